@@ -0,0 +1,334 @@
+# Copyright (c) 2022 Konnexions GmbH. All rights reserved. Use of this
+# source code is governed by the Konnexions Public License (KX-PL)
+# Version 2020.05, that can be found in the LICENSE file.
+
+"""Timing and throughput metrics of the processing stages of a document.
+
+Typical usage example:
+
+    my_metrics = DocumentMetrics(document_id=my_document_id, full_name_orig=my_document_file)
+
+    my_metrics.start_stage(DocumentMetrics.STAGE_TESSERACT, [my_image_file])
+    ... process the stage ...
+    my_metrics.end_stage(DocumentMetrics.STAGE_TESSERACT, [my_pdf_file], no_pages=my_no_pages)
+
+    my_metrics.finish(DocumentMetrics.STATUS_OK)
+
+    my_metrics.write_jsonl(my_metrics_file)
+    my_metrics.write_prometheus(my_prometheus_file)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from typing import ClassVar
+
+import dcr_core.cls_nlp_core
+import dcr_core.core_glob
+
+
+# pylint: disable=too-many-instance-attributes
+class DocumentMetrics:
+    """Timing and throughput metrics of the processing stages of a document.
+
+    For each processing stage the wall time, the CPU time, the number
+    of pages, lines, paragraphs and tokens as well as the size of the
+    input and output files are recorded. The CPU time includes the
+    terminated child processes, e.g. Pandoc or Tesseract OCR, and
+    covers the whole process: documents processed concurrently in
+    threads of the same process therefore share their CPU times.
+    """
+
+    # ------------------------------------------------------------------
+    # Class variables.
+    # ------------------------------------------------------------------
+    JSON_NAME_BYTES_IN: ClassVar[str] = "bytesIn"
+    JSON_NAME_BYTES_OUT: ClassVar[str] = "bytesOut"
+    JSON_NAME_CPU_TIME: ClassVar[str] = "cpuTime"
+    JSON_NAME_NO_LINES: ClassVar[str] = "noLines"
+    JSON_NAME_NO_PAGES: ClassVar[str] = "noPages"
+    JSON_NAME_NO_PARAS: ClassVar[str] = "noParagraphs"
+    JSON_NAME_NO_TOKENS: ClassVar[str] = "noTokens"
+    JSON_NAME_STAGE: ClassVar[str] = "stage"
+    JSON_NAME_STAGES: ClassVar[str] = "stages"
+    JSON_NAME_STATUS: ClassVar[str] = "status"
+    JSON_NAME_TIMESTAMP: ClassVar[str] = "timestamp"
+    JSON_NAME_WALL_TIME: ClassVar[str] = "wallTime"
+
+    # Prometheus metric name and help text per JSON name of a stage.
+    _PROMETHEUS_METRICS: ClassVar[list[tuple[str, str, str]]] = [
+        (JSON_NAME_WALL_TIME, "dcr_core_stage_wall_seconds", "Wall time of the processing stage in seconds."),
+        (JSON_NAME_CPU_TIME, "dcr_core_stage_cpu_seconds", "CPU time of the processing stage in seconds."),
+        (JSON_NAME_NO_PAGES, "dcr_core_stage_pages", "Number of pages processed in the processing stage."),
+        (JSON_NAME_NO_LINES, "dcr_core_stage_lines", "Number of lines created in the processing stage."),
+        (JSON_NAME_NO_PARAS, "dcr_core_stage_paragraphs", "Number of paragraphs created in the processing stage."),
+        (JSON_NAME_NO_TOKENS, "dcr_core_stage_tokens", "Number of tokens created in the processing stage."),
+        (JSON_NAME_BYTES_IN, "dcr_core_stage_bytes_in", "Size of the input files of the processing stage in bytes."),
+        (JSON_NAME_BYTES_OUT, "dcr_core_stage_bytes_out", "Size of the output data of the processing stage in bytes."),
+    ]
+
+    STAGE_CACHE: ClassVar[str] = "cache"
+    STAGE_PANDOC: ClassVar[str] = "pandoc"
+    STAGE_PARSER: ClassVar[str] = "parser"
+    STAGE_PDF2IMAGE: ClassVar[str] = "pdf2image"
+    STAGE_PDFLIB: ClassVar[str] = "pdflib"
+    STAGE_TESSERACT: ClassVar[str] = "tesseract"
+    STAGE_TOKENIZER: ClassVar[str] = "tokenizer"
+
+    STATUS_CACHE: ClassVar[str] = "cache"
+    STATUS_ERROR: ClassVar[str] = "error"
+    STATUS_OK: ClassVar[str] = "ok"
+
+    # ------------------------------------------------------------------
+    # Initialise the instance.
+    # ------------------------------------------------------------------
+    def __init__(self, document_id: int, full_name_orig: str) -> None:
+        """Initialise the instance.
+
+        Args:
+            document_id (int): Document identification.
+            full_name_orig (str): Original full file name of the document.
+        """
+        try:
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+        except AttributeError:
+            dcr_core.core_glob.initialise_logger()
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+
+        self.document_id = document_id
+        self.full_name_orig = full_name_orig
+
+        self.cpu_time = 0.0
+        self.stages: dict[str, dict[str, float | int]] = {}
+        self.status = ""
+        self.timestamp = time.time()
+        self.wall_time = 0.0
+
+        self._cpu_time_start = DocumentMetrics._get_cpu_time()
+        self._stages_started: dict[str, tuple[float, float]] = {}
+        self._wall_time_start = time.perf_counter()
+
+        self._exist = True
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+    # ------------------------------------------------------------------
+    # Determine the CPU time of the process incl. its child processes.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _get_cpu_time() -> float:
+        """Determine the CPU time of the process incl. its child processes.
+
+        Returns:
+            float: The CPU time in seconds.
+        """
+        times = os.times()
+
+        return time.process_time() + times.children_user + times.children_system
+
+    # ------------------------------------------------------------------
+    # Determine the total size of files.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _get_file_size(full_names: list[str] | None) -> int:
+        """Determine the total size of files.
+
+        Args:
+            full_names (list[str] | None): Full file names, missing files are ignored.
+
+        Returns:
+            int: The total size in bytes.
+        """
+        file_size = 0
+
+        for full_name in full_names if full_names else []:
+            try:
+                file_size += os.path.getsize(full_name)
+            except OSError:
+                pass
+
+        return file_size
+
+    # ------------------------------------------------------------------
+    # End the measurement of a processing stage.
+    # ------------------------------------------------------------------
+    # pylint: disable=too-many-arguments
+    def end_stage(
+        self,
+        stage: str,
+        full_names_out: list[str] = None,
+        bytes_out: int = 0,
+        no_lines: int = 0,
+        no_pages: int = 0,
+        no_paras: int = 0,
+        no_tokens: int = 0,
+    ) -> None:
+        """End the measurement of a processing stage.
+
+        Args:
+            stage (str): Name of the processing stage.
+            full_names_out (list[str], optional): Full file names of the output files.
+                Defaults to no output files.
+            bytes_out (int, optional): Size of the output data kept in memory.
+                Defaults to 0.
+            no_lines (int, optional): Number of lines created. Defaults to 0.
+            no_pages (int, optional): Number of pages processed. Defaults to 0.
+            no_paras (int, optional): Number of paragraphs created. Defaults to 0.
+            no_tokens (int, optional): Number of tokens created. Defaults to 0.
+        """
+        if stage not in self._stages_started:
+            return
+
+        wall_time_start, cpu_time_start = self._stages_started.pop(stage)
+
+        stage_metrics = self.stages[stage]
+
+        stage_metrics[DocumentMetrics.JSON_NAME_WALL_TIME] = round(time.perf_counter() - wall_time_start, 6)
+        stage_metrics[DocumentMetrics.JSON_NAME_CPU_TIME] = round(DocumentMetrics._get_cpu_time() - cpu_time_start, 6)
+        stage_metrics[DocumentMetrics.JSON_NAME_NO_PAGES] = no_pages
+        stage_metrics[DocumentMetrics.JSON_NAME_NO_LINES] = no_lines
+        stage_metrics[DocumentMetrics.JSON_NAME_NO_PARAS] = no_paras
+        stage_metrics[DocumentMetrics.JSON_NAME_NO_TOKENS] = no_tokens
+        stage_metrics[DocumentMetrics.JSON_NAME_BYTES_OUT] = DocumentMetrics._get_file_size(full_names_out) + bytes_out
+
+    # ------------------------------------------------------------------
+    # Check the object existence.
+    # ------------------------------------------------------------------
+    def exists(self) -> bool:
+        """Check the object existence.
+
+        Returns:
+            bool: Always true.
+        """
+        return self._exist
+
+    # ------------------------------------------------------------------
+    # Finish the measurement of the document.
+    # ------------------------------------------------------------------
+    def finish(self, status: str) -> None:
+        """Finish the measurement of the document.
+
+        A processing stage that has not been ended, e.g. because of an
+        error, is ended without counts and output data.
+
+        Args:
+            status (str): Processing result of the document, e.g. STATUS_OK.
+        """
+        for stage in list(self._stages_started):
+            self.end_stage(stage)
+
+        self.cpu_time = round(DocumentMetrics._get_cpu_time() - self._cpu_time_start, 6)
+        self.status = status
+        self.wall_time = round(time.perf_counter() - self._wall_time_start, 6)
+
+    # ------------------------------------------------------------------
+    # Start the measurement of a processing stage.
+    # ------------------------------------------------------------------
+    def start_stage(self, stage: str, full_names_in: list[str] = None, bytes_in: int = 0) -> None:
+        """Start the measurement of a processing stage.
+
+        The size of the input files is determined at the start, since
+        the auxiliary input files may be deleted during the stage.
+
+        Args:
+            stage (str): Name of the processing stage.
+            full_names_in (list[str], optional): Full file names of the input files.
+                Defaults to no input files.
+            bytes_in (int, optional): Size of the input data kept in memory.
+                Defaults to 0.
+        """
+        self.stages[stage] = {
+            DocumentMetrics.JSON_NAME_WALL_TIME: 0.0,
+            DocumentMetrics.JSON_NAME_CPU_TIME: 0.0,
+            DocumentMetrics.JSON_NAME_NO_PAGES: 0,
+            DocumentMetrics.JSON_NAME_NO_LINES: 0,
+            DocumentMetrics.JSON_NAME_NO_PARAS: 0,
+            DocumentMetrics.JSON_NAME_NO_TOKENS: 0,
+            DocumentMetrics.JSON_NAME_BYTES_IN: DocumentMetrics._get_file_size(full_names_in) + bytes_in,
+            DocumentMetrics.JSON_NAME_BYTES_OUT: 0,
+        }
+
+        self._stages_started[stage] = (time.perf_counter(), DocumentMetrics._get_cpu_time())
+
+    # ------------------------------------------------------------------
+    # Get the metrics as JSON data.
+    # ------------------------------------------------------------------
+    def to_dict(self) -> dict[str, object]:
+        """Get the metrics as JSON data.
+
+        Returns:
+            dict[str, object]: The document metrics with one entry per processing stage in processing order.
+        """
+        return {
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_DOC_ID: self.document_id,
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_DOC_FILE_NAME: self.full_name_orig,
+            DocumentMetrics.JSON_NAME_STATUS: self.status,
+            DocumentMetrics.JSON_NAME_TIMESTAMP: round(self.timestamp, 3),
+            DocumentMetrics.JSON_NAME_WALL_TIME: self.wall_time,
+            DocumentMetrics.JSON_NAME_CPU_TIME: self.cpu_time,
+            DocumentMetrics.JSON_NAME_STAGES: [
+                {DocumentMetrics.JSON_NAME_STAGE: stage} | stage_metrics for stage, stage_metrics in self.stages.items()
+            ],
+        }
+
+    # ------------------------------------------------------------------
+    # Append the metrics to a JSONL file.
+    # ------------------------------------------------------------------
+    def write_jsonl(self, full_name: str) -> None:
+        """Append the metrics to a JSONL file.
+
+        The metrics of a document are written as a single line with a
+        single write operation, so that several processes can append
+        to the same file.
+
+        Args:
+            full_name (str): Full file name of the JSONL file.
+        """
+        with open(full_name, "a", encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT) as file_handle:
+            file_handle.write(json.dumps(self.to_dict()) + "\n")
+
+    # ------------------------------------------------------------------
+    # Write the metrics to a Prometheus textfile.
+    # ------------------------------------------------------------------
+    def write_prometheus(self, full_name: str) -> None:
+        """Write the metrics to a Prometheus textfile.
+
+        The file contains the metrics of this document as gauges and is
+        replaced atomically, as required by the textfile collector of
+        the Prometheus node exporter.
+
+        Args:
+            full_name (str): Full file name of the Prometheus textfile, usually with the extension '.prom'.
+        """
+        lines = [
+            "# HELP dcr_core_document_timestamp_seconds End of the processing of the last document as Unix time.",
+            "# TYPE dcr_core_document_timestamp_seconds gauge",
+            f"dcr_core_document_timestamp_seconds {time.time():.3f}",
+            "# HELP dcr_core_document_wall_seconds Wall time of the last document in seconds.",
+            "# TYPE dcr_core_document_wall_seconds gauge",
+            f'dcr_core_document_wall_seconds{{status="{self.status}"}} {self.wall_time}',
+            "# HELP dcr_core_document_cpu_seconds CPU time of the last document in seconds.",
+            "# TYPE dcr_core_document_cpu_seconds gauge",
+            f'dcr_core_document_cpu_seconds{{status="{self.status}"}} {self.cpu_time}',
+        ]
+
+        for json_name, metric_name, metric_help in DocumentMetrics._PROMETHEUS_METRICS:
+            lines.append(f"# HELP {metric_name} {metric_help}")
+            lines.append(f"# TYPE {metric_name} gauge")
+            for stage, stage_metrics in self.stages.items():
+                lines.append(f'{metric_name}{{stage="{stage}"}} {stage_metrics[json_name]}')
+
+        file_handle, full_name_tmp = tempfile.mkstemp(dir=os.path.dirname(full_name) or ".", suffix=".tmp")
+
+        try:
+            with os.fdopen(file_handle, "w", encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT) as file_tmp:
+                file_tmp.write("\n".join(lines) + "\n")
+            # The node exporter usually runs under a different user.
+            os.chmod(full_name_tmp, 0o644)
+            os.replace(full_name_tmp, full_name)
+        except OSError:
+            os.remove(full_name_tmp)
+            raise
@@ -0,0 +1,66 @@
+# Copyright (c) 2022 Konnexions GmbH. All rights reserved. Use of this
+# source code is governed by the Konnexions Public License (KX-PL)
+# Version 2020.05, that can be found in the LICENSE file.
+
+"""Module stub file."""
+from __future__ import annotations
+
+from typing import ClassVar
+
+class DocumentMetrics:
+    JSON_NAME_BYTES_IN: ClassVar[str]
+    JSON_NAME_BYTES_OUT: ClassVar[str]
+    JSON_NAME_CPU_TIME: ClassVar[str]
+    JSON_NAME_NO_LINES: ClassVar[str]
+    JSON_NAME_NO_PAGES: ClassVar[str]
+    JSON_NAME_NO_PARAS: ClassVar[str]
+    JSON_NAME_NO_TOKENS: ClassVar[str]
+    JSON_NAME_STAGE: ClassVar[str]
+    JSON_NAME_STAGES: ClassVar[str]
+    JSON_NAME_STATUS: ClassVar[str]
+    JSON_NAME_TIMESTAMP: ClassVar[str]
+    JSON_NAME_WALL_TIME: ClassVar[str]
+    _PROMETHEUS_METRICS: ClassVar[list[tuple[str, str, str]]]
+    STAGE_CACHE: ClassVar[str]
+    STAGE_PANDOC: ClassVar[str]
+    STAGE_PARSER: ClassVar[str]
+    STAGE_PDF2IMAGE: ClassVar[str]
+    STAGE_PDFLIB: ClassVar[str]
+    STAGE_TESSERACT: ClassVar[str]
+    STAGE_TOKENIZER: ClassVar[str]
+    STATUS_CACHE: ClassVar[str]
+    STATUS_ERROR: ClassVar[str]
+    STATUS_OK: ClassVar[str]
+
+    def __init__(self, document_id: int, full_name_orig: str) -> None:
+        self._cpu_time_start: float = 0.0
+        self._exist: bool = False
+        self._stages_started: dict[str, tuple[float, float]] = {}
+        self._wall_time_start: float = 0.0
+        self.cpu_time: float = 0.0
+        self.document_id: int = 0
+        self.full_name_orig: str = ""
+        self.stages: dict[str, dict[str, float | int]] = {}
+        self.status: str = ""
+        self.timestamp: float = 0.0
+        self.wall_time: float = 0.0
+    @staticmethod
+    def _get_cpu_time() -> float: ...
+    @staticmethod
+    def _get_file_size(full_names: list[str] | None) -> int: ...
+    def end_stage(
+        self,
+        stage: str,
+        full_names_out: list[str] = ...,
+        bytes_out: int = ...,
+        no_lines: int = ...,
+        no_pages: int = ...,
+        no_paras: int = ...,
+        no_tokens: int = ...,
+    ) -> None: ...
+    def exists(self) -> bool: ...
+    def finish(self, status: str) -> None: ...
+    def start_stage(self, stage: str, full_names_in: list[str] = ..., bytes_in: int = ...) -> None: ...
+    def to_dict(self) -> dict[str, object]: ...
+    def write_jsonl(self, full_name: str) -> None: ...
+    def write_prometheus(self, full_name: str) -> None: ...
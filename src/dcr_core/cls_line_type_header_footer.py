@@ -15,6 +15,7 @@ Typical usage example:
 import jellyfish
 
 import dcr_core.cls_nlp_core
+import dcr_core.cls_run_context
 
 
 # pylint: disable=too-many-instance-attributes
@@ -51,12 +52,15 @@ class LineTypeHeaderFooter:
     def __init__(
         self,
         file_name_curr: str = "",
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = None,
     ) -> None:
         """Initialise an instance.
 
         Args:
             file_name_curr (str, optional): File name of the PDF document to be processed -
                 only for documentation purposes. Defaults to "".
+            run_context (RunContext, optional): The run context of the document.
+                Defaults to the global variables in dcr_core.core_glob.
         """
         try:
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
@@ -64,19 +68,23 @@ class LineTypeHeaderFooter:
             dcr_core.core_glob.initialise_logger()
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
 
+        self._run_context = dcr_core.core_utils.get_run_context(run_context)
+
         dcr_core.core_glob.logger.debug("param file_name_curr=%s", file_name_curr)
 
         dcr_core.core_utils.check_exists_object(
             is_setup=True,
             is_text_parser=True,
+            run_context=self._run_context,
         )
 
         self._file_name_curr = file_name_curr
 
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter")
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-            f"LineTypeHeaderFooter: Start create instance                ={self._file_name_curr}",
+            self._run_context.setup.is_verbose_lt_header_footer,
+            "LineTypeHeaderFooter: Start create instance                =%s",
+            self._file_name_curr,
         )
 
         self._irregular_footer_cand: LineTypeHeaderFooter.Candidate
@@ -113,8 +121,9 @@ class LineTypeHeaderFooter:
         self._exist = True
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-            f"LineTypeHeaderFooter: End   create instance                ={self._file_name_curr}",
+            self._run_context.setup.is_verbose_lt_header_footer,
+            "LineTypeHeaderFooter: End   create instance                =%s",
+            self._file_name_curr,
         )
 
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
@@ -123,13 +132,14 @@ class LineTypeHeaderFooter:
     # Calculate the Levenshtein distances.
     # ------------------------------------------------------------------
     def _calc_levenshtein(self) -> None:
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter")
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter: Start Levenshtein distance"
+            self._run_context.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter: Start Levenshtein distance"
         )
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-            f"LineTypeHeaderFooter: Value of line_data                   ={self._line_data}",
+            self._run_context.setup.is_verbose_lt_header_footer,
+            "LineTypeHeaderFooter: Value of line_data                   =%s",
+            self._line_data,
         )
 
         for ind in range(self._line_data_max):
@@ -146,11 +156,12 @@ class LineTypeHeaderFooter:
                     self._lsd_data[ind] = lsd_row
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-            f"LineTypeHeaderFooter: Value of lsd_data                    ={self._lsd_data}",
+            self._run_context.setup.is_verbose_lt_header_footer,
+            "LineTypeHeaderFooter: Value of lsd_data                    =%s",
+            self._lsd_data,
         )
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter: End   Levenshtein distance"
+            self._run_context.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter: End   Levenshtein distance"
         )
 
     # ------------------------------------------------------------------
@@ -250,10 +261,11 @@ class LineTypeHeaderFooter:
     def _process_page(self) -> None:  # noqa: C901
         self._page_ind += 1
 
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter")
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-            f"LineTypeHeaderFooter: Start page                           ={self._page_ind + 1}",
+            self._run_context.setup.is_verbose_lt_header_footer,
+            "LineTypeHeaderFooter: Start page                           =%s",
+            self._page_ind + 1,
         )
 
         if self._is_irregular_footer:
@@ -262,10 +274,10 @@ class LineTypeHeaderFooter:
         if self._is_irregular_header:
             self._irregular_header_cand = LineTypeHeaderFooter.Candidate()
 
-        if dcr_core.core_glob.setup.lt_header_max_lines > 0:
+        if self._run_context.setup.lt_header_max_lines > 0:
             self._store_line_data_header()
 
-        if dcr_core.core_glob.setup.lt_footer_max_lines > 0:
+        if self._run_context.setup.lt_footer_max_lines > 0:
             self._store_line_data_footer()
 
         if self._is_irregular_footer:
@@ -292,8 +304,9 @@ class LineTypeHeaderFooter:
         self._swap_current_previous()
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-            f"LineTypeHeaderFooter: End   page                           ={self._page_ind + 1}",
+            self._run_context.setup.is_verbose_lt_header_footer,
+            "LineTypeHeaderFooter: End   page                           =%s",
+            self._page_ind + 1,
         )
 
     # ------------------------------------------------------------------
@@ -303,15 +316,17 @@ class LineTypeHeaderFooter:
         if self._is_irregular_footer:
             self._no_irregular_footer = 1
             dcr_core.core_utils.progress_msg(
-                dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-                f"LineTypeHeaderFooter: Value of irregular footers           ={self._irregular_footer_cands}",
+                self._run_context.setup.is_verbose_lt_header_footer,
+                "LineTypeHeaderFooter: Value of irregular footers           =%s",
+                self._irregular_footer_cands,
             )
 
         if self._is_irregular_header:
             self._no_irregular_header = 1
             dcr_core.core_utils.progress_msg(
-                dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-                f"LineTypeHeaderFooter: Value of irregular headers           ={self._irregular_header_cands}",
+                self._run_context.setup.is_verbose_lt_header_footer,
+                "LineTypeHeaderFooter: Value of irregular headers           =%s",
+                self._irregular_header_cands,
             )
 
         for page_ind, page in enumerate(self.line_pages_json):
@@ -350,11 +365,12 @@ class LineTypeHeaderFooter:
     # Store the footers of the current page.
     # ------------------------------------------------------------------
     def _store_line_data_footer(self) -> None:
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter")
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter: Start store footers")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter: Start store footers")
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-            f"LineTypeHeaderFooter: Value of line_data                   ={self._line_data}",
+            self._run_context.setup.is_verbose_lt_header_footer,
+            "LineTypeHeaderFooter: Value of line_data                   =%s",
+            self._line_data,
         )
 
         if len(self._parser_line_lines_json) == 0:
@@ -362,7 +378,7 @@ class LineTypeHeaderFooter:
 
         line_lines_ind = len(self._parser_line_lines_json) - 1
 
-        for ind in range(self._line_data_max - 1, dcr_core.core_glob.setup.lt_header_max_lines - 1, -1):
+        for ind in range(self._line_data_max - 1, self._run_context.setup.lt_header_max_lines - 1, -1):
             (_, prev) = self._line_data[ind]
 
             page_line: dict[str, int | str] = self._parser_line_lines_json[line_lines_ind]
@@ -386,26 +402,28 @@ class LineTypeHeaderFooter:
             line_lines_ind -= 1
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-            f"LineTypeHeaderFooter: Value of line_data                   ={self._line_data}",
+            self._run_context.setup.is_verbose_lt_header_footer,
+            "LineTypeHeaderFooter: Value of line_data                   =%s",
+            self._line_data,
         )
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter: End   store footers")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter: End   store footers")
 
     # ------------------------------------------------------------------
     # Store the headers of the current page.
     # ------------------------------------------------------------------
     def _store_line_data_header(self) -> None:
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter")
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter: Start store headers")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter: Start store headers")
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-            f"LineTypeHeaderFooter: Value of line_data                   ={self._line_data}",
+            self._run_context.setup.is_verbose_lt_header_footer,
+            "LineTypeHeaderFooter: Value of line_data                   =%s",
+            self._line_data,
         )
 
         if (line_lines_max := len(self._parser_line_lines_json)) == 0:
             return
 
-        for ind in range(dcr_core.core_glob.setup.lt_header_max_lines):
+        for ind in range(self._run_context.setup.lt_header_max_lines):
             if ind >= line_lines_max:
                 break
 
@@ -427,16 +445,17 @@ class LineTypeHeaderFooter:
             )
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-            f"LineTypeHeaderFooter: Value of line_data                   ={self._line_data}",
+            self._run_context.setup.is_verbose_lt_header_footer,
+            "LineTypeHeaderFooter: Value of line_data                   =%s",
+            self._line_data,
         )
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter: End   store headers")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter: End   store headers")
 
     # ------------------------------------------------------------------
     # Store the found line types in parser result.
     # ------------------------------------------------------------------
     def _store_results(self) -> None:
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter: Start store result")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter: Start store result")
 
         self.no_lines_footer = 0
         self.no_lines_header = 0
@@ -456,28 +475,31 @@ class LineTypeHeaderFooter:
 
         if self.no_lines_header > 0:
             dcr_core.core_utils.progress_msg(
-                dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-                f"LineTypeHeaderFooter: End   store result             header={self.no_lines_header}",
+                self._run_context.setup.is_verbose_lt_header_footer,
+                "LineTypeHeaderFooter: End   store result             header=%s",
+                self.no_lines_header,
             )
         if self.no_lines_footer > 0:
             dcr_core.core_utils.progress_msg(
-                dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-                f"LineTypeHeaderFooter: End   store result             footer={self.no_lines_footer}",
+                self._run_context.setup.is_verbose_lt_header_footer,
+                "LineTypeHeaderFooter: End   store result             footer=%s",
+                self.no_lines_footer,
             )
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter: End   store result")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter: End   store result")
 
     # ------------------------------------------------------------------
     # Swap the current and previous data.
     # ------------------------------------------------------------------
     def _swap_current_previous(self) -> None:
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter")
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer,
+            self._run_context.setup.is_verbose_lt_header_footer,
             "LineTypeHeaderFooter: Start swap current & previous",
         )
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-            f"LineTypeHeaderFooter: Value of line_data                   ={self._line_data}",
+            self._run_context.setup.is_verbose_lt_header_footer,
+            "LineTypeHeaderFooter: Value of line_data                   =%s",
+            self._line_data,
         )
 
         for ind in range(self._line_data_max):
@@ -485,11 +507,12 @@ class LineTypeHeaderFooter:
             self._line_data[ind] = ((-1, ""), curr)
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-            f"LineTypeHeaderFooter: Value of line_data                   ={self._line_data}",
+            self._run_context.setup.is_verbose_lt_header_footer,
+            "LineTypeHeaderFooter: Value of line_data                   =%s",
+            self._line_data,
         )
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer,
+            self._run_context.setup.is_verbose_lt_header_footer,
             "LineTypeHeaderFooter: End   swap current & previous",
         )
 
@@ -527,44 +550,50 @@ class LineTypeHeaderFooter:
         dcr_core.core_utils.check_exists_object(
             is_setup=True,
             is_text_parser=True,
+            run_context=self._run_context,
         )
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-            f"LineTypeHeaderFooter: lt_header_max_lines={dcr_core.core_glob.setup.lt_header_max_lines} "
-            + f"- lt_footer_max_lines={dcr_core.core_glob.setup.lt_footer_max_lines}",
+            self._run_context.setup.is_verbose_lt_header_footer,
+            "LineTypeHeaderFooter: lt_header_max_lines=%s - lt_footer_max_lines=%s",
+            self._run_context.setup.lt_header_max_lines,
+            self._run_context.setup.lt_footer_max_lines,
         )
 
         # Neither the identification of headers nor footers is desired.
-        if dcr_core.core_glob.setup.lt_footer_max_lines == 0 and dcr_core.core_glob.setup.lt_header_max_lines == 0:
+        if self._run_context.setup.lt_footer_max_lines == 0 and self._run_context.setup.lt_header_max_lines == 0:
             return
 
         self._file_name_curr = file_name_curr
         self.line_pages_json = line_pages_json
         self._page_max = len(self.line_pages_json)
 
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_header_footer, "LineTypeHeaderFooter")
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-            f"LineTypeHeaderFooter: Start document                       ={self._file_name_curr}",
+            self._run_context.setup.is_verbose_lt_header_footer,
+            "LineTypeHeaderFooter: Start document                       =%s",
+            self._file_name_curr,
         )
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-            f"LineTypeHeaderFooter: Value of lsd_data                    ={self._lsd_data}",
+            self._run_context.setup.is_verbose_lt_header_footer,
+            "LineTypeHeaderFooter: Value of lsd_data                    =%s",
+            self._lsd_data,
         )
 
-        self._line_data_max = dcr_core.core_glob.setup.lt_header_max_lines + dcr_core.core_glob.setup.lt_footer_max_lines
+        self._line_data_max = self._run_context.setup.lt_header_max_lines + self._run_context.setup.lt_footer_max_lines
 
         self._line_data = [((-1, ""), (-1, "")) for _ in range(self._line_data_max)]
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-            f"LineTypeHeaderFooter: Value of line_data                   ={self._line_data}",
+            self._run_context.setup.is_verbose_lt_header_footer,
+            "LineTypeHeaderFooter: Value of line_data                   =%s",
+            self._line_data,
         )
 
         self._lsd_data = [[(-1, -1, -1) for _ in range(self._page_max)] for _ in range(self._line_data_max)]
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-            f"LineTypeHeaderFooter: Value of lsd_data                    ={self._lsd_data}",
+            self._run_context.setup.is_verbose_lt_header_footer,
+            "LineTypeHeaderFooter: Value of lsd_data                    =%s",
+            self._lsd_data,
         )
 
         for page_json in self.line_pages_json:
@@ -572,11 +601,11 @@ class LineTypeHeaderFooter:
             self._process_page()
 
         for line_ind in range(self._line_data_max):
-            if line_ind < dcr_core.core_glob.setup.lt_header_max_lines:
-                distance_max = dcr_core.core_glob.setup.lt_header_max_distance
+            if line_ind < self._run_context.setup.lt_header_max_lines:
+                distance_max = self._run_context.setup.lt_header_max_distance
                 line_type = dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_HEADER
             else:
-                distance_max = dcr_core.core_glob.setup.lt_footer_max_distance
+                distance_max = self._run_context.setup.lt_footer_max_distance
                 line_type = dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_FOOTER
 
             if self._determine_candidate(distance_max, line_ind):
@@ -588,15 +617,16 @@ class LineTypeHeaderFooter:
 
         if len(self._result_data) > 0:
             dcr_core.core_utils.progress_msg(
-                dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-                f"LineTypeHeaderFooter: Value of result_data                 ={self._result_data}",
+                self._run_context.setup.is_verbose_lt_header_footer,
+                "LineTypeHeaderFooter: Value of result_data                 =%s",
+                self._result_data,
             )
             self._store_results()
 
         if (
-            dcr_core.core_glob.setup.lt_footer_max_distance > 0
+            self._run_context.setup.lt_footer_max_distance > 0
             and self._is_irregular_footer
-            or dcr_core.core_glob.setup.lt_header_max_distance > 0
+            or self._run_context.setup.lt_header_max_distance > 0
             and self._is_irregular_header
         ):
             self._store_irregulars()
@@ -604,8 +634,9 @@ class LineTypeHeaderFooter:
             self.no_lines_header += self._no_irregular_header
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_header_footer,
-            f"LineTypeHeaderFooter: End document                         ={self._file_name_curr}",
+            self._run_context.setup.is_verbose_lt_header_footer,
+            "LineTypeHeaderFooter: End document                         =%s",
+            self._file_name_curr,
         )
 
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
@@ -4,6 +4,7 @@
 
 """Module stub file."""
 import dcr_core.cls_nlp_core
+import dcr_core.cls_run_context
 
 class LineTypeHeaderFooter:
     Candidate = tuple[int, int]
@@ -20,6 +21,7 @@ class LineTypeHeaderFooter:
     def __init__(
         self,
         file_name_curr: str = "",
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = ...,
     ) -> None:
         self._exist: bool = False
         self._file_name_curr: str = ""
@@ -40,6 +42,7 @@ class LineTypeHeaderFooter:
         self._page_max: int = 0
         self._parser_line_lines_json: dcr_core.cls_nlp_core.NLPCore.ParserLineLines = []
         self._result_data: LineTypeHeaderFooter.ResultData = {}
+        self._run_context: dcr_core.cls_run_context.RunContextProtocol
         self.line_pages_json: dcr_core.cls_nlp_core.NLPCore.ParserLinePages = []
         self.no_lines_footer: int = 0
         self.no_lines_header: int = 0
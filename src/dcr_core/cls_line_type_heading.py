@@ -26,6 +26,7 @@ import pathlib
 import re
 
 import dcr_core.cls_nlp_core
+import dcr_core.cls_run_context
 
 # ------------------------------------------------------------------
 # Global type aliases.
@@ -42,12 +43,15 @@ class LineTypeHeading:
     def __init__(
         self,
         file_name_curr: str = "",
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = None,
     ) -> None:
         """Initialise the instance.
 
         Args:
             file_name_curr (str, optional): File name of the PDF document to be processed -
                 only for documentation purposes. Defaults to "".
+            run_context (RunContext, optional): The run context of the document.
+                Defaults to the global variables in dcr_core.core_glob.
         """
         try:
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
@@ -55,6 +59,8 @@ class LineTypeHeading:
             dcr_core.core_glob.initialise_logger()
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
 
+        self._run_context = dcr_core.core_utils.get_run_context(run_context)
+
         dcr_core.core_glob.logger.debug("param file_name_curr=%s", file_name_curr)
 
         dcr_core.core_utils.check_exists_object(
@@ -65,14 +71,16 @@ class LineTypeHeading:
             is_line_type_toc=True,
             is_setup=True,
             is_text_parser=True,
+            run_context=self._run_context,
         )
 
         self.file_name_curr = file_name_curr
 
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_heading, "LineTypeHeading")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_heading, "LineTypeHeading")
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_heading,
-            f"LineTypeHeading: Start create instance                ={self.file_name_curr}",
+            self._run_context.setup.is_verbose_lt_heading,
+            "LineTypeHeading: Start create instance                =%s",
+            self.file_name_curr,
         )
 
         self._RULE_NAME_SIZE: int = 20
@@ -86,7 +94,7 @@ class LineTypeHeading:
         # ------------------------------------------------------------------
         self._anti_patterns: list[tuple[str, re.Pattern[str]]] = self._init_anti_patterns()
 
-        dcr_core.core_glob.setup.lt_heading_max_level_curr = 0
+        self._run_context.setup.lt_heading_max_level_curr = 0
 
         self._line_lines_idx = 0
 
@@ -181,8 +189,9 @@ class LineTypeHeading:
         self._exist = True
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_heading,
-            f"LineTypeHeading: End   create instance                ={self.file_name_curr}",
+            self._run_context.setup.is_verbose_lt_heading,
+            "LineTypeHeading: End   create instance                =%s",
+            self.file_name_curr,
         )
 
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
@@ -253,7 +262,7 @@ class LineTypeHeading:
             level (int): Heading level.
             text: Heading text.
         """
-        if not dcr_core.core_glob.setup.is_create_extra_file_heading:
+        if not self._run_context.setup.is_create_extra_file_heading:
             return
 
         toc_entry = {
@@ -262,12 +271,12 @@ class LineTypeHeading:
             dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGE_NO: self._page_idx + 1,
         }
 
-        if dcr_core.core_glob.setup.lt_heading_file_incl_no_ctx > 0:
+        if self._run_context.setup.lt_heading_file_incl_no_ctx > 0:
             page_idx = self._page_idx
-            line_lines: dcr_core.cls_nlp_core.NLPCore.ParserLineLines = dcr_core.core_glob.text_parser.parse_result_line_lines
+            line_lines: dcr_core.cls_nlp_core.NLPCore.ParserLineLines = self._run_context.text_parser.parse_result_line_lines
             line_lines_idx = self._line_lines_idx + 1
 
-            for idx in range(dcr_core.core_glob.setup.lt_heading_file_incl_no_ctx):
+            for idx in range(self._run_context.setup.lt_heading_file_incl_no_ctx):
                 (line, new_page_idx, new_line_lines, new_line_lines_idx) = self._get_next_body_line(page_idx, line_lines, line_lines_idx)
 
                 toc_entry[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_HEADING_CTX_LINE + str(idx + 1)] = line
@@ -277,7 +286,7 @@ class LineTypeHeading:
 
                 page_idx = new_page_idx
 
-        if dcr_core.core_glob.setup.is_lt_heading_file_incl_regexp:
+        if self._run_context.setup.is_lt_heading_file_incl_regexp:
             toc_entry[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_REGEXP] = self._rules_hierarchy[level - 1][8]
 
         self._toc.append(toc_entry)
@@ -310,7 +319,7 @@ class LineTypeHeading:
         if (page_idx + 1) < self._max_page:
             page_idx_local = page_idx + 1
 
-            line_lines_local: dcr_core.cls_nlp_core.NLPCore.ParserLineLines = dcr_core.core_glob.text_parser.parse_result_line_pages[
+            line_lines_local: dcr_core.cls_nlp_core.NLPCore.ParserLineLines = self._run_context.text_parser.parse_result_line_pages[
                 page_idx_local
             ][dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINES]
 
@@ -340,13 +349,13 @@ class LineTypeHeading:
         Returns:
             list[tuple[str, re.Pattern[str]]]: The valid heading anti-patterns.
         """
-        if dcr_core.core_glob.setup.lt_heading_rule_file and dcr_core.core_glob.setup.lt_heading_rule_file.lower() != "none":
-            lt_heading_rule_file_path = dcr_core.core_utils.get_os_independent_name(dcr_core.core_glob.setup.lt_heading_rule_file)
+        if self._run_context.setup.lt_heading_rule_file and self._run_context.setup.lt_heading_rule_file.lower() != "none":
+            lt_heading_rule_file_path = dcr_core.core_utils.get_os_independent_name(self._run_context.setup.lt_heading_rule_file)
             if os.path.isfile(lt_heading_rule_file_path):
                 return self._load_anti_patterns_from_json(pathlib.Path(lt_heading_rule_file_path))
 
             dcr_core.core_utils.terminate_fatal(
-                f"File with heading anti-patterns is missing - " f"file name '{dcr_core.core_glob.setup.lt_heading_rule_file}'"
+                f"File with heading anti-patterns is missing - " f"file name '{self._run_context.setup.lt_heading_rule_file}'"
             )
 
         anti_patterns = []
@@ -377,13 +386,13 @@ class LineTypeHeading:
             list[tuple[str, bool, str, collections.abc.Callable[[str, str], bool], list[str]]]: The
                 valid heading rules.
         """
-        if dcr_core.core_glob.setup.lt_heading_rule_file and dcr_core.core_glob.setup.lt_heading_rule_file.lower() != "none":
-            lt_heading_rule_file_path = dcr_core.core_utils.get_os_independent_name(dcr_core.core_glob.setup.lt_heading_rule_file)
+        if self._run_context.setup.lt_heading_rule_file and self._run_context.setup.lt_heading_rule_file.lower() != "none":
+            lt_heading_rule_file_path = dcr_core.core_utils.get_os_independent_name(self._run_context.setup.lt_heading_rule_file)
             if os.path.isfile(lt_heading_rule_file_path):
                 return self._load_rules_from_json(pathlib.Path(lt_heading_rule_file_path))
 
             dcr_core.core_utils.terminate_fatal(
-                f"File with heading rules is missing - " f"file name '{dcr_core.core_glob.setup.lt_heading_rule_file}'"
+                f"File with heading rules is missing - " f"file name '{self._run_context.setup.lt_heading_rule_file}'"
             )
 
         return dcr_core.cls_nlp_core.NLPCore.get_lt_rules_default_heading()
@@ -391,8 +400,8 @@ class LineTypeHeading:
     # ------------------------------------------------------------------
     # Load the valid heading anti-patterns from a JSON file.
     # ------------------------------------------------------------------
-    @staticmethod
     def _load_anti_patterns_from_json(
+        self,
         lt_heading_rule_file: pathlib.Path,
     ) -> list[tuple[str, re.Pattern[str]]]:
         """Load the valid heading anti-patterns from a JSON file.
@@ -417,8 +426,9 @@ class LineTypeHeading:
                 )
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_heading,
-            "The heading anti-patterns were successfully loaded from the " + f"file {dcr_core.core_glob.setup.lt_heading_rule_file}",
+            self._run_context.setup.is_verbose_lt_heading,
+            "The heading anti-patterns were successfully loaded from the file %s",
+            self._run_context.setup.lt_heading_rule_file,
         )
 
         return anti_patterns
@@ -426,8 +436,8 @@ class LineTypeHeading:
     # ------------------------------------------------------------------
     # Load the valid heading rules from a JSON file.
     # ------------------------------------------------------------------
-    @staticmethod
     def _load_rules_from_json(
+        self,
         lt_heading_rule_file: pathlib.Path,
     ) -> list[tuple[str, bool, str, collections.abc.Callable[[str, str], bool], list[str]]]:
         """Load the valid heading rules from a JSON file.
@@ -459,8 +469,9 @@ class LineTypeHeading:
                 )
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_heading,
-            f"The heading rules were successfully loaded from the file {dcr_core.core_glob.setup.lt_heading_rule_file}",
+            self._run_context.setup.is_verbose_lt_heading,
+            "The heading rules were successfully loaded from the file %s",
+            self._run_context.setup.lt_heading_rule_file,
         )
 
         return rules
@@ -482,8 +493,10 @@ class LineTypeHeading:
         for (rule_name, pattern) in self._anti_patterns:
             if pattern.match(text):
                 dcr_core.core_utils.progress_msg(
-                    dcr_core.core_glob.setup.is_verbose_lt_heading,
-                    f"LineTypeHeading: Anti pattern                         ={rule_name} - text={text}",
+                    self._run_context.setup.is_verbose_lt_heading,
+                    "LineTypeHeading: Anti pattern                         =%s - text=%s",
+                    rule_name,
+                    text,
                 )
                 return 0
 
@@ -514,8 +527,8 @@ class LineTypeHeading:
                 coord_llx_float = float(coord_llx)
 
                 if (
-                    coord_llx_curr_float < coord_llx_float * (100 - dcr_core.core_glob.setup.lt_heading_tolerance_llx) / 100
-                    or coord_llx_curr_float > coord_llx_float * (100 + dcr_core.core_glob.setup.lt_heading_tolerance_llx) / 100
+                    coord_llx_curr_float < coord_llx_float * (100 - self._run_context.setup.lt_heading_tolerance_llx) / 100
+                    or coord_llx_curr_float > coord_llx_float * (100 + self._run_context.setup.lt_heading_tolerance_llx) / 100
                 ):
                     return 0
 
@@ -536,8 +549,11 @@ class LineTypeHeading:
                 self._create_toc_entry(level, text)
 
                 dcr_core.core_utils.progress_msg(
-                    dcr_core.core_glob.setup.is_verbose_lt_heading,
-                    f"LineTypeHeading: Match                                ={rule_name} " + f"- level={level} - heading={text}",
+                    self._run_context.setup.is_verbose_lt_heading,
+                    "LineTypeHeading: Match                                =%s - level=%s - heading=%s",
+                    rule_name,
+                    level,
+                    text,
                 )
 
                 # Delete levels that are no longer needed
@@ -581,8 +597,11 @@ class LineTypeHeading:
                 self._create_toc_entry(level, text)
 
                 dcr_core.core_utils.progress_msg(
-                    dcr_core.core_glob.setup.is_verbose_lt_heading,
-                    f"LineTypeHeading: Match new level                      ={rule_name} " + f"- level={level} - heading={text}",
+                    self._run_context.setup.is_verbose_lt_heading,
+                    "LineTypeHeading: Match new level                      =%s - level=%s - heading=%s",
+                    rule_name,
+                    level,
+                    text,
                 )
 
                 return level
@@ -594,15 +613,16 @@ class LineTypeHeading:
     # ------------------------------------------------------------------
     def _process_page(self) -> None:
         """Process the page-related data."""
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_heading, "LineTypeHeading")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_heading, "LineTypeHeading")
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_heading,
-            f"LineTypeHeading: Start page (lines)                   ={self._page_idx+1}",
+            self._run_context.setup.is_verbose_lt_heading,
+            "LineTypeHeading: Start page (lines)                   =%s",
+            self._page_idx + 1,
         )
 
-        self._max_line_line = len(dcr_core.core_glob.text_parser.parse_result_line_lines)
+        self._max_line_line = len(self._run_context.text_parser.parse_result_line_lines)
 
-        for line_lines_idx, line_line in enumerate(dcr_core.core_glob.text_parser.parse_result_line_lines):
+        for line_lines_idx, line_line in enumerate(self._run_context.text_parser.parse_result_line_lines):
             self._line_lines_idx = line_lines_idx
             if line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINE_TYPE] != dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_BODY:
                 continue
@@ -618,11 +638,12 @@ class LineTypeHeading:
                 line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINE_TYPE] = (
                     dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_HEADER + "_" + str(level)
                 )
-                dcr_core.core_glob.text_parser.parse_result_line_lines[self._line_lines_idx] = line_line
+                self._run_context.text_parser.parse_result_line_lines[self._line_lines_idx] = line_line
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_heading,
-            f"LineTypeHeading: End   page (lines)                   ={self._page_idx+1}",
+            self._run_context.setup.is_verbose_lt_heading,
+            "LineTypeHeading: End   page (lines)                   =%s",
+            self._page_idx + 1,
         )
 
     # ------------------------------------------------------------------
@@ -672,30 +693,32 @@ class LineTypeHeading:
             is_line_type_toc=True,
             is_setup=True,
             is_text_parser=True,
+            run_context=self._run_context,
         )
 
         if (
-            dcr_core.core_glob.setup.lt_heading_max_level == 0
-            or len(dcr_core.core_glob.text_parser.parse_result_line_pages) < dcr_core.core_glob.setup.lt_heading_min_pages
+            self._run_context.setup.lt_heading_max_level == 0
+            or len(self._run_context.text_parser.parse_result_line_pages) < self._run_context.setup.lt_heading_min_pages
         ):
             return
 
         self.file_name_curr = file_name_curr
 
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_heading, "LineTypeHeading")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_heading, "LineTypeHeading")
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_heading,
-            f"LineTypeHeading: Start document                       ={self.file_name_curr}",
+            self._run_context.setup.is_verbose_lt_heading,
+            "LineTypeHeading: Start document                       =%s",
+            self.file_name_curr,
         )
 
-        self._max_page = dcr_core.core_glob.text_parser.parse_result_no_pages_in_doc
+        self._max_page = self._run_context.text_parser.parse_result_no_pages_in_doc
 
         for page_idx, page_json in enumerate(line_pages_json):
             self._page_idx = page_idx
             self._parser_line_lines_json = page_json[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINES]
             self._process_page()
 
-        if dcr_core.core_glob.setup.is_create_extra_file_heading and self._toc:
+        if self._run_context.setup.is_create_extra_file_heading and self._toc:
             full_name = dcr_core.core_utils.get_full_name_from_components(
                 directory_name,
                 dcr_core.core_utils.get_stem_name(str(file_name_curr)) + "_heading." + dcr_core.core_glob.FILE_TYPE_JSON,
@@ -714,13 +737,14 @@ class LineTypeHeading:
                         dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOC: self._toc,
                     },
                     file_handle,
-                    indent=dcr_core.core_glob.setup.json_indent,
-                    sort_keys=dcr_core.core_glob.setup.is_json_sort_keys,
+                    indent=self._run_context.setup.json_indent,
+                    sort_keys=self._run_context.setup.is_json_sort_keys,
                 )
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_heading,
-            f"LineTypeHeading: End   document                       ={self.file_name_curr}",
+            self._run_context.setup.is_verbose_lt_heading,
+            "LineTypeHeading: End   document                       =%s",
+            self.file_name_curr,
         )
 
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
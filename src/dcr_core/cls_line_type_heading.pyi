@@ -8,11 +8,13 @@ import pathlib
 import re
 
 import dcr_core.cls_nlp_core
+import dcr_core.cls_run_context
 
 class LineTypeHeading:
     def __init__(
         self,
         file_name_curr: str = "",
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = ...,
     ) -> None:
         self._RULE_NAME_SIZE: int = 0
         self._anti_patterns: list[tuple[str, re.Pattern[str]]] = []
@@ -36,6 +38,7 @@ class LineTypeHeading:
                 str,
             ]
         ] = []
+        self._run_context: dcr_core.cls_run_context.RunContextProtocol
         self._toc: list[dict[str, int | object | str]] = []
         self.file_name_curr: str = ""
     @staticmethod
@@ -46,12 +49,12 @@ class LineTypeHeading:
     ) -> tuple[str, int, dcr_core.cls_nlp_core.NLPCore.ParserLineLines, int]: ...
     def _init_anti_patterns(self) -> list[tuple[str, re.Pattern[str]]]: ...
     def _init_rules(self) -> list[tuple[str, bool, str, collections.abc.Callable[[str, str], bool], list[str]]]: ...
-    @staticmethod
     def _load_anti_patterns_from_json(
+        self,
         lt_heading_rule_file: pathlib.Path,
     ) -> list[tuple[str, re.Pattern[str]]]: ...
-    @staticmethod
     def _load_rules_from_json(
+        self,
         lt_heading_rule_file: pathlib.Path,
     ) -> list[tuple[str, bool, str, collections.abc.Callable[[str, str], bool], list[str]]]: ...
     def _process_line(self, line_line: dict[str, str], text: str, first_token: str) -> int: ...
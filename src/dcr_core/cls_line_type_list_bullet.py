@@ -23,6 +23,7 @@ import pathlib
 import re
 
 import dcr_core.cls_nlp_core
+import dcr_core.cls_run_context
 
 
 # pylint: disable=too-many-instance-attributes
@@ -41,12 +42,15 @@ class LineTypeListBullet:
     def __init__(
         self,
         file_name_curr: str = "",
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = None,
     ) -> None:
         """Initialise the instance.
 
         Args:
             file_name_curr (str, optional): File name of the PDF document to be processed -
                 only for documentation purposes. Defaults to "".
+            run_context (RunContext, optional): The run context of the document.
+                Defaults to the global variables in dcr_core.core_glob.
         """
         try:
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
@@ -54,6 +58,8 @@ class LineTypeListBullet:
             dcr_core.core_glob.initialise_logger()
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
 
+        self._run_context = dcr_core.core_utils.get_run_context(run_context)
+
         dcr_core.core_glob.logger.debug("param file_name_curr=%s", file_name_curr)
 
         dcr_core.core_utils.check_exists_object(
@@ -62,6 +68,7 @@ class LineTypeListBullet:
             is_line_type_toc=True,
             is_setup=True,
             is_text_parser=True,
+            run_context=self._run_context,
         )
 
         self._file_name_curr = file_name_curr
@@ -69,12 +76,14 @@ class LineTypeListBullet:
 
         dcr_core.core_utils.check_exists_object(
             is_text_parser=True,
+            run_context=self._run_context,
         )
 
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_list_bullet, "LineTypeListBullet")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_list_bullet, "LineTypeListBullet")
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_bullet,
-            f"LineTypeListBullet: Start create instance                ={self._file_name_curr}",
+            self._run_context.setup.is_verbose_lt_list_bullet,
+            "LineTypeListBullet: Start create instance                =%s",
+            self._file_name_curr,
         )
 
         self._anti_patterns: list[tuple[str, re.Pattern[str]]] = self._init_anti_patterns()
@@ -110,8 +119,9 @@ class LineTypeListBullet:
         self._exist = True
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_bullet,
-            f"LineTypeListBullet: End   create instance                ={self._file_name_curr}",
+            self._run_context.setup.is_verbose_lt_list_bullet,
+            "LineTypeListBullet: End   create instance                =%s",
+            self._file_name_curr,
         )
 
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
@@ -124,19 +134,23 @@ class LineTypeListBullet:
         if self._no_entries == 0:
             return
 
-        if self._no_entries < dcr_core.core_glob.setup.lt_list_bullet_min_entries:
+        if self._no_entries < self._run_context.setup.lt_list_bullet_min_entries:
             dcr_core.core_utils.progress_msg(
-                dcr_core.core_glob.setup.is_verbose_lt_list_bullet,
-                f"LineTypeListBullet: Not enough list entries    found only={self._no_entries} - "
-                + f"bullet='{self._bullet}' - entries={self._entries}",
+                self._run_context.setup.is_verbose_lt_list_bullet,
+                "LineTypeListBullet: Not enough list entries    found only=%s - bullet='%s' - entries=%s",
+                self._no_entries,
+                self._bullet,
+                self._entries,
             )
             self._reset_list()
             return
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_bullet,
-            f"LineTypeListBullet: List entries                    found={self._no_entries} - "
-            + f"bullet='{self._bullet}' - entries={self._entries}",
+            self._run_context.setup.is_verbose_lt_list_bullet,
+            "LineTypeListBullet: List entries                    found=%s - bullet='%s' - entries=%s",
+            self._no_entries,
+            self._bullet,
+            self._entries,
         )
 
         self.no_lists += 1
@@ -144,7 +158,7 @@ class LineTypeListBullet:
         entries: LineTypeListBullet.Entries = []
 
         for [page_idx, para_no, line_lines_idx_from, line_lines_idx_till] in self._entries:
-            line_lines: dcr_core.cls_nlp_core.NLPCore.ParserLineLines = dcr_core.core_glob.text_parser.parse_result_line_pages[page_idx][
+            line_lines: dcr_core.cls_nlp_core.NLPCore.ParserLineLines = self._run_context.text_parser.parse_result_line_pages[page_idx][
                 dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINES
             ]
 
@@ -153,10 +167,10 @@ class LineTypeListBullet:
             for idx in range(line_lines_idx_from, line_lines_idx_till + 1):
                 line_lines[idx][dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINE_TYPE] = dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_LIST_BULLET
 
-                if dcr_core.core_glob.setup.is_create_extra_file_list_bullet:
+                if self._run_context.setup.is_create_extra_file_list_bullet:
                     text.append(line_lines[idx][dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TEXT])
 
-            if dcr_core.core_glob.setup.is_create_extra_file_list_bullet:
+            if self._run_context.setup.is_create_extra_file_list_bullet:
                 # {
                 #     "entryNo": 99,
                 #     "lineNoPageFrom": 99,
@@ -176,9 +190,9 @@ class LineTypeListBullet:
                     }
                 )
 
-            dcr_core.core_glob.text_parser.parse_result_line_pages[page_idx][dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINES] = line_lines
+            self._run_context.text_parser.parse_result_line_pages[page_idx][dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINES] = line_lines
 
-        if dcr_core.core_glob.setup.is_create_extra_file_list_bullet:
+        if self._run_context.setup.is_create_extra_file_list_bullet:
             # {
             #     "bullet": "xxx",
             #     "listNo": 99,
@@ -201,8 +215,9 @@ class LineTypeListBullet:
         self._reset_list()
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_bullet,
-            f"LineTypeListBullet: End   list                    on page={self._page_idx+1}",
+            self._run_context.setup.is_verbose_lt_list_bullet,
+            "LineTypeListBullet: End   list                    on page=%s",
+            self._page_idx + 1,
         )
 
     # ------------------------------------------------------------------
@@ -217,13 +232,13 @@ class LineTypeListBullet:
         Returns:
             list[tuple[str, re.Pattern[str]]]: The valid bulleted list anti-patterns.
         """
-        if dcr_core.core_glob.setup.lt_list_bullet_rule_file and dcr_core.core_glob.setup.lt_list_bullet_rule_file.lower() != "none":
-            lt_list_bullet_rule_file_path = dcr_core.core_utils.get_os_independent_name(dcr_core.core_glob.setup.lt_list_bullet_rule_file)
+        if self._run_context.setup.lt_list_bullet_rule_file and self._run_context.setup.lt_list_bullet_rule_file.lower() != "none":
+            lt_list_bullet_rule_file_path = dcr_core.core_utils.get_os_independent_name(self._run_context.setup.lt_list_bullet_rule_file)
             if os.path.isfile(lt_list_bullet_rule_file_path):
                 return self._load_anti_patterns_from_json(pathlib.Path(lt_list_bullet_rule_file_path))
 
             dcr_core.core_utils.terminate_fatal(
-                f"File with bulleted list anti-patterns is missing - " f"file name '{dcr_core.core_glob.setup.lt_list_bullet_rule_file}'"
+                f"File with bulleted list anti-patterns is missing - " f"file name '{self._run_context.setup.lt_list_bullet_rule_file}'"
             )
 
         anti_patterns = []
@@ -246,14 +261,14 @@ class LineTypeListBullet:
         Returns:
             dict[str, int]: All valid bullets.
         """
-        if dcr_core.core_glob.setup.lt_list_bullet_rule_file and dcr_core.core_glob.setup.lt_list_bullet_rule_file.lower() != "none":
-            lt_list_bullet_rule_file_path = dcr_core.core_utils.get_os_independent_name(dcr_core.core_glob.setup.lt_list_bullet_rule_file)
+        if self._run_context.setup.lt_list_bullet_rule_file and self._run_context.setup.lt_list_bullet_rule_file.lower() != "none":
+            lt_list_bullet_rule_file_path = dcr_core.core_utils.get_os_independent_name(self._run_context.setup.lt_list_bullet_rule_file)
 
             if os.path.isfile(lt_list_bullet_rule_file_path):
                 return self._load_rules_from_json(pathlib.Path(lt_list_bullet_rule_file_path))
 
             dcr_core.core_utils.terminate_fatal(
-                f"File with valid bullets is missing - " f"file name '{dcr_core.core_glob.setup.lt_list_bullet_rule_file}'"
+                f"File with valid bullets is missing - " f"file name '{self._run_context.setup.lt_list_bullet_rule_file}'"
             )
 
         return dcr_core.cls_nlp_core.NLPCore.get_lt_rules_default_list_bullet()
@@ -261,8 +276,8 @@ class LineTypeListBullet:
     # ------------------------------------------------------------------
     # Load the valid bulleted list anti-patterns from a JSON file.
     # ------------------------------------------------------------------
-    @staticmethod
     def _load_anti_patterns_from_json(
+        self,
         lt_list_bullet_rule_file: pathlib.Path,
     ) -> list[tuple[str, re.Pattern[str]]]:
         """Load the valid bulleted list anti-patterns from a JSON file.
@@ -288,9 +303,9 @@ class LineTypeListBullet:
                 )
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_bullet,
-            "The bulleted list anti-patterns were successfully loaded "
-            + f"from the file {dcr_core.core_glob.setup.lt_list_bullet_rule_file}",
+            self._run_context.setup.is_verbose_lt_list_bullet,
+            "The bulleted list anti-patterns were successfully loaded from the file %s",
+            self._run_context.setup.lt_list_bullet_rule_file,
         )
 
         return anti_patterns
@@ -298,8 +313,8 @@ class LineTypeListBullet:
     # ------------------------------------------------------------------
     # Load the valid bullets from a JSON file.
     # ------------------------------------------------------------------
-    @staticmethod
     def _load_rules_from_json(
+        self,
         lt_list_bullet_rule_file: pathlib.Path,
     ) -> dict[str, int]:
         """Load the valid bullets from a JSON file.
@@ -319,8 +334,9 @@ class LineTypeListBullet:
                 list_bullet_rules[bullet] = 0
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_bullet,
-            "The list_bullet rules were successfully loaded from the " + f"file {dcr_core.core_glob.setup.lt_list_bullet_rule_file}",
+            self._run_context.setup.is_verbose_lt_list_bullet,
+            "The list_bullet rules were successfully loaded from the file %s",
+            self._run_context.setup.lt_list_bullet_rule_file,
         )
 
         return list_bullet_rules
@@ -339,8 +355,10 @@ class LineTypeListBullet:
         for (rule_name, pattern) in self._anti_patterns:
             if pattern.match(text):
                 dcr_core.core_utils.progress_msg(
-                    dcr_core.core_glob.setup.is_verbose_lt_list_bullet,
-                    f"LineTypeListBullet: Anti pattern                         ={rule_name} - text={text}",
+                    self._run_context.setup.is_verbose_lt_list_bullet,
+                    "LineTypeListBullet: Anti pattern                         =%s - text=%s",
+                    rule_name,
+                    text,
                 )
                 return
 
@@ -376,11 +394,11 @@ class LineTypeListBullet:
             self._line_lines_idx_till = self._line_lines_idx
             self._llx_lower_limit = round(
                 (coord_llx := float(line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_COORD_LLX]))
-                * (100 - dcr_core.core_glob.setup.lt_list_bullet_tolerance_llx)
+                * (100 - self._run_context.setup.lt_list_bullet_tolerance_llx)
                 / 100,
                 2,
             )
-            self._llx_upper_limit = round(coord_llx * (100 + dcr_core.core_glob.setup.lt_list_bullet_tolerance_llx) / 100, 2)
+            self._llx_upper_limit = round(coord_llx * (100 + self._run_context.setup.lt_list_bullet_tolerance_llx) / 100, 2)
 
         self._entries.append([self._page_idx, para_no, self._line_lines_idx, self._line_lines_idx])
 
@@ -394,8 +412,9 @@ class LineTypeListBullet:
     def _process_page(self) -> None:
         """Process the page-related data."""
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_bullet,
-            f"LineTypeListBullet: Start page                           ={self._page_idx + 1}",
+            self._run_context.setup.is_verbose_lt_list_bullet,
+            "LineTypeListBullet: Start page                           =%s",
+            self._page_idx + 1,
         )
 
         self._max_line_line = len(self._parser_line_lines_json)
@@ -408,8 +427,9 @@ class LineTypeListBullet:
                 self._page_idx_prev = self._page_idx
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_bullet,
-            f"LineTypeListBullet: End   page                           ={self._page_idx + 1}",
+            self._run_context.setup.is_verbose_lt_list_bullet,
+            "LineTypeListBullet: End   page                           =%s",
+            self._page_idx + 1,
         )
 
     # ------------------------------------------------------------------
@@ -418,12 +438,12 @@ class LineTypeListBullet:
     def _reset_document(self) -> None:
         """Reset the document memory."""
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_bullet, "LineTypeListBullet: Reset the document memory"
+            self._run_context.setup.is_verbose_lt_list_bullet, "LineTypeListBullet: Reset the document memory"
         )
 
         self.no_lists = 0
 
-        if dcr_core.core_glob.setup.is_create_extra_file_list_bullet:
+        if self._run_context.setup.is_create_extra_file_list_bullet:
             self._lists = []
 
         self._reset_list()
@@ -445,7 +465,7 @@ class LineTypeListBullet:
         self._page_idx_prev = -1
         self._para_no_prev = 0
 
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_list_bullet, "LineTypeListBullet: Reset the list memory")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_list_bullet, "LineTypeListBullet: Reset the list memory")
 
     # ------------------------------------------------------------------
     # Check the object existence.
@@ -495,15 +515,17 @@ class LineTypeListBullet:
             is_line_type_toc=True,
             is_setup=True,
             is_text_parser=True,
+            run_context=self._run_context,
         )
 
         self._file_name_curr = file_name_curr
         self._environment_variant = environment_variant
 
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_list_bullet, "LineTypeListBullet")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_list_bullet, "LineTypeListBullet")
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_bullet,
-            f"LineTypeListBullet: Start document                       ={self._file_name_curr}",
+            self._run_context.setup.is_verbose_lt_list_bullet,
+            "LineTypeListBullet: Start document                       =%s",
+            self._file_name_curr,
         )
 
         self._reset_document()
@@ -515,7 +537,7 @@ class LineTypeListBullet:
 
         self._finish_list()
 
-        if dcr_core.core_glob.setup.is_create_extra_file_list_bullet and self._lists:
+        if self._run_context.setup.is_create_extra_file_list_bullet and self._lists:
             full_name = dcr_core.core_utils.get_full_name_from_components(
                 directory_name,
                 dcr_core.core_utils.get_stem_name(str(file_name_curr)) + "_list_bullet." + dcr_core.core_glob.FILE_TYPE_JSON,
@@ -536,19 +558,21 @@ class LineTypeListBullet:
                         dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LISTS_BULLET: self._lists,
                     },
                     file_handle,
-                    indent=dcr_core.core_glob.setup.json_indent,
-                    sort_keys=dcr_core.core_glob.setup.is_json_sort_keys,
+                    indent=self._run_context.setup.json_indent,
+                    sort_keys=self._run_context.setup.is_json_sort_keys,
                 )
 
         if self.no_lists > 0:
             dcr_core.core_utils.progress_msg(
-                dcr_core.core_glob.setup.is_verbose_lt_list_bullet,
-                f"LineTypeListBullet:                 number bulleted lists={self.no_lists}",
+                self._run_context.setup.is_verbose_lt_list_bullet,
+                "LineTypeListBullet:                 number bulleted lists=%s",
+                self.no_lists,
             )
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_bullet,
-            f"LineTypeListBullet: End   document                       ={self._file_name_curr}",
+            self._run_context.setup.is_verbose_lt_list_bullet,
+            "LineTypeListBullet: End   document                       =%s",
+            self._file_name_curr,
         )
 
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
@@ -7,6 +7,7 @@ import pathlib
 import re
 
 import dcr_core.cls_nlp_core
+import dcr_core.cls_run_context
 
 class LineTypeListBullet:
     Entry = dict[str, int | str]
@@ -17,6 +18,7 @@ class LineTypeListBullet:
     def __init__(
         self,
         file_name_curr: str = "",
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = ...,
     ) -> None:
         self._anti_patterns: list[tuple[str, re.Pattern[str]]] = []
         self._bullet: str = ""
@@ -34,16 +36,17 @@ class LineTypeListBullet:
         self._para_no_prev: int = 0
         self._parser_line_lines_json: dcr_core.cls_nlp_core.NLPCore.ParserLineLines = []
         self._rules: dict[str, int] = {}
+        self._run_context: dcr_core.cls_run_context.RunContextProtocol
         self.no_lists: int = 0
     def _finish_list(self) -> None: ...
     def _init_anti_patterns(self) -> list[tuple[str, re.Pattern[str]]]: ...
     def _init_rules(self) -> dict[str, int]: ...
-    @staticmethod
     def _load_anti_patterns_from_json(
+        self,
         lt_list_bullet_rule_file: pathlib.Path,
     ) -> list[tuple[str, re.Pattern[str]]]: ...
-    @staticmethod
     def _load_rules_from_json(
+        self,
         lt_list_bullet_rule_file: pathlib.Path,
     ) -> dict[str, int]: ...
     def _process_line(self, line_line: dict[str, float | int | str]) -> None: ...
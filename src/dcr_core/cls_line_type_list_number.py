@@ -27,6 +27,7 @@ import pathlib
 import re
 
 import dcr_core.cls_nlp_core
+import dcr_core.cls_run_context
 
 
 # pylint: disable=too-many-instance-attributes
@@ -48,12 +49,15 @@ class LineTypeListNumber:
     def __init__(
         self,
         file_name_curr: str = "",
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = None,
     ) -> None:
         """Initialise the instance.
 
         Args:
             file_name_curr (str, optional): File name of the PDF document to be processed -
                     only for documentation purposes. Defaults to "".
+            run_context (RunContext, optional): The run context of the document.
+                Defaults to the global variables in dcr_core.core_glob.
         """
         try:
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
@@ -61,6 +65,8 @@ class LineTypeListNumber:
             dcr_core.core_glob.initialise_logger()
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
 
+        self._run_context = dcr_core.core_utils.get_run_context(run_context)
+
         dcr_core.core_glob.logger.debug("param file_name_curr=%s", file_name_curr)
 
         dcr_core.core_utils.check_exists_object(
@@ -70,6 +76,7 @@ class LineTypeListNumber:
             is_line_type_toc=True,
             is_setup=True,
             is_text_parser=True,
+            run_context=self._run_context,
         )
 
         self.file_name_curr = file_name_curr
@@ -77,12 +84,14 @@ class LineTypeListNumber:
 
         dcr_core.core_utils.check_exists_object(
             is_text_parser=True,
+            run_context=self._run_context,
         )
 
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_list_number, "LineTypeListNumber")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_list_number, "LineTypeListNumber")
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_number,
-            f"LineTypeListNumber: Start create instance                ={self.file_name_curr}",
+            self._run_context.setup.is_verbose_lt_list_number,
+            "LineTypeListNumber: Start create instance                =%s",
+            self.file_name_curr,
         )
 
         self._RULE_NAME_SIZE: int = 20
@@ -147,8 +156,9 @@ class LineTypeListNumber:
         self._exist = True
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_number,
-            f"LineTypeListNumber: End   create instance                ={self.file_name_curr}",
+            self._run_context.setup.is_verbose_lt_list_number,
+            "LineTypeListNumber: End   create instance                =%s",
+            self.file_name_curr,
         )
 
     # ------------------------------------------------------------------
@@ -159,19 +169,23 @@ class LineTypeListNumber:
         if self._no_entries == 0:
             return
 
-        if self._no_entries < dcr_core.core_glob.setup.lt_list_number_min_entries:
+        if self._no_entries < self._run_context.setup.lt_list_number_min_entries:
             dcr_core.core_utils.progress_msg(
-                dcr_core.core_glob.setup.is_verbose_lt_list_number,
-                f"LineTypeListNumber: Not enough list entries    found only={self._no_entries} - "
-                + f"number='{self._rule[0]}' - entries={self._entries}",
+                self._run_context.setup.is_verbose_lt_list_number,
+                "LineTypeListNumber: Not enough list entries    found only=%s - number='%s' - entries=%s",
+                self._no_entries,
+                self._rule[0],
+                self._entries,
             )
             self._reset_list()
             return
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_number,
-            f"LineTypeListNumber: List entries                    found={self._no_entries} - "
-            + f"number='{self._rule[0]}' - entries={self._entries}",
+            self._run_context.setup.is_verbose_lt_list_number,
+            "LineTypeListNumber: List entries                    found=%s - number='%s' - entries=%s",
+            self._no_entries,
+            self._rule[0],
+            self._entries,
         )
 
         self.no_lists += 1
@@ -188,10 +202,10 @@ class LineTypeListNumber:
             for idx in range(int(line_lines_idx_from), int(line_lines_idx_till) + 1):
                 line_lines[idx][dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINE_TYPE] = dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_LIST_NUMBER
 
-                if dcr_core.core_glob.setup.is_create_extra_file_list_number:
+                if self._run_context.setup.is_create_extra_file_list_number:
                     text.append(line_lines[idx][dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TEXT])
 
-            if dcr_core.core_glob.setup.is_create_extra_file_list_number:
+            if self._run_context.setup.is_create_extra_file_list_number:
                 # {
                 #     "entryNo": 99,
                 #     "lineNoPageFrom": 99,
@@ -213,7 +227,7 @@ class LineTypeListNumber:
 
             self._line_pages_json[page_idx][dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINES] = line_lines
 
-        if dcr_core.core_glob.setup.is_create_extra_file_list_number:
+        if self._run_context.setup.is_create_extra_file_list_number:
             # {
             #     "number": "xxx",
             #     "listNo": 99,
@@ -231,7 +245,7 @@ class LineTypeListNumber:
                 dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGE_NO_TILL: int(self._entries[-1][0]) + 1,
             }
 
-            if dcr_core.core_glob.setup.is_lt_list_number_file_incl_regexp:
+            if self._run_context.setup.is_lt_list_number_file_incl_regexp:
                 entry[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_REGEXP] = self._rule[-1]
 
             entry[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_ENTRIES] = entries
@@ -241,8 +255,9 @@ class LineTypeListNumber:
         self._reset_list()
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_number,
-            f"LineTypeListNumber: End   list                    on page={self._page_idx+1}",
+            self._run_context.setup.is_verbose_lt_list_number,
+            "LineTypeListNumber: End   list                    on page=%s",
+            self._page_idx + 1,
         )
 
     # ------------------------------------------------------------------
@@ -257,13 +272,13 @@ class LineTypeListNumber:
         Returns:
             list[tuple[str, re.Pattern[str]]]: The valid numbered list anti-patterns.
         """
-        if dcr_core.core_glob.setup.lt_list_number_rule_file and dcr_core.core_glob.setup.lt_list_number_rule_file.lower() != "none":
-            lt_list_number_rule_file_path = dcr_core.core_utils.get_os_independent_name(dcr_core.core_glob.setup.lt_list_number_rule_file)
+        if self._run_context.setup.lt_list_number_rule_file and self._run_context.setup.lt_list_number_rule_file.lower() != "none":
+            lt_list_number_rule_file_path = dcr_core.core_utils.get_os_independent_name(self._run_context.setup.lt_list_number_rule_file)
             if os.path.isfile(lt_list_number_rule_file_path):
                 return self._load_anti_patterns_from_json(pathlib.Path(lt_list_number_rule_file_path))
 
             dcr_core.core_utils.terminate_fatal(
-                f"File with numbered list anti-patterns is missing - " f"file name '{dcr_core.core_glob.setup.lt_list_number_rule_file}'"
+                f"File with numbered list anti-patterns is missing - " f"file name '{self._run_context.setup.lt_list_number_rule_file}'"
             )
 
         anti_patterns = []
@@ -293,13 +308,13 @@ class LineTypeListNumber:
             list[tuple[str, str, collections.abc.Callable[[str, str], bool], list[str]]]: The
                 valid numbered list rules.
         """
-        if dcr_core.core_glob.setup.lt_list_number_rule_file and dcr_core.core_glob.setup.lt_list_number_rule_file.lower() != "none":
-            lt_list_number_rule_file_path = dcr_core.core_utils.get_os_independent_name(dcr_core.core_glob.setup.lt_list_number_rule_file)
+        if self._run_context.setup.lt_list_number_rule_file and self._run_context.setup.lt_list_number_rule_file.lower() != "none":
+            lt_list_number_rule_file_path = dcr_core.core_utils.get_os_independent_name(self._run_context.setup.lt_list_number_rule_file)
             if os.path.isfile(lt_list_number_rule_file_path):
                 return self._load_rules_from_json(pathlib.Path(lt_list_number_rule_file_path))
 
             dcr_core.core_utils.terminate_fatal(
-                f"File with numbered list rules is missing - " f"file name '{dcr_core.core_glob.setup.lt_list_number_rule_file}'"
+                f"File with numbered list rules is missing - " f"file name '{self._run_context.setup.lt_list_number_rule_file}'"
             )
 
         return dcr_core.cls_nlp_core.NLPCore.get_lt_rules_default_list_number()
@@ -307,8 +322,8 @@ class LineTypeListNumber:
     # ------------------------------------------------------------------
     # Load the valid numbered list anti-patterns from a JSON file.
     # ------------------------------------------------------------------
-    @staticmethod
     def _load_anti_patterns_from_json(
+        self,
         lt_list_number_rule_file: pathlib.Path,
     ) -> list[tuple[str, re.Pattern[str]]]:
         """Load the valid numbered list anti-patterns from a JSON file.
@@ -334,9 +349,9 @@ class LineTypeListNumber:
                 )
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_number,
-            "The numbered list anti-patterns were successfully loaded "
-            + f"from the file {dcr_core.core_glob.setup.lt_list_number_rule_file}",
+            self._run_context.setup.is_verbose_lt_list_number,
+            "The numbered list anti-patterns were successfully loaded from the file %s",
+            self._run_context.setup.lt_list_number_rule_file,
         )
 
         return anti_patterns
@@ -344,8 +359,8 @@ class LineTypeListNumber:
     # ------------------------------------------------------------------
     # Load numbered list rules from a JSON file.
     # ------------------------------------------------------------------
-    @staticmethod
     def _load_rules_from_json(
+        self,
         lt_list_number_rule_file: pathlib.Path,
     ) -> list[LineTypeListNumber.RuleExtern]:
         """Load numbered list rules from a JSON file.
@@ -376,8 +391,9 @@ class LineTypeListNumber:
                 )
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_number,
-            "The list_number rules were successfully loaded from the " + f"file {dcr_core.core_glob.setup.lt_list_number_rule_file}",
+            self._run_context.setup.is_verbose_lt_list_number,
+            "The list_number rules were successfully loaded from the file %s",
+            self._run_context.setup.lt_list_number_rule_file,
         )
 
         return rules
@@ -396,8 +412,10 @@ class LineTypeListNumber:
         for (rule_name, pattern) in self._anti_patterns:
             if pattern.match(text):
                 dcr_core.core_utils.progress_msg(
-                    dcr_core.core_glob.setup.is_verbose_lt_list_number,
-                    f"LineTypeListNumber: Anti pattern                         ={rule_name} - text={text}",
+                    self._run_context.setup.is_verbose_lt_list_number,
+                    "LineTypeListNumber: Anti pattern                         =%s - text=%s",
+                    rule_name,
+                    text,
                 )
                 return
 
@@ -452,11 +470,11 @@ class LineTypeListNumber:
             self._line_lines_idx_till = self._line_lines_idx
             self._llx_lower_limit = round(
                 (coord_llx := float(line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_COORD_LLX]))
-                * (100 - dcr_core.core_glob.setup.lt_list_number_tolerance_llx)
+                * (100 - self._run_context.setup.lt_list_number_tolerance_llx)
                 / 100,
                 2,
             )
-            self._llx_upper_limit = round(coord_llx * (100 + dcr_core.core_glob.setup.lt_list_number_tolerance_llx) / 100, 2)
+            self._llx_upper_limit = round(coord_llx * (100 + self._run_context.setup.lt_list_number_tolerance_llx) / 100, 2)
 
         self._entries.append([self._page_idx, para_no, self._line_lines_idx, self._line_lines_idx, target_value])
 
@@ -470,8 +488,9 @@ class LineTypeListNumber:
     def _process_page(self) -> None:
         """Process the page-related data."""
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_number,
-            f"LineTypeListNumber: Start page                           ={self._page_idx + 1}",
+            self._run_context.setup.is_verbose_lt_list_number,
+            "LineTypeListNumber: Start page                           =%s",
+            self._page_idx + 1,
         )
 
         self._max_line_line = len(self._parser_line_lines_json)
@@ -484,8 +503,9 @@ class LineTypeListNumber:
                 self._page_idx_prev = self._page_idx
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_number,
-            f"LineTypeListNumber: End   page                           ={self._page_idx + 1}",
+            self._run_context.setup.is_verbose_lt_list_number,
+            "LineTypeListNumber: End   page                           =%s",
+            self._page_idx + 1,
         )
 
     # ------------------------------------------------------------------
@@ -493,13 +513,11 @@ class LineTypeListNumber:
     # ------------------------------------------------------------------
     def _reset_document(self) -> None:
         """Reset the document memory."""
-        self._max_page = dcr_core.core_glob.text_parser.parse_result_no_pages_in_doc
+        self._max_page = self._run_context.text_parser.parse_result_no_pages_in_doc
 
         self._lists = []
 
-        dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_number, "LineTypeListNumber: Reset the document memory"
-        )
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_list_number, "LineTypeListNumber: Reset the document memory")
 
         self._reset_list()
 
@@ -524,7 +542,7 @@ class LineTypeListNumber:
 
         self._rule = ()  # type: ignore
 
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_list_number, "LineTypeListNumber: Reset the list memory")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_list_number, "LineTypeListNumber: Reset the list memory")
 
     # ------------------------------------------------------------------
     # Check the object existence.
@@ -575,16 +593,18 @@ class LineTypeListNumber:
             is_line_type_toc=True,
             is_setup=True,
             is_text_parser=True,
+            run_context=self._run_context,
         )
 
         self.file_name_curr = file_name_curr
         self._environment_variant = environment_variant
         self._line_pages_json = line_pages_json
 
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_list_number, "LineTypeListNumber")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_list_number, "LineTypeListNumber")
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_number,
-            f"LineTypeListNumber: Start document                       ={self.file_name_curr}",
+            self._run_context.setup.is_verbose_lt_list_number,
+            "LineTypeListNumber: Start document                       =%s",
+            self.file_name_curr,
         )
 
         self._reset_document()
@@ -596,7 +616,7 @@ class LineTypeListNumber:
 
         self._finish_list()
 
-        if dcr_core.core_glob.setup.is_create_extra_file_list_number and self._lists:
+        if self._run_context.setup.is_create_extra_file_list_number and self._lists:
             full_name = dcr_core.core_utils.get_full_name_from_components(
                 directory_name,
                 dcr_core.core_utils.get_stem_name(str(file_name_curr)) + "_list_number." + dcr_core.core_glob.FILE_TYPE_JSON,
@@ -610,19 +630,21 @@ class LineTypeListNumber:
                         dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LISTS_NUMBER: self._lists,
                     },
                     file_handle,
-                    indent=dcr_core.core_glob.setup.json_indent,
-                    sort_keys=dcr_core.core_glob.setup.is_json_sort_keys,
+                    indent=self._run_context.setup.json_indent,
+                    sort_keys=self._run_context.setup.is_json_sort_keys,
                 )
 
         if self.no_lists > 0:
             dcr_core.core_utils.progress_msg(
-                dcr_core.core_glob.setup.is_verbose_lt_list_number,
-                f"LineTypeListNumber:                 number numbered lists={self.no_lists}",
+                self._run_context.setup.is_verbose_lt_list_number,
+                "LineTypeListNumber:                 number numbered lists=%s",
+                self.no_lists,
             )
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_list_number,
-            f"LineTypeListNumber: End   document                       ={self.file_name_curr}",
+            self._run_context.setup.is_verbose_lt_list_number,
+            "LineTypeListNumber: End   document                       =%s",
+            self.file_name_curr,
         )
 
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
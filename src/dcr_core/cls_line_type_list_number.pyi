@@ -8,6 +8,7 @@ import pathlib
 import re
 
 import dcr_core.cls_nlp_core
+import dcr_core.cls_run_context
 
 class LineTypeListNumber:
     Entry = dict[str, int | str]
@@ -20,6 +21,7 @@ class LineTypeListNumber:
     def __init__(
         self,
         file_name_curr: str = "",
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = ...,
     ) -> None:
         self._RULE_NAME_SIZE: int = 0
         self._anti_patterns: list[tuple[str, re.Pattern[str]]] = []
@@ -39,17 +41,18 @@ class LineTypeListNumber:
         self._rule: LineTypeListNumber.RuleIntern = ()  # type: ignore
         self._rules: list[LineTypeListNumber.RuleExtern] = []
         self._rules_collection: list[LineTypeListNumber.RuleIntern] = []
+        self._run_context: dcr_core.cls_run_context.RunContextProtocol
         self.file_name_curr: str = ""
         self.no_lists: int = 0
     def _finish_list(self) -> None: ...
     def _init_anti_patterns(self) -> list[tuple[str, re.Pattern[str]]]: ...
     def _init_rules(self) -> list[LineTypeListNumber.RuleExtern]: ...
-    @staticmethod
     def _load_anti_patterns_from_json(
+        self,
         lt_list_number_rule_file: pathlib.Path,
     ) -> list[tuple[str, re.Pattern[str]]]: ...
-    @staticmethod
     def _load_rules_from_json(
+        self,
         lt_list_number_rule_file: pathlib.Path,
     ) -> list[LineTypeListNumber.RuleExtern]: ...
     def _process_line(self, line_line: dict[str, float | int | str]) -> None: ...
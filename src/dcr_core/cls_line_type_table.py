@@ -20,6 +20,7 @@ Typical usage example:
 import json
 
 import dcr_core.cls_nlp_core
+import dcr_core.cls_run_context
 
 
 # pylint: disable=too-many-instance-attributes
@@ -41,12 +42,15 @@ class LineTypeTable:
     def __init__(
         self,
         file_name_curr: str = "",
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = None,
     ) -> None:
         """Initialise the instance.
 
         Args:
             file_name_curr (str, optional): File name of the PDF document to be processed -
                 only for documentation purposes. Defaults to "".
+            run_context (RunContext, optional): The run context of the document.
+                Defaults to the global variables in dcr_core.core_glob.
         """
         try:
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
@@ -54,6 +58,8 @@ class LineTypeTable:
             dcr_core.core_glob.initialise_logger()
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
 
+        self._run_context = dcr_core.core_utils.get_run_context(run_context)
+
         dcr_core.core_glob.logger.debug("param file_name_curr=%s", file_name_curr)
 
         dcr_core.core_utils.check_exists_object(
@@ -61,14 +67,16 @@ class LineTypeTable:
             is_line_type_toc=True,
             is_setup=True,
             is_text_parser=True,
+            run_context=self._run_context,
         )
 
         self._file_name_curr = file_name_curr
 
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_table, "LineTypeTable")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_table, "LineTypeTable")
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_table,
-            f"LineTypeTable: Start create instance                ={self._file_name_curr}",
+            self._run_context.setup.is_verbose_lt_table,
+            "LineTypeTable: Start create instance                =%s",
+            self._file_name_curr,
         )
 
         self._column_no = 0
@@ -103,8 +111,9 @@ class LineTypeTable:
         self._exist = True
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_table,
-            f"LineTypeTable: End   create instance                ={self._file_name_curr}",
+            self._run_context.setup.is_verbose_lt_table,
+            "LineTypeTable: End   create instance                =%s",
+            self._file_name_curr,
         )
 
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
@@ -140,8 +149,9 @@ class LineTypeTable:
         self._reset_row()
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_table,
-            f"LineTypeTable: End   row                            ={row_no}",
+            self._run_context.setup.is_verbose_lt_table,
+            "LineTypeTable: End   row                            =%s",
+            row_no,
         )
 
     # ------------------------------------------------------------------
@@ -183,8 +193,9 @@ class LineTypeTable:
         self._reset_table()
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_table,
-            f"LineTypeTable: End   table                   on page={self._page_idx+1}",
+            self._run_context.setup.is_verbose_lt_table,
+            "LineTypeTable: End   table                   on page=%s",
+            self._page_idx + 1,
         )
 
     # ------------------------------------------------------------------
@@ -214,7 +225,7 @@ class LineTypeTable:
 
         text = line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TEXT]
 
-        if text == "" and not dcr_core.core_glob.setup.is_lt_table_file_incl_empty_columns:
+        if text == "" and not self._run_context.setup.is_lt_table_file_incl_empty_columns:
             return dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_TABLE
 
         coord_llx = float(line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_COORD_LLX])
@@ -290,7 +301,7 @@ class LineTypeTable:
 
         self.table_no = 0
 
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_table, "LineTypeTable: Reset the document memory")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_table, "LineTypeTable: Reset the document memory")
 
         self._reset_table()
 
@@ -305,7 +316,7 @@ class LineTypeTable:
         self._first_column_llx = 0.0
         self._last_column_urx = 0.0
 
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_table, "LineTypeTable: Reset the row memory")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_table, "LineTypeTable: Reset the row memory")
 
     # ------------------------------------------------------------------
     # Reset the table memory.
@@ -327,7 +338,7 @@ class LineTypeTable:
 
         self.table_no = 0
 
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_table, "LineTypeTable: Reset the table memory")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_table, "LineTypeTable: Reset the table memory")
 
         self._reset_row()
 
@@ -374,14 +385,16 @@ class LineTypeTable:
             is_line_type_toc=True,
             is_setup=True,
             is_text_parser=True,
+            run_context=self._run_context,
         )
 
         self._file_name_curr = file_name_curr
 
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_table, "LineTypeTable")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_table, "LineTypeTable")
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_table,
-            f"LineTypeTable: Start document                       ={self._file_name_curr}",
+            self._run_context.setup.is_verbose_lt_table,
+            "LineTypeTable: Start document                       =%s",
+            self._file_name_curr,
         )
 
         self._reset_document()
@@ -391,7 +404,7 @@ class LineTypeTable:
             self._parser_line_lines_json = page_json[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINES]
             self._process_page()
 
-        if dcr_core.core_glob.setup.is_create_extra_file_table and self._tables:
+        if self._run_context.setup.is_create_extra_file_table and self._tables:
             full_name = dcr_core.core_utils.get_full_name_from_components(
                 directory_name,
                 dcr_core.core_utils.get_stem_name(str(file_name_curr)) + "_table." + dcr_core.core_glob.FILE_TYPE_JSON,
@@ -412,19 +425,21 @@ class LineTypeTable:
                         dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TABLES: self._tables,
                     },
                     file_handle,
-                    indent=dcr_core.core_glob.setup.json_indent,
-                    sort_keys=dcr_core.core_glob.setup.is_json_sort_keys,
+                    indent=self._run_context.setup.json_indent,
+                    sort_keys=self._run_context.setup.is_json_sort_keys,
                 )
 
         if self.no_tables > 0:
             dcr_core.core_utils.progress_msg(
-                dcr_core.core_glob.setup.is_verbose_lt_table,
-                f"LineTypeTable:                         number tables={self.no_tables}",
+                self._run_context.setup.is_verbose_lt_table,
+                "LineTypeTable:                         number tables=%s",
+                self.no_tables,
             )
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_table,
-            f"LineTypeTable: End   document                       ={self._file_name_curr}",
+            self._run_context.setup.is_verbose_lt_table,
+            "LineTypeTable: End   document                       =%s",
+            self._file_name_curr,
         )
 
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
@@ -4,6 +4,7 @@
 
 """Module stub file."""
 import dcr_core.cls_nlp_core
+import dcr_core.cls_run_context
 
 class LineTypeTable:
     Column = dict[str, float | int | object | str]
@@ -16,6 +17,7 @@ class LineTypeTable:
     def __init__(
         self,
         file_name_curr: str = "",
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = ...,
     ) -> None:
         self._column_no: int = 0
         self._column_no_prev: int = 0
@@ -35,6 +37,7 @@ class LineTypeTable:
         self._row_no: int = 0
         self._row_no_prev: int = 0
         self._rows: LineTypeTable.Rows = []
+        self._run_context: dcr_core.cls_run_context.RunContextProtocol
         self._tables: LineTypeTable.Tables = []
         self.no_tables: int = 0
     def _finish_row(self) -> None: ...
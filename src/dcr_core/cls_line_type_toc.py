@@ -15,6 +15,7 @@ Typical usage example:
 """
 
 import dcr_core.cls_nlp_core
+import dcr_core.cls_run_context
 
 
 class LineTypeToc:
@@ -26,6 +27,7 @@ class LineTypeToc:
     def __init__(
         self,
         file_name_curr: str = "",
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = None,
     ) -> None:
         """Initialise the instance.
 
@@ -33,6 +35,8 @@ class LineTypeToc:
             file_name_curr (str, optional): File name of the PDF document to be processed -
                                             only for documentation purposes.
                                             Defaults to "".
+            run_context (RunContext, optional): The run context of the document.
+                Defaults to the global variables in dcr_core.core_glob.
         """
         try:
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
@@ -40,20 +44,24 @@ class LineTypeToc:
             dcr_core.core_glob.initialise_logger()
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
 
+        self._run_context = dcr_core.core_utils.get_run_context(run_context)
+
         dcr_core.core_glob.logger.debug("param file_name_curr=%s", file_name_curr)
 
         dcr_core.core_utils.check_exists_object(
             is_line_type_header_footer=True,
             is_setup=True,
             is_text_parser=True,
+            run_context=self._run_context,
         )
 
         self._file_name_curr = file_name_curr
 
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_toc, "LineTypeToc")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_toc, "LineTypeToc")
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_toc,
-            f"LineTypeToc: Start create instance                ={self._file_name_curr}",
+            self._run_context.setup.is_verbose_lt_toc,
+            "LineTypeToc: Start create instance                =%s",
+            self._file_name_curr,
         )
 
         self._is_toc_existing = False
@@ -75,8 +83,9 @@ class LineTypeToc:
         self._exist = True
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_toc,
-            f"LineTypeToc: End   create instance                ={self._file_name_curr}",
+            self._run_context.setup.is_verbose_lt_toc,
+            "LineTypeToc: End   create instance                =%s",
+            self._file_name_curr,
         )
 
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
@@ -89,8 +98,9 @@ class LineTypeToc:
             return
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_toc,
-            f"LineTypeToc: Start check TOC candidate            ={len(self._toc_candidates)}",
+            self._run_context.setup.is_verbose_lt_toc,
+            "LineTypeToc: Start check TOC candidate            =%s",
+            len(self._toc_candidates),
         )
 
         row_no = 0
@@ -104,8 +114,10 @@ class LineTypeToc:
                 if row_no != 1:
                     self._init_toc_candidate()
                     dcr_core.core_utils.progress_msg(
-                        dcr_core.core_glob.setup.is_verbose_lt_toc,
-                        "LineTypeToc: End   check TOC candidate (!=)       " + f"={self._is_toc_existing}: {page_no_toc}",
+                        self._run_context.setup.is_verbose_lt_toc,
+                        "LineTypeToc: End   check TOC candidate (!=)       =%s: %s",
+                        self._is_toc_existing,
+                        page_no_toc,
                     )
                     return
 
@@ -114,8 +126,10 @@ class LineTypeToc:
             if page_no_toc < page_no_toc_last or page_no_toc > page_no_max:
                 self._init_toc_candidate()
                 dcr_core.core_utils.progress_msg(
-                    dcr_core.core_glob.setup.is_verbose_lt_toc,
-                    "LineTypeToc: End   check TOC candidate (<>)       " + f"={self._is_toc_existing}: {page_no_toc}",
+                    self._run_context.setup.is_verbose_lt_toc,
+                    "LineTypeToc: End   check TOC candidate (<>)       =%s: %s",
+                    self._is_toc_existing,
+                    page_no_toc,
                 )
                 return
 
@@ -124,8 +138,9 @@ class LineTypeToc:
         self._is_toc_existing = True
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_toc,
-            "LineTypeToc: End   check TOC candidate            " + f"={self._is_toc_existing}",
+            self._run_context.setup.is_verbose_lt_toc,
+            "LineTypeToc: End   check TOC candidate            =%s",
+            self._is_toc_existing,
         )
 
     # ------------------------------------------------------------------
@@ -139,15 +154,16 @@ class LineTypeToc:
     # ------------------------------------------------------------------
     def _process_page_lines(self) -> None:
         """Process the page-related data - line version."""
-        if self._is_toc_existing or self._page_no >= dcr_core.core_glob.setup.lt_toc_last_page:
+        if self._is_toc_existing or self._page_no >= self._run_context.setup.lt_toc_last_page:
             return
 
         self._page_no += 1
 
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_toc, "LineTypeToc")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_toc, "LineTypeToc")
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_toc,
-            f"LineTypeToc: Start page (lines)                   ={self._page_no}",
+            self._run_context.setup.is_verbose_lt_toc,
+            "LineTypeToc: Start page (lines)                   =%s",
+            self._page_no,
         )
 
         for line_line in self._parser_line_lines_json:
@@ -162,8 +178,9 @@ class LineTypeToc:
                             break
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_toc,
-            f"LineTypeToc: End   page (lines)                   ={self._page_no}",
+            self._run_context.setup.is_verbose_lt_toc,
+            "LineTypeToc: End   page (lines)                   =%s",
+            self._page_no,
         )
 
     # ------------------------------------------------------------------
@@ -171,15 +188,16 @@ class LineTypeToc:
     # ------------------------------------------------------------------
     def _process_page_table(self) -> None:
         """Process the page-related data - table version."""
-        if self._is_toc_existing or self._page_no >= dcr_core.core_glob.setup.lt_toc_last_page:
+        if self._is_toc_existing or self._page_no >= self._run_context.setup.lt_toc_last_page:
             return
 
         self._page_no += 1
 
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_toc, "LineTypeToc")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_toc, "LineTypeToc")
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_toc,
-            f"LineTypeToc: Start page (table)                   ={self._page_no}",
+            self._run_context.setup.is_verbose_lt_toc,
+            "LineTypeToc: Start page (table)                   =%s",
+            self._page_no,
         )
 
         for line_line in self._parser_line_lines_json:
@@ -192,8 +210,9 @@ class LineTypeToc:
                         break
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_toc,
-            f"LineTypeToc: End   page (table)                   ={self._page_no}",
+            self._run_context.setup.is_verbose_lt_toc,
+            "LineTypeToc: End   page (table)                   =%s",
+            self._page_no,
         )
 
     # ------------------------------------------------------------------
@@ -242,14 +261,16 @@ class LineTypeToc:
         self.no_lines_toc = len(self._toc_candidates)
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_toc,
-            f"LineTypeToc: Start store result                   ={self.no_lines_toc}",
+            self._run_context.setup.is_verbose_lt_toc,
+            "LineTypeToc: Start store result                   =%s",
+            self.no_lines_toc,
         )
 
-        if len(self._toc_candidates) < dcr_core.core_glob.setup.lt_toc_min_entries:
+        if len(self._toc_candidates) < self._run_context.setup.lt_toc_min_entries:
             dcr_core.core_utils.progress_msg(
-                dcr_core.core_glob.setup.is_verbose_lt_toc,
-                f"LineTypeToc: End   store result (min. entries)    ={self.no_lines_toc}",
+                self._run_context.setup.is_verbose_lt_toc,
+                "LineTypeToc: End   store result (min. entries)    =%s",
+                self.no_lines_toc,
             )
             self.no_lines_toc = 0
             return
@@ -289,8 +310,9 @@ class LineTypeToc:
                             line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINE_TYPE] = dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_TOC
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_toc,
-            f"LineTypeToc: End   store result                   ={self.no_lines_toc}",
+            self._run_context.setup.is_verbose_lt_toc,
+            "LineTypeToc: End   store result                   =%s",
+            self.no_lines_toc,
         )
 
     # ------------------------------------------------------------------
@@ -326,14 +348,16 @@ class LineTypeToc:
             is_line_type_header_footer=True,
             is_setup=True,
             is_text_parser=True,
+            run_context=self._run_context,
         )
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_toc,
-            f"LineTypeToc: lt_toc_last_page={dcr_core.core_glob.setup.lt_toc_last_page}",
+            self._run_context.setup.is_verbose_lt_toc,
+            "LineTypeToc: lt_toc_last_page=%s",
+            self._run_context.setup.lt_toc_last_page,
         )
 
-        if dcr_core.core_glob.setup.lt_toc_last_page == 0:
+        if self._run_context.setup.lt_toc_last_page == 0:
             return
 
         self._file_name_curr = file_name_curr
@@ -341,10 +365,11 @@ class LineTypeToc:
 
         self._parser_no_pages_in_doc = len(self.line_pages_json)
 
-        dcr_core.core_utils.progress_msg(dcr_core.core_glob.setup.is_verbose_lt_toc, "LineTypeToc")
+        dcr_core.core_utils.progress_msg(self._run_context.setup.is_verbose_lt_toc, "LineTypeToc")
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_toc,
-            f"LineTypeToc: Start document                       ={self._file_name_curr}",
+            self._run_context.setup.is_verbose_lt_toc,
+            "LineTypeToc: Start document                       =%s",
+            self._file_name_curr,
         )
 
         # -------------------------------------------------------------------------
@@ -380,8 +405,9 @@ class LineTypeToc:
             self._store_results()
 
         dcr_core.core_utils.progress_msg(
-            dcr_core.core_glob.setup.is_verbose_lt_toc,
-            f"LineTypeToc: End   document                       ={self._file_name_curr}",
+            self._run_context.setup.is_verbose_lt_toc,
+            "LineTypeToc: End   document                       =%s",
+            self._file_name_curr,
         )
 
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
@@ -4,11 +4,13 @@
 
 """Module stub file."""
 import dcr_core.cls_nlp_core
+import dcr_core.cls_run_context
 
 class LineTypeToc:
     def __init__(
         self,
         file_name_curr: str = "",
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = ...,
     ) -> None:
         self._exist: bool = False
         self._file_name_curr: str = ""
@@ -16,6 +18,7 @@ class LineTypeToc:
         self._page_no: int = 0
         self._parser_line_lines_json: dcr_core.cls_nlp_core.NLPCore.ParserLineLines = []
         self._parser_no_pages_in_doc: int = 0
+        self._run_context: dcr_core.cls_run_context.RunContextProtocol
         self._strategy: str = ""
         self._toc_candidates: list[list[int]] = []
         self.no_lines_toc: int = 0
@@ -25,6 +25,12 @@ class NLPCore:
     # ------------------------------------------------------------------
     # Global type aliases.
     # ------------------------------------------------------------------
+    PandocAst = dict[str, object]
+    PandocBlocks = list[dict[str, object]]
+
+    PandocPara = tuple[int, list[str], tuple[int, int, int] | None]
+    PandocParas = list[PandocPara]
+
     ParserLineLine = dict[str, int | str]
     ParserLineLines = list[ParserLineLine]
 
@@ -55,6 +61,9 @@ class NLPCore:
 
     ParserWordDocument = dict[str, int | str | ParserWordPages]
 
+    TesseractPage = tuple[dict[str, list[float | int | str]], float]
+    TesseractPages = list[TesseractPage]
+
     # ------------------------------------------------------------------
     # Class variables.
     # ------------------------------------------------------------------
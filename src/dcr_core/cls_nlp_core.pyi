@@ -7,6 +7,10 @@ import collections
 from typing import ClassVar
 
 class NLPCore:
+    PandocAst = dict[str, object]
+    PandocBlocks = list[dict[str, object]]
+    PandocPara = tuple[int, list[str], tuple[int, int, int] | None]
+    PandocParas = list[PandocPara]
     ParserLineLine = dict[str, int | str]
     ParserLineLines = list[ParserLineLine]
     ParserLinePage = dict[str, int | ParserLineLines]
@@ -26,6 +30,8 @@ class NLPCore:
     ParserWordPage = dict[str, int | str | ParserWordParas]
     ParserWordPages = list[ParserWordPage]
     ParserWordDocument = dict[str, int | str | ParserWordPages]
+    TesseractPage = tuple[dict[str, list[float | int | str]], float]
+    TesseractPages = list[TesseractPage]
 
     ENVIRONMENT_TYPE_DEV: ClassVar[str]
     ENVIRONMENT_TYPE_PROD: ClassVar[str]
@@ -0,0 +1,182 @@
+# Copyright (c) 2022 Konnexions GmbH. All rights reserved. Use of this
+# source code is governed by the Konnexions Public License (KX-PL)
+# Version 2020.05, that can be found in the LICENSE file.
+
+"""Metadata of a PDF document shared across the processing stages.
+
+Typical usage example:
+
+    my_instance = PdfMetadata.get(full_name=my_pdf_file)
+
+    no_pages = my_instance.no_pages
+    text_layer_map = my_instance.get_text_layer_map()
+"""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import os
+import threading
+from typing import ClassVar
+
+import fitz
+
+import dcr_core.core_glob
+
+
+class PdfMetadata:
+    """Metadata of a PDF document shared across the processing stages.
+
+    The metadata of a PDF document are determined only once per version
+    of the file: the instances are cached by file name and are reused
+    as long as the size and the modification time of the file remain
+    unchanged. The page count and the file size are determined when the
+    instance is created, the text layer map and the content hash only
+    when they are requested for the first time.
+    """
+
+    # ------------------------------------------------------------------
+    # Class variables.
+    # ------------------------------------------------------------------
+    _CACHE_MAX_ENTRIES: ClassVar[int] = 64
+    _CONTENT_HASH_CHUNK_SIZE: ClassVar[int] = 1024 * 1024
+
+    _cache: ClassVar[collections.OrderedDict[str, PdfMetadata]] = collections.OrderedDict()
+    _cache_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Initialise the instance.
+    # ------------------------------------------------------------------
+    def __init__(self, full_name: str) -> None:
+        """Initialise the instance.
+
+        Args:
+            full_name (str): Full file name of the PDF document.
+
+        Raises:
+            RuntimeError: The file is not a valid PDF document (fitz.FileDataError).
+        """
+        try:
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+        except AttributeError:
+            dcr_core.core_glob.initialise_logger()
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+
+        dcr_core.core_glob.logger.debug("param full_name=%s", full_name)
+
+        self.full_name = full_name
+
+        file_stat = os.stat(full_name)
+
+        self.file_size = file_stat.st_size
+        self.file_mtime_ns = file_stat.st_mtime_ns
+
+        with fitz.open(full_name) as pdf_document:
+            self.no_pages: int = pdf_document.page_count
+
+        self._content_hash = ""
+        self._text_layer_map: list[bool | None] = []
+        self._is_text_layer_map_complete = False
+
+        self._exist = True
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+    # ------------------------------------------------------------------
+    # Check the object existence.
+    # ------------------------------------------------------------------
+    def exists(self) -> bool:
+        """Check the object existence.
+
+        Returns:
+            bool: Always true.
+        """
+        return self._exist
+
+    # ------------------------------------------------------------------
+    # Get the metadata of a PDF document.
+    # ------------------------------------------------------------------
+    @classmethod
+    def get(cls, full_name: str) -> PdfMetadata:
+        """Get the metadata of a PDF document.
+
+        Args:
+            full_name (str): Full file name of the PDF document.
+
+        Returns:
+            PdfMetadata: The cached instance if the file has not been
+                changed since, otherwise a new instance.
+        """
+        cache_key = os.path.abspath(full_name)
+        file_stat = os.stat(full_name)
+
+        with cls._cache_lock:
+            instance = cls._cache.get(cache_key)
+            if instance is not None and (instance.file_size, instance.file_mtime_ns) == (file_stat.st_size, file_stat.st_mtime_ns):
+                cls._cache.move_to_end(cache_key)
+                return instance
+
+        instance = cls(full_name)
+
+        with cls._cache_lock:
+            cls._cache[cache_key] = instance
+            cls._cache.move_to_end(cache_key)
+            while len(cls._cache) > cls._CACHE_MAX_ENTRIES:
+                cls._cache.popitem(last=False)
+
+        return instance
+
+    # ------------------------------------------------------------------
+    # Get the SHA-256 hash of the file content.
+    # ------------------------------------------------------------------
+    def get_content_hash(self) -> str:
+        """Get the SHA-256 hash of the file content.
+
+        Returns:
+            str: The hash as hexadecimal string.
+        """
+        if not self._content_hash:
+            content_hash = hashlib.sha256()
+
+            with open(self.full_name, "rb") as file_handle:
+                for chunk in iter(lambda: file_handle.read(PdfMetadata._CONTENT_HASH_CHUNK_SIZE), b""):
+                    content_hash.update(chunk)
+
+            self._content_hash = content_hash.hexdigest()
+
+        return self._content_hash
+
+    # ------------------------------------------------------------------
+    # Determine which pages have a text layer.
+    # ------------------------------------------------------------------
+    def get_text_layer_map(self, is_complete: bool = False) -> list[bool | None]:
+        """Determine which pages have a text layer.
+
+        The pages are checked one after the other. Unless a complete map
+        is requested, the check stops at the first page with a text layer
+        and the remaining pages are marked as not checked.
+
+        Args:
+            is_complete (bool, optional): Check all pages. Defaults to False.
+
+        Returns:
+            list[bool | None]: One entry per page: true if the page has a text layer,
+                false if not and none if the page has not been checked.
+        """
+        if self._is_text_layer_map_complete or (self._text_layer_map and not is_complete):
+            return list(self._text_layer_map)
+
+        with fitz.open(self.full_name) as pdf_document:
+            text_layer_map: list[bool | None] = self._text_layer_map if self._text_layer_map else [None] * pdf_document.page_count
+
+            for page in pdf_document:
+                if text_layer_map[page.number] is None:
+                    text_layer_map[page.number] = bool(page.get_text().strip())
+                if text_layer_map[page.number] and not is_complete:
+                    break
+
+        self._text_layer_map = text_layer_map
+        self._is_text_layer_map_complete = None not in text_layer_map
+
+        return list(self._text_layer_map)
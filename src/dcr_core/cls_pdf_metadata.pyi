@@ -0,0 +1,32 @@
+# Copyright (c) 2022 Konnexions GmbH. All rights reserved. Use of this
+# source code is governed by the Konnexions Public License (KX-PL)
+# Version 2020.05, that can be found in the LICENSE file.
+
+"""Module stub file."""
+from __future__ import annotations
+
+import collections
+import threading
+from typing import ClassVar
+
+class PdfMetadata:
+    _CACHE_MAX_ENTRIES: ClassVar[int]
+    _CONTENT_HASH_CHUNK_SIZE: ClassVar[int]
+
+    _cache: ClassVar[collections.OrderedDict[str, PdfMetadata]]
+    _cache_lock: ClassVar[threading.Lock]
+
+    def __init__(self, full_name: str) -> None:
+        self._content_hash: str = ""
+        self._exist: bool = False
+        self._is_text_layer_map_complete: bool = False
+        self._text_layer_map: list[bool | None] = []
+        self.file_mtime_ns: int = 0
+        self.file_size: int = 0
+        self.full_name: str = ""
+        self.no_pages: int = 0
+    def exists(self) -> bool: ...
+    @classmethod
+    def get(cls, full_name: str) -> PdfMetadata: ...
+    def get_content_hash(self) -> str: ...
+    def get_text_layer_map(self, is_complete: bool = ...) -> list[bool | None]: ...
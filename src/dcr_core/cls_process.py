@@ -4,22 +4,39 @@
 
 """Main processing."""
 
+import collections
+import collections.abc
+import concurrent.futures
+import contextlib
+import functools
 import glob
+import io
+import itertools
+import json
 import os.path
+import re
+import shutil
+import threading
 from typing import ClassVar
 
-import defusedxml
-import defusedxml.ElementTree
 import fitz
 import pdf2image
+import PIL.Image
 import pypandoc
 import PyPDF2
 import pytesseract
+import spacy
 from pdf2image.exceptions import PDFPageCountError
 
+import dcr_core.cls_document_metrics
 import dcr_core.cls_nlp_core
+import dcr_core.cls_pdf_metadata
+import dcr_core.cls_result_cache
+import dcr_core.cls_run_context
 import dcr_core.cls_setup
 import dcr_core.cls_text_parser
+import dcr_core.cls_token_json_writer
+import dcr_core.cls_tokenizer_spacy
 import dcr_core.core_glob
 import dcr_core.core_utils
 import dcr_core.PDFlib.TET
@@ -32,10 +49,44 @@ class Process:
     # ------------------------------------------------------------------
     # Class variables.
     # ------------------------------------------------------------------
+    _CHECKPOINT_STAGE_PANDOC: ClassVar[str] = "pandoc"
+    _CHECKPOINT_STAGE_PARSER: ClassVar[str] = "parser"
+    _CHECKPOINT_STAGE_TESSERACT: ClassVar[str] = "tesseract"
+    _CHECKPOINT_STAGES: ClassVar[tuple[str, ...]] = (
+        _CHECKPOINT_STAGE_PANDOC,
+        _CHECKPOINT_STAGE_TESSERACT,
+        _CHECKPOINT_STAGE_PARSER,
+    )
+    # Instance attributes required by the stages following a checkpoint.
+    _CHECKPOINT_STATE: ClassVar[tuple[str, ...]] = (
+        "_full_name_in_pdflib",
+        "_full_name_in_stem_name",
+        "_full_name_in_tokenizer_line",
+        "_no_lines_footer",
+        "_no_lines_header",
+        "_no_lines_toc",
+        "_no_pdf_pages",
+        "_result_files",
+    )
+
+    _DOCUMENT_CACHE_FILES: ClassVar[str] = "files"
+    _DOCUMENT_CACHE_MANIFEST: ClassVar[str] = ".manifest.json"
+    # File name suffixes of the result files, the stem name of the document file excluded.
+    _DOCUMENT_CACHE_RESULT_FILES: ClassVar[str] = r"(_\d+)?(\.line_token|(\.line)?_(heading|list_bullet|list_number|table))\.json"
+
+    # The thread limit of Tesseract OCR is shared by all concurrent runs in the process.
+    _omp_thread_limit_lock: ClassVar[threading.Lock] = threading.Lock()
+    _omp_thread_limit_prev: ClassVar[str | None] = None
+    _omp_thread_limit_users: ClassVar[int] = 0
+
     ERROR_01_901: ClassVar[str] = "01.901 Issue (p_i): Document rejected because of unknown file extension='{extension}'."
     ERROR_01_903: ClassVar[str] = (
         "01.903 Issue (p_i): Error with fitz.open() processing of file '{file_name}' " + "- RuntimeError - error: '{error_msg}'"
     )
+    ERROR_01_905: ClassVar[str] = (
+        "01.905 Issue (p_i): Processing the document '{full_name}' in the batch failed - "
+        + "error type: '{error_type}' - error: '{error_msg}'"
+    )
 
     ERROR_21_901: ClassVar[str] = (
         "21.901 Issue (p_2_i): Processing file '{full_name}' with pdf2image failed - PDFPageCountError - "
@@ -47,6 +98,19 @@ class Process:
     ERROR_31_903: ClassVar[str] = (
         "31.903 Issue (n_2_p): The file '{full_name}' cannot be converted to an " + "'PDF' document - RuntimeError - error: '{error_msg}'"
     )
+    ERROR_31_904: ClassVar[str] = (
+        "31.904 Issue (n_2_p): The file '{full_name}' cannot be converted to the " + "Pandoc AST - FileNotFoundError"
+    )
+    ERROR_31_905: ClassVar[str] = (
+        "31.905 Issue (n_2_p): The file '{full_name}' cannot be converted to the " + "Pandoc AST - error: '{error_msg}'"
+    )
+    ERROR_31_906: ClassVar[str] = (
+        "31.906 Issue (n_2_p): The file '{full_name}' cannot be converted to an "
+        + "'PDF' document - error type: '{error_type}' - error: '{error_msg}'"
+    )
+    ERROR_31_907: ClassVar[str] = (
+        "31.907 Issue (n_2_p): The PDF file of identical content cannot be copied to the file '{full_name}' - " + "error: '{error_msg}'"
+    )
     ERROR_31_911: ClassVar[str] = "31.911 Issue (n_2_p): The pdf document {full_name} for PDFlib TET is an empty file"
     ERROR_41_901: ClassVar[str] = (
         "41.901 Issue (ocr): Converting the file '{full_name}' with Tesseract OCR failed - " + "RuntimeError - error: '{error_msg}'"
@@ -72,8 +136,15 @@ class Process:
             dcr_core.core_glob.initialise_logger()
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
 
+        self._checkpoint: dict[str, object] = {}
+        self._checkpoint_files: set[str] = set()
+        self._checkpoint_no_stages: int = 0
+
         self._document_id: int = 0
+        self._document_key = ""
+        self._document_metrics: dcr_core.cls_document_metrics.DocumentMetrics
 
+        self._full_name_checkpoint = ""
         self._full_name_in = ""
         self._full_name_in_directory = ""
         self._full_name_in_extension = ""
@@ -94,8 +165,12 @@ class Process:
 
         self._is_delete_auxiliary_files = False
         self._is_pandoc = False
+        self._is_pandoc_json = False
         self._is_pdf2image = False
+        self._is_pdf_hybrid = False
+        self._is_resume = False
         self._is_tesseract = False
+        self._is_tesseract_tsv = False
         self._is_verbose = False
 
         self._language_pandoc: str = ""
@@ -107,10 +182,176 @@ class Process:
         self._no_lines_toc: int = 0
         self._no_pdf_pages: int = 0
 
+        self._pandoc_ast: dcr_core.cls_nlp_core.NLPCore.PandocAst = {}
+
+        self._parse_result_line_document: dcr_core.cls_nlp_core.NLPCore.ParserLineDocument = {}
+
+        self._pdf_hybrid_pages: list[int] = []
+        self._pdf_text_layer_map: list[bool | None] = []
+
+        self._result_files: list[str] = []
+
+        self._run_context: dcr_core.cls_run_context.RunContext
+
+        self._tesseract_images: collections.abc.Iterable[PIL.Image.Image | str] = []
+        self._tesseract_pages: dcr_core.cls_nlp_core.NLPCore.TesseractPages = []
+
+        self._tetml_line = b""
+        self._tetml_page = b""
+        self._tetml_word = b""
+
         self._exist = True
 
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
 
+    # ------------------------------------------------------------------
+    # Restore the result files of the document from the cache.
+    # ------------------------------------------------------------------
+    def _document_cache_get(self, result_cache: dcr_core.cls_result_cache.ResultCache, cache_key: str) -> bool:
+        """Restore the result files of the document from the cache.
+
+        The document identification and the original file name in the
+        result files are replaced if they differ from the cached ones.
+
+        Args:
+            result_cache (ResultCache): The document cache.
+            cache_key (str): The cache key of the document.
+
+        Returns:
+            bool: True if all result files have been restored, otherwise false.
+        """
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+
+        manifest = result_cache.get_json(cache_key, Process._DOCUMENT_CACHE_MANIFEST)
+        if manifest is None:
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+            return False
+
+        # No result file is restored unless all of them are in the cache.
+        for file_suffix in manifest[Process._DOCUMENT_CACHE_FILES]:
+            if not result_cache.contains(cache_key, file_suffix):
+                dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+                return False
+
+        is_rewrite = (
+            manifest[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_DOC_ID] != self._document_id
+            or manifest[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_DOC_FILE_NAME] != self._full_name_orig
+        )
+
+        for file_suffix in manifest[Process._DOCUMENT_CACHE_FILES]:
+            full_name = dcr_core.core_utils.get_full_name_from_components(
+                self._full_name_in_directory,
+                self._full_name_in_stem_name + file_suffix,
+            )
+
+            if not result_cache.get(cache_key, full_name, file_suffix):
+                dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+                return False
+
+            if is_rewrite:
+                self._document_cache_rewrite(full_name)
+
+            dcr_core.core_utils.progress_msg(self._is_verbose, f"Restored from the cache        {full_name}")
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+        return True
+
+    # ------------------------------------------------------------------
+    # Store the result files of the document in the cache.
+    # ------------------------------------------------------------------
+    def _document_cache_put(
+        self,
+        result_cache: dcr_core.cls_result_cache.ResultCache,
+        cache_key: str,
+        full_name_in_stem_name: str,
+        full_names: list[str],
+    ) -> None:
+        """Store the result files of the document in the cache.
+
+        The result files are the JSON file with the tokens and the
+        extra files written by the parser, also if the parser stage
+        was completed in a previous run. The manifest listing them is
+        stored last, so that a document is only taken from the cache if
+        all result files were stored.
+
+        Args:
+            result_cache (ResultCache): The document cache.
+            cache_key (str): The cache key of the document.
+            full_name_in_stem_name (str): Stem name of the document file.
+            full_names (list[str]): Full file names of the result files.
+        """
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+
+        file_suffixes = []
+
+        for full_name in full_names:
+            file_suffix = os.path.basename(full_name)[len(full_name_in_stem_name) :]
+            result_cache.put(cache_key, full_name, file_suffix)
+            file_suffixes.append(file_suffix)
+
+        if file_suffixes:
+            result_cache.put_json(
+                cache_key,
+                Process._DOCUMENT_CACHE_MANIFEST,
+                {
+                    dcr_core.cls_nlp_core.NLPCore.JSON_NAME_DOC_ID: self._document_id,
+                    dcr_core.cls_nlp_core.NLPCore.JSON_NAME_DOC_FILE_NAME: self._full_name_orig,
+                    Process._DOCUMENT_CACHE_FILES: sorted(file_suffixes),
+                },
+            )
+
+        result_cache.evict(self._run_context.setup.document_cache_max_age, self._run_context.setup.document_cache_max_size)
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+    # ------------------------------------------------------------------
+    # Replace the document identification and the original file name
+    # in a result file restored from the cache.
+    # ------------------------------------------------------------------
+    def _document_cache_rewrite(self, full_name: str) -> None:
+        """Replace the document identification and the original file name.
+
+        The JSON file with the tokens is written again by the JSON
+        writer and the extra files like by the line type classifiers,
+        so that the format of the result file, e.g. compact or with
+        short keys, is preserved.
+
+        Args:
+            full_name (str): Full file name of the restored result file.
+        """
+        if full_name.endswith(".line_token." + dcr_core.core_glob.FILE_TYPE_JSON):
+            json_writer = dcr_core.cls_token_json_writer.TokenJsonWriter(run_context=self._run_context)
+
+            token_document = json_writer.load_document(full_name)
+            token_document[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_DOC_ID] = self._document_id
+            token_document[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_DOC_FILE_NAME] = self._full_name_orig
+
+            json_writer.open_document(full_name)
+
+            try:
+                for token_page in token_document[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGES]:
+                    json_writer.write_page(token_page)
+
+                json_writer.write_document(token_document)
+            finally:
+                json_writer.close_document()
+            return
+
+        with open(full_name, "r", encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT) as file_handle:
+            json_data = json.load(file_handle)
+
+        json_data[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_DOC_ID] = self._document_id
+        json_data[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_DOC_FILE_NAME] = self._full_name_orig
+
+        with open(full_name, "w", encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT) as file_handle:
+            json.dump(
+                json_data,
+                file_handle,
+                indent=self._run_context.setup.json_indent,
+                sort_keys=self._run_context.setup.is_json_sort_keys,
+            )
+
     # ------------------------------------------------------------------
     # Check the document by the file extension and determine further
     # processing.
@@ -128,9 +369,15 @@ class Process:
 
         if self._full_name_in_extension_int == dcr_core.core_glob.FILE_TYPE_PDF:
             try:
-                if bool("".join([page.get_text() for page in fitz.open(self._full_name_in)])):
+                # Routing single pages requires the text layer state of all pages.
+                self._pdf_text_layer_map = dcr_core.cls_pdf_metadata.PdfMetadata.get(self._full_name_in).get_text_layer_map(
+                    is_complete=self._run_context.setup.is_pdf2image_hybrid,
+                )
+                if all(self._pdf_text_layer_map) or (any(self._pdf_text_layer_map) and not self._run_context.setup.is_pdf2image_hybrid):
                     self._full_name_in_pdflib = self._full_name_in
                 else:
+                    # Hybrid document: only the pages without a text layer are processed with OCR.
+                    self._is_pdf_hybrid = any(self._pdf_text_layer_map)
                     self._is_pdf2image = True
                     self._is_tesseract = True
                     self._full_name_in_pdf2image = self._full_name_in
@@ -144,9 +391,172 @@ class Process:
         elif self._full_name_in_extension_int in dcr_core.core_glob.FILE_TYPE_TESSERACT:
             self._is_tesseract = True
             self._full_name_in_tesseract = self._full_name_in
+            self._tesseract_images = [self._full_name_in]
         else:
             raise RuntimeError(Process.ERROR_01_901.replace("{extension}", self._full_name_in_extension_int))
 
+        # The granularities page and word and the text pages of hybrid
+        # PDF documents are only available via PDFlib TET.
+        self._is_pandoc_json = (
+            self._is_pandoc
+            and self._run_context.setup.is_pandoc_json
+            and not self._run_context.setup.is_tetml_page
+            and not self._run_context.setup.is_tetml_word
+        )
+        self._is_tesseract_tsv = (
+            self._is_tesseract
+            and self._run_context.setup.is_tesseract_tsv
+            and not self._is_pdf_hybrid
+            and not self._run_context.setup.is_tetml_page
+            and not self._run_context.setup.is_tetml_word
+        )
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+    # ------------------------------------------------------------------
+    # Finish the checkpoints of the completed document.
+    # ------------------------------------------------------------------
+    def _document_checkpoint_finish(self) -> None:
+        """Finish the checkpoints of the completed document.
+
+        The auxiliary files kept for resuming and the checkpoint file
+        are deleted.
+        """
+        if not self._is_resume:
+            return
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+
+        checkpoint_files = self._checkpoint_files
+        self._checkpoint_files = set()
+
+        for full_name in sorted(checkpoint_files):
+            self._document_delete_auxiliary_file(full_name)
+
+        if os.path.isfile(self._full_name_checkpoint):
+            os.remove(self._full_name_checkpoint)
+
+        self._checkpoint = {}
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+    # ------------------------------------------------------------------
+    # Check whether a processing stage has been completed in a previous run.
+    # ------------------------------------------------------------------
+    def _document_checkpoint_is_completed(self, stage: str) -> bool:
+        """Check whether a processing stage has been completed in a previous run.
+
+        Args:
+            stage (str): The processing stage.
+
+        Returns:
+            bool: True if the processing stage can be skipped, otherwise false.
+        """
+        return Process._CHECKPOINT_STAGES.index(stage) < self._checkpoint_no_stages
+
+    # ------------------------------------------------------------------
+    # Load the checkpoints of a previous run.
+    # ------------------------------------------------------------------
+    def _document_checkpoint_load(self) -> None:
+        """Load the checkpoints of a previous run.
+
+        The processing is resumed after the last stage whose checkpoint
+        belongs to the same document content and configuration and whose
+        output files still exist unchanged. The instance attributes
+        required by the following stages are restored from this
+        checkpoint.
+        """
+        if not self._is_resume:
+            return
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+
+        self._full_name_checkpoint = dcr_core.core_utils.get_full_name_from_components(
+            self._full_name_in_directory,
+            self._full_name_in_stem_name + ".checkpoint." + dcr_core.core_glob.FILE_TYPE_JSON,
+        )
+
+        self._checkpoint = {"documentKey": self._get_document_key(), "stages": {}}
+
+        try:
+            with open(self._full_name_checkpoint, "r", encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT) as file_handle:
+                checkpoint = json.load(file_handle)
+        except FileNotFoundError:
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+            return
+        except ValueError as err:
+            dcr_core.core_glob.logger.warning("checkpoint file %s not readable: %s", self._full_name_checkpoint, err)
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+            return
+
+        if checkpoint.get("documentKey") != self._checkpoint["documentKey"]:
+            dcr_core.core_utils.progress_msg(self._is_verbose, f"Checkpoints outdated           {self._full_name_checkpoint}")
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+            return
+
+        for stage_idx, stage in reversed(list(enumerate(Process._CHECKPOINT_STAGES))):
+            if stage not in checkpoint["stages"]:
+                continue
+
+            stage_checkpoint = checkpoint["stages"][stage]
+
+            if not all(
+                os.path.isfile(full_name) and os.path.getsize(full_name) == file_size for full_name, file_size in stage_checkpoint["files"]
+            ):
+                continue
+
+            for name, value in stage_checkpoint["state"].items():
+                setattr(self, name, value)
+
+            self._checkpoint["stages"] = {
+                stage_prev: checkpoint["stages"][stage_prev]
+                for stage_prev in Process._CHECKPOINT_STAGES[: stage_idx + 1]
+                if stage_prev in checkpoint["stages"]
+            }
+            self._checkpoint_files = {
+                full_name for stage_checkpoint in self._checkpoint["stages"].values() for full_name, _ in stage_checkpoint["files"]
+            }
+            self._checkpoint_no_stages = stage_idx + 1
+
+            dcr_core.core_utils.progress_msg(self._is_verbose, f"Resume after the stage         {stage}")
+            break
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+    # ------------------------------------------------------------------
+    # Record the completion of a processing stage.
+    # ------------------------------------------------------------------
+    def _document_checkpoint_put(self, stage: str, full_names: list[str]) -> None:
+        """Record the completion of a processing stage.
+
+        The checkpoint contains the output files of the stage and the
+        instance attributes required by the following stages. The
+        output files are kept until the whole document is completed.
+
+        Args:
+            stage (str): The processing stage.
+            full_names (list[str]): Full file names of the output files of the stage,
+                no checkpoint is recorded if the stage has no output files.
+        """
+        if not self._is_resume or not full_names:
+            return
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+
+        self._checkpoint["stages"][stage] = {
+            "files": [(full_name, os.path.getsize(full_name)) for full_name in full_names],
+            "state": {name: getattr(self, name) for name in Process._CHECKPOINT_STATE},
+        }
+
+        self._checkpoint_files.update(full_names)
+
+        full_name_tmp = self._full_name_checkpoint + ".tmp"
+
+        with open(full_name_tmp, "w", encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT) as file_handle:
+            json.dump(self._checkpoint, file_handle, indent=self._run_context.setup.json_indent)
+
+        os.replace(full_name_tmp, self._full_name_checkpoint)
+
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
 
     # -----------------------------------------------------------------------------
@@ -155,12 +565,18 @@ class Process:
     def _document_delete_auxiliary_file(self, full_name: str) -> None:
         """Delete the given auxiliary file.
 
+        The output files of the stages with a checkpoint are only
+        deleted when the whole document has been completed.
+
         Args:
             full_name (str): File name.
         """
         if not self._is_delete_auxiliary_files:
             return
 
+        if full_name in self._checkpoint_files:
+            return
+
         # Don't remove the base document !!!
         if full_name == self._full_name_in:
             return
@@ -176,8 +592,14 @@ class Process:
         """Initialize the document recognition process."""
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
 
+        self._checkpoint: dict[str, object] = {}
+        self._checkpoint_files: set[str] = set()
+        self._checkpoint_no_stages: int = 0
+
         self._document_id: int = 0
+        self._document_key: str = ""
 
+        self._full_name_checkpoint: str = ""
         self._full_name_in: str = ""
         self._full_name_in_directory: str = ""
         self._full_name_in_extension: str = ""
@@ -197,8 +619,11 @@ class Process:
         self._full_name_orig: str = ""
 
         self._is_pandoc: bool = False
+        self._is_pandoc_json: bool = False
         self._is_pdf2image: bool = False
+        self._is_pdf_hybrid: bool = False
         self._is_tesseract: bool = False
+        self._is_tesseract_tsv: bool = False
 
         self._language_pandoc: str = ""
         self._language_spacy: str = ""
@@ -209,8 +634,114 @@ class Process:
         self._no_lines_toc: int = 0
         self._no_pdf_pages: int = 0
 
+        self._pandoc_ast: dcr_core.cls_nlp_core.NLPCore.PandocAst = {}
+
+        self._parse_result_line_document: dcr_core.cls_nlp_core.NLPCore.ParserLineDocument = {}
+
+        self._pdf_hybrid_pages: list[int] = []
+        self._pdf_text_layer_map: list[bool | None] = []
+
+        self._result_files: list[str] = []
+
+        self._tesseract_images: collections.abc.Iterable[PIL.Image.Image | str] = []
+        self._tesseract_pages: dcr_core.cls_nlp_core.NLPCore.TesseractPages = []
+
+        self._tetml_line: bytes = b""
+        self._tetml_page: bytes = b""
+        self._tetml_word: bytes = b""
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+    # ------------------------------------------------------------------
+    # Merge the OCR pages of a hybrid PDF document with its text pages.
+    # ------------------------------------------------------------------
+    def _document_merge_pdf_hybrid(self) -> None:
+        """Merge the OCR pages of a hybrid PDF document with its text pages.
+
+        The pages without a text layer are replaced by the pages created
+        with Tesseract OCR, all other pages are taken unchanged from the
+        original document.
+        """
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+
+        with open(self._full_name_in_pdflib, "rb") as file_handle:
+            pdf_reader_ocr = PyPDF2.PdfReader(io.BytesIO(file_handle.read()))
+
+        # The OCR pages are in the order of the page numbers.
+        ocr_pages = dict(zip(self._pdf_hybrid_pages, pdf_reader_ocr.pages))
+
+        pdf_writer = PyPDF2.PdfWriter()
+
+        for page_no, page in enumerate(PyPDF2.PdfReader(self._full_name_in_pdf2image).pages, 1):
+            pdf_writer.add_page(ocr_pages.get(page_no, page))
+
+        with open(self._full_name_in_pdflib, "wb") as file_handle:
+            pdf_writer.write(file_handle)
+
+        dcr_core.core_utils.progress_msg(
+            self._is_verbose,
+            f"Merged {len(ocr_pages)} OCR page(s) into the text pages of {self._full_name_in_pdf2image}",
+        )
+
+        self._document_delete_auxiliary_file(self._full_name_in_pdf2image)
+
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
 
+    # ------------------------------------------------------------------
+    # End the measurement of a stage with the counts of the line-oriented document.
+    # ------------------------------------------------------------------
+    def _document_metrics_end_stage(
+        self,
+        stage: str,
+        full_names_out: list[str],
+        line_document: dcr_core.cls_nlp_core.NLPCore.ParserLineDocument,
+        no_tokens: int = 0,
+    ) -> None:
+        """End the measurement of a stage with the counts of the line-oriented document.
+
+        Args:
+            stage (str): Name of the processing stage.
+            full_names_out (list[str]): Full file names of the output files.
+            line_document (ParserLineDocument): The line-oriented result of the parser.
+            no_tokens (int, optional): Number of tokens created. Defaults to 0.
+        """
+        self._document_metrics.end_stage(
+            stage,
+            full_names_out,
+            no_lines=Process._get_line_document_count(line_document, dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LINES_IN_DOC),
+            no_pages=Process._get_line_document_count(line_document, dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_PAGES_IN_DOC),
+            no_paras=Process._get_line_document_count(line_document, dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_PARAS_IN_DOC),
+            no_tokens=no_tokens,
+        )
+
+    # ------------------------------------------------------------------
+    # Finish the metrics of the document and write them.
+    # ------------------------------------------------------------------
+    def _document_metrics_finish(self, status: str) -> None:
+        """Finish the metrics of the document and write them.
+
+        The metrics are appended to the JSONL file `metrics_file` and
+        written to the Prometheus textfile `metrics_prometheus_file`,
+        if configured. A metrics file that cannot be written is only
+        logged, the processing of the document is not affected.
+
+        Args:
+            status (str): Processing result of the document.
+        """
+        self._document_metrics.finish(status)
+
+        for full_name, write_metrics in (
+            (self._run_context.setup.metrics_file, self._document_metrics.write_jsonl),
+            (self._run_context.setup.metrics_prometheus_file, self._document_metrics.write_prometheus),
+        ):
+            if not full_name or full_name.lower() == "none":
+                continue
+
+            try:
+                write_metrics(full_name)
+            except OSError as err:
+                dcr_core.core_glob.logger.warning("metrics file %s not written: %s", full_name, err)
+
     # ------------------------------------------------------------------
     # Convert the document to PDF format using Pandoc.
     # ------------------------------------------------------------------
@@ -225,6 +756,21 @@ class Process:
 
             dcr_core.core_utils.progress_msg(self._is_verbose, f"Start processing Pandoc        {self._full_name_in_pandoc}")
 
+            self._document_metrics.start_stage(dcr_core.cls_document_metrics.DocumentMetrics.STAGE_PANDOC, [self._full_name_in_pandoc])
+
+            if self._is_pandoc_json:
+                # The lines are taken directly from the Pandoc AST - no PDF document is created.
+                return_code, error_msg, self._pandoc_ast = Process.pandoc_json(self._full_name_in_pandoc)
+                if return_code != "ok":
+                    raise RuntimeError(error_msg)
+
+                self._document_metrics.end_stage(dcr_core.cls_document_metrics.DocumentMetrics.STAGE_PANDOC)
+
+                dcr_core.core_utils.progress_msg(self._is_verbose, f"End   processing Pandoc        {self._full_name_in_pandoc}")
+
+                dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+                return
+
             self._full_name_in_pdflib = dcr_core.core_utils.get_full_name_from_components(
                 self._full_name_in_directory, self._full_name_in_stem_name, dcr_core.core_glob.FILE_TYPE_PDF
             )
@@ -233,10 +779,17 @@ class Process:
                 self._full_name_in_pandoc,
                 self._full_name_in_pdflib,
                 self._language_pandoc,
+                run_context=self._run_context,
             )
             if return_code != "ok":
                 raise RuntimeError(error_msg)
 
+            self._document_metrics.end_stage(
+                dcr_core.cls_document_metrics.DocumentMetrics.STAGE_PANDOC,
+                [self._full_name_in_pdflib],
+                no_pages=dcr_core.cls_pdf_metadata.PdfMetadata.get(self._full_name_in_pdflib).no_pages,
+            )
+
             self._document_delete_auxiliary_file(self._full_name_in_pandoc)
 
             dcr_core.core_utils.progress_msg(self._is_verbose, f"End   processing Pandoc        {self._full_name_in_pdflib}")
@@ -250,6 +803,12 @@ class Process:
         """Extract the text for all granularities from the PDF document."""
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
 
+        self._document_metrics.start_stage(
+            dcr_core.cls_document_metrics.DocumentMetrics.STAGE_PARSER,
+            [self._full_name_in_parser_line, self._full_name_in_parser_page, self._full_name_in_parser_word],
+            bytes_in=len(self._tetml_line) + len(self._tetml_page) + len(self._tetml_word),
+        )
+
         self._full_name_in_tokenizer_line = dcr_core.core_utils.get_full_name_from_components(
             self._full_name_in_directory,
             self._full_name_in_stem_name + "." + dcr_core.cls_nlp_core.NLPCore.LINE_XML_VARIATION + dcr_core.core_glob.FILE_TYPE_JSON,
@@ -265,7 +824,7 @@ class Process:
             self._full_name_in_stem_name + "." + dcr_core.cls_nlp_core.NLPCore.WORD_XML_VARIATION + dcr_core.core_glob.FILE_TYPE_JSON,
         )
 
-        for (full_name_in_parser, full_name_in_tokenizer, tetml_type, is_parsing_line, is_parsing_page, is_parsing_word,) in (
+        for (full_name_in_parser, full_name_in_tokenizer, tetml_type, is_parsing_line, is_parsing_page, is_parsing_word, tetml,) in (
             (
                 self._full_name_in_parser_line,
                 self._full_name_in_tokenizer_line,
@@ -273,6 +832,7 @@ class Process:
                 True,
                 False,
                 False,
+                self._tetml_line,
             ),
             (
                 self._full_name_in_parser_page,
@@ -281,6 +841,7 @@ class Process:
                 False,
                 True,
                 False,
+                self._tetml_page,
             ),
             (
                 self._full_name_in_parser_word,
@@ -289,13 +850,14 @@ class Process:
                 False,
                 False,
                 True,
+                self._tetml_word,
             ),
         ):
             if (
                 is_parsing_page
-                and not dcr_core.core_glob.setup.is_tetml_page
+                and not self._run_context.setup.is_tetml_page
                 or is_parsing_word
-                and not dcr_core.core_glob.setup.is_tetml_word
+                and not self._run_context.setup.is_tetml_word
             ):
                 continue
 
@@ -306,12 +868,97 @@ class Process:
                 is_parsing_line,
                 is_parsing_page,
                 is_parsing_word,
+                tetml,
             )
 
             if is_parsing_line:
-                self._no_lines_footer = dcr_core.core_glob.line_type_header_footer.no_lines_footer
-                self._no_lines_header = dcr_core.core_glob.line_type_header_footer.no_lines_header
-                self._no_lines_toc = dcr_core.core_glob.line_type_toc.no_lines_toc
+                self._parse_result_line_document = self._run_context.text_parser.parse_result_line_document
+                self._no_lines_footer = self._run_context.line_type_header_footer.no_lines_footer
+                self._no_lines_header = self._run_context.line_type_header_footer.no_lines_header
+                self._no_lines_toc = self._run_context.line_type_toc.no_lines_toc
+
+        self._tetml_line = b""
+        self._tetml_page = b""
+        self._tetml_word = b""
+
+        self._document_metrics_end_stage(
+            dcr_core.cls_document_metrics.DocumentMetrics.STAGE_PARSER,
+            [self._full_name_in_tokenizer_line, self._full_name_in_tokenizer_page, self._full_name_in_tokenizer_word],
+            self._parse_result_line_document,
+        )
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+    # ------------------------------------------------------------------
+    # Extract the lines from the Pandoc AST or the Tesseract OCR TSV data.
+    # ------------------------------------------------------------------
+    def _document_parser_direct(self) -> None:
+        """Extract the lines from the Pandoc AST or the Tesseract OCR TSV data.
+
+        The line-oriented result is only stored in a JSON file if the
+        auxiliary files are kept or the processing can be resumed.
+        """
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+
+        self._full_name_in_tokenizer_line = dcr_core.core_utils.get_full_name_from_components(
+            self._full_name_in_directory,
+            self._full_name_in_stem_name + "." + dcr_core.cls_nlp_core.NLPCore.LINE_XML_VARIATION + dcr_core.core_glob.FILE_TYPE_JSON,
+        )
+
+        full_name_in_direct = self._full_name_in_pandoc if self._is_pandoc_json else self._full_name_in_tesseract
+
+        dcr_core.core_utils.progress_msg(
+            self._is_verbose, f"Start processing {dcr_core.cls_nlp_core.NLPCore.TETML_TYPE_LINE}          {full_name_in_direct}"
+        )
+
+        self._document_metrics.start_stage(dcr_core.cls_document_metrics.DocumentMetrics.STAGE_PARSER)
+
+        self._run_context.setup.is_parsing_line = True
+        self._run_context.setup.is_parsing_page = False
+        self._run_context.setup.is_parsing_word = False
+
+        self._run_context.text_parser = dcr_core.cls_text_parser.TextParser(run_context=self._run_context)
+
+        if self._is_pandoc_json:
+            self._run_context.text_parser.parse_pandoc_json(
+                directory_name=self._full_name_in_directory,
+                document_id=self._document_id,
+                environment_variant=self._run_context.setup.environment_variant,
+                file_name_curr=os.path.basename(self._full_name_in),
+                file_name_next="" if self._is_delete_auxiliary_files and not self._is_resume else self._full_name_in_tokenizer_line,
+                file_name_orig=self._full_name_orig,
+                pandoc_ast=self._pandoc_ast,
+            )
+            self._no_pdf_pages = self._run_context.text_parser.parse_result_no_pages_in_doc
+        else:
+            self._run_context.text_parser.parse_tesseract_tsv(
+                directory_name=self._full_name_in_directory,
+                document_id=self._document_id,
+                environment_variant=self._run_context.setup.environment_variant,
+                file_name_curr=os.path.basename(self._full_name_in),
+                file_name_next="" if self._is_delete_auxiliary_files and not self._is_resume else self._full_name_in_tokenizer_line,
+                file_name_orig=self._full_name_orig,
+                tesseract_pages=self._tesseract_pages,
+            )
+
+        self._parse_result_line_document = self._run_context.text_parser.parse_result_line_document
+        self._no_lines_footer = self._run_context.line_type_header_footer.no_lines_footer
+        self._no_lines_header = self._run_context.line_type_header_footer.no_lines_header
+        self._no_lines_toc = self._run_context.line_type_toc.no_lines_toc
+
+        self._pandoc_ast = {}
+        self._tesseract_pages = []
+
+        self._document_metrics_end_stage(
+            dcr_core.cls_document_metrics.DocumentMetrics.STAGE_PARSER,
+            [self._full_name_in_tokenizer_line],
+            self._parse_result_line_document,
+        )
+
+        dcr_core.core_utils.progress_msg(
+            self._is_verbose,
+            f"End   processing {dcr_core.cls_nlp_core.NLPCore.TETML_TYPE_LINE}          {self._full_name_in_tokenizer_line}",
+        )
 
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
 
@@ -326,11 +973,15 @@ class Process:
         is_parsing_line,
         is_parsing_page,
         is_parsing_word,
+        tetml,
     ):
         """XML Parser processing.
 
         Extract the text for a specific granularity from the PDF
-        document.
+        document - either from the TETML data in memory or, if there
+        are none, from the TETML file. The line-oriented result is
+        only stored in a JSON file if the auxiliary files are kept or
+        the processing can be resumed.
 
         Raises:
             RuntimeError: Any parser issue.
@@ -339,16 +990,18 @@ class Process:
 
         dcr_core.core_utils.progress_msg(self._is_verbose, f"Start processing {tetml_type}          {full_name_in_parser}")
 
-        dcr_core.core_glob.setup.is_parsing_line = is_parsing_line
-        dcr_core.core_glob.setup.is_parsing_page = is_parsing_page
-        dcr_core.core_glob.setup.is_parsing_word = is_parsing_word
+        self._run_context.setup.is_parsing_line = is_parsing_line
+        self._run_context.setup.is_parsing_page = is_parsing_page
+        self._run_context.setup.is_parsing_word = is_parsing_word
 
         return_code, error_msg = Process.parser(
             full_name_in_parser,
-            full_name_in_tokenizer,
+            "" if is_parsing_line and self._is_delete_auxiliary_files and not self._is_resume else full_name_in_tokenizer,
             self._no_pdf_pages,
             self._document_id,
             self._full_name_orig,
+            run_context=self._run_context,
+            tetml=tetml,
         )
         if return_code != "ok":
             raise RuntimeError(error_msg)
@@ -365,6 +1018,10 @@ class Process:
     def _document_pdf2image(self):
         """Convert the PDF document to an image file using pdf2image.
 
+        If the auxiliary files are deleted anyway, no image files are
+        written: the pages are rendered in memory only when they are
+        processed with Tesseract OCR.
+
         Raises:
             RuntimeError: Any pdf2image issue.
         """
@@ -373,24 +1030,48 @@ class Process:
 
             dcr_core.core_utils.progress_msg(self._is_verbose, f"Start processing pdf2image     {self._full_name_in_pdf2image}")
 
-            self._full_name_in_tesseract = dcr_core.core_utils.get_full_name_from_components(
-                self._full_name_in_directory,
-                self._full_name_in_stem_name
-                + "_[0-9]*."
-                + (
-                    dcr_core.core_glob.FILE_TYPE_PNG
-                    if dcr_core.core_glob.setup.pdf2image_type == dcr_core.cls_setup.Setup.PDF2IMAGE_TYPE_PNG
-                    else dcr_core.core_glob.FILE_TYPE_JPEG
-                ),
+            self._document_metrics.start_stage(
+                dcr_core.cls_document_metrics.DocumentMetrics.STAGE_PDF2IMAGE, [self._full_name_in_pdf2image]
             )
 
-            return_code, error_msg, _ = Process.pdf2image(
-                self._full_name_in_pdf2image,
-            )
-            if return_code != "ok":
-                raise RuntimeError(error_msg)
+            if self._is_pdf_hybrid:
+                page_numbers = [page_no for page_no, is_text_layer in enumerate(self._pdf_text_layer_map, 1) if not is_text_layer]
+                # The text pages are still needed for the merge after Tesseract OCR.
+                self._pdf_hybrid_pages = page_numbers
+            else:
+                page_numbers = list(range(1, dcr_core.cls_pdf_metadata.PdfMetadata.get(self._full_name_in_pdf2image).no_pages + 1))
+
+            if self._is_delete_auxiliary_files:
+                self._full_name_in_tesseract = self._full_name_in_pdf2image
+                self._tesseract_images = Process._get_page_images(self._full_name_in_pdf2image, page_numbers, self._run_context.setup)
+            else:
+                self._full_name_in_tesseract = dcr_core.core_utils.get_full_name_from_components(
+                    self._full_name_in_directory,
+                    self._full_name_in_stem_name
+                    + "_[0-9]*."
+                    + (
+                        dcr_core.core_glob.FILE_TYPE_PNG
+                        if self._run_context.setup.pdf2image_type == dcr_core.cls_setup.Setup.PDF2IMAGE_TYPE_PNG
+                        else dcr_core.core_glob.FILE_TYPE_JPEG
+                    ),
+                )
+
+                return_code, error_msg, children = Process.pdf2image(
+                    self._full_name_in_pdf2image,
+                    run_context=self._run_context,
+                    page_numbers=page_numbers,
+                )
+                if return_code != "ok":
+                    raise RuntimeError(error_msg)
 
-            self._document_delete_auxiliary_file(self._full_name_in_pdf2image)
+                self._tesseract_images = [full_name for _, full_name in children]
+
+            # The pages rendered in memory are only rendered during Tesseract OCR.
+            self._document_metrics.end_stage(
+                dcr_core.cls_document_metrics.DocumentMetrics.STAGE_PDF2IMAGE,
+                [image for image in self._tesseract_images if isinstance(image, str)] if isinstance(self._tesseract_images, list) else [],
+                no_pages=len(page_numbers),
+            )
 
             dcr_core.core_utils.progress_msg(self._is_verbose, f"End   processing pdf2image     {self._full_name_in_tesseract}")
 
@@ -409,8 +1090,9 @@ class Process:
 
         dcr_core.core_utils.progress_msg(self._is_verbose, f"Start processing PDFlib TET    {self._full_name_in_pdflib}")
 
-        # noinspection PyUnresolvedReferences
-        self._no_pdf_pages = len(PyPDF2.PdfReader(self._full_name_in_pdflib).pages)
+        self._document_metrics.start_stage(dcr_core.cls_document_metrics.DocumentMetrics.STAGE_PDFLIB, [self._full_name_in_pdflib])
+
+        self._no_pdf_pages = dcr_core.cls_pdf_metadata.PdfMetadata.get(self._full_name_in_pdflib).no_pages
         if self._no_pdf_pages == 0:
             raise RuntimeError(f"The number of pages of the PDF document {self._full_name_in_pdflib} cannot be determined")
 
@@ -419,46 +1101,82 @@ class Process:
             self._full_name_in_stem_name + "." + dcr_core.cls_nlp_core.NLPCore.LINE_XML_VARIATION + dcr_core.core_glob.FILE_TYPE_XML,
         )
 
-        return_code, error_msg = Process.pdflib(
-            full_name_in=self._full_name_in_pdflib,
-            full_name_out=self._full_name_in_parser_line,
-            document_opt_list=dcr_core.cls_nlp_core.NLPCore.LINE_TET_DOCUMENT_OPT_LIST,
-            page_opt_list=dcr_core.cls_nlp_core.NLPCore.LINE_TET_PAGE_OPT_LIST,
-        )
-        if return_code != "ok":
-            raise RuntimeError(error_msg)
-
-        dcr_core.core_utils.progress_msg(self._is_verbose, f"End   processing PDFlib TET    {self._full_name_in_parser_line}")
+        tetml_passes = [
+            (
+                self._full_name_in_parser_line,
+                dcr_core.cls_nlp_core.NLPCore.LINE_TET_DOCUMENT_OPT_LIST,
+                dcr_core.cls_nlp_core.NLPCore.LINE_TET_PAGE_OPT_LIST,
+            )
+        ]
 
-        if dcr_core.core_glob.setup.is_tetml_page:
+        if self._run_context.setup.is_tetml_page:
             self._full_name_in_parser_page = dcr_core.core_utils.get_full_name_from_components(
                 self._full_name_in_directory,
                 self._full_name_in_stem_name + "." + dcr_core.cls_nlp_core.NLPCore.PAGE_XML_VARIATION + dcr_core.core_glob.FILE_TYPE_XML,
             )
-            return_code, error_msg = Process.pdflib(
-                full_name_in=self._full_name_in_pdflib,
-                full_name_out=self._full_name_in_parser_page,
-                document_opt_list=dcr_core.cls_nlp_core.NLPCore.PAGE_TET_DOCUMENT_OPT_LIST,
-                page_opt_list=dcr_core.cls_nlp_core.NLPCore.PAGE_TET_PAGE_OPT_LIST,
+            tetml_passes.append(
+                (
+                    self._full_name_in_parser_page,
+                    dcr_core.cls_nlp_core.NLPCore.PAGE_TET_DOCUMENT_OPT_LIST,
+                    dcr_core.cls_nlp_core.NLPCore.PAGE_TET_PAGE_OPT_LIST,
+                )
             )
-            if return_code != "ok":
-                raise RuntimeError(error_msg)
-            dcr_core.core_utils.progress_msg(self._is_verbose, f"End   processing PDFlib TET    {self._full_name_in_parser_page}")
 
-        if dcr_core.core_glob.setup.is_tetml_word:
+        if self._run_context.setup.is_tetml_word:
             self._full_name_in_parser_word = dcr_core.core_utils.get_full_name_from_components(
                 self._full_name_in_directory,
                 self._full_name_in_stem_name + "." + dcr_core.cls_nlp_core.NLPCore.WORD_XML_VARIATION + dcr_core.core_glob.FILE_TYPE_XML,
             )
-            return_code, error_msg = Process.pdflib(
-                full_name_in=self._full_name_in_pdflib,
-                full_name_out=self._full_name_in_parser_word,
-                document_opt_list=dcr_core.cls_nlp_core.NLPCore.WORD_TET_DOCUMENT_OPT_LIST,
-                page_opt_list=dcr_core.cls_nlp_core.NLPCore.WORD_TET_PAGE_OPT_LIST,
+            tetml_passes.append(
+                (
+                    self._full_name_in_parser_word,
+                    dcr_core.cls_nlp_core.NLPCore.WORD_TET_DOCUMENT_OPT_LIST,
+                    dcr_core.cls_nlp_core.NLPCore.WORD_TET_PAGE_OPT_LIST,
+                )
             )
+
+        # The TETML data are only written to files if these files are to be
+        # kept, e.g. for debugging - otherwise they remain in memory.
+        is_tetml_in_memory = self._is_delete_auxiliary_files
+
+        # A TETML output file has exactly one granularity and one set of
+        # document options - the granularities line, page and word are
+        # therefore extracted concurrently, each with its own TET object.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(tetml_passes)) as executor:
+            futures = [
+                executor.submit(
+                    Process.pdflib_tetml,
+                    full_name_in=self._full_name_in_pdflib,
+                    full_name_out="" if is_tetml_in_memory else full_name_out,
+                    document_opt_list=document_opt_list,
+                    page_opt_list=page_opt_list,
+                )
+                for (full_name_out, document_opt_list, page_opt_list) in tetml_passes
+            ]
+
+        tetml_data = []
+
+        for future, (full_name_out, _, _) in zip(futures, tetml_passes):
+            return_code, error_msg, tetml = future.result()
             if return_code != "ok":
                 raise RuntimeError(error_msg)
-            dcr_core.core_utils.progress_msg(self._is_verbose, f"End   processing PDFlib TET    {self._full_name_in_parser_word}")
+
+            tetml_data.append(tetml)
+
+            dcr_core.core_utils.progress_msg(self._is_verbose, f"End   processing PDFlib TET    {full_name_out}")
+
+        self._tetml_line = tetml_data[0]
+        if self._run_context.setup.is_tetml_page:
+            self._tetml_page = tetml_data[1]
+        if self._run_context.setup.is_tetml_word:
+            self._tetml_word = tetml_data[-1]
+
+        self._document_metrics.end_stage(
+            dcr_core.cls_document_metrics.DocumentMetrics.STAGE_PDFLIB,
+            [] if is_tetml_in_memory else [full_name_out for (full_name_out, _, _) in tetml_passes],
+            bytes_out=sum(len(tetml) for tetml in tetml_data),
+            no_pages=self._no_pdf_pages,
+        )
 
         self._document_delete_auxiliary_file(self._full_name_in_pdflib)
 
@@ -481,30 +1199,70 @@ class Process:
 
             dcr_core.core_utils.progress_msg(self._is_verbose, f"Start processing Tesseract OCR {self._full_name_in_tesseract}")
 
+            # Pages rendered in memory are taken from the PDF document itself.
+            full_names_in = (
+                [image for image in self._tesseract_images if isinstance(image, str)]
+                if isinstance(self._tesseract_images, list)
+                else [self._full_name_in_tesseract]
+            )
+
+            self._document_metrics.start_stage(dcr_core.cls_document_metrics.DocumentMetrics.STAGE_TESSERACT, full_names_in)
+
             if self._is_pdf2image:
                 self._full_name_in_stem_name += "_0"
 
-            self._full_name_in_pdflib = dcr_core.core_utils.get_full_name_from_components(
-                self._full_name_in_directory, self._full_name_in_stem_name, dcr_core.core_glob.FILE_TYPE_PDF
-            )
+            if self._is_tesseract_tsv:
+                # The lines are taken directly from the TSV data - no PDF document is created.
+                return_code, error_msg, self._tesseract_pages = Process.tesseract_tsv(
+                    self._full_name_in_tesseract,
+                    self._language_tesseract,
+                    run_context=self._run_context,
+                    images=self._tesseract_images,
+                    resolution=self._run_context.setup.pdf2image_dpi if self._is_pdf2image else 0,
+                )
+                if return_code != "ok":
+                    raise RuntimeError(error_msg)
 
-            return_code, error_msg, children = Process.tesseract(
-                self._full_name_in_tesseract,
-                self._full_name_in_pdflib,
-                self._language_tesseract,
-            )
-            if return_code != "ok":
-                raise RuntimeError(error_msg)
+                if self._is_pdf2image:
+                    self._document_delete_auxiliary_file(self._full_name_in_pdf2image)
 
-            # noinspection PyUnresolvedReferences
-            self._no_pdf_pages = len(PyPDF2.PdfReader(self._full_name_in_pdflib).pages)
-            if self._no_pdf_pages == 0:
-                raise RuntimeError(f"The number of pages of the PDF document {self._full_name_in_pdflib} cannot be determined")
+                self._no_pdf_pages = len(self._tesseract_pages)
 
-            for child in children:
-                self._document_delete_auxiliary_file(child)
+                self._document_metrics.end_stage(dcr_core.cls_document_metrics.DocumentMetrics.STAGE_TESSERACT, no_pages=self._no_pdf_pages)
 
-            dcr_core.core_utils.progress_msg(self._is_verbose, f"End   processing Tesseract OCR {self._full_name_in_pdflib}")
+                dcr_core.core_utils.progress_msg(self._is_verbose, f"End   processing Tesseract OCR {self._full_name_in_tesseract}")
+            else:
+                self._full_name_in_pdflib = dcr_core.core_utils.get_full_name_from_components(
+                    self._full_name_in_directory, self._full_name_in_stem_name, dcr_core.core_glob.FILE_TYPE_PDF
+                )
+
+                return_code, error_msg, children = Process.tesseract(
+                    self._full_name_in_tesseract,
+                    self._full_name_in_pdflib,
+                    self._language_tesseract,
+                    run_context=self._run_context,
+                    images=self._tesseract_images,
+                )
+                if return_code != "ok":
+                    raise RuntimeError(error_msg)
+
+                if self._is_pdf_hybrid:
+                    self._document_merge_pdf_hybrid()
+                elif self._is_pdf2image:
+                    self._document_delete_auxiliary_file(self._full_name_in_pdf2image)
+
+                self._no_pdf_pages = dcr_core.cls_pdf_metadata.PdfMetadata.get(self._full_name_in_pdflib).no_pages
+                if self._no_pdf_pages == 0:
+                    raise RuntimeError(f"The number of pages of the PDF document {self._full_name_in_pdflib} cannot be determined")
+
+                self._document_metrics.end_stage(
+                    dcr_core.cls_document_metrics.DocumentMetrics.STAGE_TESSERACT, [self._full_name_in_pdflib], no_pages=self._no_pdf_pages
+                )
+
+                for child in children:
+                    self._document_delete_auxiliary_file(child)
+
+                dcr_core.core_utils.progress_msg(self._is_verbose, f"End   processing Tesseract OCR {self._full_name_in_pdflib}")
 
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
 
@@ -521,10 +1279,11 @@ class Process:
 
         dcr_core.core_utils.progress_msg(self._is_verbose, f"Start processing spaCy         {self._full_name_in_tokenizer_line}")
 
-        try:
-            dcr_core.core_glob.tokenizer_spacy.exists()
-        except AttributeError:
-            dcr_core.core_glob.tokenizer_spacy = dcr_core.cls_tokenizer_spacy.TokenizerSpacy()
+        self._document_metrics.start_stage(
+            dcr_core.cls_document_metrics.DocumentMetrics.STAGE_TOKENIZER, [self._full_name_in_tokenizer_line]
+        )
+
+        self._run_context.tokenizer_spacy = dcr_core.cls_tokenizer_spacy.TokenizerSpacy(run_context=self._run_context)
 
         self._full_name_in_next_step = dcr_core.core_utils.get_full_name_from_components(
             self._full_name_in_directory,
@@ -540,16 +1299,429 @@ class Process:
             no_lines_footer=self._no_lines_footer,
             no_lines_header=self._no_lines_header,
             no_lines_toc=self._no_lines_toc,
+            run_context=self._run_context,
+            line_document=self._parse_result_line_document,
         )
         if return_code != "ok":
             raise RuntimeError(error_msg)
 
+        self._parse_result_line_document = {}
+
+        self._document_metrics_end_stage(
+            dcr_core.cls_document_metrics.DocumentMetrics.STAGE_TOKENIZER,
+            [self._full_name_in_next_step],
+            self._run_context.text_parser.parse_result_line_document,
+            no_tokens=self._run_context.tokenizer_spacy.get_no_tokens_in_doc(),
+        )
+
         self._document_delete_auxiliary_file(self._full_name_in_tokenizer_line)
 
         dcr_core.core_utils.progress_msg(self._is_verbose, f"End   processing spaCy         {self._full_name_in_next_step}")
 
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
 
+    # ------------------------------------------------------------------
+    # Process a single document of a batch in a worker process.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _documents_worker(
+        full_name_in: str,
+        document_params: dict[str, bool | dict[str, bool | int | str] | str | None],
+    ) -> tuple[str, str, str]:
+        """Process a single document of a batch in a worker process.
+
+        Any error is caught and returned so that the remaining
+        documents of the batch are processed regardless.
+
+        Args:
+            full_name_in (str):
+                    Full file name of the document file.
+            document_params (dict[str, bool | dict[str, bool | int | str] | str | None]):
+                    The optional keyword arguments of the method `document`.
+
+        Returns:
+            tuple[str, str, str]:
+                    (full_name_in, "ok", "") if the processing has been completed successfully,
+                                             otherwise a corresponding error code and error message.
+        """
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+
+        dcr_core.core_glob.logger.debug("param full_name_in   =%s", full_name_in)
+        dcr_core.core_glob.logger.debug("param document_params=%s", document_params)
+
+        instance = Process()
+
+        try:
+            instance.document(full_name_in, **document_params)  # type: ignore[arg-type]
+        except (Exception, SystemExit) as err:  # pylint: disable=broad-except
+            error_msg = str(err)
+            if not (isinstance(err, RuntimeError) and re.match(r"\d\d\.\d\d\d ", error_msg)):
+                error_msg = (
+                    Process.ERROR_01_905.replace("{full_name}", full_name_in)
+                    .replace("{error_type}", str(type(err)))
+                    .replace("{error_msg}", error_msg)
+                )
+            dcr_core.core_glob.logger.debug("return               =%s", (full_name_in, error_msg[:6], error_msg))
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+            return full_name_in, error_msg[:6], error_msg
+
+        dcr_core.core_glob.logger.debug("return               =%s", (full_name_in, *dcr_core.core_glob.RETURN_OK))
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+        return full_name_in, dcr_core.core_glob.RETURN_OK[0], dcr_core.core_glob.RETURN_OK[1]
+
+    # ------------------------------------------------------------------
+    # Initialise a worker process of a batch.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _documents_worker_init(pipeline_name: str) -> None:
+        """Initialise a worker process of a batch.
+
+        The logging functionality, the configuration parameters and
+        the spaCy pipeline are loaded only once per worker process
+        and are then reused for all documents processed by it.
+
+        Args:
+            pipeline_name (str): SpaCy pipeline name.
+        """
+        dcr_core.core_glob.initialise_logger()
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+        dcr_core.core_glob.logger.debug("param pipeline_name=%s", pipeline_name)
+
+        dcr_core.cls_setup.Setup.get_snapshot()
+
+        dcr_core.cls_tokenizer_spacy.TokenizerSpacy.load_pipeline(pipeline_name)
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+    # ------------------------------------------------------------------
+    # Determine the key of the document.
+    # ------------------------------------------------------------------
+    def _get_document_key(self) -> str:
+        """Determine the key of the document.
+
+        The key covers the content of the document file, the languages,
+        the fingerprint of the configuration parameters and the versions
+        of spaCy and of the spaCy pipeline.
+
+        Returns:
+            str: The key of the document.
+        """
+        if not self._document_key:
+            self._document_key = dcr_core.cls_result_cache.ResultCache.get_key(
+                self._full_name_in,
+                self._full_name_in_extension_int,
+                self._language_pandoc,
+                self._language_spacy,
+                self._language_tesseract,
+                self._run_context.setup.get_fingerprint(),
+                spacy.about.__version__,
+                spacy.util.get_package_version(self._language_spacy) or "",
+            )
+
+        return self._document_key
+
+    # ------------------------------------------------------------------
+    # Determine the document cache and the cache key of the document.
+    # ------------------------------------------------------------------
+    def _get_document_result_cache(self) -> tuple[dcr_core.cls_result_cache.ResultCache | None, str]:
+        """Determine the document cache and the cache key of the document.
+
+        Returns:
+            tuple[ResultCache | None, str]: The document cache and the cache key,
+                (None, "") if the cache is disabled.
+        """
+        setup = self._run_context.setup
+
+        if not setup.document_cache_directory or setup.document_cache_directory.lower() == "none":
+            return None, ""
+
+        return dcr_core.cls_result_cache.ResultCache(setup.document_cache_directory), self._get_document_key()
+
+    # ------------------------------------------------------------------
+    # Determine the result files of the document.
+    # ------------------------------------------------------------------
+    def _get_document_result_files(self, full_name_in_stem_name: str) -> dict[str, tuple[int, int]]:
+        """Determine the result files of the document.
+
+        Args:
+            full_name_in_stem_name (str): Stem name of the document file.
+
+        Returns:
+            dict[str, tuple[int, int]]: The modification time in nanoseconds and
+                the size of the existing result files by full file name.
+        """
+        result_files = re.compile(re.escape(full_name_in_stem_name) + Process._DOCUMENT_CACHE_RESULT_FILES)
+
+        return {
+            directory_entry.path: (directory_entry.stat().st_mtime_ns, directory_entry.stat().st_size)
+            for directory_entry in os.scandir(self._full_name_in_directory)
+            if result_files.fullmatch(directory_entry.name)
+        }
+
+    # ------------------------------------------------------------------
+    # Determine the resolution of an image.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _get_image_resolution(image: PIL.Image.Image | str) -> float:
+        """Determine the resolution of an image.
+
+        Args:
+            image (PIL.Image.Image | str): The image or the full file name of the image file.
+
+        Returns:
+            float: The horizontal resolution in dpi, 72 dpi if the image does
+                not contain any resolution, i.e. one pixel corresponds to one point.
+        """
+        if isinstance(image, str):
+            with PIL.Image.open(image) as image_file:
+                dpi = image_file.info.get("dpi")
+        else:
+            dpi = image.info.get("dpi")
+
+        return float(dpi[0]) if dpi and dpi[0] else 72.0
+
+    # ------------------------------------------------------------------
+    # Determine a count of the line-oriented document.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _get_line_document_count(line_document: dcr_core.cls_nlp_core.NLPCore.ParserLineDocument, json_name: str) -> int:
+        """Determine a count of the line-oriented document.
+
+        Args:
+            line_document (ParserLineDocument): The line-oriented result of the parser.
+            json_name (str): JSON name of the count.
+
+        Returns:
+            int: The count, 0 if the document does not contain it.
+        """
+        count = line_document.get(json_name)
+
+        return count if isinstance(count, int) else 0
+
+    # ------------------------------------------------------------------
+    # Split the page numbers into batches of consecutive pages.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _get_page_batches(page_numbers: list[int], batch_size: int) -> list[tuple[int, int]]:
+        """Split the page numbers into batches of consecutive pages.
+
+        Args:
+            page_numbers (list[int]): The page numbers.
+            batch_size (int): Maximum number of pages per batch.
+
+        Returns:
+            list[tuple[int, int]]: The first and the last page number of each batch.
+        """
+        page_batches: list[tuple[int, int]] = []
+
+        for _, page_run in itertools.groupby(enumerate(sorted(page_numbers)), lambda item: item[1] - item[0]):
+            run_page_numbers = [page_no for _, page_no in page_run]
+            for batch_start in range(0, len(run_page_numbers), batch_size):
+                batch_page_numbers = run_page_numbers[batch_start : batch_start + batch_size]
+                page_batches.append((batch_page_numbers[0], batch_page_numbers[-1]))
+
+        return page_batches
+
+    # ------------------------------------------------------------------
+    # Render the pages of a PDF document in memory.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _get_page_images(
+        full_name_in: str,
+        page_numbers: list[int],
+        setup: dcr_core.cls_setup.Setup,
+    ) -> collections.abc.Iterator[PIL.Image.Image]:
+        """Render the pages of a PDF document in memory.
+
+        The pages are rendered batch by batch only when they are
+        requested and are returned as uncompressed PPM images, which
+        Tesseract OCR can read without any further conversion.
+
+        Args:
+            full_name_in (str): Full file name of the PDF document.
+            page_numbers (list[int]): The numbers of the pages to be rendered.
+            setup (Setup): The configuration parameters.
+
+        Yields:
+            PIL.Image.Image: The page images in the order of the page numbers.
+
+        Raises:
+            RuntimeError: ERROR_21_901
+        """
+        for first_page, last_page in Process._get_page_batches(page_numbers, setup.pdf2image_batch_size):
+            try:
+                images = pdf2image.convert_from_path(
+                    full_name_in,
+                    dpi=setup.pdf2image_dpi,
+                    first_page=first_page,
+                    fmt="ppm",
+                    grayscale=setup.is_pdf2image_grayscale,
+                    last_page=last_page,
+                    thread_count=setup.pdf2image_thread_count,
+                )
+            except PDFPageCountError as err:
+                raise RuntimeError(
+                    Process.ERROR_21_901.replace("{full_name}", full_name_in)
+                    .replace("{error_type}", str(type(err)))
+                    .replace("{error_msg}", str(err))
+                ) from err
+
+            yield from images
+
+    # ------------------------------------------------------------------
+    # Determine the sort key of the image file of a page.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _get_page_sort_key(full_name: str) -> list[int | str]:
+        """Determine the sort key of the image file of a page.
+
+        The numbers in the file name are compared numerically, so that
+        e.g. the page 'x_2.jpeg' is sorted before the page 'x_10.jpeg'.
+
+        Args:
+            full_name (str): Full file name of the image file.
+
+        Returns:
+            list[int | str]: The sort key.
+        """
+        return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", full_name)]
+
+    # ------------------------------------------------------------------
+    # Determine the result cache and the cache key of a Pandoc conversion.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _get_pandoc_result_cache(
+        full_name_in: str,
+        extra_args: list[str],
+        setup: dcr_core.cls_setup.Setup,
+    ) -> tuple[dcr_core.cls_result_cache.ResultCache | None, str]:
+        """Determine the result cache and the cache key of a Pandoc conversion.
+
+        Args:
+            full_name_in (str): Full file name of the input file.
+            extra_args (list[str]): The Pandoc arguments of the conversion.
+            setup (Setup): The configuration parameters.
+
+        Returns:
+            tuple[ResultCache | None, str]: The result cache and the cache key,
+                (None, "") if the cache is disabled.
+        """
+        if not setup.pandoc_cache_directory or setup.pandoc_cache_directory.lower() == "none":
+            return None, ""
+
+        return (
+            dcr_core.cls_result_cache.ResultCache(setup.pandoc_cache_directory),
+            dcr_core.cls_result_cache.ResultCache.get_key(
+                full_name_in,
+                os.path.splitext(full_name_in)[1].lower(),
+                pypandoc.get_pandoc_version(),
+                *extra_args,
+            ),
+        )
+
+    # ------------------------------------------------------------------
+    # Process images concurrently with Tesseract OCR.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _get_tesseract_results(
+        images: collections.abc.Iterable[PIL.Image.Image | str],
+        setup: dcr_core.cls_setup.Setup,
+        function: collections.abc.Callable[[PIL.Image.Image | str], object],
+    ) -> collections.abc.Iterator[tuple[PIL.Image.Image | str, object]]:
+        """Process images concurrently with Tesseract OCR.
+
+        The images are processed concurrently, controlled by the
+        configuration parameters `tesseract_max_workers` and
+        `tesseract_omp_thread_limit`. At most two images per worker are
+        requested in advance, so that images passed in memory are only
+        rendered when they are needed. The thread limit only applies
+        while images are processed concurrently.
+
+        Args:
+            images (Iterable[PIL.Image.Image | str]): The images or image files in page order.
+            setup (Setup): The configuration parameters.
+            function (Callable[[PIL.Image.Image | str], object]): The pytesseract function to be applied
+                to each image, all further arguments already bound.
+
+        Yields:
+            tuple[PIL.Image.Image | str, object]: Image and result of the pytesseract function in page order.
+
+        Raises:
+            RuntimeError: Any Tesseract OCR issue.
+        """
+        max_workers = setup.tesseract_max_workers
+        if max_workers == -1:
+            max_workers = os.cpu_count() or 1
+        if isinstance(images, collections.abc.Sized):
+            max_workers = max(1, min(max_workers, len(images)))
+
+        # Otherwise each Tesseract OCR process uses all available CPUs.
+        omp_thread_limit = setup.tesseract_omp_thread_limit if max_workers > 1 else 0
+
+        with Process._limit_omp_threads(omp_thread_limit), concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            image_iterator = iter(images)
+            pending: collections.deque[tuple[PIL.Image.Image | str, concurrent.futures.Future[object]]] = collections.deque()
+
+            try:
+                while True:
+                    for image in itertools.islice(image_iterator, 2 * max_workers - len(pending)):
+                        pending.append((image, executor.submit(function, image)))
+
+                    if not pending:
+                        break
+
+                    image, future = pending.popleft()
+
+                    yield image, future.result()
+            finally:
+                # Nothing more is processed after an error or if the results are no longer requested.
+                executor.shutdown(cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Limit the number of OpenMP threads of the subprocesses.
+    # ------------------------------------------------------------------
+    @staticmethod
+    @contextlib.contextmanager
+    def _limit_omp_threads(omp_thread_limit: int) -> collections.abc.Iterator[None]:
+        """Limit the number of OpenMP threads of the subprocesses.
+
+        Tesseract OCR takes the limit from the environment variable
+        `OMP_THREAD_LIMIT`, which pytesseract cannot pass per call. The
+        variable is therefore set for the process as long as at least
+        one concurrent Tesseract OCR run is active, the first run
+        determines its value. When the last run has finished, the value
+        from before the first run is restored.
+
+        Args:
+            omp_thread_limit (int): Maximum number of threads per subprocess,
+                0 means no limit is set.
+
+        Yields:
+            None: The limit applies while the context is active.
+        """
+        if omp_thread_limit <= 0:
+            yield
+            return
+
+        with Process._omp_thread_limit_lock:
+            if Process._omp_thread_limit_users == 0:
+                Process._omp_thread_limit_prev = os.environ.get("OMP_THREAD_LIMIT")
+                os.environ["OMP_THREAD_LIMIT"] = str(omp_thread_limit)
+            Process._omp_thread_limit_users += 1
+
+        try:
+            yield
+        finally:
+            with Process._omp_thread_limit_lock:
+                Process._omp_thread_limit_users -= 1
+                if Process._omp_thread_limit_users == 0:
+                    if Process._omp_thread_limit_prev is None:
+                        os.environ.pop("OMP_THREAD_LIMIT", None)
+                    else:
+                        os.environ["OMP_THREAD_LIMIT"] = Process._omp_thread_limit_prev
+
     # ------------------------------------------------------------------
     # Document content recognition for a specific file.
     # ------------------------------------------------------------------
@@ -559,12 +1731,14 @@ class Process:
         document_id: int = None,
         full_name_orig: str = None,
         is_delete_auxiliary_files: bool = None,
+        is_resume: bool = False,
         is_verbose: bool = None,
         language_pandoc: str = None,
         language_spacy: str = None,
         language_tesseract: str = None,
         output_directory: str = None,
-    ) -> None:
+        setup_overrides: dict[str, bool | int | str] = None,
+    ) -> dcr_core.cls_document_metrics.DocumentMetrics:
         """Document content recognition for a specific file.
 
         This method extracts the document content structure from a
@@ -578,6 +1752,32 @@ class Process:
         token data are then made available together with the metadata in a
         JSON format.
 
+        Each call works with its own run context, so that several documents
+        can be processed concurrently in threads, each thread using its own
+        instance of this class. The configuration parameters are taken from
+        the process-wide configuration snapshot, which is only read again
+        if `setup.cfg` has been modified, and the per-call overrides are
+        applied to a private copy of it.
+
+        If the configuration parameter `document_cache_directory` is set,
+        the result files of a document with identical content, languages
+        and configuration parameters are restored from the cache instead
+        of processing the document again. No auxiliary files are created
+        in this case.
+
+        With `is_resume`, each processing stage records a checkpoint
+        with its output files in the file `<stem>.checkpoint.json`, and
+        these output files are kept until the document is completed. If
+        the processing fails, a new call with `is_resume` continues after
+        the last stage whose output files are still valid, e.g. with the
+        tokenizer instead of repeating Tesseract OCR.
+
+        The wall time, the CPU time and the throughput of each processing
+        stage are measured and returned. They are also appended to the
+        JSONL file `metrics_file` and written to the Prometheus textfile
+        `metrics_prometheus_file`, if these parameters are set - in case
+        of an error with the status 'error'.
+
         Args:
             full_name_in (str):
                 Full file name of the document file.
@@ -590,6 +1790,9 @@ class Process:
             is_delete_auxiliary_files (bool, optional):
                 Delete the auxiliary files after a successful processing step.
                 Defaults to parameter `delete_auxiliary_files` in `setup.cfg`.
+            is_resume (bool, optional):
+                Record checkpoints and skip the stages completed in a previous run.
+                Defaults to False.
             is_verbose (bool, optional):
                 Display progress messages for processing.
                 Defaults to parameter `verbose` in `setup.cfg`.
@@ -605,6 +1808,13 @@ class Process:
             output_directory (str, optional):
                 Directory for the flat files to be created.
                 Defaults to the directory of the document file.
+            setup_overrides (dict[str, bool | int | str], optional):
+                Configuration parameters overriding those from `setup.cfg`
+                for this call only, e.g. {"is_tetml_page": True}.
+                Defaults to no overrides.
+
+        Returns:
+            DocumentMetrics: The timing and throughput metrics of the processing stages.
 
         Raises:
             RuntimeError: Any issue from Pandoc, pdf2image, PDFlib TET, spaCy, or Tesseract OCR.
@@ -631,13 +1841,18 @@ class Process:
         dcr_core.core_glob.logger.debug("param language_spacy    =%s", self._language_spacy)
         dcr_core.core_glob.logger.debug("param language_tesseract=%s", self._language_tesseract)
 
-        # Load the configuration parameters.
-        dcr_core.core_glob.setup = dcr_core.cls_setup.Setup()
+        # Layer the per-call overrides on the configuration snapshot.
+        setup_snapshot = dcr_core.cls_setup.Setup.get_snapshot()
+
+        self._run_context = dcr_core.cls_run_context.RunContext(
+            setup=setup_snapshot.copy_with(**(setup_overrides if setup_overrides else {})),
+        )
 
         self._is_delete_auxiliary_files = (
-            is_delete_auxiliary_files if is_delete_auxiliary_files is not None else dcr_core.core_glob.setup.is_delete_auxiliary_files
+            is_delete_auxiliary_files if is_delete_auxiliary_files is not None else self._run_context.setup.is_delete_auxiliary_files
         )
-        self._is_verbose = is_verbose if is_verbose is not None else dcr_core.core_glob.setup.is_verbose
+        self._is_resume = is_resume
+        self._is_verbose = is_verbose if is_verbose is not None else self._run_context.setup.is_verbose
 
         dcr_core.core_utils.progress_msg(self._is_verbose, f"Start processing document file {self._full_name_orig}")
         dcr_core.core_utils.progress_msg(self._is_verbose, f"Language key Pandoc            {self._language_pandoc}")
@@ -656,24 +1871,197 @@ class Process:
             self._full_name_in_extension.lower() if self._full_name_in_extension else self._full_name_in_extension
         )
 
-        self._document_check_extension()
+        self._document_metrics = dcr_core.cls_document_metrics.DocumentMetrics(self._document_id, self._full_name_orig)
+
+        try:
+            self._document_check_extension()
+
+            result_cache, cache_key = self._get_document_result_cache()
+
+            if result_cache is not None:
+                self._document_metrics.start_stage(dcr_core.cls_document_metrics.DocumentMetrics.STAGE_CACHE, [self._full_name_in])
+                is_cache_hit = self._document_cache_get(result_cache, cache_key)
+                self._document_metrics.end_stage(dcr_core.cls_document_metrics.DocumentMetrics.STAGE_CACHE)
+
+                if is_cache_hit:
+                    self._document_metrics_finish(dcr_core.cls_document_metrics.DocumentMetrics.STATUS_CACHE)
+                    dcr_core.core_utils.progress_msg(self._is_verbose, f"End   processing document file {self._full_name_orig}")
+                    dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+                    return self._document_metrics
+
+            full_name_in_stem_name = self._full_name_in_stem_name
+
+            self._document_checkpoint_load()
+
+            if not self._document_checkpoint_is_completed(Process._CHECKPOINT_STAGE_PANDOC):
+                self._document_pandoc()
 
-        self._document_pandoc()
+                self._document_checkpoint_put(
+                    Process._CHECKPOINT_STAGE_PANDOC,
+                    [self._full_name_in_pdflib] if self._is_pandoc and not self._is_pandoc_json else [],
+                )
+
+            if not self._document_checkpoint_is_completed(Process._CHECKPOINT_STAGE_TESSERACT):
+                self._document_pdf2image()
+
+                self._document_tesseract()
+
+                self._document_checkpoint_put(
+                    Process._CHECKPOINT_STAGE_TESSERACT,
+                    [self._full_name_in_pdflib] if self._is_tesseract and not self._is_tesseract_tsv else [],
+                )
+
+            if not self._document_checkpoint_is_completed(Process._CHECKPOINT_STAGE_PARSER):
+                result_files = self._get_document_result_files(full_name_in_stem_name)
+
+                if self._is_pandoc_json or self._is_tesseract_tsv:
+                    self._document_parser_direct()
+                else:
+                    self._document_pdflib()
 
-        self._document_pdf2image()
+                    self._document_parser()
 
-        self._document_tesseract()
+                # The extra files are the result files written or rewritten by the parser.
+                self._result_files = sorted(
+                    full_name
+                    for full_name, file_stat in self._get_document_result_files(full_name_in_stem_name).items()
+                    if result_files.get(full_name) != file_stat
+                )
+
+                self._document_checkpoint_put(Process._CHECKPOINT_STAGE_PARSER, [self._full_name_in_tokenizer_line])
 
-        self._document_pdflib()
+            self._document_tokenizer()
 
-        self._document_parser()
+            self._document_checkpoint_finish()
+
+            if result_cache is not None:
+                self._document_cache_put(
+                    result_cache,
+                    cache_key,
+                    full_name_in_stem_name,
+                    self._result_files + [self._full_name_in_next_step],
+                )
+        except Exception:
+            self._document_metrics_finish(dcr_core.cls_document_metrics.DocumentMetrics.STATUS_ERROR)
+            raise
 
-        self._document_tokenizer()
+        self._document_metrics_finish(dcr_core.cls_document_metrics.DocumentMetrics.STATUS_OK)
 
         dcr_core.core_utils.progress_msg(self._is_verbose, f"End   processing document file {self._full_name_orig}")
 
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
 
+        return self._document_metrics
+
+    # ------------------------------------------------------------------
+    # Document content recognition for a batch of files.
+    # ------------------------------------------------------------------
+    @classmethod
+    def documents(
+        cls,
+        full_names_in: list[str],
+        max_workers: int = None,
+        is_delete_auxiliary_files: bool = None,
+        is_resume: bool = False,
+        is_verbose: bool = None,
+        language_pandoc: str = None,
+        language_spacy: str = None,
+        language_tesseract: str = None,
+        output_directory: str = None,
+        setup_overrides: dict[str, bool | int | str] = None,
+    ) -> list[tuple[str, str, str]]:
+        """Document content recognition for a batch of files.
+
+        The documents are distributed over a pool of worker processes,
+        each of which processes its documents with the method `document`.
+        The configuration parameters and the spaCy pipeline are loaded
+        only once per worker process. An error in one document does not
+        abort the batch, instead it is returned as the result of this
+        document.
+
+        Args:
+            full_names_in (list[str]):
+                Full file names of the document files.
+            max_workers (int, optional):
+                Maximum number of worker processes.
+                Defaults to the number of processors of the machine.
+            is_delete_auxiliary_files (bool, optional):
+                Delete the auxiliary files after a successful processing step.
+                Defaults to parameter `delete_auxiliary_files` in `setup.cfg`.
+            is_resume (bool, optional):
+                Record checkpoints and skip the stages completed in a previous run.
+                Defaults to False.
+            is_verbose (bool, optional):
+                Display progress messages for processing.
+                Defaults to parameter `verbose` in `setup.cfg`.
+            language_pandoc (str, optional):
+                Pandoc language code.
+                Defaults to English.
+            language_spacy (str, optional):
+                spaCy language code.
+                Defaults to English transformer pipeline (roberta-base)..
+            language_tesseract (str, optional):
+                Tesseract OCR language code.
+                Defaults to English.
+            output_directory (str, optional):
+                Directory for the flat files to be created.
+                Defaults to the directory of the document file.
+            setup_overrides (dict[str, bool | int | str], optional):
+                Configuration parameters overriding those from `setup.cfg`
+                for this batch only, e.g. {"is_tetml_page": True}.
+                Defaults to no overrides.
+
+        Returns:
+            list[tuple[str, str, str]]:
+                    One entry per document in the order of `full_names_in`:
+                    (full_name_in, "ok", "") if the processing has been completed successfully,
+                                             otherwise a corresponding error code and error message.
+        """
+        try:
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+        except AttributeError:
+            dcr_core.core_glob.initialise_logger()
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+
+        dcr_core.core_glob.logger.debug("param full_names_in=%s", full_names_in)
+        dcr_core.core_glob.logger.debug("param max_workers  =%s", max_workers)
+
+        document_params: dict[str, bool | dict[str, bool | int | str] | str | None] = {
+            "is_delete_auxiliary_files": is_delete_auxiliary_files,
+            "is_resume": is_resume,
+            "is_verbose": is_verbose,
+            "language_pandoc": language_pandoc,
+            "language_spacy": language_spacy,
+            "language_tesseract": language_tesseract,
+            "output_directory": output_directory,
+            "setup_overrides": setup_overrides,
+        }
+
+        results: list[tuple[str, str, str]] = []
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=Process._documents_worker_init,
+            initargs=(language_spacy if language_spacy else dcr_core.cls_nlp_core.NLPCore.LANGUAGE_SPACY_DEFAULT,),
+        ) as executor:
+            futures = [executor.submit(Process._documents_worker, full_name_in, document_params) for full_name_in in full_names_in]
+
+            for full_name_in, future in zip(full_names_in, futures):
+                try:
+                    results.append(future.result())
+                except concurrent.futures.process.BrokenProcessPool as err:
+                    error_msg = (
+                        Process.ERROR_01_905.replace("{full_name}", full_name_in)
+                        .replace("{error_type}", str(type(err)))
+                        .replace("{error_msg}", str(err))
+                    )
+                    results.append((full_name_in, error_msg[:6], error_msg))
+
+        dcr_core.core_glob.logger.debug("return             =%s", results)
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+        return results
+
     # ------------------------------------------------------------------
     # Converting a Non-PDF file to a PDF file.
     # ------------------------------------------------------------------
@@ -683,6 +2071,7 @@ class Process:
         full_name_in: str,
         full_name_out: str,
         language_pandoc: str,
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = None,
     ) -> tuple[str, str]:
         """Convert a Non-PDF file to a PDF file.
 
@@ -697,6 +2086,11 @@ class Process:
         - rst - reStructuredText (RST
         - rtf - Rich Text Format
 
+        If the configuration parameter `pandoc_cache_directory` is set,
+        the PDF file of an input file with identical content, language
+        and Pandoc version is taken from the cache instead of running
+        Pandoc and XeLaTeX again.
+
         Args:
             full_name_in (str):
                     The directory name and file name of the input file.
@@ -704,6 +2098,9 @@ class Process:
                     The directory name and file name of the output file.
             language_pandoc (str):
                     The Pandoc name of the document language.
+            run_context (RunContext, optional):
+                    The run context of the document.
+                    Defaults to the global variables in dcr_core.core_glob.
 
         Returns:
             tuple[str, str]:
@@ -720,6 +2117,8 @@ class Process:
         dcr_core.core_glob.logger.debug("param full_name_out  =%s", full_name_out)
         dcr_core.core_glob.logger.debug("param language_pandoc=%s", language_pandoc)
 
+        run_context_int = dcr_core.core_utils.get_run_context(run_context)
+
         # Convert the document
         extra_args = [
             f"--pdf-engine={Process.PANDOC_PDF_ENGINE_XELATEX}",
@@ -728,6 +2127,13 @@ class Process:
         ]
 
         try:
+            result_cache, cache_key = Process._get_pandoc_result_cache(full_name_in, extra_args, run_context_int.setup)
+
+            if result_cache is not None and result_cache.get(cache_key, full_name_out):
+                dcr_core.core_glob.logger.debug("return               =%s", dcr_core.core_glob.RETURN_OK)
+                dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+                return dcr_core.core_glob.RETURN_OK
+
             pypandoc.convert_file(
                 full_name_in,
                 dcr_core.core_glob.FILE_TYPE_PDF,
@@ -735,12 +2141,15 @@ class Process:
                 outputfile=full_name_out,
             )
 
-            if len(PyPDF2.PdfReader(full_name_out).pages) == 0:
+            if dcr_core.cls_pdf_metadata.PdfMetadata.get(full_name_out).no_pages == 0:
                 error_msg = Process.ERROR_31_911.replace("{full_name}", full_name_out)
                 dcr_core.core_glob.logger.debug("return               =%s", (error_msg[:6], error_msg))
                 dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
                 return error_msg[:6], error_msg
 
+            if result_cache is not None:
+                result_cache.put(cache_key, full_name_out)
+
         except FileNotFoundError:
             error_msg = Process.ERROR_31_902.replace("{full_name}", full_name_in)
             dcr_core.core_glob.logger.debug("return               =%s", (error_msg[:6], error_msg))
@@ -757,6 +2166,158 @@ class Process:
 
         return dcr_core.core_glob.RETURN_OK
 
+    # ------------------------------------------------------------------
+    # Converting a batch of Non-PDF files to PDF files.
+    # ------------------------------------------------------------------
+    @classmethod
+    def pandoc_batch(
+        cls,
+        full_names: list[tuple[str, str]],
+        language_pandoc: str,
+        max_workers: int = None,
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = None,
+    ) -> list[tuple[str, str, str]]:
+        """Convert a batch of Non-PDF files to PDF files.
+
+        The files are converted concurrently with the method `pandoc`,
+        each conversion in its own Pandoc process. Input files with
+        identical content are converted only once, the PDF file is
+        then copied to the other output files. An error in one
+        conversion only affects the files of identical content.
+
+        Args:
+            full_names (list[tuple[str, str]]):
+                    The directory names and file names of the input and output files.
+            language_pandoc (str):
+                    The Pandoc name of the document language.
+            max_workers (int, optional):
+                    Maximum number of concurrent conversions.
+                    Defaults to the default of concurrent.futures.ThreadPoolExecutor.
+            run_context (RunContext, optional):
+                    The run context of the documents.
+                    Defaults to the global variables in dcr_core.core_glob.
+
+        Returns:
+            list[tuple[str, str, str]]:
+                    One entry per file in the order of `full_names`:
+                    (full_name_in, "ok", "") if the processing has been completed successfully,
+                                             otherwise a corresponding error code and error message.
+        """
+        try:
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+        except AttributeError:
+            dcr_core.core_glob.initialise_logger()
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+
+        dcr_core.core_glob.logger.debug("param full_names     =%s", full_names)
+        dcr_core.core_glob.logger.debug("param language_pandoc=%s", language_pandoc)
+        dcr_core.core_glob.logger.debug("param max_workers    =%s", max_workers)
+
+        results: list[tuple[str, str]] = [dcr_core.core_glob.RETURN_OK] * len(full_names)
+
+        # Group the files by content
+        groups: dict[str, list[int]] = {}
+
+        for idx, (full_name_in, _) in enumerate(full_names):
+            try:
+                key = dcr_core.cls_result_cache.ResultCache.get_key(full_name_in, os.path.splitext(full_name_in)[1].lower())
+            except FileNotFoundError:
+                error_msg = Process.ERROR_31_902.replace("{full_name}", full_name_in)
+                results[idx] = (error_msg[:6], error_msg)
+                continue
+
+            groups.setdefault(key, []).append(idx)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(Process.pandoc, *full_names[indexes[0]], language_pandoc, run_context=run_context): indexes
+                for indexes in groups.values()
+            }
+
+            for future in concurrent.futures.as_completed(futures):
+                indexes = futures[future]
+
+                try:
+                    results[indexes[0]] = future.result()
+                except Exception as err:  # pylint: disable=broad-except
+                    error_msg = (
+                        Process.ERROR_31_906.replace("{full_name}", full_names[indexes[0]][0])
+                        .replace("{error_type}", str(type(err)))
+                        .replace("{error_msg}", str(err))
+                    )
+                    results[indexes[0]] = (error_msg[:6], error_msg)
+
+                for idx in indexes[1:]:
+                    if results[indexes[0]] != dcr_core.core_glob.RETURN_OK:
+                        results[idx] = results[indexes[0]]
+                        continue
+
+                    try:
+                        shutil.copyfile(full_names[indexes[0]][1], full_names[idx][1])
+                        results[idx] = dcr_core.core_glob.RETURN_OK
+                    except OSError as err:
+                        error_msg = Process.ERROR_31_907.replace("{full_name}", full_names[idx][1]).replace("{error_msg}", str(err))
+                        results[idx] = (error_msg[:6], error_msg)
+
+        batch_results = [(full_name_in, return_code, error_msg) for (full_name_in, _), (return_code, error_msg) in zip(full_names, results)]
+
+        dcr_core.core_glob.logger.debug("return               =%s", batch_results)
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+        return batch_results
+
+    # ------------------------------------------------------------------
+    # Converting a Non-PDF file to the Pandoc AST.
+    # ------------------------------------------------------------------
+    @classmethod
+    def pandoc_json(
+        cls,
+        full_name_in: str,
+    ) -> tuple[str, str, dcr_core.cls_nlp_core.NLPCore.PandocAst]:
+        """Convert a Non-PDF file to the Pandoc AST.
+
+        The file formats supported by the method `pandoc` are read with
+        Pandoc into its abstract syntax tree (JSON output). In contrast
+        to the conversion to PDF format, neither XeLaTeX nor PDFlib TET
+        are required afterwards.
+
+        Args:
+            full_name_in (str):
+                    The directory name and file name of the input file.
+
+        Returns:
+            tuple[str, str, NLPCore.PandocAst]:
+                    ("ok", "", {...}) if the processing has been completed successfully,
+                                      otherwise a corresponding error code and error message.
+        """
+        try:
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+        except AttributeError:
+            dcr_core.core_glob.initialise_logger()
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+
+        dcr_core.core_glob.logger.debug("param full_name_in=%s", full_name_in)
+
+        try:
+            pandoc_ast = json.loads(pypandoc.convert_file(full_name_in, "json"))
+        except FileNotFoundError:
+            error_msg = Process.ERROR_31_904.replace("{full_name}", full_name_in)
+            dcr_core.core_glob.logger.debug("return            =%s", (error_msg[:6], error_msg))
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+            return error_msg[:6], error_msg, {}
+        except (RuntimeError, ValueError) as err:
+            error_msg = Process.ERROR_31_905.replace("{full_name}", full_name_in).replace("{error_msg}", str(err))
+            dcr_core.core_glob.logger.debug("return            =%s", (error_msg[:6], error_msg))
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+            return error_msg[:6], error_msg, {}
+
+        dcr_core.core_glob.logger.debug(
+            "return            =%s", (dcr_core.core_glob.RETURN_OK[0], dcr_core.core_glob.RETURN_OK[1], len(pandoc_ast.get("blocks", [])))
+        )
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+        return dcr_core.core_glob.RETURN_OK[0], dcr_core.core_glob.RETURN_OK[1], pandoc_ast
+
     # ------------------------------------------------------------------
     # Extracting the text from the PDF document.
     # ------------------------------------------------------------------
@@ -768,18 +2329,25 @@ class Process:
         no_pdf_pages: int,
         document_id: int = -1,
         full_name_orig: str = dcr_core.core_glob.INFORMATION_NOT_YET_AVAILABLE,
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = None,
+        tetml: bytes = b"",
     ) -> tuple[str, str]:
         """Extract the text from the PDF document.
 
         From the line-oriented XML output file of PDFlib TET,
         the text and relevant metadata are extracted with the
         help of an XML parser and stored in a JSON file.
+        The XML data is parsed incrementally page by page, so that
+        even very large documents need only little memory.
+        Alternatively, the XML data can be passed directly in memory.
 
         Args:
             full_name_in (str):
                     The directory name and file name of the input file.
             full_name_out (str):
                     The directory name and file name of the output file.
+                    When parsing lines, an empty name keeps the result
+                    in memory only (TextParser.parse_result_line_document).
             no_pdf_pages (int):
                     Total number of PDF pages.
             document_id (int, optional):
@@ -788,6 +2356,13 @@ class Process:
             full_name_orig (str, optional):
                     The file name of the originating document.
                     Defaults to dcr_core.core_glob.INFORMATION_NOT_YET_AVAILABLE.
+            run_context (RunContext, optional):
+                    The run context of the document.
+                    Defaults to the global variables in dcr_core.core_glob.
+            tetml (bytes, optional):
+                    The XML data of PDFlib TET. If given, the input file is
+                    not read, its name only identifies the document.
+                    Defaults to the XML data in the input file.
 
         Returns:
             tuple[str, str]:
@@ -800,38 +2375,29 @@ class Process:
             dcr_core.core_glob.initialise_logger()
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
 
+        run_context_int = dcr_core.core_utils.get_run_context(run_context)
+
         dcr_core.core_glob.logger.debug("param document_id   =%i", document_id)
         dcr_core.core_glob.logger.debug("param full_name_orig=%s", full_name_orig)
         dcr_core.core_glob.logger.debug("param full_name_in  =%s", full_name_in)
         dcr_core.core_glob.logger.debug("param full_name_out =%s", full_name_out)
         dcr_core.core_glob.logger.debug("param no_pdf_pages  =%i", no_pdf_pages)
+        dcr_core.core_glob.logger.debug("param tetml         =%i bytes", len(tetml))
 
         try:
-            # Create the Element tree object
-            tree = defusedxml.ElementTree.parse(full_name_in)
-
-            # Get the root Element
-            root = tree.getroot()
-
-            dcr_core.core_glob.text_parser = dcr_core.cls_text_parser.TextParser()
-
-            for child in root:
-                child_tag = child.tag[dcr_core.cls_nlp_core.NLPCore.PARSE_ELEM_FROM :]
-                match child_tag:
-                    case dcr_core.cls_nlp_core.NLPCore.PARSE_ELEM_DOCUMENT:
-                        dcr_core.core_glob.text_parser.parse_tag_document(
-                            directory_name=os.path.dirname(full_name_in),
-                            document_id=document_id,
-                            environment_variant=dcr_core.core_glob.setup.environment_variant,
-                            file_name_curr=os.path.basename(full_name_in),
-                            file_name_next=full_name_out,
-                            file_name_orig=full_name_orig,
-                            no_pdf_pages=no_pdf_pages,
-                            parent=child,
-                            parent_tag=child_tag,
-                        )
-                    case dcr_core.cls_nlp_core.NLPCore.PARSE_ELEM_CREATION:
-                        pass
+            run_context_int.text_parser = dcr_core.cls_text_parser.TextParser(run_context=run_context_int)
+
+            # The XML data is processed page by page.
+            run_context_int.text_parser.parse_tetml(
+                directory_name=os.path.dirname(full_name_in),
+                document_id=document_id,
+                environment_variant=run_context_int.setup.environment_variant,
+                file_name_curr=os.path.basename(full_name_in),
+                file_name_next=full_name_out,
+                file_name_orig=full_name_orig,
+                no_pdf_pages=no_pdf_pages,
+                source=tetml if tetml else full_name_in,
+            )
         except FileNotFoundError:
             error_msg = Process.ERROR_61_901.replace("{full_name}", full_name_in)
             dcr_core.core_glob.logger.debug("return              =%s", (error_msg[:6], error_msg))
@@ -850,6 +2416,8 @@ class Process:
     def pdf2image(
         cls,
         full_name_in: str,
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = None,
+        page_numbers: list[int] = None,
     ) -> tuple[str, str, list[tuple[str, str]]]:
         """Convert a scanned PDF file to a set of image files.
 
@@ -859,10 +2427,19 @@ class Process:
         into a normal PDF document with the help of an OCR programme.
         The input file for this method must be a scanned PDF document,
         which is then converted into image files with the help of PDF2Image.
+        The pages are rendered by Poppler directly into the image files in
+        batches of at most `pdf2image_batch_size` pages, so that the memory
+        requirement does not depend on the number of pages.
 
         Args:
             full_name_in (str):
                     The directory name and file name of the input file.
+            run_context (RunContext, optional):
+                    The run context of the document.
+                    Defaults to the global variables in dcr_core.core_glob.
+            page_numbers (list[int], optional):
+                    The numbers of the pages to be converted, starting with 1.
+                    Defaults to all pages.
 
         Returns:
             tuple[str, str, list[tuple[str,str]]]:
@@ -875,61 +2452,65 @@ class Process:
             dcr_core.core_glob.initialise_logger()
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
 
+        run_context_int = dcr_core.core_utils.get_run_context(run_context)
+
         dcr_core.core_glob.logger.debug("param full_name_in=%s", full_name_in)
+        dcr_core.core_glob.logger.debug("param page_numbers=%s", page_numbers)
 
         try:
-            images = pdf2image.convert_from_path(full_name_in)
-
             children: list[tuple[str, str]] = []
-            no_children = 0
 
             directory_name = os.path.dirname(full_name_in)
             stem_name = os.path.splitext(os.path.basename(full_name_in))[0]
 
+            file_type = (
+                dcr_core.core_glob.FILE_TYPE_PNG
+                if run_context_int.setup.pdf2image_type == dcr_core.cls_setup.Setup.PDF2IMAGE_TYPE_PNG
+                else dcr_core.core_glob.FILE_TYPE_JPEG
+            )
+
             try:
                 os.remove(
                     dcr_core.core_utils.get_full_name_from_components(
                         directory_name,
-                        stem_name
-                        + "_*."
-                        + (
-                            dcr_core.core_glob.FILE_TYPE_PNG
-                            if dcr_core.core_glob.setup.pdf2image_type == dcr_core.cls_setup.Setup.PDF2IMAGE_TYPE_PNG
-                            else dcr_core.core_glob.FILE_TYPE_JPEG
-                        ),
+                        stem_name + "_*." + file_type,
                     )
                 )
             except OSError:
                 pass
 
-            # Store the image pages
-            for img in images:
-                no_children += 1
-
-                file_name_next = (
-                    stem_name
-                    + "_"
-                    + str(no_children)
-                    + "."
-                    + (
-                        dcr_core.core_glob.FILE_TYPE_PNG
-                        if dcr_core.core_glob.setup.pdf2image_type == dcr_core.cls_setup.Setup.PDF2IMAGE_TYPE_PNG
-                        else dcr_core.core_glob.FILE_TYPE_JPEG
-                    )
+            if not page_numbers:
+                page_numbers = list(range(1, dcr_core.cls_pdf_metadata.PdfMetadata.get(full_name_in).no_pages + 1))
+
+            # The pages are rendered in batches of bounded size directly into
+            # image files by Poppler - no page image is held in memory.
+            for first_page, last_page in Process._get_page_batches(page_numbers, run_context_int.setup.pdf2image_batch_size):
+                image_paths = pdf2image.convert_from_path(
+                    full_name_in,
+                    dpi=run_context_int.setup.pdf2image_dpi,
+                    first_page=first_page,
+                    fmt=run_context_int.setup.pdf2image_type,
+                    grayscale=run_context_int.setup.is_pdf2image_grayscale,
+                    last_page=last_page,
+                    output_file=stem_name + "_pdf2image_",
+                    output_folder=directory_name if directory_name else os.curdir,
+                    paths_only=True,
+                    thread_count=run_context_int.setup.pdf2image_thread_count,
                 )
 
-                full_name_next = dcr_core.core_utils.get_full_name_from_components(
-                    directory_name,
-                    file_name_next,
-                )
+                # Store the image pages
+                for page_no, image_path in zip(range(first_page, last_page + 1), image_paths):
+                    file_name_next = stem_name + "_" + str(page_no) + "." + file_type
 
-                img.save(
-                    full_name_next,
-                    dcr_core.core_glob.setup.pdf2image_type,
-                )
+                    full_name_next = dcr_core.core_utils.get_full_name_from_components(
+                        directory_name,
+                        file_name_next,
+                    )
 
-                children.append((file_name_next, full_name_next))
-        except PDFPageCountError as err:
+                    os.replace(image_path, full_name_next)  # type: ignore[arg-type]
+
+                    children.append((file_name_next, full_name_next))
+        except (PDFPageCountError, fitz.FileDataError) as err:
             error_msg = (
                 Process.ERROR_21_901.replace("{full_name}", full_name_in)
                 .replace("{error_type}", str(type(err)))
@@ -985,6 +2566,49 @@ class Process:
                     ("ok", "") if the processing has been completed successfully,
                                otherwise a corresponding error code and error message.
         """
+        return_code, error_msg, _ = Process.pdflib_tetml(
+            full_name_in=full_name_in,
+            full_name_out=full_name_out,
+            document_opt_list=document_opt_list,
+            page_opt_list=page_opt_list,
+        )
+
+        return return_code, error_msg
+
+    # ------------------------------------------------------------------
+    # Processing a PDF file with PDFlib TET - in memory or to a file.
+    # ------------------------------------------------------------------
+    @classmethod
+    def pdflib_tetml(
+        cls,
+        full_name_in: str,
+        full_name_out: str,
+        document_opt_list: str,
+        page_opt_list: str,
+    ) -> tuple[str, str, bytes]:
+        """Process a PDF file with PDFlib TET - in memory or to a file.
+
+        Like the method pdflib, but without an output file name the
+        XML data of PDFlib TET (TETML) is not written to a file but
+        returned in memory.
+
+        Args:
+            full_name_in (str):
+                    Directory name and file name of the input file.
+            full_name_out (str):
+                    Directory name and file name of the output file,
+                    an empty string for the processing in memory.
+            document_opt_list (str):
+                    Document level options - see method pdflib.
+            page_opt_list (str):
+                    Page level options - see method pdflib.
+
+        Returns:
+            tuple[str, str, bytes]:
+                    ("ok", "", TETML data) if the processing has been completed successfully,
+                               otherwise a corresponding error code and error message.
+                               The TETML data is empty if an output file name is given.
+        """
         try:
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
         except AttributeError:
@@ -998,7 +2622,10 @@ class Process:
 
         tet = dcr_core.PDFlib.TET.TET()
 
-        doc_opt_list = f"tetml={{filename={{{full_name_out}}}}} {document_opt_list}"
+        if full_name_out:
+            doc_opt_list = f"tetml={{filename={{{full_name_out}}}}} {document_opt_list}"
+        else:
+            doc_opt_list = f"tetml={{}} {document_opt_list}"
 
         if (file_curr := tet.open_document(full_name_in, doc_opt_list)) == -1:
             error_msg = (
@@ -1009,7 +2636,7 @@ class Process:
             )
             dcr_core.core_glob.logger.debug("return                 =%s", (error_msg[:6], error_msg))
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
-            return error_msg[:6], error_msg
+            return error_msg[:6], error_msg, b""
 
         # get number of pages in the document */
         no_pages = tet.pcos_get_number(file_curr, "length:pages")
@@ -1021,6 +2648,8 @@ class Process:
         # This could be combined with the last page-related call
         tet.process_page(file_curr, 0, "tetml={trailer}")
 
+        tetml = b"" if full_name_out else tet.get_tetml(file_curr, "")
+
         tet.close_document(file_curr)
 
         tet.delete()
@@ -1028,7 +2657,7 @@ class Process:
         dcr_core.core_glob.logger.debug("return                 =%s", dcr_core.core_glob.LOGGER_END)
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
 
-        return dcr_core.core_glob.RETURN_OK
+        return dcr_core.core_glob.RETURN_OK[0], dcr_core.core_glob.RETURN_OK[1], tetml
 
     # ------------------------------------------------------------------
     # Converting image files to PDF files via OCR.
@@ -1039,6 +2668,8 @@ class Process:
         full_name_in: str,
         full_name_out: str,
         language_tesseract: str,
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = None,
+        images: collections.abc.Iterable[PIL.Image.Image | str] = None,
     ) -> tuple[str, str, list[str]]:
         """Convert image files to PDF files via OCR.
 
@@ -1057,6 +2688,12 @@ class Process:
 
         After processing with Tesseract OCR, the files split previously
         into multiple image files are combined into a single PDF document.
+        The image files are processed concurrently, controlled by the
+        configuration parameters `tesseract_max_workers` and
+        `tesseract_omp_thread_limit`, and are merged in page order.
+        The images can also be passed in memory, e.g. directly from
+        pdf2image. They are then requested only as needed, so that at
+        most two images per worker are held in memory at any time.
 
         Args:
             full_name_in (str):
@@ -1065,6 +2702,12 @@ class Process:
                     The directory name and file name of the output file.
             language_tesseract (str):
                     The Tesseract name of the document language.
+            run_context (RunContext, optional):
+                    The run context of the document.
+                    Defaults to the global variables in dcr_core.core_glob.
+            images (Iterable[PIL.Image.Image | str], optional):
+                    The images or image files of the pages in page order.
+                    Defaults to the image files matching full_name_in.
 
         Returns:
             tuple[str, str, list[str]]:
@@ -1077,48 +2720,60 @@ class Process:
             dcr_core.core_glob.initialise_logger()
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
 
+        run_context_int = dcr_core.core_utils.get_run_context(run_context)
+
         dcr_core.core_glob.logger.debug("param full_name_in      =%s", full_name_in)
         dcr_core.core_glob.logger.debug("param full_name_out     =%s", full_name_out)
         dcr_core.core_glob.logger.debug("param language_tesseract=%s", language_tesseract)
 
         children: list[str] = []
 
+        if images is None:
+            # The image files of the pages are sorted by page number and not alphabetically.
+            images = sorted(glob.glob(full_name_in), key=Process._get_page_sort_key)
+
         pdf_writer = PyPDF2.PdfWriter()
 
-        for full_name in sorted(glob.glob(full_name_in)):
-            try:
-                pdf = pytesseract.image_to_pdf_or_hocr(
+        # PyPDF2 identifies the source documents of the pages by their object id,
+        # so the readers must not be released before the merged PDF is written.
+        pdf_readers: list[PyPDF2.PdfReader] = []
+
+        try:
+            # The pages are processed concurrently and merged in page order.
+            for image, pdf in Process._get_tesseract_results(
+                images,
+                run_context_int.setup,
+                functools.partial(
+                    pytesseract.image_to_pdf_or_hocr,
                     extension="pdf",
-                    image=full_name,
                     lang=language_tesseract,
-                    timeout=dcr_core.core_glob.setup.tesseract_timeout,
-                )
-
-                with open(full_name_out, "w+b") as file_handle:
-                    # PDF type is bytes by default
-                    file_handle.write(pdf)
+                    timeout=run_context_int.setup.tesseract_timeout,
+                ),
+            ):
+                # The page PDF remains in memory and is parsed only once.
+                pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf))
+                pdf_readers.append(pdf_reader)
 
-                if len(PyPDF2.PdfReader(full_name_out).pages) == 0:
+                if len(pdf_reader.pages) == 0:
                     error_msg = Process.ERROR_41_911.replace("{full_name_out}", full_name_out)
                     dcr_core.core_glob.logger.debug("return                  =%s", (error_msg[:6], error_msg, []))
                     dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
                     return error_msg[:6], error_msg, []
 
-                pdf_reader = PyPDF2.PdfReader(full_name_out)
-
                 for page in pdf_reader.pages:
                     # Add each page to the writer object
                     pdf_writer.add_page(page)
 
-                children.append(full_name)
+                if isinstance(image, str):
+                    children.append(image)
 
-            except RuntimeError as err:
-                error_msg = Process.ERROR_41_901.replace("{full_name}", full_name_in).replace("{error_msg}", str(err))
-                dcr_core.core_glob.logger.debug("return                  =%s", (error_msg[:6], error_msg, []))
-                dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
-                return error_msg[:6], error_msg, []
+        except RuntimeError as err:
+            error_msg = Process.ERROR_41_901.replace("{full_name}", full_name_in).replace("{error_msg}", str(err))
+            dcr_core.core_glob.logger.debug("return                  =%s", (error_msg[:6], error_msg, []))
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+            return error_msg[:6], error_msg, []
 
-        # Write out the merged PDF
+        # Write out the merged PDF - the only file written here.
         with open(full_name_out, "wb") as file_handle:
             pdf_writer.write(file_handle)
 
@@ -1129,6 +2784,92 @@ class Process:
 
         return dcr_core.core_glob.RETURN_OK[0], dcr_core.core_glob.RETURN_OK[1], children
 
+    # ------------------------------------------------------------------
+    # Recognising the lines and words of image files via OCR.
+    # ------------------------------------------------------------------
+    @classmethod
+    def tesseract_tsv(
+        cls,
+        full_name_in: str,
+        language_tesseract: str,
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = None,
+        images: collections.abc.Iterable[PIL.Image.Image | str] = None,
+        resolution: int = 0,
+    ) -> tuple[str, str, dcr_core.cls_nlp_core.NLPCore.TesseractPages]:
+        """Recognise the lines and words of image files via OCR.
+
+        Instead of a searchable PDF document, Tesseract OCR provides
+        the recognised blocks, paragraphs, lines and words together
+        with their bounding boxes (TSV format). The line structure
+        can be built directly from these data with the help of the
+        method `parse_tesseract_tsv` of the class TextParser - neither
+        PyPDF2 nor PDFlib TET are required. The images are processed
+        concurrently like in the method `tesseract`.
+
+        Args:
+            full_name_in (str):
+                    The directory name and file name of the input file.
+            language_tesseract (str):
+                    The Tesseract name of the document language.
+            run_context (RunContext, optional):
+                    The run context of the document.
+                    Defaults to the global variables in dcr_core.core_glob.
+            images (Iterable[PIL.Image.Image | str], optional):
+                    The images or image files of the pages in page order.
+                    Defaults to the image files matching full_name_in.
+            resolution (int, optional):
+                    The resolution of the images in dpi.
+                    Defaults to the resolution contained in the images.
+
+        Returns:
+            tuple[str, str, NLPCore.TesseractPages]:
+                    ("ok", "", [...]) if the processing has been completed successfully,
+                                      otherwise a corresponding error code and error message.
+        """
+        try:
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+        except AttributeError:
+            dcr_core.core_glob.initialise_logger()
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+
+        run_context_int = dcr_core.core_utils.get_run_context(run_context)
+
+        dcr_core.core_glob.logger.debug("param full_name_in      =%s", full_name_in)
+        dcr_core.core_glob.logger.debug("param language_tesseract=%s", language_tesseract)
+        dcr_core.core_glob.logger.debug("param resolution        =%i", resolution)
+
+        tesseract_pages: dcr_core.cls_nlp_core.NLPCore.TesseractPages = []
+
+        if images is None:
+            # The image files of the pages are sorted by page number and not alphabetically.
+            images = sorted(glob.glob(full_name_in), key=Process._get_page_sort_key)
+
+        try:
+            for image, tsv_data in Process._get_tesseract_results(
+                images,
+                run_context_int.setup,
+                functools.partial(
+                    pytesseract.image_to_data,
+                    lang=language_tesseract,
+                    output_type=pytesseract.Output.DICT,
+                    timeout=run_context_int.setup.tesseract_timeout,
+                ),
+            ):
+                tesseract_pages.append((tsv_data, resolution if resolution else Process._get_image_resolution(image)))
+
+        except RuntimeError as err:
+            error_msg = Process.ERROR_41_901.replace("{full_name}", full_name_in).replace("{error_msg}", str(err))
+            dcr_core.core_glob.logger.debug("return                  =%s", (error_msg[:6], error_msg, []))
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+            return error_msg[:6], error_msg, []
+
+        dcr_core.core_glob.logger.debug(
+            "return                  =%s", (dcr_core.core_glob.RETURN_OK[0], dcr_core.core_glob.RETURN_OK[1], len(tesseract_pages))
+        )
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+        return dcr_core.core_glob.RETURN_OK[0], dcr_core.core_glob.RETURN_OK[1], tesseract_pages
+
     # ------------------------------------------------------------------
     # Tokenizing the text from the PDF document.
     # ------------------------------------------------------------------
@@ -1143,11 +2884,14 @@ class Process:
         no_lines_footer: int = -1,
         no_lines_header: int = -1,
         no_lines_toc: int = -1,
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = None,
+        line_document: dcr_core.cls_nlp_core.NLPCore.ParserLineDocument = None,
     ) -> tuple[str, str]:
         """Tokenizing the text from the PDF document.
 
         The line-oriented text is broken down into qualified
         tokens with the means of SpaCy.
+        Alternatively, the line-oriented text can be passed directly in memory.
 
         Args:
             full_name_in (str):
@@ -1170,6 +2914,13 @@ class Process:
             no_lines_toc (int, optional):
                     Total number of TOC lines.
                     Defaults to -1.
+            run_context (RunContext, optional):
+                    The run context of the document.
+                    Defaults to the global variables in dcr_core.core_glob.
+            line_document (ParserLineDocument, optional):
+                    The line-oriented result of the parser. If given, the
+                    input file is not read, its name only identifies the document.
+                    Defaults to the data in the input file.
 
         Returns:
             tuple[str, str]:
@@ -1182,6 +2933,8 @@ class Process:
             dcr_core.core_glob.initialise_logger()
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
 
+        run_context_int = dcr_core.core_utils.get_run_context(run_context)
+
         dcr_core.core_glob.logger.debug("param document_id    =%i", document_id)
         dcr_core.core_glob.logger.debug("param full_name_in   =%s", full_name_in)
         dcr_core.core_glob.logger.debug("param full_name_orig =%s", full_name_orig)
@@ -1190,13 +2943,20 @@ class Process:
         dcr_core.core_glob.logger.debug("param no_lines_header=%i", no_lines_header)
         dcr_core.core_glob.logger.debug("param no_lines_toc   =%i", no_lines_toc)
         dcr_core.core_glob.logger.debug("param pipeline_name  =%s", pipeline_name)
+        dcr_core.core_glob.logger.debug("param line_document  =%s", "in memory" if line_document else "from file")
 
         try:
-            dcr_core.core_glob.text_parser = dcr_core.cls_text_parser.TextParser.from_files(
-                file_encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT, full_name_line=full_name_in
-            )
+            if line_document:
+                run_context_int.text_parser = dcr_core.cls_text_parser.TextParser(run_context=run_context_int)
+                run_context_int.text_parser.parse_result_line_document = line_document
+            else:
+                run_context_int.text_parser = dcr_core.cls_text_parser.TextParser.from_files(
+                    file_encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT,
+                    full_name_line=full_name_in,
+                    run_context=run_context_int,
+                )
 
-            dcr_core.core_glob.tokenizer_spacy.process_document(
+            run_context_int.tokenizer_spacy.process_document(
                 document_id=document_id,
                 file_name_next=full_name_out,
                 file_name_orig=full_name_orig,
@@ -3,14 +3,42 @@
 # Version 2020.05, that can be found in the LICENSE file.
 
 """Module stub file."""
+import collections.abc
+import contextlib
+import threading
 from typing import ClassVar
 
+import PIL.Image
+
+import dcr_core.cls_document_metrics
+import dcr_core.cls_nlp_core
+import dcr_core.cls_result_cache
+import dcr_core.cls_run_context
+import dcr_core.cls_setup
+
 class Process:
+    _CHECKPOINT_STAGE_PANDOC: ClassVar[str]
+    _CHECKPOINT_STAGE_PARSER: ClassVar[str]
+    _CHECKPOINT_STAGE_TESSERACT: ClassVar[str]
+    _CHECKPOINT_STAGES: ClassVar[tuple[str, ...]]
+    _CHECKPOINT_STATE: ClassVar[tuple[str, ...]]
+    _DOCUMENT_CACHE_FILES: ClassVar[str]
+    _DOCUMENT_CACHE_MANIFEST: ClassVar[str]
+    _DOCUMENT_CACHE_RESULT_FILES: ClassVar[str]
+    _omp_thread_limit_lock: ClassVar[threading.Lock]
+    _omp_thread_limit_prev: ClassVar[str | None]
+    _omp_thread_limit_users: ClassVar[int]
+
     ERROR_01_901: ClassVar[str]
     ERROR_01_903: ClassVar[str]
+    ERROR_01_905: ClassVar[str]
     ERROR_21_901: ClassVar[str]
     ERROR_31_902: ClassVar[str]
     ERROR_31_903: ClassVar[str]
+    ERROR_31_904: ClassVar[str]
+    ERROR_31_905: ClassVar[str]
+    ERROR_31_906: ClassVar[str]
+    ERROR_31_907: ClassVar[str]
     ERROR_31_911: ClassVar[str]
     ERROR_41_901: ClassVar[str]
     ERROR_41_911: ClassVar[str]
@@ -21,7 +49,13 @@ class Process:
     PANDOC_PDF_ENGINE_XELATEX: ClassVar[str]
 
     def __init__(self) -> None:
+        self._checkpoint: dict[str, object] = {}
+        self._checkpoint_files: set[str] = set()
+        self._checkpoint_no_stages: int = 0
         self._document_id = None
+        self._document_key: str = ""
+        self._document_metrics: dcr_core.cls_document_metrics.DocumentMetrics
+        self._full_name_checkpoint: str = ""
         self._full_name_in = None
         self._full_name_in_directory = None
         self._full_name_in_extension = None
@@ -41,8 +75,12 @@ class Process:
         self._full_name_orig = None
         self._is_delete_auxiliary_files = None
         self._is_pandoc = None
+        self._is_pandoc_json: bool = False
         self._is_pdf2image = None
+        self._is_pdf_hybrid = None
+        self._is_resume: bool = False
         self._is_tesseract = None
+        self._is_tesseract_tsv = None
         self._is_verbose = None
         self._language_pandoc = None
         self._language_spacy = None
@@ -51,11 +89,45 @@ class Process:
         self._no_lines_header = None
         self._no_lines_toc = None
         self._no_pdf_pages = None
+        self._pandoc_ast: dcr_core.cls_nlp_core.NLPCore.PandocAst = {}
+        self._parse_result_line_document: dcr_core.cls_nlp_core.NLPCore.ParserLineDocument = {}
+        self._pdf_hybrid_pages: list[int] = []
+        self._pdf_text_layer_map: list[bool | None] = []
+        self._result_files: list[str] = []
+        self._run_context: dcr_core.cls_run_context.RunContext
+        self._tesseract_images: collections.abc.Iterable[PIL.Image.Image | str] = []
+        self._tesseract_pages: dcr_core.cls_nlp_core.NLPCore.TesseractPages = []
+        self._tetml_line: bytes = b""
+        self._tetml_page: bytes = b""
+        self._tetml_word: bytes = b""
+    def _document_cache_get(self, result_cache: dcr_core.cls_result_cache.ResultCache, cache_key: str) -> bool: ...
+    def _document_cache_put(
+        self,
+        result_cache: dcr_core.cls_result_cache.ResultCache,
+        cache_key: str,
+        full_name_in_stem_name: str,
+        full_names: list[str],
+    ) -> None: ...
+    def _document_cache_rewrite(self, full_name: str) -> None: ...
     def _document_check_extension(self) -> None: ...
+    def _document_checkpoint_finish(self) -> None: ...
+    def _document_checkpoint_is_completed(self, stage: str) -> bool: ...
+    def _document_checkpoint_load(self) -> None: ...
+    def _document_checkpoint_put(self, stage: str, full_names: list[str]) -> None: ...
     def _document_delete_auxiliary_file(self, full_name: str) -> None: ...
     def _document_init(self) -> None: ...
+    def _document_merge_pdf_hybrid(self) -> None: ...
+    def _document_metrics_end_stage(
+        self,
+        stage: str,
+        full_names_out: list[str],
+        line_document: dcr_core.cls_nlp_core.NLPCore.ParserLineDocument,
+        no_tokens: int = ...,
+    ) -> None: ...
+    def _document_metrics_finish(self, status: str) -> None: ...
     def _document_pandoc(self) -> None: ...
     def _document_parser(self) -> None: ...
+    def _document_parser_direct(self) -> None: ...
     def _document_parser_tetml_type(
         self,
         full_name_in_parser: str,
@@ -64,35 +136,131 @@ class Process:
         is_parsing_line: bool,
         is_parsing_page: bool,
         is_parsing_word: bool,
+        tetml: bytes,
     ) -> None: ...
     def _document_pdf2image(self) -> None: ...
     def _document_pdflib(self) -> None: ...
     def _document_tesseract(self) -> None: ...
     def _document_tokenizer(self) -> None: ...
+    @staticmethod
+    def _documents_worker(
+        full_name_in: str, document_params: dict[str, bool | dict[str, bool | int | str] | str | None]
+    ) -> tuple[str, str, str]: ...
+    @staticmethod
+    def _documents_worker_init(pipeline_name: str) -> None: ...
+    def _get_document_key(self) -> str: ...
+    def _get_document_result_cache(self) -> tuple[dcr_core.cls_result_cache.ResultCache | None, str]: ...
+    def _get_document_result_files(self, full_name_in_stem_name: str) -> dict[str, tuple[int, int]]: ...
+    @staticmethod
+    def _get_image_resolution(image: PIL.Image.Image | str) -> float: ...
+    @staticmethod
+    def _get_line_document_count(line_document: dcr_core.cls_nlp_core.NLPCore.ParserLineDocument, json_name: str) -> int: ...
+    @staticmethod
+    def _get_page_batches(page_numbers: list[int], batch_size: int) -> list[tuple[int, int]]: ...
+    @staticmethod
+    def _get_page_images(
+        full_name_in: str, page_numbers: list[int], setup: dcr_core.cls_setup.Setup
+    ) -> collections.abc.Iterator[PIL.Image.Image]: ...
+    @staticmethod
+    def _get_page_sort_key(full_name: str) -> list[int | str]: ...
+    @staticmethod
+    def _get_pandoc_result_cache(
+        full_name_in: str,
+        extra_args: list[str],
+        setup: dcr_core.cls_setup.Setup,
+    ) -> tuple[dcr_core.cls_result_cache.ResultCache | None, str]: ...
+    @staticmethod
+    def _get_tesseract_results(
+        images: collections.abc.Iterable[PIL.Image.Image | str],
+        setup: dcr_core.cls_setup.Setup,
+        function: collections.abc.Callable[[PIL.Image.Image | str], object],
+    ) -> collections.abc.Iterator[tuple[PIL.Image.Image | str, object]]: ...
+    @staticmethod
+    @contextlib.contextmanager
+    def _limit_omp_threads(omp_thread_limit: int) -> collections.abc.Iterator[None]: ...
     def document(
         self,
         full_name_in: str,
         document_id: int = ...,
         full_name_orig: str = ...,
         is_delete_auxiliary_files: bool = ...,
+        is_resume: bool = ...,
         is_verbose: bool = ...,
         language_pandoc: str = ...,
         language_spacy: str = ...,
         language_tesseract: str = ...,
         output_directory: str = ...,
-    ) -> None: ...
+        setup_overrides: dict[str, bool | int | str] = ...,
+    ) -> dcr_core.cls_document_metrics.DocumentMetrics: ...
+    @classmethod
+    def documents(
+        cls,
+        full_names_in: list[str],
+        max_workers: int = ...,
+        is_delete_auxiliary_files: bool = ...,
+        is_resume: bool = ...,
+        is_verbose: bool = ...,
+        language_pandoc: str = ...,
+        language_spacy: str = ...,
+        language_tesseract: str = ...,
+        output_directory: str = ...,
+        setup_overrides: dict[str, bool | int | str] = ...,
+    ) -> list[tuple[str, str, str]]: ...
+    @classmethod
+    def pandoc(
+        cls,
+        full_name_in: str,
+        full_name_out: str,
+        language_pandoc: str,
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = ...,
+    ) -> tuple[str, str]: ...
     @classmethod
-    def pandoc(cls, full_name_in: str, full_name_out: str, language_pandoc: str) -> tuple[str, str]: ...
+    def pandoc_batch(
+        cls,
+        full_names: list[tuple[str, str]],
+        language_pandoc: str,
+        max_workers: int = ...,
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = ...,
+    ) -> list[tuple[str, str, str]]: ...
+    @classmethod
+    def pandoc_json(cls, full_name_in: str) -> tuple[str, str, dcr_core.cls_nlp_core.NLPCore.PandocAst]: ...
     @classmethod
     def parser(
-        cls, full_name_in: str, full_name_out: str, no_pdf_pages: int, document_id: int = ..., file_name_orig: str = ...
+        cls,
+        full_name_in: str,
+        full_name_out: str,
+        no_pdf_pages: int,
+        document_id: int = ...,
+        full_name_orig: str = ...,
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = ...,
+        tetml: bytes = ...,
     ) -> tuple[str, str]: ...
     @classmethod
-    def pdf2image(cls, full_name_in: str) -> tuple[str, str, list[tuple[str, str]]]: ...
+    def pdf2image(
+        cls, full_name_in: str, run_context: dcr_core.cls_run_context.RunContextProtocol | None = ..., page_numbers: list[int] = ...
+    ) -> tuple[str, str, list[tuple[str, str]]]: ...
     @classmethod
     def pdflib(cls, full_name_in: str, full_name_out: str, document_opt_list: str, page_opt_list: str) -> tuple[str, str]: ...
     @classmethod
-    def tesseract(cls, full_name_in: str, full_name_out: str, language_tesseract: str) -> tuple[str, str, list[str]]: ...
+    def pdflib_tetml(cls, full_name_in: str, full_name_out: str, document_opt_list: str, page_opt_list: str) -> tuple[str, str, bytes]: ...
+    @classmethod
+    def tesseract(
+        cls,
+        full_name_in: str,
+        full_name_out: str,
+        language_tesseract: str,
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = ...,
+        images: collections.abc.Iterable[PIL.Image.Image | str] = ...,
+    ) -> tuple[str, str, list[str]]: ...
+    @classmethod
+    def tesseract_tsv(
+        cls,
+        full_name_in: str,
+        language_tesseract: str,
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = ...,
+        images: collections.abc.Iterable[PIL.Image.Image | str] = ...,
+        resolution: int = ...,
+    ) -> tuple[str, str, dcr_core.cls_nlp_core.NLPCore.TesseractPages]: ...
     @classmethod
     def tokenizer(
         cls,
@@ -104,4 +272,6 @@ class Process:
         no_lines_footer: int = ...,
         no_lines_header: int = ...,
         no_lines_toc: int = ...,
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = ...,
+        line_document: dcr_core.cls_nlp_core.NLPCore.ParserLineDocument = ...,
     ) -> tuple[str, str]: ...
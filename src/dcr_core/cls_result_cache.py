@@ -0,0 +1,340 @@
+# Copyright (c) 2022 Konnexions GmbH. All rights reserved. Use of this
+# source code is governed by the Konnexions Public License (KX-PL)
+# Version 2020.05, that can be found in the LICENSE file.
+
+"""Content-addressed cache of result files.
+
+Typical usage example:
+
+    my_instance = ResultCache(directory_name=my_cache_directory)
+
+    key = ResultCache.get_key(my_input_file, "my_variant")
+
+    if not my_instance.get(key, my_output_file):
+        ... create my_output_file ...
+        my_instance.put(key, my_output_file)
+
+    my_instance.evict(max_age=30, max_size=1024)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import ClassVar
+
+import dcr_core.core_glob
+
+
+class ResultCache:
+    """Content-addressed cache of result files.
+
+    The result files are stored under a key derived from the content
+    of the input file and the variants of the processing step, e.g.
+    the language or the tool version. Entries are written atomically,
+    so that several processes can share the same cache directory.
+    Restoring an entry marks it as recently used, so that the eviction
+    removes the least recently used entries first.
+    """
+
+    # ------------------------------------------------------------------
+    # Class variables.
+    # ------------------------------------------------------------------
+    _CONTENT_HASH_CHUNK_SIZE: ClassVar[int] = 1024 * 1024
+
+    _FILE_SUFFIX_TMP: ClassVar[str] = ".tmp"
+
+    # Length of the hexadecimal SHA-256 key at the start of the file names.
+    _KEY_LENGTH: ClassVar[int] = 2 * hashlib.sha256().digest_size
+
+    # ------------------------------------------------------------------
+    # Initialise the instance.
+    # ------------------------------------------------------------------
+    def __init__(self, directory_name: str) -> None:
+        """Initialise the instance.
+
+        Args:
+            directory_name (str): Directory of the cache entries,
+                created if it does not yet exist.
+        """
+        try:
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+        except AttributeError:
+            dcr_core.core_glob.initialise_logger()
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+
+        dcr_core.core_glob.logger.debug("param directory_name=%s", directory_name)
+
+        self.directory_name = directory_name
+
+        os.makedirs(directory_name, exist_ok=True)
+
+        self._exist = True
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+    # ------------------------------------------------------------------
+    # Copy a file via a temporary file in the target directory.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _copy_file_atomically(full_name_from: str, full_name_to: str) -> None:
+        """Copy a file via a temporary file in the target directory.
+
+        Args:
+            full_name_from (str): Full name of the source file.
+            full_name_to (str): Full name of the target file.
+        """
+        file_handle, full_name_tmp = tempfile.mkstemp(dir=os.path.dirname(full_name_to) or ".", suffix=ResultCache._FILE_SUFFIX_TMP)
+        os.close(file_handle)
+
+        try:
+            shutil.copyfile(full_name_from, full_name_tmp)
+            os.replace(full_name_tmp, full_name_to)
+        except OSError:
+            os.remove(full_name_tmp)
+            raise
+
+    # ------------------------------------------------------------------
+    # Get the full file name of a cache entry.
+    # ------------------------------------------------------------------
+    def _get_full_name_entry(self, key: str, file_suffix: str) -> str:
+        """Get the full file name of a cache entry.
+
+        Args:
+            key (str): Key of the cache entry.
+            file_suffix (str): File name suffix of the result file, e.g. the extension incl. the dot.
+
+        Returns:
+            str: The full file name.
+        """
+        return os.path.join(self.directory_name, key[:2], key + file_suffix)
+
+    # ------------------------------------------------------------------
+    # Check whether a result file is in the cache.
+    # ------------------------------------------------------------------
+    def contains(self, key: str, file_suffix: str) -> bool:
+        """Check whether a result file is in the cache.
+
+        Args:
+            key (str): Key of the cache entry.
+            file_suffix (str): File name suffix of the cache entry.
+
+        Returns:
+            bool: True if the result file is in the cache, otherwise false.
+        """
+        return os.path.isfile(self._get_full_name_entry(key, file_suffix))
+
+    # ------------------------------------------------------------------
+    # Evict the cache entries exceeding the age or size limit.
+    # ------------------------------------------------------------------
+    def evict(self, max_age: int, max_size: int) -> int:
+        """Evict the cache entries exceeding the age or size limit.
+
+        All files of an entry are removed together. The least recently
+        used entries, i.e. with the oldest most recently used file, are
+        removed first, until no entry is older than the age limit and
+        the cache no longer exceeds the size limit.
+
+        Args:
+            max_age (int): Maximum age of an unused entry in days, 0 means no limit.
+            max_size (int): Maximum size of the cache in megabytes, 0 means no limit.
+
+        Returns:
+            int: The number of the removed entries.
+        """
+        if max_age == 0 and max_size == 0:
+            return 0
+
+        # Most recent modification time, total size and files of each entry by key.
+        entries: dict[str, tuple[float, int, list[str]]] = {}
+
+        for directory_entry in os.scandir(self.directory_name):
+            if not directory_entry.is_dir():
+                continue
+
+            for file_entry in os.scandir(directory_entry.path):
+                if file_entry.name.endswith(ResultCache._FILE_SUFFIX_TMP):
+                    continue
+
+                try:
+                    file_stat = file_entry.stat()
+                except FileNotFoundError:
+                    continue
+
+                mtime, size, full_names_entry = entries.get(file_entry.name[: ResultCache._KEY_LENGTH], (0.0, 0, []))
+                full_names_entry.append(file_entry.path)
+                entries[file_entry.name[: ResultCache._KEY_LENGTH]] = (
+                    max(mtime, file_stat.st_mtime),
+                    size + file_stat.st_size,
+                    full_names_entry,
+                )
+
+        time_min = time.time() - max_age * 86400 if max_age else 0.0
+        size_cache = sum(size for _, size, _ in entries.values())
+        size_max = max_size * 1024 * 1024 if max_size else size_cache
+
+        no_evicted = 0
+
+        for mtime, size, full_names_entry in sorted(entries.values(), key=lambda entry: entry[0]):
+            if mtime >= time_min and size_cache <= size_max:
+                break
+
+            for full_name_entry in full_names_entry:
+                try:
+                    os.remove(full_name_entry)
+                except FileNotFoundError:
+                    pass
+
+            no_evicted += 1
+            size_cache -= size
+
+        if no_evicted:
+            dcr_core.core_glob.logger.debug("cache entries evicted: %i", no_evicted)
+
+        return no_evicted
+
+    # ------------------------------------------------------------------
+    # Check the object existence.
+    # ------------------------------------------------------------------
+    def exists(self) -> bool:
+        """Check the object existence.
+
+        Returns:
+            bool: Always true.
+        """
+        return self._exist
+
+    # ------------------------------------------------------------------
+    # Restore a result file from the cache.
+    # ------------------------------------------------------------------
+    def get(self, key: str, full_name_out: str, file_suffix: str = None) -> bool:
+        """Restore a result file from the cache.
+
+        Args:
+            key (str): Key of the cache entry.
+            full_name_out (str): Full file name of the result file to be restored.
+            file_suffix (str, optional): File name suffix of the cache entry.
+                Defaults to the file extension of the result file.
+
+        Returns:
+            bool: True if the cache entry exists and has been restored, otherwise false.
+        """
+        full_name_entry = self._get_full_name_entry(key, file_suffix if file_suffix else os.path.splitext(full_name_out)[1])
+
+        try:
+            ResultCache._copy_file_atomically(full_name_entry, full_name_out)
+            os.utime(full_name_entry)
+        except FileNotFoundError:
+            return False
+
+        dcr_core.core_glob.logger.debug("cache hit: %s -> %s", full_name_entry, full_name_out)
+
+        return True
+
+    # ------------------------------------------------------------------
+    # Get the data of a JSON cache entry.
+    # ------------------------------------------------------------------
+    def get_json(self, key: str, file_suffix: str) -> dict[str, object] | None:
+        """Get the data of a JSON cache entry.
+
+        Args:
+            key (str): Key of the cache entry.
+            file_suffix (str): File name suffix of the cache entry.
+
+        Returns:
+            dict[str, object] | None: The data of the cache entry,
+                None if the cache entry does not exist or cannot be read.
+        """
+        full_name_entry = self._get_full_name_entry(key, file_suffix)
+
+        try:
+            with open(full_name_entry, "r", encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT) as file_handle:
+                data = json.load(file_handle)
+            os.utime(full_name_entry)
+        except FileNotFoundError:
+            return None
+        except ValueError as err:
+            dcr_core.core_glob.logger.warning("cache entry %s not readable: %s", full_name_entry, err)
+            return None
+
+        return data
+
+    # ------------------------------------------------------------------
+    # Determine the key of a cache entry.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def get_key(full_name_in: str, *variants: str) -> str:
+        """Determine the key of a cache entry.
+
+        Args:
+            full_name_in (str): Full file name of the input file.
+            *variants (str): Variants of the processing step that influence the result.
+
+        Returns:
+            str: The SHA-256 hash of the file content and the variants as hexadecimal string.
+        """
+        content_hash = hashlib.sha256()
+
+        with open(full_name_in, "rb") as file_handle:
+            for chunk in iter(lambda: file_handle.read(ResultCache._CONTENT_HASH_CHUNK_SIZE), b""):
+                content_hash.update(chunk)
+
+        for variant in variants:
+            content_hash.update(b"\0" + variant.encode(dcr_core.core_glob.FILE_ENCODING_DEFAULT))
+
+        return content_hash.hexdigest()
+
+    # ------------------------------------------------------------------
+    # Store a result file in the cache.
+    # ------------------------------------------------------------------
+    def put(self, key: str, full_name: str, file_suffix: str = None) -> None:
+        """Store a result file in the cache.
+
+        A cache entry that cannot be written is only logged, the
+        processing step itself has already been successful.
+
+        Args:
+            key (str): Key of the cache entry.
+            full_name (str): Full file name of the result file.
+            file_suffix (str, optional): File name suffix of the cache entry.
+                Defaults to the file extension of the result file.
+        """
+        full_name_entry = self._get_full_name_entry(key, file_suffix if file_suffix else os.path.splitext(full_name)[1])
+
+        try:
+            os.makedirs(os.path.dirname(full_name_entry), exist_ok=True)
+            ResultCache._copy_file_atomically(full_name, full_name_entry)
+        except OSError as err:
+            dcr_core.core_glob.logger.warning("cache entry %s not written: %s", full_name_entry, err)
+
+    # ------------------------------------------------------------------
+    # Store data in a JSON cache entry.
+    # ------------------------------------------------------------------
+    def put_json(self, key: str, file_suffix: str, data: dict[str, object]) -> None:
+        """Store data in a JSON cache entry.
+
+        Args:
+            key (str): Key of the cache entry.
+            file_suffix (str): File name suffix of the cache entry.
+            data (dict[str, object]): The data to be stored.
+        """
+        full_name_entry = self._get_full_name_entry(key, file_suffix)
+
+        try:
+            os.makedirs(os.path.dirname(full_name_entry), exist_ok=True)
+
+            file_handle, full_name_tmp = tempfile.mkstemp(dir=os.path.dirname(full_name_entry), suffix=ResultCache._FILE_SUFFIX_TMP)
+
+            try:
+                with os.fdopen(file_handle, "w", encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT) as file_tmp:
+                    json.dump(data, file_tmp)
+                os.replace(full_name_tmp, full_name_entry)
+            except OSError:
+                os.remove(full_name_tmp)
+                raise
+        except OSError as err:
+            dcr_core.core_glob.logger.warning("cache entry %s not written: %s", full_name_entry, err)
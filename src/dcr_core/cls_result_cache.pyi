@@ -0,0 +1,29 @@
+# Copyright (c) 2022 Konnexions GmbH. All rights reserved. Use of this
+# source code is governed by the Konnexions Public License (KX-PL)
+# Version 2020.05, that can be found in the LICENSE file.
+
+"""Module stub file."""
+from __future__ import annotations
+
+from typing import ClassVar
+
+class ResultCache:
+    _CONTENT_HASH_CHUNK_SIZE: ClassVar[int]
+    _FILE_SUFFIX_TMP: ClassVar[str]
+    _KEY_LENGTH: ClassVar[int]
+
+    def __init__(self, directory_name: str) -> None:
+        self._exist: bool = False
+        self.directory_name: str = ""
+    @staticmethod
+    def _copy_file_atomically(full_name_from: str, full_name_to: str) -> None: ...
+    def _get_full_name_entry(self, key: str, file_suffix: str) -> str: ...
+    def contains(self, key: str, file_suffix: str) -> bool: ...
+    def evict(self, max_age: int, max_size: int) -> int: ...
+    def exists(self) -> bool: ...
+    def get(self, key: str, full_name_out: str, file_suffix: str = ...) -> bool: ...
+    def get_json(self, key: str, file_suffix: str) -> dict[str, object] | None: ...
+    @staticmethod
+    def get_key(full_name_in: str, *variants: str) -> str: ...
+    def put(self, key: str, full_name: str, file_suffix: str = ...) -> None: ...
+    def put_json(self, key: str, file_suffix: str, data: dict[str, object]) -> None: ...
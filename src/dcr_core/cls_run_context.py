@@ -0,0 +1,98 @@
+# Copyright (c) 2022 Konnexions GmbH. All rights reserved. Use of this
+# source code is governed by the Konnexions Public License (KX-PL)
+# Version 2020.05, that can be found in the LICENSE file.
+
+"""Manage the state of a single processing run.
+
+Typical usage example:
+
+    my_run_context = RunContext()
+
+    my_instance = TextParser(run_context=my_run_context)
+"""
+from __future__ import annotations
+
+from typing import Protocol
+
+import dcr_core.cls_setup
+
+
+# pylint: disable=too-few-public-methods
+class RunContextProtocol(Protocol):
+    """The objects of a processing run.
+
+    Both a run context and the global variables in `dcr_core.core_glob`,
+    which are used without an explicit run context, provide them.
+    """
+
+    line_type_header_footer: dcr_core.cls_line_type_header_footer.LineTypeHeaderFooter
+    line_type_heading: dcr_core.cls_line_type_heading.LineTypeHeading
+    line_type_list_bullet: dcr_core.cls_line_type_list_bullet.LineTypeListBullet
+    line_type_list_number: dcr_core.cls_line_type_list_number.LineTypeListNumber
+    line_type_table: dcr_core.cls_line_type_table.LineTypeTable
+    line_type_toc: dcr_core.cls_line_type_toc.LineTypeToc
+
+    setup: dcr_core.cls_setup.Setup
+
+    text_parser: dcr_core.cls_text_parser.TextParser
+
+    tokenizer_spacy: dcr_core.cls_tokenizer_spacy.TokenizerSpacy
+
+
+# pylint: disable=too-few-public-methods
+# pylint: disable=too-many-instance-attributes
+class RunContext:
+    """Manage the state of a single processing run.
+
+    A run context holds all objects which are otherwise kept as global
+    variables in `dcr_core.core_glob`. Each document processed with its
+    own run context is independent of all other documents, so that
+    several documents can be processed concurrently in threads.
+    """
+
+    # ------------------------------------------------------------------
+    # Initialise the instance.
+    # ------------------------------------------------------------------
+    def __init__(self, setup: dcr_core.cls_setup.Setup | None = None) -> None:
+        """Initialise the instance.
+
+        Args:
+            setup (Setup, optional): The configuration parameters of this run.
+                Defaults to a modifiable copy of the process-wide
+                configuration snapshot.
+        """
+        try:
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+        except AttributeError:
+            dcr_core.core_glob.initialise_logger()
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+
+        # The following objects are created during processing - their
+        # existence is checked with dcr_core.core_utils.check_exists_object.
+        self.line_type_header_footer: dcr_core.cls_line_type_header_footer.LineTypeHeaderFooter
+        self.line_type_heading: dcr_core.cls_line_type_heading.LineTypeHeading
+        self.line_type_list_bullet: dcr_core.cls_line_type_list_bullet.LineTypeListBullet
+        self.line_type_list_number: dcr_core.cls_line_type_list_number.LineTypeListNumber
+        self.line_type_table: dcr_core.cls_line_type_table.LineTypeTable
+        self.line_type_toc: dcr_core.cls_line_type_toc.LineTypeToc
+
+        self.setup: dcr_core.cls_setup.Setup = setup if setup is not None else dcr_core.cls_setup.Setup.get_snapshot().copy_with()
+
+        self.text_parser: dcr_core.cls_text_parser.TextParser
+
+        self.tokenizer_spacy: dcr_core.cls_tokenizer_spacy.TokenizerSpacy
+
+        self._exist = True
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+    # ------------------------------------------------------------------
+    # Check the object existence.
+    # ------------------------------------------------------------------
+    def exists(self) -> bool:
+        """Check the object existence.
+
+        Returns:
+            bool: Always true.
+        """
+        return self._exist
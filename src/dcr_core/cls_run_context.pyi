@@ -0,0 +1,41 @@
+# Copyright (c) 2022 Konnexions GmbH. All rights reserved. Use of this
+# source code is governed by the Konnexions Public License (KX-PL)
+# Version 2020.05, that can be found in the LICENSE file.
+
+"""Module stub file."""
+from typing import Protocol
+
+import dcr_core.cls_line_type_header_footer
+import dcr_core.cls_line_type_heading
+import dcr_core.cls_line_type_list_bullet
+import dcr_core.cls_line_type_list_number
+import dcr_core.cls_line_type_table
+import dcr_core.cls_line_type_toc
+import dcr_core.cls_setup
+import dcr_core.cls_text_parser
+import dcr_core.cls_tokenizer_spacy
+
+class RunContextProtocol(Protocol):
+    line_type_header_footer: dcr_core.cls_line_type_header_footer.LineTypeHeaderFooter
+    line_type_heading: dcr_core.cls_line_type_heading.LineTypeHeading
+    line_type_list_bullet: dcr_core.cls_line_type_list_bullet.LineTypeListBullet
+    line_type_list_number: dcr_core.cls_line_type_list_number.LineTypeListNumber
+    line_type_table: dcr_core.cls_line_type_table.LineTypeTable
+    line_type_toc: dcr_core.cls_line_type_toc.LineTypeToc
+    setup: dcr_core.cls_setup.Setup
+    text_parser: dcr_core.cls_text_parser.TextParser
+    tokenizer_spacy: dcr_core.cls_tokenizer_spacy.TokenizerSpacy
+
+class RunContext:
+    def __init__(self, setup: dcr_core.cls_setup.Setup | None = ...) -> None:
+        self._exist: bool = False
+        self.line_type_header_footer: dcr_core.cls_line_type_header_footer.LineTypeHeaderFooter
+        self.line_type_heading: dcr_core.cls_line_type_heading.LineTypeHeading
+        self.line_type_list_bullet: dcr_core.cls_line_type_list_bullet.LineTypeListBullet
+        self.line_type_list_number: dcr_core.cls_line_type_list_number.LineTypeListNumber
+        self.line_type_table: dcr_core.cls_line_type_table.LineTypeTable
+        self.line_type_toc: dcr_core.cls_line_type_toc.LineTypeToc
+        self.setup: dcr_core.cls_setup.Setup
+        self.text_parser: dcr_core.cls_text_parser.TextParser
+        self.tokenizer_spacy: dcr_core.cls_tokenizer_spacy.TokenizerSpacy
+    def exists(self) -> bool: ...
@@ -7,9 +7,18 @@
 Typical usage example:
 
     my_instance = Setup()
+
+    my_snapshot = Setup.get_snapshot()
+    my_instance = my_snapshot.copy_with(is_verbose=False)
 """
+from __future__ import annotations
+
 import configparser
+import copy
+import hashlib
+import importlib.util
 import os
+import threading
 from typing import ClassVar
 
 import dcr_core.core_utils
@@ -30,6 +39,9 @@ class Setup:
     _DCR_CFG_CREATE_EXTRA_FILE_TABLE: ClassVar[str] = "create_extra_file_table"
     _DCR_CFG_DELETE_AUXILIARY_FILES: ClassVar[str] = "delete_auxiliary_files"
     _DCR_CFG_DIRECTORY_INBOX: ClassVar[str] = "directory_inbox"
+    _DCR_CFG_DOCUMENT_CACHE_DIRECTORY: ClassVar[str] = "document_cache_directory"
+    _DCR_CFG_DOCUMENT_CACHE_MAX_AGE: ClassVar[str] = "document_cache_max_age"
+    _DCR_CFG_DOCUMENT_CACHE_MAX_SIZE: ClassVar[str] = "document_cache_max_size"
     _DCR_CFG_FILE: ClassVar[str] = "setup.cfg"
     _DCR_CFG_JSON_INDENT: ClassVar[str] = "json_indent"
     _DCR_CFG_JSON_SORT_KEYS: ClassVar[str] = "json_sort_keys"
@@ -53,6 +65,15 @@ class Setup:
     _DCR_CFG_LT_TABLE_FILE_INCL_EMPTY_COLUMNS: ClassVar[str] = "lt_table_file_incl_empty_columns"
     _DCR_CFG_LT_TOC_LAST_PAGE: ClassVar[str] = "lt_toc_last_page"
     _DCR_CFG_LT_TOC_MIN_ENTRIES: ClassVar[str] = "lt_toc_min_entries"
+    _DCR_CFG_METRICS_FILE: ClassVar[str] = "metrics_file"
+    _DCR_CFG_METRICS_PROMETHEUS_FILE: ClassVar[str] = "metrics_prometheus_file"
+    _DCR_CFG_PANDOC_CACHE_DIRECTORY: ClassVar[str] = "pandoc_cache_directory"
+    _DCR_CFG_PANDOC_JSON: ClassVar[str] = "pandoc_json"
+    _DCR_CFG_PDF2IMAGE_BATCH_SIZE: ClassVar[str] = "pdf2image_batch_size"
+    _DCR_CFG_PDF2IMAGE_DPI: ClassVar[str] = "pdf2image_dpi"
+    _DCR_CFG_PDF2IMAGE_GRAYSCALE: ClassVar[str] = "pdf2image_grayscale"
+    _DCR_CFG_PDF2IMAGE_HYBRID: ClassVar[str] = "pdf2image_hybrid"
+    _DCR_CFG_PDF2IMAGE_THREAD_COUNT: ClassVar[str] = "pdf2image_thread_count"
     _DCR_CFG_PDF2IMAGE_TYPE: ClassVar[str] = "pdf2image_type"
     _DCR_CFG_SECTION_CORE: ClassVar[str] = "dcr_core"
     _DCR_CFG_SECTION_CORE_ENV_TEST: ClassVar[str] = "dcr_core.env.test"
@@ -73,6 +94,10 @@ class Setup:
     _DCR_CFG_SPACY_IGNORE_SPACE: ClassVar[str] = "spacy_ignore_space"
     _DCR_CFG_SPACY_IGNORE_STOP: ClassVar[str] = "spacy_ignore_stop"
 
+    _DCR_CFG_SPACY_PIPE: ClassVar[str] = "spacy_pipe"
+    _DCR_CFG_SPACY_PIPE_BATCH_SIZE: ClassVar[str] = "spacy_pipe_batch_size"
+    _DCR_CFG_SPACY_PIPE_N_PROCESS: ClassVar[str] = "spacy_pipe_n_process"
+
     _DCR_CFG_SPACY_TKN_ATTR_CLUSTER: ClassVar[str] = "spacy_tkn_attr_cluster"
     _DCR_CFG_SPACY_TKN_ATTR_DEP_: ClassVar[str] = "spacy_tkn_attr_dep_"
     _DCR_CFG_SPACY_TKN_ATTR_DOC: ClassVar[str] = "spacy_tkn_attr_doc"
@@ -127,11 +152,18 @@ class Setup:
     _DCR_CFG_SPACY_TKN_ATTR_VOCAB: ClassVar[str] = "spacy_tkn_attr_vocab"
     _DCR_CFG_SPACY_TKN_ATTR_WHITESPACE_: ClassVar[str] = "spacy_tkn_attr_whitespace_"
 
+    _DCR_CFG_TESSERACT_MAX_WORKERS: ClassVar[str] = "tesseract_max_workers"
+    _DCR_CFG_TESSERACT_OMP_THREAD_LIMIT: ClassVar[str] = "tesseract_omp_thread_limit"
     _DCR_CFG_TESSERACT_TIMEOUT: ClassVar[str] = "tesseract_timeout"
+    _DCR_CFG_TESSERACT_TSV: ClassVar[str] = "tesseract_tsv"
     _DCR_CFG_TETML_PAGE: ClassVar[str] = "tetml_page"
     _DCR_CFG_TETML_WORD: ClassVar[str] = "tetml_word"
     _DCR_CFG_TOKENIZE_2_DATABASE: ClassVar[str] = "tokenize_2_database"
     _DCR_CFG_TOKENIZE_2_JSONFILE: ClassVar[str] = "tokenize_2_jsonfile"
+    _DCR_CFG_TOKENIZE_2_JSONFILE_COMPACT: ClassVar[str] = "tokenize_2_jsonfile_compact"
+    _DCR_CFG_TOKENIZE_2_JSONFILE_ENCODER: ClassVar[str] = "tokenize_2_jsonfile_encoder"
+    _DCR_CFG_TOKENIZE_2_JSONFILE_SHORT_KEYS: ClassVar[str] = "tokenize_2_jsonfile_short_keys"
+    _DCR_CFG_TOKENIZE_2_JSONFILE_STREAM: ClassVar[str] = "tokenize_2_jsonfile_stream"
     _DCR_CFG_VERBOSE: ClassVar[str] = "verbose"
     _DCR_CFG_VERBOSE_LT_HEADER_FOOTER: ClassVar[str] = "verbose_lt_header_footer"
     _DCR_CFG_VERBOSE_LT_HEADING: ClassVar[str] = "verbose_lt_heading"
@@ -145,19 +177,58 @@ class Setup:
 
     DCR_VERSION: ClassVar[str] = "0.9.7"
 
+    # Parameters without influence on the processing results.
+    _FINGERPRINT_IGNORED: ClassVar[tuple[str, ...]] = (
+        "directory_inbox",
+        "document_cache_directory",
+        "document_cache_max_age",
+        "document_cache_max_size",
+        "is_delete_auxiliary_files",
+        "is_parsing_line",
+        "is_parsing_page",
+        "is_parsing_word",
+        "is_verbose",
+        "is_verbose_lt_header_footer",
+        "is_verbose_lt_heading",
+        "is_verbose_lt_list_bullet",
+        "is_verbose_lt_list_number",
+        "is_verbose_lt_table",
+        "is_verbose_lt_toc",
+        "metrics_file",
+        "metrics_prometheus_file",
+        "pandoc_cache_directory",
+        "pdf2image_batch_size",
+        "pdf2image_thread_count",
+        "spacy_pipe_batch_size",
+        "spacy_pipe_n_process",
+        "tesseract_max_workers",
+        "tesseract_omp_thread_limit",
+        "tesseract_timeout",
+        "verbose_parser",
+    )
+
     ENVIRONMENT_TYPE_DEV: ClassVar[str] = "dev"
     ENVIRONMENT_TYPE_PROD: ClassVar[str] = "prod"
     ENVIRONMENT_TYPE_TEST: ClassVar[str] = "test"
 
+    JSON_ENCODER_JSON: ClassVar[str] = "json"
+    JSON_ENCODER_ORJSON: ClassVar[str] = "orjson"
+
     PDF2IMAGE_TYPE_JPEG: ClassVar[str] = "jpeg"
     PDF2IMAGE_TYPE_PNG: ClassVar[str] = "png"
 
+    _snapshot: ClassVar[Setup | None] = None
+    _snapshot_key: ClassVar[tuple[str, float]] = ("", 0.0)
+    _snapshot_lock: ClassVar[threading.Lock] = threading.Lock()
+
     # ------------------------------------------------------------------
     # Initialise the instance.
     # ------------------------------------------------------------------
     # pylint: disable=too-many-statements
     def __init__(self) -> None:
         """Initialise the instance."""
+        self._is_frozen = False
+
         try:
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
         except AttributeError:
@@ -180,6 +251,10 @@ class Setup:
         self.is_create_extra_file_table = True
         self.is_delete_auxiliary_files = True
 
+        self.document_cache_directory = "none"
+        self.document_cache_max_age = 30
+        self.document_cache_max_size = 1024
+
         self.json_indent = 4
 
         self.is_json_sort_keys = False
@@ -211,18 +286,36 @@ class Setup:
         self.lt_toc_last_page = 5
         self.lt_toc_min_entries = 5
 
+        self.metrics_file = "none"
+        self.metrics_prometheus_file = "none"
+
         self.is_parsing_line: bool = False
         self.is_parsing_page: bool = False
         self.is_parsing_word: bool = False
 
+        self.pandoc_cache_directory = "none"
+        self.is_pandoc_json = False
+
+        self.pdf2image_batch_size = 10
+        self.pdf2image_dpi = 200
+        self.is_pdf2image_grayscale = False
+        self.is_pdf2image_hybrid = False
+        self.pdf2image_thread_count = 1
         self.pdf2image_type = Setup.PDF2IMAGE_TYPE_JPEG
+        self.tesseract_max_workers = -1
+        self.tesseract_omp_thread_limit = 1
         self.tesseract_timeout = 10
+        self.is_tesseract_tsv = False
 
         self.is_tetml_page = False
         self.is_tetml_word = False
 
         self.is_tokenize_2_database = True
         self.is_tokenize_2_jsonfile = True
+        self.is_tokenize_2_jsonfile_compact = False
+        self.tokenize_2_jsonfile_encoder = Setup.JSON_ENCODER_JSON
+        self.is_tokenize_2_jsonfile_short_keys = False
+        self.is_tokenize_2_jsonfile_stream = False
 
         self.is_verbose = True
         self.is_verbose_lt_header_footer = False
@@ -252,6 +345,13 @@ class Setup:
         self.is_spacy_ignore_space = True
         self.is_spacy_ignore_stop = True
 
+        # ------------------------------------------------------------------
+        # spaCy batch processing.
+        # ------------------------------------------------------------------
+        self.is_spacy_pipe = False
+        self.spacy_pipe_batch_size = 64
+        self.spacy_pipe_n_process = 1
+
         # ------------------------------------------------------------------
         # spaCy token attributes.
         # ------------------------------------------------------------------
@@ -317,6 +417,24 @@ class Setup:
 
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
 
+    # ------------------------------------------------------------------
+    # Reject changes to a frozen configuration snapshot.
+    # ------------------------------------------------------------------
+    def __setattr__(self, name: str, value: object) -> None:
+        """Reject changes to a frozen configuration snapshot.
+
+        Args:
+            name (str): The attribute name.
+            value (object): The new attribute value.
+
+        Raises:
+            AttributeError: If the instance is the shared configuration snapshot.
+        """
+        if getattr(self, "_is_frozen", False):
+            raise AttributeError(f"The configuration snapshot is immutable - attribute '{name}' cannot be changed")
+
+        super().__setattr__(name, value)
+
     # ------------------------------------------------------------------
     # Check the configuration parameters.
     # ------------------------------------------------------------------
@@ -342,6 +460,8 @@ class Setup:
 
         self._check_config_directory_inbox()
 
+        self._check_config_document_cache()
+
         self.json_indent = self._determine_config_param_integer(Setup._DCR_CFG_JSON_INDENT, self.json_indent)
 
         self.is_json_sort_keys = self._determine_config_param_boolean(Setup._DCR_CFG_JSON_SORT_KEYS, self.is_json_sort_keys)
@@ -386,12 +506,16 @@ class Setup:
         self.lt_toc_last_page = self._determine_config_param_integer(Setup._DCR_CFG_LT_TOC_LAST_PAGE, self.lt_toc_last_page)
         self.lt_toc_min_entries = self._determine_config_param_integer(Setup._DCR_CFG_LT_TOC_MIN_ENTRIES, self.lt_toc_min_entries)
 
+        self.is_pandoc_json = self._determine_config_param_boolean(Setup._DCR_CFG_PANDOC_JSON, self.is_pandoc_json)
+
+        self._check_config_pdf2image()
         self._check_config_pdf2image_type()
 
+        self._check_config_spacy_pipe()
         self._determine_config_spacy_tkn()
         self._determine_config_spacy_tkn_ignore()
 
-        self.tesseract_timeout = self._determine_config_param_integer(Setup._DCR_CFG_TESSERACT_TIMEOUT, self.tesseract_timeout)
+        self._check_config_tesseract()
 
         self.is_tetml_page = self._determine_config_param_boolean(Setup._DCR_CFG_TETML_PAGE, self.is_tetml_page)
         self.is_tetml_word = self._determine_config_param_boolean(Setup._DCR_CFG_TETML_WORD, self.is_tetml_word)
@@ -403,6 +527,7 @@ class Setup:
                 dcr_core.core_utils.terminate_fatal(
                     "At least one of the configuration parameters 'tokenize_2_database' or " + "'tokenize_2_jsonfile' must be 'true'"
                 )
+        self._check_config_tokenize_2_jsonfile()
 
         self.is_verbose = self._determine_config_param_boolean(Setup._DCR_CFG_VERBOSE, self.is_verbose)
         self.is_verbose_lt_header_footer = self._determine_config_param_boolean(
@@ -433,6 +558,55 @@ class Setup:
         else:
             dcr_core.core_utils.terminate_fatal(f"Missing configuration parameter '{Setup._DCR_CFG_DIRECTORY_INBOX}'")
 
+    # ------------------------------------------------------------------
+    # Check the configuration parameters - document_cache_*.
+    # ------------------------------------------------------------------
+    def _check_config_document_cache(self) -> None:
+        """Check the configuration parameters - document_cache_*."""
+        self.document_cache_max_age = self._determine_config_param_integer(
+            Setup._DCR_CFG_DOCUMENT_CACHE_MAX_AGE, self.document_cache_max_age
+        )
+        if self.document_cache_max_age < 0:
+            dcr_core.core_utils.terminate_fatal(
+                f"Invalid configuration parameter value for parameter " f"'document_cache_max_age': '{self.document_cache_max_age}'"
+            )
+
+        self.document_cache_max_size = self._determine_config_param_integer(
+            Setup._DCR_CFG_DOCUMENT_CACHE_MAX_SIZE, self.document_cache_max_size
+        )
+        if self.document_cache_max_size < 0:
+            dcr_core.core_utils.terminate_fatal(
+                f"Invalid configuration parameter value for parameter " f"'document_cache_max_size': '{self.document_cache_max_size}'"
+            )
+
+    # ------------------------------------------------------------------
+    # Check the configuration parameters - pdf2image_*.
+    # ------------------------------------------------------------------
+    def _check_config_pdf2image(self) -> None:
+        """Check the configuration parameters - pdf2image_*."""
+        self.pdf2image_batch_size = self._determine_config_param_integer(Setup._DCR_CFG_PDF2IMAGE_BATCH_SIZE, self.pdf2image_batch_size)
+        if self.pdf2image_batch_size < 1:
+            dcr_core.core_utils.terminate_fatal(
+                f"Invalid configuration parameter value for parameter " f"'pdf2image_batch_size': '{self.pdf2image_batch_size}'"
+            )
+
+        self.pdf2image_dpi = self._determine_config_param_integer(Setup._DCR_CFG_PDF2IMAGE_DPI, self.pdf2image_dpi)
+        if self.pdf2image_dpi < 1:
+            dcr_core.core_utils.terminate_fatal(
+                f"Invalid configuration parameter value for parameter " f"'pdf2image_dpi': '{self.pdf2image_dpi}'"
+            )
+
+        self.pdf2image_thread_count = self._determine_config_param_integer(
+            Setup._DCR_CFG_PDF2IMAGE_THREAD_COUNT, self.pdf2image_thread_count
+        )
+        if self.pdf2image_thread_count < 1:
+            dcr_core.core_utils.terminate_fatal(
+                f"Invalid configuration parameter value for parameter " f"'pdf2image_thread_count': '{self.pdf2image_thread_count}'"
+            )
+
+        self.is_pdf2image_grayscale = self._determine_config_param_boolean(Setup._DCR_CFG_PDF2IMAGE_GRAYSCALE, self.is_pdf2image_grayscale)
+        self.is_pdf2image_hybrid = self._determine_config_param_boolean(Setup._DCR_CFG_PDF2IMAGE_HYBRID, self.is_pdf2image_hybrid)
+
     # ------------------------------------------------------------------
     # Check the configuration parameter - pdf2image_type.
     # ------------------------------------------------------------------
@@ -448,6 +622,84 @@ class Setup:
                     f"Invalid configuration parameter value for parameter " f"'pdf2image_type': '{self.pdf2image_type}'"
                 )
 
+    # ------------------------------------------------------------------
+    # Check the configuration parameters - spacy_pipe*.
+    # ------------------------------------------------------------------
+    def _check_config_spacy_pipe(self) -> None:
+        """Check the configuration parameters - spacy_pipe*."""
+        self.is_spacy_pipe = self._determine_config_param_boolean(Setup._DCR_CFG_SPACY_PIPE, self.is_spacy_pipe)
+
+        self.spacy_pipe_batch_size = self._determine_config_param_integer(Setup._DCR_CFG_SPACY_PIPE_BATCH_SIZE, self.spacy_pipe_batch_size)
+        if self.spacy_pipe_batch_size < 1:
+            dcr_core.core_utils.terminate_fatal(
+                f"Invalid configuration parameter value for parameter " f"'spacy_pipe_batch_size': '{self.spacy_pipe_batch_size}'"
+            )
+
+        self.spacy_pipe_n_process = self._determine_config_param_integer(Setup._DCR_CFG_SPACY_PIPE_N_PROCESS, self.spacy_pipe_n_process)
+        if self.spacy_pipe_n_process == 0 or self.spacy_pipe_n_process < -1:
+            dcr_core.core_utils.terminate_fatal(
+                f"Invalid configuration parameter value for parameter " f"'spacy_pipe_n_process': '{self.spacy_pipe_n_process}'"
+            )
+
+    # ------------------------------------------------------------------
+    # Check the configuration parameters - tesseract_*.
+    # ------------------------------------------------------------------
+    def _check_config_tesseract(self) -> None:
+        """Check the configuration parameters - tesseract_*."""
+        self.tesseract_max_workers = self._determine_config_param_integer(Setup._DCR_CFG_TESSERACT_MAX_WORKERS, self.tesseract_max_workers)
+        if self.tesseract_max_workers == 0 or self.tesseract_max_workers < -1:
+            dcr_core.core_utils.terminate_fatal(
+                f"Invalid configuration parameter value for parameter " f"'tesseract_max_workers': '{self.tesseract_max_workers}'"
+            )
+
+        self.tesseract_omp_thread_limit = self._determine_config_param_integer(
+            Setup._DCR_CFG_TESSERACT_OMP_THREAD_LIMIT, self.tesseract_omp_thread_limit
+        )
+        if self.tesseract_omp_thread_limit < 0:
+            dcr_core.core_utils.terminate_fatal(
+                f"Invalid configuration parameter value for parameter " f"'tesseract_omp_thread_limit': '{self.tesseract_omp_thread_limit}'"
+            )
+
+        self.tesseract_timeout = self._determine_config_param_integer(Setup._DCR_CFG_TESSERACT_TIMEOUT, self.tesseract_timeout)
+
+        self.is_tesseract_tsv = self._determine_config_param_boolean(Setup._DCR_CFG_TESSERACT_TSV, self.is_tesseract_tsv)
+
+    # ------------------------------------------------------------------
+    # Check the configuration parameters - tokenize_2_jsonfile_*.
+    # ------------------------------------------------------------------
+    def _check_config_tokenize_2_jsonfile(self) -> None:
+        """Check the configuration parameters - tokenize_2_jsonfile_*."""
+        self.is_tokenize_2_jsonfile_compact = self._determine_config_param_boolean(
+            Setup._DCR_CFG_TOKENIZE_2_JSONFILE_COMPACT, self.is_tokenize_2_jsonfile_compact
+        )
+
+        if Setup._DCR_CFG_TOKENIZE_2_JSONFILE_ENCODER in self._config:
+            self.tokenize_2_jsonfile_encoder = str(self._config[Setup._DCR_CFG_TOKENIZE_2_JSONFILE_ENCODER]).lower()
+            if self.tokenize_2_jsonfile_encoder not in [
+                Setup.JSON_ENCODER_JSON,
+                Setup.JSON_ENCODER_ORJSON,
+            ]:
+                dcr_core.core_utils.terminate_fatal(
+                    f"Invalid configuration parameter value for parameter "
+                    f"'tokenize_2_jsonfile_encoder': '{self.tokenize_2_jsonfile_encoder}'"
+                )
+            if self.tokenize_2_jsonfile_encoder == Setup.JSON_ENCODER_ORJSON and importlib.util.find_spec("orjson") is None:
+                dcr_core.core_utils.terminate_fatal(
+                    "The configuration parameter 'tokenize_2_jsonfile_encoder' requires the package 'orjson'"
+                )
+
+        self.is_tokenize_2_jsonfile_short_keys = self._determine_config_param_boolean(
+            Setup._DCR_CFG_TOKENIZE_2_JSONFILE_SHORT_KEYS, self.is_tokenize_2_jsonfile_short_keys
+        )
+
+        self.is_tokenize_2_jsonfile_stream = self._determine_config_param_boolean(
+            Setup._DCR_CFG_TOKENIZE_2_JSONFILE_STREAM, self.is_tokenize_2_jsonfile_stream
+        )
+        if self.is_tokenize_2_jsonfile_stream and self.is_tokenize_2_database:
+            dcr_core.core_utils.terminate_fatal(
+                "The configuration parameter 'tokenize_2_jsonfile_stream' requires " + "'tokenize_2_database' to be 'false'"
+            )
+
     # ------------------------------------------------------------------
     # Check the configuration parameter - verbose_parser.
     # ------------------------------------------------------------------
@@ -707,6 +959,24 @@ class Setup:
                 f"The environment variable '{Setup._DCR_ENVIRONMENT_TYPE}' " f"has the invalid content '{self.environment_variant}'"
             )
 
+    # ------------------------------------------------------------------
+    # Determine the key identifying the current configuration file state.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _get_snapshot_key() -> tuple[str, float]:
+        """Determine the key identifying the current configuration file state.
+
+        Returns:
+            tuple[str, float]: The environment variant and the modification
+                time of the configuration file.
+        """
+        try:
+            mtime = os.path.getmtime(Setup._DCR_CFG_FILE)
+        except OSError:
+            mtime = 0.0
+
+        return os.environ.get(Setup._DCR_ENVIRONMENT_TYPE, ""), mtime
+
     # ------------------------------------------------------------------
     # Load and check the configuration parameters.
     # ------------------------------------------------------------------
@@ -732,6 +1002,8 @@ class Setup:
                             | Setup._DCR_CFG_CREATE_EXTRA_FILE_TABLE
                             | Setup._DCR_CFG_DELETE_AUXILIARY_FILES
                             | Setup._DCR_CFG_DIRECTORY_INBOX
+                            | Setup._DCR_CFG_DOCUMENT_CACHE_MAX_AGE
+                            | Setup._DCR_CFG_DOCUMENT_CACHE_MAX_SIZE
                             | Setup._DCR_CFG_JSON_INDENT
                             | Setup._DCR_CFG_JSON_SORT_KEYS
                             | Setup._DCR_CFG_LT_FOOTER_MAX_DISTANCE
@@ -751,6 +1023,12 @@ class Setup:
                             | Setup._DCR_CFG_LT_TABLE_FILE_INCL_EMPTY_COLUMNS
                             | Setup._DCR_CFG_LT_TOC_LAST_PAGE
                             | Setup._DCR_CFG_LT_TOC_MIN_ENTRIES
+                            | Setup._DCR_CFG_PANDOC_JSON
+                            | Setup._DCR_CFG_PDF2IMAGE_BATCH_SIZE
+                            | Setup._DCR_CFG_PDF2IMAGE_DPI
+                            | Setup._DCR_CFG_PDF2IMAGE_GRAYSCALE
+                            | Setup._DCR_CFG_PDF2IMAGE_HYBRID
+                            | Setup._DCR_CFG_PDF2IMAGE_THREAD_COUNT
                             | Setup._DCR_CFG_PDF2IMAGE_TYPE
                             | Setup._DCR_CFG_SPACY_IGNORE_BRACKET
                             | Setup._DCR_CFG_SPACY_IGNORE_LEFT_PUNCT
@@ -766,6 +1044,9 @@ class Setup:
                             | Setup._DCR_CFG_SPACY_IGNORE_RIGHT_PUNCT
                             | Setup._DCR_CFG_SPACY_IGNORE_SPACE
                             | Setup._DCR_CFG_SPACY_IGNORE_STOP
+                            | Setup._DCR_CFG_SPACY_PIPE
+                            | Setup._DCR_CFG_SPACY_PIPE_BATCH_SIZE
+                            | Setup._DCR_CFG_SPACY_PIPE_N_PROCESS
                             | Setup._DCR_CFG_SPACY_TKN_ATTR_CLUSTER
                             | Setup._DCR_CFG_SPACY_TKN_ATTR_DEP_
                             | Setup._DCR_CFG_SPACY_TKN_ATTR_DOC
@@ -819,11 +1100,18 @@ class Setup:
                             | Setup._DCR_CFG_SPACY_TKN_ATTR_TEXT_WITH_WS
                             | Setup._DCR_CFG_SPACY_TKN_ATTR_VOCAB
                             | Setup._DCR_CFG_SPACY_TKN_ATTR_WHITESPACE_
+                            | Setup._DCR_CFG_TESSERACT_MAX_WORKERS
+                            | Setup._DCR_CFG_TESSERACT_OMP_THREAD_LIMIT
                             | Setup._DCR_CFG_TESSERACT_TIMEOUT
+                            | Setup._DCR_CFG_TESSERACT_TSV
                             | Setup._DCR_CFG_TETML_PAGE
                             | Setup._DCR_CFG_TETML_WORD
                             | Setup._DCR_CFG_TOKENIZE_2_DATABASE
                             | Setup._DCR_CFG_TOKENIZE_2_JSONFILE
+                            | Setup._DCR_CFG_TOKENIZE_2_JSONFILE_COMPACT
+                            | Setup._DCR_CFG_TOKENIZE_2_JSONFILE_ENCODER
+                            | Setup._DCR_CFG_TOKENIZE_2_JSONFILE_SHORT_KEYS
+                            | Setup._DCR_CFG_TOKENIZE_2_JSONFILE_STREAM
                             | Setup._DCR_CFG_VERBOSE
                             | Setup._DCR_CFG_VERBOSE_LT_HEADER_FOOTER
                             | Setup._DCR_CFG_VERBOSE_LT_HEADING
@@ -834,12 +1122,20 @@ class Setup:
                             | Setup._DCR_CFG_VERBOSE_PARSER
                         ):
                             continue
+                        case Setup._DCR_CFG_DOCUMENT_CACHE_DIRECTORY:
+                            self.document_cache_directory = dcr_core.core_utils.get_os_independent_name(item)
                         case Setup._DCR_CFG_LT_HEADING_RULE_FILE:
                             self.lt_heading_rule_file = dcr_core.core_utils.get_os_independent_name(item)
                         case Setup._DCR_CFG_LT_LIST_BULLET_RULE_FILE:
                             self.lt_list_bullet_rule_file = dcr_core.core_utils.get_os_independent_name(item)
                         case Setup._DCR_CFG_LT_LIST_NUMBER_RULE_FILE:
                             self.lt_list_number_rule_file = dcr_core.core_utils.get_os_independent_name(item)
+                        case Setup._DCR_CFG_METRICS_FILE:
+                            self.metrics_file = dcr_core.core_utils.get_os_independent_name(item)
+                        case Setup._DCR_CFG_METRICS_PROMETHEUS_FILE:
+                            self.metrics_prometheus_file = dcr_core.core_utils.get_os_independent_name(item)
+                        case Setup._DCR_CFG_PANDOC_CACHE_DIRECTORY:
+                            self.pandoc_cache_directory = dcr_core.core_utils.get_os_independent_name(item)
                         case _:
                             pass
 
@@ -847,6 +1143,35 @@ class Setup:
 
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
 
+    # ------------------------------------------------------------------
+    # Create a modifiable copy with the given overrides.
+    # ------------------------------------------------------------------
+    def copy_with(self, **overrides: bool | int | str) -> Setup:
+        """Create a modifiable copy with the given overrides.
+
+        The copy shares nothing that is changed during processing with
+        the original instance, so that the shared configuration snapshot
+        can be layered with per-call overrides.
+
+        Args:
+            **overrides (bool | int | str): Configuration parameters to be
+                overridden, e.g. is_verbose=False.
+
+        Returns:
+            Setup: The modifiable copy.
+        """
+        instance = copy.copy(self)
+
+        object.__setattr__(instance, "_is_frozen", False)
+
+        for name, value in overrides.items():
+            if name.startswith("_") or not hasattr(instance, name):
+                dcr_core.core_utils.terminate_fatal(f"The configuration parameter '{name}' to be overridden is unknown")
+
+            setattr(instance, name, value)
+
+        return instance
+
     # ------------------------------------------------------------------
     # Check the object existence.
     # ------------------------------------------------------------------
@@ -857,3 +1182,62 @@ class Setup:
             bool: Always true.
         """
         return self._exist
+
+    # ------------------------------------------------------------------
+    # Determine the fingerprint of the configuration parameters.
+    # ------------------------------------------------------------------
+    def get_fingerprint(self) -> str:
+        """Determine the fingerprint of the configuration parameters.
+
+        The fingerprint covers the version and all configuration
+        parameters that influence the processing results, including
+        the content of the rule files.
+
+        Returns:
+            str: The SHA-256 hash of the parameters as hexadecimal string.
+        """
+        fingerprint = hashlib.sha256(Setup.DCR_VERSION.encode(dcr_core.core_glob.FILE_ENCODING_DEFAULT))
+
+        for name, value in sorted(vars(self).items()):
+            if name.startswith("_") or name in Setup._FINGERPRINT_IGNORED:
+                continue
+
+            fingerprint.update(f"\0{name}={value!r}".encode(dcr_core.core_glob.FILE_ENCODING_DEFAULT))
+
+        for rule_file in (self.lt_heading_rule_file, self.lt_list_bullet_rule_file, self.lt_list_number_rule_file):
+            if rule_file and rule_file.lower() != "none" and os.path.isfile(rule_file):
+                with open(rule_file, "rb") as file_handle:
+                    fingerprint.update(b"\0" + file_handle.read())
+
+        return fingerprint.hexdigest()
+
+    # ------------------------------------------------------------------
+    # Get the process-wide configuration snapshot.
+    # ------------------------------------------------------------------
+    @classmethod
+    def get_snapshot(cls, is_reload: bool = False) -> Setup:
+        """Get the process-wide configuration snapshot.
+
+        The configuration file is only read on the first call, when it
+        has been modified since it was last read, when the environment
+        variant has changed or when a reload is explicitly requested.
+        The snapshot is immutable - use copy_with() to get a modifiable
+        instance.
+
+        Args:
+            is_reload (bool, optional): Read the configuration file again
+                unconditionally. Defaults to False.
+
+        Returns:
+            Setup: The immutable configuration snapshot.
+        """
+        snapshot_key = cls._get_snapshot_key()
+
+        with cls._snapshot_lock:
+            if is_reload or cls._snapshot is None or cls._snapshot_key != snapshot_key:
+                snapshot = cls()
+                snapshot._is_frozen = True
+                cls._snapshot = snapshot
+                cls._snapshot_key = snapshot_key
+
+            return cls._snapshot
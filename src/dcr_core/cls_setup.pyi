@@ -3,7 +3,10 @@
 # Version 2020.05, that can be found in the LICENSE file.
 
 """Module stub file."""
+from __future__ import annotations
+
 import configparser
+import threading
 from typing import ClassVar
 
 class Setup:
@@ -14,6 +17,9 @@ class Setup:
     _DCR_CFG_CREATE_EXTRA_FILE_TABLE: ClassVar[str]
     _DCR_CFG_DELETE_AUXILIARY_FILES: ClassVar[str]
     _DCR_CFG_DIRECTORY_INBOX: ClassVar[str]
+    _DCR_CFG_DOCUMENT_CACHE_DIRECTORY: ClassVar[str]
+    _DCR_CFG_DOCUMENT_CACHE_MAX_AGE: ClassVar[str]
+    _DCR_CFG_DOCUMENT_CACHE_MAX_SIZE: ClassVar[str]
     _DCR_CFG_FILE: ClassVar[str]
     _DCR_CFG_JSON_INDENT: ClassVar[str]
     _DCR_CFG_JSON_SORT_KEYS: ClassVar[str]
@@ -37,6 +43,15 @@ class Setup:
     _DCR_CFG_LT_TABLE_FILE_INCL_EMPTY_COLUMNS: ClassVar[str]
     _DCR_CFG_LT_TOC_LAST_PAGE: ClassVar[str]
     _DCR_CFG_LT_TOC_MIN_ENTRIES: ClassVar[str]
+    _DCR_CFG_METRICS_FILE: ClassVar[str]
+    _DCR_CFG_METRICS_PROMETHEUS_FILE: ClassVar[str]
+    _DCR_CFG_PANDOC_CACHE_DIRECTORY: ClassVar[str]
+    _DCR_CFG_PANDOC_JSON: ClassVar[str]
+    _DCR_CFG_PDF2IMAGE_BATCH_SIZE: ClassVar[str]
+    _DCR_CFG_PDF2IMAGE_DPI: ClassVar[str]
+    _DCR_CFG_PDF2IMAGE_GRAYSCALE: ClassVar[str]
+    _DCR_CFG_PDF2IMAGE_HYBRID: ClassVar[str]
+    _DCR_CFG_PDF2IMAGE_THREAD_COUNT: ClassVar[str]
     _DCR_CFG_PDF2IMAGE_TYPE: ClassVar[str]
     _DCR_CFG_SECTION_CORE: ClassVar[str]
     _DCR_CFG_SECTION_CORE_ENV_TEST: ClassVar[str]
@@ -55,6 +70,9 @@ class Setup:
     _DCR_CFG_SPACY_IGNORE_RIGHT_PUNCT: ClassVar[str]
     _DCR_CFG_SPACY_IGNORE_SPACE: ClassVar[str]
     _DCR_CFG_SPACY_IGNORE_STOP: ClassVar[str]
+    _DCR_CFG_SPACY_PIPE: ClassVar[str]
+    _DCR_CFG_SPACY_PIPE_BATCH_SIZE: ClassVar[str]
+    _DCR_CFG_SPACY_PIPE_N_PROCESS: ClassVar[str]
     _DCR_CFG_SPACY_TKN_ATTR_CLUSTER: ClassVar[str]
     _DCR_CFG_SPACY_TKN_ATTR_DEP_: ClassVar[str]
     _DCR_CFG_SPACY_TKN_ATTR_DOC: ClassVar[str]
@@ -108,11 +126,18 @@ class Setup:
     _DCR_CFG_SPACY_TKN_ATTR_TEXT_WITH_WS: ClassVar[str]
     _DCR_CFG_SPACY_TKN_ATTR_VOCAB: ClassVar[str]
     _DCR_CFG_SPACY_TKN_ATTR_WHITESPACE_: ClassVar[str]
+    _DCR_CFG_TESSERACT_MAX_WORKERS: ClassVar[str]
+    _DCR_CFG_TESSERACT_OMP_THREAD_LIMIT: ClassVar[str]
     _DCR_CFG_TESSERACT_TIMEOUT: ClassVar[str]
+    _DCR_CFG_TESSERACT_TSV: ClassVar[str]
     _DCR_CFG_TETML_PAGE: ClassVar[str]
     _DCR_CFG_TETML_WORD: ClassVar[str]
     _DCR_CFG_TOKENIZE_2_DATABASE: ClassVar[str]
     _DCR_CFG_TOKENIZE_2_JSONFILE: ClassVar[str]
+    _DCR_CFG_TOKENIZE_2_JSONFILE_COMPACT: ClassVar[str]
+    _DCR_CFG_TOKENIZE_2_JSONFILE_ENCODER: ClassVar[str]
+    _DCR_CFG_TOKENIZE_2_JSONFILE_SHORT_KEYS: ClassVar[str]
+    _DCR_CFG_TOKENIZE_2_JSONFILE_STREAM: ClassVar[str]
     _DCR_CFG_VERBOSE: ClassVar[str]
     _DCR_CFG_VERBOSE_LT_HEADER_FOOTER: ClassVar[str]
     _DCR_CFG_VERBOSE_LT_HEADING: ClassVar[str]
@@ -122,21 +147,32 @@ class Setup:
     _DCR_CFG_VERBOSE_LT_TOC: ClassVar[str]
     _DCR_CFG_VERBOSE_PARSER: ClassVar[str]
     _DCR_ENVIRONMENT_TYPE: ClassVar[str]
+    _FINGERPRINT_IGNORED: ClassVar[tuple[str, ...]]
 
     DCR_VERSION: ClassVar[str]
     ENVIRONMENT_TYPE_DEV: ClassVar[str]
     ENVIRONMENT_TYPE_PROD: ClassVar[str]
     ENVIRONMENT_TYPE_TEST: ClassVar[str]
+    JSON_ENCODER_JSON: ClassVar[str]
+    JSON_ENCODER_ORJSON: ClassVar[str]
     PDF2IMAGE_TYPE_JPEG: ClassVar[str]
     PDF2IMAGE_TYPE_PNG: ClassVar[str]
 
+    _snapshot: ClassVar[Setup | None]
+    _snapshot_key: ClassVar[tuple[str, float]]
+    _snapshot_lock: ClassVar[threading.Lock]
+
     def __init__(self) -> None:
         self._config: dict[str, str] = {}
         self._config_parser: configparser.ConfigParser = configparser.ConfigParser()
         self._exist: bool = False
+        self._is_frozen: bool = False
         self.directory_inbox: str = ""
         self.directory_inbox_accepted: str = ""
         self.directory_inbox_rejected: str = ""
+        self.document_cache_directory: str = ""
+        self.document_cache_max_age: int = 0
+        self.document_cache_max_size: int = 0
         self.environment_variant: str = ""
         self.is_create_extra_file_heading: bool = False
         self.is_create_extra_file_list_bullet: bool = False
@@ -147,9 +183,12 @@ class Setup:
         self.is_lt_heading_file_incl_regexp: bool = False
         self.is_lt_list_number_file_incl_regexp: bool = False
         self.is_lt_table_file_incl_empty_columns: bool = False
+        self.is_pandoc_json: bool = False
         self.is_parsing_line: bool = False
         self.is_parsing_page: bool = False
         self.is_parsing_word: bool = False
+        self.is_pdf2image_grayscale: bool = False
+        self.is_pdf2image_hybrid: bool = False
         self.is_spacy_ignore_bracket: bool = False
         self.is_spacy_ignore_left_punct: bool = False
         self.is_spacy_ignore_line_type_footer: bool = False
@@ -164,6 +203,7 @@ class Setup:
         self.is_spacy_ignore_right_punct: bool = False
         self.is_spacy_ignore_space: bool = False
         self.is_spacy_ignore_stop: bool = False
+        self.is_spacy_pipe: bool = False
         self.is_spacy_tkn_attr_cluster: bool = False
         self.is_spacy_tkn_attr_dep_: bool = False
         self.is_spacy_tkn_attr_doc: bool = False
@@ -217,10 +257,14 @@ class Setup:
         self.is_spacy_tkn_attr_text_with_ws: bool = False
         self.is_spacy_tkn_attr_vocab: bool = False
         self.is_spacy_tkn_attr_whitespace_: bool = False
+        self.is_tesseract_tsv: bool = False
         self.is_tetml_page: bool = False
         self.is_tetml_word: bool = False
         self.is_tokenize_2_database: bool = False
         self.is_tokenize_2_jsonfile: bool = False
+        self.is_tokenize_2_jsonfile_compact: bool = False
+        self.is_tokenize_2_jsonfile_short_keys: bool = False
+        self.is_tokenize_2_jsonfile_stream: bool = False
         self.is_verbose: bool = False
         self.is_verbose_lt_header_footer: bool = False
         self.is_verbose_lt_heading: bool = False
@@ -246,12 +290,29 @@ class Setup:
         self.lt_list_number_tolerance_llx: int = 0
         self.lt_toc_last_page: int = 0
         self.lt_toc_min_entries: int = 0
+        self.metrics_file: str = ""
+        self.metrics_prometheus_file: str = ""
+        self.pandoc_cache_directory: str = ""
+        self.pdf2image_batch_size: int = 0
+        self.pdf2image_dpi: int = 0
+        self.pdf2image_thread_count: int = 0
         self.pdf2image_type: str = ""
+        self.spacy_pipe_batch_size: int = 0
+        self.spacy_pipe_n_process: int = 0
+        self.tesseract_max_workers: int = 0
+        self.tesseract_omp_thread_limit: int = 0
         self.tesseract_timeout: int = 0
+        self.tokenize_2_jsonfile_encoder: str = ""
         self.verbose_parser: str = ""
+    def __setattr__(self, name: str, value: object) -> None: ...
     def _check_config(self) -> None: ...
     def _check_config_directory_inbox(self) -> None: ...
+    def _check_config_document_cache(self) -> None: ...
+    def _check_config_pdf2image(self) -> None: ...
     def _check_config_pdf2image_type(self) -> None: ...
+    def _check_config_spacy_pipe(self) -> None: ...
+    def _check_config_tesseract(self) -> None: ...
+    def _check_config_tokenize_2_jsonfile(self) -> None: ...
     def _check_config_verbose_parser(self) -> None: ...
     def _determine_config_param_boolean(
         self,
@@ -266,5 +327,11 @@ class Setup:
     def _determine_config_spacy_tkn(self) -> None: ...
     def _determine_config_spacy_tkn_ignore(self) -> None: ...
     def _get_environment_variant(self) -> None: ...
+    @staticmethod
+    def _get_snapshot_key() -> tuple[str, float]: ...
     def _load_config(self) -> None: ...
+    def copy_with(self, **overrides: bool | int | str) -> Setup: ...
     def exists(self) -> bool: ...
+    def get_fingerprint(self) -> str: ...
+    @classmethod
+    def get_snapshot(cls, is_reload: bool = ...) -> Setup: ...
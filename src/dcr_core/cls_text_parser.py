@@ -15,7 +15,13 @@ from __future__ import annotations
 
 import collections.abc
 import datetime
+import io
+import itertools
 import json
+import textwrap
+from typing import ClassVar
+
+import defusedxml.ElementTree
 
 import dcr_core.cls_line_type_header_footer
 import dcr_core.cls_line_type_heading
@@ -24,25 +30,45 @@ import dcr_core.cls_line_type_list_number
 import dcr_core.cls_line_type_table
 import dcr_core.cls_line_type_toc
 import dcr_core.cls_nlp_core
+import dcr_core.cls_run_context
 
 
 # pylint: disable=too-many-instance-attributes
 class TextParser:
     """Extract text and metadata from PDFlib TET."""
 
+    # ------------------------------------------------------------------
+    # Class variables.
+    # ------------------------------------------------------------------
+    # Synthetic layout of the documents taken from the Pandoc AST.
+    _PANDOC_CHAR_WIDTH: ClassVar[float] = 6.0
+    _PANDOC_COLUMN_WIDTH: ClassVar[float] = 100.0
+    _PANDOC_INDENT: ClassVar[float] = 18.0
+    _PANDOC_LINE_LENGTH: ClassVar[int] = 90
+    _PANDOC_LINES_PER_PAGE: ClassVar[int] = 50
+    _PANDOC_MARGIN_LEFT: ClassVar[float] = 72.0
+
     # ------------------------------------------------------------------
     # Initialise the instance.
     # ------------------------------------------------------------------
-    def __init__(self) -> None:
-        """Initialise the instance."""
+    def __init__(self, run_context: dcr_core.cls_run_context.RunContextProtocol | None = None) -> None:
+        """Initialise the instance.
+
+        Args:
+            run_context (RunContext, optional): The run context of the document.
+                Defaults to the global variables in dcr_core.core_glob.
+        """
         try:
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
         except AttributeError:
             dcr_core.core_glob.initialise_logger()
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
 
+        self._run_context = dcr_core.core_utils.get_run_context(run_context)
+
         dcr_core.core_utils.check_exists_object(
             is_setup=True,
+            run_context=self._run_context,
         )
 
         self._directory_name: str = ""
@@ -57,7 +83,7 @@ class TextParser:
 
         self._parse_result_creation_date = ""
 
-        self._parse_result_line_document: dcr_core.cls_nlp_core.NLPCore.ParserLineDocument = {}
+        self.parse_result_line_document: dcr_core.cls_nlp_core.NLPCore.ParserLineDocument = {}
         self._parse_result_line_index_page = 0
         self._parse_result_line_index_para = 0
         self._parse_result_line_llx = 0.00
@@ -127,28 +153,32 @@ class TextParser:
     def _create_line_document(self) -> None:
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
 
-        with open(self._full_name, "w", encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT) as file_handle:
-            json.dump(
-                {
-                    dcr_core.cls_nlp_core.NLPCore.JSON_NAME_DOC_ID: self._document_id,
-                    dcr_core.cls_nlp_core.NLPCore.JSON_NAME_DOC_FILE_NAME: self._file_name_orig,
-                    dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LINES_FOOTER: dcr_core.core_glob.line_type_header_footer.no_lines_footer,
-                    dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LINES_HEADER: dcr_core.core_glob.line_type_header_footer.no_lines_header,
-                    dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LINES_IN_DOC: self._parse_result_no_lines_in_doc,
-                    dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LINES_TOC: dcr_core.core_glob.line_type_toc.no_lines_toc,
-                    dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LISTS_BULLET_IN_DOC: dcr_core.core_glob.line_type_list_bullet.no_lists,
-                    dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LISTS_NUMBER_IN_DOC: dcr_core.core_glob.line_type_list_number.no_lists,
-                    dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_PAGES_IN_DOC: self.parse_result_no_pages_in_doc,
-                    dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_PARAS_IN_DOC: self._parse_result_no_paras_in_doc,
-                    dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_TABLES_IN_DOC: dcr_core.core_glob.line_type_table.no_tables,
-                    dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_TITLES_IN_DOC: len(self.parse_result_titles),
-                    dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TITLES: self.parse_result_titles,
-                    dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGES: self.parse_result_line_pages,
-                },
-                file_handle,
-                indent=dcr_core.core_glob.setup.json_indent,
-                sort_keys=dcr_core.core_glob.setup.is_json_sort_keys,
-            )
+        self.parse_result_line_document = {
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_DOC_ID: self._document_id,
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_DOC_FILE_NAME: self._file_name_orig,
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LINES_FOOTER: self._run_context.line_type_header_footer.no_lines_footer,
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LINES_HEADER: self._run_context.line_type_header_footer.no_lines_header,
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LINES_IN_DOC: self._parse_result_no_lines_in_doc,
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LINES_TOC: self._run_context.line_type_toc.no_lines_toc,
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LISTS_BULLET_IN_DOC: self._run_context.line_type_list_bullet.no_lists,
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LISTS_NUMBER_IN_DOC: self._run_context.line_type_list_number.no_lists,
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_PAGES_IN_DOC: self.parse_result_no_pages_in_doc,
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_PARAS_IN_DOC: self._parse_result_no_paras_in_doc,
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_TABLES_IN_DOC: self._run_context.line_type_table.no_tables,
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_TITLES_IN_DOC: len(self.parse_result_titles),
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TITLES: self.parse_result_titles,
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGES: self.parse_result_line_pages,
+        }
+
+        # The JSON file is only an optional by-product - the tokenizer takes the data from memory.
+        if self._full_name != "":
+            with open(self._full_name, "w", encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT) as file_handle:
+                json.dump(
+                    self.parse_result_line_document,
+                    file_handle,
+                    indent=self._run_context.setup.json_indent,
+                    sort_keys=self._run_context.setup.is_json_sort_keys,
+                )
 
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
 
@@ -232,8 +262,8 @@ class TextParser:
                     dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGES: self._parse_result_page_pages,
                 },
                 file_handle,
-                indent=dcr_core.core_glob.setup.json_indent,
-                sort_keys=dcr_core.core_glob.setup.is_json_sort_keys,
+                indent=self._run_context.setup.json_indent,
+                sort_keys=self._run_context.setup.is_json_sort_keys,
             )
 
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
@@ -304,8 +334,8 @@ class TextParser:
                     dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGES: self._parse_result_word_pages,
                 },
                 file_handle,
-                indent=dcr_core.core_glob.setup.json_indent,
-                sort_keys=dcr_core.core_glob.setup.is_json_sort_keys,
+                indent=self._run_context.setup.json_indent,
+                sort_keys=self._run_context.setup.is_json_sort_keys,
             )
 
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
@@ -394,8 +424,13 @@ class TextParser:
     # ------------------------------------------------------------------
     # Debug an XML element detailed.
     # ------------------------------------------------------------------
-    @staticmethod
-    def _debug_xml_element_all(event: str, parent_tag: str, attrib: dict[str, str], text: collections.abc.Iterable[str | None]) -> None:
+    def _debug_xml_element_all(
+        self,
+        event: str,
+        parent_tag: str,
+        attrib: dict[str, str],
+        text: collections.abc.Iterable[str | None],
+    ) -> None:
         """Debug an XML element detailed.
 
         Args:
@@ -404,7 +439,7 @@ class TextParser:
             attrib (dict[str,str]): Attributes.
             text (collections.abc.Iterable[str|None]): XML element.
         """
-        if dcr_core.core_glob.setup.verbose_parser == "all":
+        if self._run_context.setup.verbose_parser == "all":
             print(f"{event} tag   ={parent_tag}")
 
             if attrib != {}:
@@ -418,7 +453,7 @@ class TextParser:
     # ------------------------------------------------------------------
     def _debug_xml_element_text_line(self) -> None:
         """Debug an XML element only 'text - variant line."""
-        if dcr_core.core_glob.setup.verbose_parser == "text":
+        if self._run_context.setup.verbose_parser == "text":
             print(
                 f"pages_i_doc={self.parse_result_no_pages_in_doc:2d} "
                 f"paras_i_page={self._parse_result_no_paras_in_page:2d} "
@@ -432,7 +467,7 @@ class TextParser:
     # ------------------------------------------------------------------
     def _debug_xml_element_text_page(self) -> None:
         """Debug an XML element only 'text - variant page."""
-        if dcr_core.core_glob.setup.verbose_parser == "text":
+        if self._run_context.setup.verbose_parser == "text":
             print(
                 f"pages_i_doc={self.parse_result_no_pages_in_doc:2d} "
                 f"paras_i_page={self._parse_result_no_paras_in_page:2d} "
@@ -446,7 +481,7 @@ class TextParser:
     # ------------------------------------------------------------------
     def _debug_xml_element_text_word(self) -> None:
         """Debug an XML element only 'text - variant word."""
-        if dcr_core.core_glob.setup.verbose_parser == "text":
+        if self._run_context.setup.verbose_parser == "text":
             print(
                 f"pages_i_doc={self.parse_result_no_pages_in_doc:2d} "
                 f"paras_i_page={self._parse_result_no_paras_in_page:2d} "
@@ -458,6 +493,445 @@ class TextParser:
                 f"text='{self._parse_result_text}'"
             )
 
+    # ------------------------------------------------------------------
+    # Finish the document after the last page.
+    # ------------------------------------------------------------------
+    def _finish_document(self) -> None:
+        """Finish the document after the last page.
+
+        The line types are determined and the document structure of the
+        selected granularity is created.
+        """
+        if self._run_context.setup.is_parsing_line:
+            self._run_context.line_type_header_footer.process_document(
+                file_name_curr=self._file_name_curr,
+                line_pages_json=self.parse_result_line_pages,
+            )
+            self._run_context.line_type_toc.process_document(
+                file_name_curr=self._file_name_curr,
+                line_pages_json=self.parse_result_line_pages,
+            )
+            self._run_context.line_type_table.process_document(
+                file_name_curr=self._file_name_curr,
+                directory_name=self._directory_name,
+                document_id=self._document_id,
+                file_name_orig=self._file_name_orig,
+                line_pages_json=self.parse_result_line_pages,
+            )
+            self._run_context.line_type_list_bullet.process_document(
+                directory_name=self._directory_name,
+                document_id=self._document_id,
+                environment_variant=self._environment_variant,
+                file_name_curr=self._file_name_curr,
+                file_name_orig=self._file_name_orig,
+                line_pages_json=self.parse_result_line_pages,
+            )
+            self._run_context.line_type_list_number.process_document(
+                directory_name=self._directory_name,
+                document_id=self._document_id,
+                environment_variant=self._environment_variant,
+                file_name_curr=self._file_name_curr,
+                file_name_orig=self._file_name_orig,
+                line_pages_json=self.parse_result_line_pages,
+            )
+            self._run_context.line_type_heading.process_document(
+                directory_name=self._directory_name,
+                document_id=self._document_id,
+                file_name_curr=self._file_name_curr,
+                file_name_orig=self._file_name_orig,
+                line_pages_json=self.parse_result_line_pages,
+            )
+            self._create_line_document()
+        elif self._run_context.setup.is_parsing_page:
+            self._create_page_document()
+        elif self._run_context.setup.is_parsing_word:
+            self._create_word_document()
+
+    # ------------------------------------------------------------------
+    # Determine the lines of a paragraph taken from the Pandoc AST.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _get_pandoc_lines(text: str) -> list[str]:
+        """Determine the lines of a paragraph taken from the Pandoc AST.
+
+        Args:
+            text (str): Text of the paragraph, line breaks as line feeds.
+
+        Returns:
+            list[str]: The lines wrapped at the synthetic line length.
+        """
+        lines: list[str] = []
+
+        for segment in text.split("\n"):
+            lines.extend(textwrap.wrap(segment, width=TextParser._PANDOC_LINE_LENGTH))
+
+        return lines
+
+    # ------------------------------------------------------------------
+    # Determine the paragraphs of a list item taken from the Pandoc AST.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _get_pandoc_list_item_paras(
+        blocks: dcr_core.cls_nlp_core.NLPCore.PandocBlocks,
+        marker: str,
+        level: int,
+        paras: dcr_core.cls_nlp_core.NLPCore.PandocParas,
+    ) -> None:
+        """Determine the paragraphs of a list item taken from the Pandoc AST.
+
+        The marker is placed in front of the first line of the list item,
+        so that the list line type classifiers recognise the list.
+
+        Args:
+            blocks (NLPCore.PandocBlocks): Pandoc blocks of the list item.
+            marker (str): Bullet or number of the list item.
+            level (int): Nesting level of the list.
+            paras (NLPCore.PandocParas): The paragraphs determined so far.
+        """
+        no_paras = len(paras)
+
+        TextParser._get_pandoc_paras(blocks, level + 1, paras)
+
+        if len(paras) > no_paras and paras[no_paras][1]:
+            paras[no_paras][1][0] = marker + " " + paras[no_paras][1][0]
+
+    # ------------------------------------------------------------------
+    # Determine the marker of a numbered list item.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _get_pandoc_list_marker(number: int, style: str, delimiter: str) -> str:
+        """Determine the marker of a numbered list item.
+
+        Args:
+            number (int): Number of the list item.
+            style (str): Pandoc list number style, e.g. 'LowerRoman'.
+            delimiter (str): Pandoc list number delimiter, e.g. 'OneParen'.
+
+        Returns:
+            str: The marker incl. the delimiter, e.g. 'iv)'.
+        """
+        match style:
+            case "LowerAlpha" | "UpperAlpha":
+                label = ""
+                while number > 0:
+                    number, remainder = divmod(number - 1, 26)
+                    label = chr(ord("a") + remainder) + label
+            case "LowerRoman" | "UpperRoman":
+                label = ""
+                for value, numeral in (
+                    (1000, "m"),
+                    (900, "cm"),
+                    (500, "d"),
+                    (400, "cd"),
+                    (100, "c"),
+                    (90, "xc"),
+                    (50, "l"),
+                    (40, "xl"),
+                    (10, "x"),
+                    (9, "ix"),
+                    (5, "v"),
+                    (4, "iv"),
+                    (1, "i"),
+                ):
+                    count, number = divmod(number, value)
+                    label += numeral * count
+            case _:
+                label = str(number)
+
+        if style.startswith("Upper"):
+            label = label.upper()
+
+        match delimiter:
+            case "OneParen":
+                return label + ")"
+            case "TwoParens":
+                return "(" + label + ")"
+            case _:
+                return label + "."
+
+    # ------------------------------------------------------------------
+    # Determine the paragraphs taken from the Pandoc AST.
+    # ------------------------------------------------------------------
+    # pylint: disable=too-many-branches
+    @staticmethod
+    def _get_pandoc_paras(  # noqa: C901
+        blocks: dcr_core.cls_nlp_core.NLPCore.PandocBlocks,
+        level: int,
+        paras: dcr_core.cls_nlp_core.NLPCore.PandocParas,
+    ) -> None:
+        """Determine the paragraphs taken from the Pandoc AST.
+
+        Every block with text becomes a paragraph, nested blocks like
+        block quotes or list items are indented by one level. Raw
+        format-specific blocks and horizontal rules are ignored.
+
+        Args:
+            blocks (NLPCore.PandocBlocks): Pandoc blocks.
+            level (int): Nesting level of the blocks.
+            paras (NLPCore.PandocParas): The paragraphs determined so far.
+        """
+        for block in blocks:
+            content = block.get("c")
+            lines: list[str] = []
+
+            match block["t"]:
+                case "Para" | "Plain":
+                    lines = TextParser._get_pandoc_lines(TextParser._get_pandoc_text(content))
+                case "Header":
+                    lines = TextParser._get_pandoc_lines(TextParser._get_pandoc_text(content[2]))
+                case "CodeBlock":
+                    lines = [line for line in content[1].splitlines() if line.strip()]
+                case "LineBlock":
+                    lines = [line for inlines in content if (line := TextParser._get_pandoc_text(inlines).strip())]
+                case "BlockQuote":
+                    TextParser._get_pandoc_paras(content, level + 1, paras)
+                case "Div":
+                    TextParser._get_pandoc_paras(content[1], level, paras)
+                case "Figure":
+                    TextParser._get_pandoc_paras(content[2], level, paras)
+                    TextParser._get_pandoc_paras(content[1][1], level, paras)
+                case "BulletList":
+                    for item in content:
+                        TextParser._get_pandoc_list_item_paras(item, "\u2022", level, paras)
+                case "OrderedList":
+                    (start, style, delimiter), items = content
+                    for number, item in enumerate(items, start):
+                        TextParser._get_pandoc_list_item_paras(
+                            item, TextParser._get_pandoc_list_marker(number, style["t"], delimiter["t"]), level, paras
+                        )
+                case "DefinitionList":
+                    for term, definitions in content:
+                        term_lines = TextParser._get_pandoc_lines(TextParser._get_pandoc_text(term))
+                        if term_lines:
+                            paras.append((level, term_lines, None))
+                        for definition in definitions:
+                            TextParser._get_pandoc_paras(definition, level + 1, paras)
+                case "Table":
+                    TextParser._get_pandoc_table_paras(content, level, paras)
+
+            if lines:
+                paras.append((level, lines, None))
+
+    # ------------------------------------------------------------------
+    # Determine the paragraphs of a table taken from the Pandoc AST.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _get_pandoc_table_paras(
+        table: list[object],
+        level: int,
+        paras: dcr_core.cls_nlp_core.NLPCore.PandocParas,
+    ) -> None:
+        """Determine the paragraphs of a table taken from the Pandoc AST.
+
+        Like with PDFlib TET, every table cell becomes a paragraph with
+        its row and column number - rows and columns are numbered
+        from 1 and a cell spanning several columns skips the numbers
+        of the spanned columns. Requires the table structure of
+        Pandoc 2.10 or later.
+
+        Args:
+            table (list[object]): Content of the Pandoc table block.
+            level (int): Nesting level of the table.
+            paras (NLPCore.PandocParas): The paragraphs determined so far.
+        """
+        _, caption, _, head, bodies, foot = table
+
+        TextParser._get_pandoc_paras(caption[1], level, paras)
+
+        rows = head[1] + [row for body in bodies for row in body[2] + body[3]] + foot[1]
+
+        for row_no, row in enumerate(rows, 1):
+            column_no = 0
+            col_span_prev = 1
+
+            for _, _, _, col_span, cell_blocks in row[1]:
+                column_no += col_span_prev
+                col_span_prev = col_span
+
+                cell_paras: dcr_core.cls_nlp_core.NLPCore.PandocParas = []
+                TextParser._get_pandoc_paras(cell_blocks, 0, cell_paras)
+
+                paras.append((level, [line for _, cell_lines, _ in cell_paras for line in cell_lines], (row_no, column_no, col_span)))
+
+    # ------------------------------------------------------------------
+    # Determine the text of Pandoc inline elements.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _get_pandoc_text(inlines: dcr_core.cls_nlp_core.NLPCore.PandocBlocks) -> str:
+        """Determine the text of Pandoc inline elements.
+
+        Line breaks are returned as line feeds, footnotes and raw
+        format-specific content are ignored.
+
+        Args:
+            inlines (NLPCore.PandocBlocks): Pandoc inline elements.
+
+        Returns:
+            str: The text.
+        """
+        text: list[str] = []
+
+        for inline in inlines:
+            content = inline.get("c")
+
+            match inline["t"]:
+                case "Str":
+                    text.append(content)
+                case "Space" | "SoftBreak":
+                    text.append(" ")
+                case "LineBreak":
+                    text.append("\n")
+                case "Code" | "Math":
+                    text.append(content[1])
+                case "Emph" | "SmallCaps" | "Strikeout" | "Strong" | "Subscript" | "Superscript" | "Underline":
+                    text.append(TextParser._get_pandoc_text(content))
+                case "Cite" | "Image" | "Link" | "Span":
+                    text.append(TextParser._get_pandoc_text(content[1]))
+                case "Quoted":
+                    quote = '"' if content[0]["t"] == "DoubleQuote" else "'"
+                    text.append(quote + TextParser._get_pandoc_text(content[1]) + quote)
+
+        return "".join(text)
+
+    # ------------------------------------------------------------------
+    # Prepare the document before the first page.
+    # ------------------------------------------------------------------
+    def _init_document(self) -> None:
+        """Prepare the document before the first page."""
+        self._parse_result_no_paras_in_doc = 0
+        self.parse_result_no_pages_in_doc = 0
+
+        if self._run_context.setup.is_parsing_line:
+            self._parse_result_no_lines_in_doc = 0
+            self.parse_result_line_pages = []
+            self._run_context.line_type_header_footer = dcr_core.cls_line_type_header_footer.LineTypeHeaderFooter(
+                file_name_curr=self._file_name_curr,
+                run_context=self._run_context,
+            )
+            self._run_context.line_type_toc = dcr_core.cls_line_type_toc.LineTypeToc(
+                file_name_curr=self._file_name_curr,
+                run_context=self._run_context,
+            )
+            self._run_context.line_type_table = dcr_core.cls_line_type_table.LineTypeTable(
+                file_name_curr=self._file_name_curr,
+                run_context=self._run_context,
+            )
+            self._run_context.line_type_list_bullet = dcr_core.cls_line_type_list_bullet.LineTypeListBullet(
+                file_name_curr=self._file_name_curr,
+                run_context=self._run_context,
+            )
+            self._run_context.line_type_list_number = dcr_core.cls_line_type_list_number.LineTypeListNumber(
+                file_name_curr=self._file_name_curr,
+                run_context=self._run_context,
+            )
+            self._run_context.line_type_heading = dcr_core.cls_line_type_heading.LineTypeHeading(
+                file_name_curr=self._file_name_curr,
+                run_context=self._run_context,
+            )
+        elif self._run_context.setup.is_parsing_page:
+            self._parse_result_page_pages = []
+        elif self._run_context.setup.is_parsing_word:
+            self._parse_result_no_words_in_doc = 0
+            self._parse_result_no_lines_in_doc = 0
+            self._parse_result_word_pages = []
+
+    # ------------------------------------------------------------------
+    # Finish a synthetic page of the Pandoc AST.
+    # ------------------------------------------------------------------
+    def _parse_pandoc_page_end(self) -> None:
+        """Finish a synthetic page of the Pandoc AST."""
+        self._parse_result_no_lines_in_page = self._parse_result_line_index_page
+
+        self._create_line_pages()
+
+        self._parse_result_no_lines_in_doc += self._parse_result_no_lines_in_page
+        self._parse_result_no_paras_in_doc += self._parse_result_no_paras_in_page
+
+    # ------------------------------------------------------------------
+    # Start a synthetic page of the Pandoc AST.
+    # ------------------------------------------------------------------
+    def _parse_pandoc_page_start(self) -> None:
+        """Start a synthetic page of the Pandoc AST."""
+        self.parse_result_no_pages_in_doc += 1
+
+        self._parse_result_no_paras_in_page = 0
+        self._parse_result_no_lines_in_page = 0
+
+        self._parse_result_line_index_page = 0
+        self.parse_result_line_lines = []
+
+    # ------------------------------------------------------------------
+    # Distribute the paragraphs taken from the Pandoc AST over pages.
+    # ------------------------------------------------------------------
+    def _parse_pandoc_paras(self, paras: dcr_core.cls_nlp_core.NLPCore.PandocParas) -> None:
+        """Distribute the paragraphs taken from the Pandoc AST over pages.
+
+        A synthetic page comprises up to _PANDOC_LINES_PER_PAGE lines, a
+        paragraph that does not fit on the page is continued as a new
+        paragraph on the next page. The horizontal coordinates are
+        derived from the nesting level, the table column and the text
+        length.
+
+        Args:
+            paras (NLPCore.PandocParas): The paragraphs of the document.
+        """
+        is_page_open = False
+
+        for level, lines, table_cell in paras:
+            coord_llx = TextParser._PANDOC_MARGIN_LEFT + level * TextParser._PANDOC_INDENT
+
+            self._parse_result_table = table_cell is not None
+
+            if table_cell is not None:
+                self._parse_result_table_row, self._parse_result_table_cell, col_span = table_cell
+                self._parse_result_table_col_span = col_span if col_span > 1 else 0
+                coord_llx += (self._parse_result_table_cell - 1) * TextParser._PANDOC_COLUMN_WIDTH
+
+                if not lines:
+                    # Like with PDFlib TET an empty cell is an uncounted line without text.
+                    if not is_page_open:
+                        self._parse_pandoc_page_start()
+                        is_page_open = True
+
+                    self._parse_result_line_llx = round(coord_llx, 2)
+                    self._parse_result_line_urx = round(coord_llx, 2)
+                    self._parse_result_text = ""
+                    self._create_line_lines()
+                    continue
+
+            is_para_open = False
+
+            for text in lines:
+                if is_page_open and self._parse_result_line_index_page == TextParser._PANDOC_LINES_PER_PAGE:
+                    self._parse_pandoc_page_end()
+                    is_page_open = False
+
+                if not is_page_open:
+                    self._parse_pandoc_page_start()
+                    is_page_open = True
+                    is_para_open = False
+
+                if not is_para_open:
+                    self._parse_result_no_paras_in_page += 1
+                    self._parse_result_no_lines_in_para = 0
+                    self._parse_result_line_index_para = 0
+                    is_para_open = True
+
+                self._parse_result_line_llx = round(coord_llx, 2)
+                self._parse_result_line_urx = round(coord_llx + len(text) * TextParser._PANDOC_CHAR_WIDTH, 2)
+
+                self._parse_result_no_lines_in_para += 1
+                self._parse_result_text = text
+
+                self._create_line_lines()
+                self._parse_result_line_index_page += 1
+                self._parse_result_line_index_para += 1
+
+        if is_page_open:
+            self._parse_pandoc_page_end()
+
+        self._parse_result_table = False
+
     # ------------------------------------------------------------------
     # Processing tag Bookmark.
     # ------------------------------------------------------------------
@@ -653,7 +1127,7 @@ class TextParser:
         self._parse_result_no_lines_in_para += 1
         self._parse_result_no_words_in_line = 0
 
-        if dcr_core.core_glob.setup.is_parsing_word:
+        if self._run_context.setup.is_parsing_word:
             self._parse_result_word_words = []
 
         for child in parent:
@@ -664,11 +1138,11 @@ class TextParser:
                 case dcr_core.cls_nlp_core.NLPCore.PARSE_ELEM_WORD:
                     self._parse_tag_word(child_tag, child)
 
-        if dcr_core.core_glob.setup.is_parsing_line:
+        if self._run_context.setup.is_parsing_line:
             self._create_line_lines()
             self._parse_result_line_index_page += 1
             self._parse_result_line_index_para += 1
-        elif dcr_core.core_glob.setup.is_parsing_word:
+        elif self._run_context.setup.is_parsing_word:
             self._create_word_lines()
 
         self._parse_result_no_words_in_para += self._parse_result_no_words_in_line
@@ -694,12 +1168,12 @@ class TextParser:
         self._parse_result_no_lines_in_page = 0
         self._parse_result_no_words_in_page = 0
 
-        if dcr_core.core_glob.setup.is_parsing_line:
+        if self._run_context.setup.is_parsing_line:
             self._parse_result_line_index_page = 0
             self.parse_result_line_lines = []
-        elif dcr_core.core_glob.setup.is_parsing_page:
+        elif self._run_context.setup.is_parsing_page:
             self._parse_result_page_paras = []
-        elif dcr_core.core_glob.setup.is_parsing_word:
+        elif self._run_context.setup.is_parsing_word:
             self._parse_result_word_paras = []
 
         # Process the page related tags.
@@ -718,11 +1192,11 @@ class TextParser:
                 case dcr_core.cls_nlp_core.NLPCore.PARSE_ELEM_CONTENT:
                     self._parse_tag_content(child_tag, child)
 
-        if dcr_core.core_glob.setup.is_parsing_line:
+        if self._run_context.setup.is_parsing_line:
             self._create_line_pages()
-        elif dcr_core.core_glob.setup.is_parsing_page:
+        elif self._run_context.setup.is_parsing_page:
             self._create_page_pages()
-        elif dcr_core.core_glob.setup.is_parsing_word:
+        elif self._run_context.setup.is_parsing_word:
             self._create_word_pages()
 
         self._parse_result_no_words_in_doc += self._parse_result_no_words_in_page
@@ -735,45 +1209,14 @@ class TextParser:
     # Processing tag 'Pages'.
     # ------------------------------------------------------------------
     # noinspection PyArgumentList
-    def _parse_tag_pages(self, parent_tag: str, parent: collections.abc.Iterable[str]) -> None:  # noqa: C901
+    def _parse_tag_pages(self, parent_tag: str, parent: collections.abc.Iterable[str]) -> None:
         """Process tag 'Pages'.
 
         Args:
             parent_tag (str): Parent tag.
             parent (collections.abc.Iterable[str]): Parent data structure.
         """
-        self._debug_xml_element_all("Start", parent_tag, parent.attrib, parent.text)
-
-        self._parse_result_no_paras_in_doc = 0
-        self.parse_result_no_pages_in_doc = 0
-
-        if dcr_core.core_glob.setup.is_parsing_line:
-            self._parse_result_no_lines_in_doc = 0
-            self.parse_result_line_pages = []
-            dcr_core.core_glob.line_type_header_footer = dcr_core.cls_line_type_header_footer.LineTypeHeaderFooter(
-                file_name_curr=self._file_name_curr,
-            )
-            dcr_core.core_glob.line_type_toc = dcr_core.cls_line_type_toc.LineTypeToc(
-                file_name_curr=self._file_name_curr,
-            )
-            dcr_core.core_glob.line_type_table = dcr_core.cls_line_type_table.LineTypeTable(
-                file_name_curr=self._file_name_curr,
-            )
-            dcr_core.core_glob.line_type_list_bullet = dcr_core.cls_line_type_list_bullet.LineTypeListBullet(
-                file_name_curr=self._file_name_curr,
-            )
-            dcr_core.core_glob.line_type_list_number = dcr_core.cls_line_type_list_number.LineTypeListNumber(
-                file_name_curr=self._file_name_curr,
-            )
-            dcr_core.core_glob.line_type_heading = dcr_core.cls_line_type_heading.LineTypeHeading(
-                file_name_curr=self._file_name_curr,
-            )
-        elif dcr_core.core_glob.setup.is_parsing_page:
-            self._parse_result_page_pages = []
-        elif dcr_core.core_glob.setup.is_parsing_word:
-            self._parse_result_no_words_in_doc = 0
-            self._parse_result_no_lines_in_doc = 0
-            self._parse_result_word_pages = []
+        self._parse_tag_pages_start(parent_tag, parent)
 
         # Process the tags of all document pages.
         for child in parent:
@@ -784,53 +1227,37 @@ class TextParser:
                 case dcr_core.cls_nlp_core.NLPCore.PARSE_ELEM_PAGE:
                     self._parse_tag_page(child_tag, child)
 
-        if dcr_core.core_glob.setup.is_parsing_line:
-            dcr_core.core_glob.line_type_header_footer.process_document(
-                file_name_curr=self._file_name_curr,
-                line_pages_json=self.parse_result_line_pages,
-            )
-            dcr_core.core_glob.line_type_toc.process_document(
-                file_name_curr=self._file_name_curr,
-                line_pages_json=self.parse_result_line_pages,
-            )
-            dcr_core.core_glob.line_type_table.process_document(
-                file_name_curr=self._file_name_curr,
-                directory_name=self._directory_name,
-                document_id=self._document_id,
-                file_name_orig=self._file_name_orig,
-                line_pages_json=self.parse_result_line_pages,
-            )
-            dcr_core.core_glob.line_type_list_bullet.process_document(
-                directory_name=self._directory_name,
-                document_id=self._document_id,
-                environment_variant=self._environment_variant,
-                file_name_curr=self._file_name_curr,
-                file_name_orig=self._file_name_orig,
-                line_pages_json=self.parse_result_line_pages,
-            )
-            dcr_core.core_glob.line_type_list_number.process_document(
-                directory_name=self._directory_name,
-                document_id=self._document_id,
-                environment_variant=self._environment_variant,
-                file_name_curr=self._file_name_curr,
-                file_name_orig=self._file_name_orig,
-                line_pages_json=self.parse_result_line_pages,
-            )
-            dcr_core.core_glob.line_type_heading.process_document(
-                directory_name=self._directory_name,
-                document_id=self._document_id,
-                file_name_curr=self._file_name_curr,
-                file_name_orig=self._file_name_orig,
-                line_pages_json=self.parse_result_line_pages,
-            )
-            self._create_line_document()
-        elif dcr_core.core_glob.setup.is_parsing_page:
-            self._create_page_document()
-        elif dcr_core.core_glob.setup.is_parsing_word:
-            self._create_word_document()
+        self._parse_tag_pages_end(parent_tag, parent)
+
+    # ------------------------------------------------------------------
+    # Processing tag 'Pages' - finish the document.
+    # ------------------------------------------------------------------
+    def _parse_tag_pages_end(self, parent_tag: str, parent: collections.abc.Iterable[str]) -> None:
+        """Process tag 'Pages' - finish the document after the last page.
+
+        Args:
+            parent_tag (str): Parent tag.
+            parent (collections.abc.Iterable[str]): Parent data structure.
+        """
+        self._finish_document()
 
         self._debug_xml_element_all("End  ", parent_tag, parent.attrib, parent.text)
 
+    # ------------------------------------------------------------------
+    # Processing tag 'Pages' - prepare the document.
+    # ------------------------------------------------------------------
+    # noinspection PyArgumentList
+    def _parse_tag_pages_start(self, parent_tag: str, parent: collections.abc.Iterable[str]) -> None:
+        """Process tag 'Pages' - prepare the document before the first page.
+
+        Args:
+            parent_tag (str): Parent tag.
+            parent (collections.abc.Iterable[str]): Parent data structure.
+        """
+        self._debug_xml_element_all("Start", parent_tag, parent.attrib, parent.text)
+
+        self._init_document()
+
     # ------------------------------------------------------------------
     # Processing tag Para.
     # ------------------------------------------------------------------
@@ -848,9 +1275,9 @@ class TextParser:
         self._parse_result_no_lines_in_para = 0
         self._parse_result_no_words_in_para = 0
 
-        if dcr_core.core_glob.setup.is_parsing_line:
+        if self._run_context.setup.is_parsing_line:
             self._parse_result_line_index_para = 0
-        elif dcr_core.core_glob.setup.is_parsing_word:
+        elif self._run_context.setup.is_parsing_word:
             self._parse_result_word_lines = []
 
         for child in parent:
@@ -859,9 +1286,9 @@ class TextParser:
                 case dcr_core.cls_nlp_core.NLPCore.PARSE_ELEM_BOX:
                     self._parse_tag_box(child_tag, child)
 
-        if dcr_core.core_glob.setup.is_parsing_page:
+        if self._run_context.setup.is_parsing_page:
             self._create_page_paras()
-        elif dcr_core.core_glob.setup.is_parsing_word:
+        elif self._run_context.setup.is_parsing_word:
             self._create_word_paras()
 
         self._parse_result_no_lines_in_page += self._parse_result_no_lines_in_para
@@ -976,6 +1403,67 @@ class TextParser:
 
         self._debug_xml_element_all("End  ", parent_tag, parent.attrib, parent.text)
 
+    # ------------------------------------------------------------------
+    # Processing the Tesseract OCR TSV data of a page.
+    # ------------------------------------------------------------------
+    def _parse_tesseract_page(self, tsv_data: dict[str, list[float | int | str]], resolution: float) -> None:
+        """Process the Tesseract OCR TSV data of a page.
+
+        The recognised words are combined into lines and the lines into
+        paragraphs as specified by Tesseract OCR. The horizontal line
+        coordinates are converted from pixels to points like those of
+        PDFlib TET.
+
+        Args:
+            tsv_data (dict[str, list[float | int | str]]): TSV data of the page.
+            resolution (float): Resolution of the page image in dpi.
+        """
+        self.parse_result_no_pages_in_doc += 1
+
+        self._parse_result_no_paras_in_page = 0
+        self._parse_result_no_lines_in_page = 0
+
+        self._parse_result_line_index_page = 0
+        self.parse_result_line_lines = []
+
+        # Indexes of the non-empty words per line in the order of recognition.
+        line_words: dict[tuple[int, int, int], list[int]] = {}
+
+        for word_index, word_text in enumerate(tsv_data["text"]):
+            if str(word_text).strip():
+                line_words.setdefault(
+                    (int(tsv_data["block_num"][word_index]), int(tsv_data["par_num"][word_index]), int(tsv_data["line_num"][word_index])),
+                    [],
+                ).append(word_index)
+
+        points_per_pixel = 72 / resolution
+
+        for _, para_lines in itertools.groupby(line_words.items(), lambda line: line[0][:2]):
+            self._parse_result_no_paras_in_page += 1
+
+            self._parse_result_no_lines_in_para = 0
+            self._parse_result_line_index_para = 0
+
+            for _, word_indexes in para_lines:
+                self._parse_result_line_llx = round(min(int(tsv_data["left"][i]) for i in word_indexes) * points_per_pixel, 2)
+                self._parse_result_line_urx = round(
+                    max(int(tsv_data["left"][i]) + int(tsv_data["width"][i]) for i in word_indexes) * points_per_pixel, 2
+                )
+
+                self._parse_result_no_lines_in_para += 1
+                self._parse_result_text = " ".join(str(tsv_data["text"][i]).strip() for i in word_indexes)
+
+                self._create_line_lines()
+                self._parse_result_line_index_page += 1
+                self._parse_result_line_index_para += 1
+
+            self._parse_result_no_lines_in_page += self._parse_result_no_lines_in_para
+
+        self._create_line_pages()
+
+        self._parse_result_no_lines_in_doc += self._parse_result_no_lines_in_page
+        self._parse_result_no_paras_in_doc += self._parse_result_no_paras_in_page
+
     # ------------------------------------------------------------------
     # Check the object existence.
     # ------------------------------------------------------------------
@@ -991,7 +1479,14 @@ class TextParser:
     # Initialise from the JSON files.
     # ------------------------------------------------------------------
     @classmethod
-    def from_files(cls, file_encoding: str, full_name_line: str = "", full_name_page: str = "", full_name_word: str = "") -> TextParser:
+    def from_files(
+        cls,
+        file_encoding: str,
+        full_name_line: str = "",
+        full_name_page: str = "",
+        full_name_word: str = "",
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = None,
+    ) -> TextParser:
         """Initialise from JSON files.
 
         Args:
@@ -999,6 +1494,8 @@ class TextParser:
             full_name_line (str): Name of the file with the line-related JSON data.
             full_name_page (str): Name of the file with the page-related JSON data.
             full_name_word (str): Name of the file with the word-related JSON data.
+            run_context (RunContext, optional): The run context of the document.
+                Defaults to the global variables in dcr_core.core_glob.
 
         Returns:
             TextParser: The object instance matching the specified database row.
@@ -1009,7 +1506,7 @@ class TextParser:
         dcr_core.core_glob.logger.debug("param full_name_page=%s", full_name_page)
         dcr_core.core_glob.logger.debug("param full_name_word=%s", full_name_word)
 
-        instance = cls()
+        instance = cls(run_context=run_context)
 
         if full_name_line != "":
             with open(full_name_line, "r", encoding=file_encoding) as file_handle:
@@ -1068,6 +1565,7 @@ class TextParser:
 
         dcr_core.core_utils.check_exists_object(
             is_setup=True,
+            run_context=self._run_context,
         )
 
         self._directory_name = directory_name
@@ -1107,3 +1605,230 @@ class TextParser:
         self._debug_xml_element_all("End  ", parent_tag, parent.attrib, parent.text)
 
         dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+    # ------------------------------------------------------------------
+    # Processing the Tesseract OCR TSV data page by page.
+    # ------------------------------------------------------------------
+    def parse_tesseract_tsv(
+        self,
+        directory_name: str,
+        document_id: int,
+        environment_variant: str,
+        file_name_curr: str,
+        file_name_next: str,
+        file_name_orig: str,
+        tesseract_pages: dcr_core.cls_nlp_core.NLPCore.TesseractPages,
+    ) -> None:
+        """Process the Tesseract OCR TSV data page by page.
+
+        In contrast to parse_tetml, the line-oriented document structure
+        is built directly from the lines, words and bounding boxes
+        recognised by Tesseract OCR, i.e. neither a searchable PDF
+        document nor PDFlib TET are required. Only the granularity
+        'line' is supported.
+
+        Args:
+            directory_name (str): Directory name of the output file.
+            document_id (int): Identification of the document.
+            environment_variant (str): Environment variant: dev, prod or test.
+            file_name_curr (str): File name of the current file.
+            file_name_next (str): File name of the output file.
+            file_name_orig (in): File name of the document file.
+            tesseract_pages (NLPCore.TesseractPages): TSV data and image resolution per page.
+        """
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+        dcr_core.core_glob.logger.debug("param directory_name     =%s", directory_name)
+        dcr_core.core_glob.logger.debug("param document_id        =%i", document_id)
+        dcr_core.core_glob.logger.debug("param environment_variant=%s", environment_variant)
+        dcr_core.core_glob.logger.debug("param file_name_curr     =%s", file_name_curr)
+        dcr_core.core_glob.logger.debug("param file_name_next     =%s", file_name_next)
+        dcr_core.core_glob.logger.debug("param file_name_orig     =%s", file_name_orig)
+        dcr_core.core_glob.logger.debug("param tesseract_pages    =%i pages", len(tesseract_pages))
+
+        dcr_core.core_utils.check_exists_object(
+            is_setup=True,
+            run_context=self._run_context,
+        )
+
+        self._directory_name = directory_name
+        self._document_id = document_id
+        self._environment_variant = environment_variant
+        self._file_name_curr = file_name_curr
+        self._file_name_orig = file_name_orig
+        self._full_name = file_name_next
+        self._no_pdf_pages = len(tesseract_pages)
+
+        self._init_document()
+
+        for tsv_data, resolution in tesseract_pages:
+            self._parse_tesseract_page(tsv_data, resolution)
+
+        self._finish_document()
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+    # ------------------------------------------------------------------
+    # Process the Pandoc AST.
+    # ------------------------------------------------------------------
+    def parse_pandoc_json(
+        self,
+        directory_name: str,
+        document_id: int,
+        environment_variant: str,
+        file_name_curr: str,
+        file_name_next: str,
+        file_name_orig: str,
+        pandoc_ast: dcr_core.cls_nlp_core.NLPCore.PandocAst,
+    ) -> None:
+        """Process the Pandoc AST.
+
+        In contrast to parse_tetml, the line-oriented document structure
+        is built directly from the blocks of the Pandoc AST (JSON output),
+        i.e. neither XeLaTeX nor PDFlib TET are required. As the source
+        document has no layout, the pages, line breaks and coordinates
+        are synthetic. Only the granularity 'line' is supported.
+
+        Args:
+            directory_name (str): Directory name of the output file.
+            document_id (int): Identification of the document.
+            environment_variant (str): Environment variant: dev, prod or test.
+            file_name_curr (str): File name of the current file.
+            file_name_next (str): File name of the output file.
+            file_name_orig (in): File name of the document file.
+            pandoc_ast (NLPCore.PandocAst): The Pandoc AST of the document.
+        """
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+        dcr_core.core_glob.logger.debug("param directory_name     =%s", directory_name)
+        dcr_core.core_glob.logger.debug("param document_id        =%i", document_id)
+        dcr_core.core_glob.logger.debug("param environment_variant=%s", environment_variant)
+        dcr_core.core_glob.logger.debug("param file_name_curr     =%s", file_name_curr)
+        dcr_core.core_glob.logger.debug("param file_name_next     =%s", file_name_next)
+        dcr_core.core_glob.logger.debug("param file_name_orig     =%s", file_name_orig)
+        dcr_core.core_glob.logger.debug("param pandoc_ast         =%i blocks", len(pandoc_ast.get("blocks", [])))
+
+        dcr_core.core_utils.check_exists_object(
+            is_setup=True,
+            run_context=self._run_context,
+        )
+
+        paras: dcr_core.cls_nlp_core.NLPCore.PandocParas = []
+        TextParser._get_pandoc_paras(pandoc_ast.get("blocks", []), 0, paras)
+
+        self._directory_name = directory_name
+        self._document_id = document_id
+        self._environment_variant = environment_variant
+        self._file_name_curr = file_name_curr
+        self._file_name_orig = file_name_orig
+        self._full_name = file_name_next
+
+        self._init_document()
+
+        self._parse_pandoc_paras(paras)
+
+        self._no_pdf_pages = self.parse_result_no_pages_in_doc
+
+        self._finish_document()
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+    # ------------------------------------------------------------------
+    # Processing the PDFlib TET XML data page by page.
+    # ------------------------------------------------------------------
+    # pylint: disable=too-many-branches
+    def parse_tetml(  # noqa: C901
+        self,
+        directory_name: str,
+        document_id: int,
+        environment_variant: str,
+        file_name_curr: str,
+        file_name_next: str,
+        file_name_orig: str,
+        no_pdf_pages: int,
+        source: str | bytes,
+    ) -> None:
+        """Process the PDFlib TET XML data page by page.
+
+        In contrast to parse_tag_document, the XML data is not loaded
+        completely into an element tree. Instead, each 'Page' element is
+        processed as soon as it has been parsed and is then discarded,
+        so that the memory consumption no longer grows with the number
+        of pages of the document.
+
+        Args:
+            directory_name (str): Directory name of the output file.
+            document_id (int): Identification of the document.
+            environment_variant (str): Environment variant: dev, prod or test.
+            file_name_curr (str): File name of the current file.
+            file_name_next (str): File name of the output file.
+            file_name_orig (in): File name of the document file.
+            no_pdf_pages (int): Number ODF pages.
+            source (str|bytes): File name of the XML file or the XML data itself.
+        """
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+        dcr_core.core_glob.logger.debug("param directory_name     =%s", directory_name)
+        dcr_core.core_glob.logger.debug("param document_id        =%i", document_id)
+        dcr_core.core_glob.logger.debug("param environment_variant=%s", environment_variant)
+        dcr_core.core_glob.logger.debug("param file_name_curr     =%s", file_name_curr)
+        dcr_core.core_glob.logger.debug("param file_name_next     =%s", file_name_next)
+        dcr_core.core_glob.logger.debug("param file_name_orig     =%s", file_name_orig)
+        dcr_core.core_glob.logger.debug("param no_pdf_pages       =%i", no_pdf_pages)
+        dcr_core.core_glob.logger.debug("param source             =%s", source if isinstance(source, str) else f"{len(source)} bytes")
+
+        dcr_core.core_utils.check_exists_object(
+            is_setup=True,
+            run_context=self._run_context,
+        )
+
+        self._directory_name = directory_name
+        self._document_id = document_id
+        self._environment_variant = environment_variant
+        self._file_name_curr = file_name_curr
+        self._file_name_orig = file_name_orig
+        self._full_name = file_name_next
+        self._no_pdf_pages = no_pdf_pages
+
+        # Element path from the root element to the current element.
+        path: list[str] = []
+        pages = None
+
+        for event, elem in defusedxml.ElementTree.iterparse(
+            io.BytesIO(source) if isinstance(source, bytes) else source,
+            events=("start", "end"),
+        ):
+            if event == "start":
+                path.append(elem.tag[dcr_core.cls_nlp_core.NLPCore.PARSE_ELEM_FROM :])
+                match path[1:]:
+                    case [dcr_core.cls_nlp_core.NLPCore.PARSE_ELEM_DOCUMENT]:
+                        self._debug_xml_element_all("Start", path[-1], elem.attrib, None)
+                    case [dcr_core.cls_nlp_core.NLPCore.PARSE_ELEM_DOCUMENT, dcr_core.cls_nlp_core.NLPCore.PARSE_ELEM_PAGES]:
+                        pages = elem
+                        self._parse_tag_pages_start(path[-1], elem)
+                continue
+
+            match path[1:]:
+                case [dcr_core.cls_nlp_core.NLPCore.PARSE_ELEM_DOCUMENT, dcr_core.cls_nlp_core.NLPCore.PARSE_ELEM_PAGES, child_tag]:
+                    if child_tag == dcr_core.cls_nlp_core.NLPCore.PARSE_ELEM_PAGE:
+                        self._parse_tag_page(child_tag, elem)
+                    # The page is no longer needed.
+                    elem.clear()
+                    if pages is not None:
+                        pages.remove(elem)
+                case [dcr_core.cls_nlp_core.NLPCore.PARSE_ELEM_DOCUMENT, child_tag]:
+                    match child_tag:
+                        case dcr_core.cls_nlp_core.NLPCore.PARSE_ELEM_BOOKMARKS:
+                            self._parse_tag_bookmarks(child_tag, elem)
+                        case dcr_core.cls_nlp_core.NLPCore.PARSE_ELEM_DOCUMENT_INFO:
+                            self._parse_tag_doc_info(child_tag, elem)
+                        case dcr_core.cls_nlp_core.NLPCore.PARSE_ELEM_PAGES:
+                            self._parse_tag_pages_end(child_tag, elem)
+                            pages = None
+                    elem.clear()
+                case [dcr_core.cls_nlp_core.NLPCore.PARSE_ELEM_DOCUMENT]:
+                    self._debug_xml_element_all("End  ", path[-1], elem.attrib, elem.text)
+                    elem.clear()
+                case [dcr_core.cls_nlp_core.NLPCore.PARSE_ELEM_CREATION]:
+                    elem.clear()
+
+            path.pop()
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
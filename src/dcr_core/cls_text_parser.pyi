@@ -6,11 +6,20 @@
 from __future__ import annotations
 
 import collections.abc
+from typing import ClassVar
 
 import dcr_core.cls_nlp_core
+import dcr_core.cls_run_context
 
 class TextParser:
-    def __init__(self) -> None:
+    _PANDOC_CHAR_WIDTH: ClassVar[float]
+    _PANDOC_COLUMN_WIDTH: ClassVar[float]
+    _PANDOC_INDENT: ClassVar[float]
+    _PANDOC_LINE_LENGTH: ClassVar[int]
+    _PANDOC_LINES_PER_PAGE: ClassVar[int]
+    _PANDOC_MARGIN_LEFT: ClassVar[float]
+
+    def __init__(self, run_context: dcr_core.cls_run_context.RunContextProtocol | None = ...) -> None:
         self.parse_result_line_lines = None
         self._directory_name: str = ""
         self._document_id: int = 0
@@ -46,9 +55,8 @@ class TextParser:
         self._parse_result_word_pages: dcr_core.cls_nlp_core.NLPCore.ParserWordPages = []
         self._parse_result_word_paras: dcr_core.cls_nlp_core.NLPCore.ParserWordParas = []
         self._parse_result_word_words: dcr_core.cls_nlp_core.NLPCore.ParserWordWords = []
+        self._run_context: dcr_core.cls_run_context.RunContextProtocol
         self.parse_result_line_document: dcr_core.cls_nlp_core.NLPCore.ParserLineDocument = {}
-        self.parse_result_line_line: dcr_core.cls_nlp_core.NLPCore.ParserLineLine = {}
-        self.parse_result_line_page: dcr_core.cls_nlp_core.NLPCore.ParserLinePage = {}
         self.parse_result_line_pages: dcr_core.cls_nlp_core.NLPCore.ParserLinePages = []
         self.parse_result_no_pages_in_doc: int = 0
         self.parse_result_titles: list[str] = []
@@ -63,11 +71,46 @@ class TextParser:
     def _create_word_pages(self) -> None: ...
     def _create_word_paras(self) -> None: ...
     def _create_word_words(self) -> None: ...
-    @staticmethod
-    def _debug_xml_element_all(event: str, parent_tag: str, attrib: dict[str, str], text: collections.abc.Iterable[str | None]) -> None: ...
+    def _debug_xml_element_all(
+        self,
+        event: str,
+        parent_tag: str,
+        attrib: dict[str, str],
+        text: collections.abc.Iterable[str | None],
+    ) -> None: ...
     def _debug_xml_element_text_line(self) -> None: ...
     def _debug_xml_element_text_page(self) -> None: ...
     def _debug_xml_element_text_word(self) -> None: ...
+    def _finish_document(self) -> None: ...
+    @staticmethod
+    def _get_pandoc_lines(text: str) -> list[str]: ...
+    @staticmethod
+    def _get_pandoc_list_item_paras(
+        blocks: dcr_core.cls_nlp_core.NLPCore.PandocBlocks,
+        marker: str,
+        level: int,
+        paras: dcr_core.cls_nlp_core.NLPCore.PandocParas,
+    ) -> None: ...
+    @staticmethod
+    def _get_pandoc_list_marker(number: int, style: str, delimiter: str) -> str: ...
+    @staticmethod
+    def _get_pandoc_paras(
+        blocks: dcr_core.cls_nlp_core.NLPCore.PandocBlocks,
+        level: int,
+        paras: dcr_core.cls_nlp_core.NLPCore.PandocParas,
+    ) -> None: ...
+    @staticmethod
+    def _get_pandoc_table_paras(
+        table: list[object],
+        level: int,
+        paras: dcr_core.cls_nlp_core.NLPCore.PandocParas,
+    ) -> None: ...
+    @staticmethod
+    def _get_pandoc_text(inlines: dcr_core.cls_nlp_core.NLPCore.PandocBlocks) -> str: ...
+    def _init_document(self) -> None: ...
+    def _parse_pandoc_page_end(self) -> None: ...
+    def _parse_pandoc_page_start(self) -> None: ...
+    def _parse_pandoc_paras(self, paras: dcr_core.cls_nlp_core.NLPCore.PandocParas) -> None: ...
     def _parse_tag_bookmark(self, parent_tag: str, parent: collections.abc.Iterable[str]) -> None: ...
     def _parse_tag_bookmarks(self, parent_tag: str, parent: collections.abc.Iterable[str]) -> None: ...
     def _parse_tag_box(self, parent_tag: str, parent: collections.abc.Iterable[str]) -> None: ...
@@ -77,15 +120,35 @@ class TextParser:
     def _parse_tag_line(self, parent_tag: str, parent: collections.abc.Iterable[str]) -> None: ...
     def _parse_tag_page(self, parent_tag: str, parent: collections.abc.Iterable[str]) -> None: ...
     def _parse_tag_pages(self, parent_tag: str, parent: collections.abc.Iterable[str]) -> None: ...
+    def _parse_tag_pages_end(self, parent_tag: str, parent: collections.abc.Iterable[str]) -> None: ...
+    def _parse_tag_pages_start(self, parent_tag: str, parent: collections.abc.Iterable[str]) -> None: ...
     def _parse_tag_para(self, parent_tag: str, parent: collections.abc.Iterable[str]) -> None: ...
     def _parse_tag_row(self, parent_tag: str, parent: collections.abc.Iterable[str]) -> None: ...
     def _parse_tag_table(self, parent_tag: str, parent: collections.abc.Iterable[str]) -> None: ...
     def _parse_tag_text(self, parent_tag: str, parent: collections.abc.Iterable[str]) -> None: ...
     def _parse_tag_title(self, parent_tag: str, parent: collections.abc.Iterable[str]) -> None: ...
     def _parse_tag_word(self, parent_tag: str, parent: collections.abc.Iterable[str]) -> None: ...
+    def _parse_tesseract_page(self, tsv_data: dict[str, list[float | int | str]], resolution: float) -> None: ...
     def exists(self) -> bool: ...
     @classmethod
-    def from_files(cls, file_encoding: str, full_name_line: str = "", full_name_page: str = "", full_name_word: str = "") -> TextParser: ...
+    def from_files(
+        cls,
+        file_encoding: str,
+        full_name_line: str = "",
+        full_name_page: str = "",
+        full_name_word: str = "",
+        run_context: dcr_core.cls_run_context.RunContextProtocol | None = ...,
+    ) -> TextParser: ...
+    def parse_pandoc_json(
+        self,
+        directory_name: str,
+        document_id: int,
+        environment_variant: str,
+        file_name_curr: str,
+        file_name_next: str,
+        file_name_orig: str,
+        pandoc_ast: dcr_core.cls_nlp_core.NLPCore.PandocAst,
+    ) -> None: ...
     def parse_tag_document(
         self,
         directory_name: str,
@@ -98,3 +161,24 @@ class TextParser:
         parent: collections.abc.Iterable[str],
         parent_tag: str,
     ) -> None: ...
+    def parse_tesseract_tsv(
+        self,
+        directory_name: str,
+        document_id: int,
+        environment_variant: str,
+        file_name_curr: str,
+        file_name_next: str,
+        file_name_orig: str,
+        tesseract_pages: dcr_core.cls_nlp_core.NLPCore.TesseractPages,
+    ) -> None: ...
+    def parse_tetml(
+        self,
+        directory_name: str,
+        document_id: int,
+        environment_variant: str,
+        file_name_curr: str,
+        file_name_next: str,
+        file_name_orig: str,
+        no_pdf_pages: int,
+        source: str | bytes,
+    ) -> None: ...
@@ -0,0 +1,487 @@
+# Copyright (c) 2022 Konnexions GmbH. All rights reserved. Use of this
+# source code is governed by the Konnexions Public License (KX-PL)
+# Version 2020.05, that can be found in the LICENSE file.
+
+"""Write the tokens of a document to a JSON file.
+
+Typical usage example:
+
+    my_instance = TokenJsonWriter()
+
+    my_instance.open_document(file_name_next=my_file)
+    my_instance.write_page(token_page=my_page)
+    my_instance.write_document(token_document=my_document)
+    my_instance.close_document()
+"""
+
+import json
+import os
+from typing import IO
+from typing import ClassVar
+
+import dcr_core.cls_nlp_core
+import dcr_core.cls_run_context
+import dcr_core.cls_setup
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+# pylint: disable=too-many-instance-attributes
+class TokenJsonWriter:
+    """Write the tokens of a document to a JSON file.
+
+    The output format is controlled by the configuration parameters
+    'tokenize_2_jsonfile_*': a compact format without whitespace, short
+    key names instead of the JSON names from NLPCore, the encoder
+    ('json' or 'orjson') and the streaming mode, in which each page is
+    written as soon as it is finished. In the streaming mode the key
+    'pages' precedes the other keys of the document.
+
+    The output is written to a temporary file, which replaces the
+    output file only when the document is finished.
+
+    A subclass can be assigned to TokenizerSpacy.json_writer to write
+    the tokens in a different way.
+    """
+
+    # Short key names - one-to-one, so that they can be mapped back.
+    SHORT_KEYS: ClassVar[dict[str, str]] = {
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_COLUMN_NO: "cN",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_COLUMN_SPAN: "cS",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_COORD_LLX: "cL",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_COORD_URX: "cU",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_DOC_FILE_NAME: "dF",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_DOC_ID: "dI",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINE_TYPE: "lT",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LINES_FOOTER: "nLF",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LINES_HEADER: "nLH",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LINES_IN_DOC: "nLD",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LINES_IN_PAGE: "nLP",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LINES_IN_PARA: "nLA",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LINES_TOC: "nLT",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LISTS_BULLET_IN_DOC: "nBD",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LISTS_NUMBER_IN_DOC: "nND",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_PAGES_IN_DOC: "nPD",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_PARAS_IN_DOC: "nAD",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_PARAS_IN_PAGE: "nAP",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_SENTS_IN_DOC: "nSD",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_SENTS_IN_PAGE: "nSP",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_SENTS_IN_PARA: "nSA",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_TABLES_IN_DOC: "nXD",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_TOKENS_IN_DOC: "nTD",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_TOKENS_IN_PAGE: "nTP",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_TOKENS_IN_PARA: "nTA",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_TOKENS_IN_SENT: "nTS",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGES: "P",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGE_NO: "pN",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PARAS: "A",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PARA_NO: "aN",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_ROW_NO: "rN",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_SENTS: "S",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_SENT_NO: "sN",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TEXT: "x",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKENS: "T",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_CLUSTER: "cl",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_DEP_: "dp",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_DOC: "dc",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_ENT_IOB_: "eI",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_ENT_KB_ID_: "eK",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_ENT_TYPE_: "eT",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_HEAD: "hd",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_I: "i",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IDX: "ix",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_ALPHA: "iAl",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_ASCII: "iAs",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_BRACKET: "iBr",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_CURRENCY: "iCu",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_DIGIT: "iDi",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_LEFT_PUNCT: "iLP",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_LOWER: "iLo",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_OOV: "iOo",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_PUNCT: "iPu",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_QUOTE: "iQu",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_RIGHT_PUNCT: "iRP",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_SENT_END: "iSE",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_SENT_START: "iSS",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_SPACE: "iSp",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_STOP: "iSt",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_TITLE: "iTi",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_UPPER: "iUp",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LANG_: "la",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LEFT_EDGE: "lE",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LEMMA_: "le",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LEX: "lx",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LEX_ID: "lI",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LIKE_EMAIL: "kE",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LIKE_NUM: "kN",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LIKE_URL: "kU",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LOWER_: "lo",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_MORPH: "mo",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_NORM_: "no",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_ORTH_: "or",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_POS_: "po",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_PREFIX_: "pf",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_PROB: "pr",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_RANK: "ra",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_RIGHT_EDGE: "rE",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_SENT: "se",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_SENTIMENT: "sm",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_SHAPE_: "sh",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_SUFFIX_: "sf",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_TAG_: "ta",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_TENSOR: "te",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_TEXT: "t",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_TEXT_WITH_WS: "tW",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_VOCAB: "vo",
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_WHITESPACE_: "ws",
+    }
+
+    _JSON_NAMES: ClassVar[dict[str, str]] = {short_key: json_name for json_name, short_key in SHORT_KEYS.items()}
+
+    # ------------------------------------------------------------------
+    # Initialise the instance.
+    # ------------------------------------------------------------------
+    def __init__(self, run_context: dcr_core.cls_run_context.RunContextProtocol | None = None) -> None:
+        """Initialise the instance.
+
+        Args:
+            run_context (RunContext, optional): The run context of the document.
+                Defaults to the global variables in dcr_core.core_glob.
+        """
+        try:
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+        except AttributeError:
+            dcr_core.core_glob.initialise_logger()
+            dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+
+        self._run_context = dcr_core.core_utils.get_run_context(run_context)
+
+        dcr_core.core_utils.check_exists_object(
+            is_setup=True,
+            run_context=self._run_context,
+        )
+
+        self._file_handle: IO[bytes] | IO[str] | None = None
+        self._file_name_next = ""
+        self._file_name_temp = ""
+
+        self._is_compact = False
+        self._is_orjson = False
+        self._is_short_keys = False
+        self._is_stream = False
+
+        self._no_pages_written = 0
+
+        self._exist = True
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+    # ------------------------------------------------------------------
+    # Encode and write a Python object.
+    # ------------------------------------------------------------------
+    def _dump(self, data: object, indent_level: int = 0) -> None:
+        """Encode and write a Python object.
+
+        Args:
+            data (object): Python object.
+            indent_level (int, optional): Nesting level of the object in the JSON file.
+                Defaults to 0.
+        """
+        setup = self._run_context.setup
+
+        if self._is_short_keys:
+            data = TokenJsonWriter._shorten_keys(data)
+
+        if self._is_orjson:
+            option = orjson.OPT_SORT_KEYS if setup.is_json_sort_keys else 0
+            if not self._is_compact:
+                option |= orjson.OPT_INDENT_2
+            encoded = orjson.dumps(data, option=option)
+            if indent_level > 0 and not self._is_compact:
+                encoded = encoded.replace(b"\n", self._indent(indent_level).encode(dcr_core.core_glob.FILE_ENCODING_DEFAULT))
+            self._file_handle.write(encoded)  # type: ignore
+        elif self._is_compact:
+            json.dump(data, self._file_handle, separators=(",", ":"), sort_keys=setup.is_json_sort_keys)  # type: ignore
+        elif indent_level > 0:
+            self._write(
+                json.dumps(data, indent=setup.json_indent, sort_keys=setup.is_json_sort_keys).replace("\n", self._indent(indent_level))
+            )
+        else:
+            json.dump(data, self._file_handle, indent=setup.json_indent, sort_keys=setup.is_json_sort_keys)  # type: ignore
+
+    # ------------------------------------------------------------------
+    # Encode and write the document page by page.
+    # ------------------------------------------------------------------
+    def _dump_document(self, token_document: dict[str, object]) -> None:
+        """Encode and write the document page by page.
+
+        The pages are encoded one at a time, so that with short key
+        names only a copy of the current page is needed. The result is
+        the same as encoding the document in one piece.
+
+        Args:
+            token_document (dict[str, object]): The tokens of the document.
+        """
+        key_separator = ":" if self._is_compact else ": "
+
+        items = [(self._short_key(key), key, value) for key, value in token_document.items()]
+        if self._run_context.setup.is_json_sort_keys:
+            items.sort(key=lambda item: item[0])
+
+        self._write("{")
+
+        for item_no, (key, json_name, value) in enumerate(items):
+            self._write(("," if item_no > 0 else "") + self._indent(1) + json.dumps(key) + key_separator)
+
+            if json_name != dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGES or not isinstance(value, list) or not value:
+                self._dump(value, 1)
+                continue
+
+            for page_no, token_page in enumerate(value):
+                self._write(("," if page_no > 0 else "[") + self._indent(2))
+                self._dump(token_page, 2)
+
+            self._write(self._indent(1) + "]")
+
+        self._write(self._indent(0) + "}")
+
+    # ------------------------------------------------------------------
+    # Determine the line break and indentation of a nesting level.
+    # ------------------------------------------------------------------
+    def _indent(self, indent_level: int) -> str:
+        """Determine the line break and indentation of a nesting level.
+
+        Args:
+            indent_level (int): Nesting level in the JSON file.
+
+        Returns:
+            str: Line break and indentation, empty in the compact format.
+        """
+        if self._is_compact:
+            return ""
+
+        return "\n" + " " * ((2 if self._is_orjson else self._run_context.setup.json_indent) * indent_level)
+
+    # ------------------------------------------------------------------
+    # Replace the short key names by the JSON names.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _lengthen_keys(data: object) -> object:
+        """Replace the short key names by the JSON names.
+
+        Args:
+            data (object): Python object.
+
+        Returns:
+            object: Python object with JSON names.
+        """
+        if isinstance(data, dict):
+            return {TokenJsonWriter._JSON_NAMES.get(key, key): TokenJsonWriter._lengthen_keys(value) for key, value in data.items()}
+
+        if isinstance(data, list):
+            return [TokenJsonWriter._lengthen_keys(value) for value in data]
+
+        return data
+
+    # ------------------------------------------------------------------
+    # Open the output file.
+    # ------------------------------------------------------------------
+    def _open_file(self) -> None:
+        """Open the temporary output file - binary for the encoder 'orjson'."""
+        self._file_name_temp = self._file_name_next + ".tmp"
+
+        if self._is_orjson:
+            self._file_handle = open(self._file_name_temp, "wb")  # pylint: disable=consider-using-with
+        else:
+            self._file_handle = open(  # pylint: disable=consider-using-with
+                self._file_name_temp, "w", encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT
+            )
+
+    # ------------------------------------------------------------------
+    # Determine the key name in the output file.
+    # ------------------------------------------------------------------
+    def _short_key(self, json_name: str) -> str:
+        """Determine the key name in the output file.
+
+        Args:
+            json_name (str): JSON name.
+
+        Returns:
+            str: The short key name if required, otherwise the JSON name.
+        """
+        return TokenJsonWriter.SHORT_KEYS.get(json_name, json_name) if self._is_short_keys else json_name
+
+    # ------------------------------------------------------------------
+    # Replace the JSON names by the short key names.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _shorten_keys(data: object) -> object:
+        """Replace the JSON names by the short key names.
+
+        Args:
+            data (object): Python object.
+
+        Returns:
+            object: Python object with short key names.
+        """
+        if isinstance(data, dict):
+            return {TokenJsonWriter.SHORT_KEYS.get(key, key): TokenJsonWriter._shorten_keys(value) for key, value in data.items()}
+
+        if isinstance(data, list):
+            return [TokenJsonWriter._shorten_keys(value) for value in data]
+
+        return data
+
+    # ------------------------------------------------------------------
+    # Write a text fragment of the JSON file.
+    # ------------------------------------------------------------------
+    def _write(self, text: str) -> None:
+        """Write a text fragment of the JSON file.
+
+        Args:
+            text (str): Text fragment.
+        """
+        self._file_handle.write(text.encode(dcr_core.core_glob.FILE_ENCODING_DEFAULT) if self._is_orjson else text)  # type: ignore
+
+    # ------------------------------------------------------------------
+    # Stop writing the current document.
+    # ------------------------------------------------------------------
+    def close_document(self) -> None:
+        """Stop writing the current document.
+
+        If the document has not been finished by write_document, the
+        temporary output file is closed and deleted, so that neither an
+        open file nor an incomplete output file remains.
+        """
+        if self._file_handle is None:
+            return
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+
+        self._file_handle.close()
+        self._file_handle = None
+
+        if os.path.isfile(self._file_name_temp):
+            os.remove(self._file_name_temp)
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+    # ------------------------------------------------------------------
+    # Check the object existence.
+    # ------------------------------------------------------------------
+    def exists(self) -> bool:
+        """Check the object existence.
+
+        Returns:
+            bool: Always true.
+        """
+        return self._exist
+
+    # ------------------------------------------------------------------
+    # Load a document written in the configured format.
+    # ------------------------------------------------------------------
+    def load_document(self, file_name: str) -> dict[str, object]:
+        """Load a document written in the configured format.
+
+        Args:
+            file_name (str): File name of the JSON file.
+
+        Returns:
+            dict[str, object]: The tokens of the document with the JSON names.
+        """
+        with open(file_name, "r", encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT) as file_handle:
+            token_document = json.load(file_handle)
+
+        if self._run_context.setup.is_tokenize_2_jsonfile_short_keys:
+            token_document = TokenJsonWriter._lengthen_keys(token_document)
+
+        return token_document  # type: ignore
+
+    # ------------------------------------------------------------------
+    # Start writing a new document.
+    # ------------------------------------------------------------------
+    def open_document(self, file_name_next: str) -> None:
+        """Start writing a new document.
+
+        Args:
+            file_name_next (str): File name of the output file.
+        """
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+        dcr_core.core_glob.logger.debug("param file_name_next=%s", file_name_next)
+
+        setup = self._run_context.setup
+
+        self._file_name_next = file_name_next
+
+        self._is_compact = setup.is_tokenize_2_jsonfile_compact
+        self._is_orjson = setup.tokenize_2_jsonfile_encoder == dcr_core.cls_setup.Setup.JSON_ENCODER_ORJSON
+        self._is_short_keys = setup.is_tokenize_2_jsonfile_short_keys
+        self._is_stream = setup.is_tokenize_2_jsonfile_stream
+
+        self._no_pages_written = 0
+
+        if self._is_stream:
+            self._open_file()
+
+            self._write('{"' + self._short_key(dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGES) + '":[')
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
+
+    # ------------------------------------------------------------------
+    # Write a finished page.
+    # ------------------------------------------------------------------
+    def write_page(self, token_page: dict[str, object]) -> None:
+        """Write a finished page - only in the streaming mode.
+
+        Args:
+            token_page (dict[str, object]): The tokens of the page.
+        """
+        if not self._is_stream:
+            return
+
+        if self._no_pages_written > 0:
+            self._write(",")
+
+        self._dump(token_page)
+
+        self._no_pages_written += 1
+
+    # ------------------------------------------------------------------
+    # Write the finished document.
+    # ------------------------------------------------------------------
+    def write_document(self, token_document: dict[str, object]) -> None:
+        """Write the finished document.
+
+        In the streaming mode the pages have already been written, so
+        that only the remaining keys of the document are added. The
+        finished file replaces the output file.
+
+        Args:
+            token_document (dict[str, object]): The tokens of the document.
+        """
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
+
+        if self._is_stream:
+            self._write("]")
+
+            for key, value in token_document.items():
+                if key == dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGES:
+                    continue
+                self._write("," + json.dumps(self._short_key(key)) + ":")
+                self._dump(value)
+
+            self._write("}")
+        else:
+            self._open_file()
+
+            self._dump_document(token_document)
+
+        self._file_handle.close()  # type: ignore
+        self._file_handle = None
+
+        os.replace(self._file_name_temp, self._file_name_next)
+
+        dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_END)
@@ -0,0 +1,41 @@
+# Copyright (c) 2022 Konnexions GmbH. All rights reserved. Use of this
+# source code is governed by the Konnexions Public License (KX-PL)
+# Version 2020.05, that can be found in the LICENSE file.
+
+"""Module stub file."""
+from typing import IO
+from typing import ClassVar
+
+import dcr_core.cls_run_context
+
+class TokenJsonWriter:
+    _JSON_NAMES: ClassVar[dict[str, str]]
+    SHORT_KEYS: ClassVar[dict[str, str]]
+
+    def __init__(self, run_context: dcr_core.cls_run_context.RunContextProtocol | None = ...) -> None:
+        self._exist: bool = False
+        self._file_handle: IO[bytes] | IO[str] | None = None
+        self._file_name_next: str = ""
+        self._file_name_temp: str = ""
+        self._is_compact: bool = False
+        self._is_orjson: bool = False
+        self._is_short_keys: bool = False
+        self._is_stream: bool = False
+        self._no_pages_written: int = 0
+        self._run_context: dcr_core.cls_run_context.RunContextProtocol
+    def _dump(self, data: object, indent_level: int = ...) -> None: ...
+    def _dump_document(self, token_document: dict[str, object]) -> None: ...
+    def _indent(self, indent_level: int) -> str: ...
+    @staticmethod
+    def _lengthen_keys(data: object) -> object: ...
+    def _open_file(self) -> None: ...
+    def _short_key(self, json_name: str) -> str: ...
+    @staticmethod
+    def _shorten_keys(data: object) -> object: ...
+    def _write(self, text: str) -> None: ...
+    def close_document(self) -> None: ...
+    def exists(self) -> bool: ...
+    def load_document(self, file_name: str) -> dict[str, object]: ...
+    def open_document(self, file_name_next: str) -> None: ...
+    def write_document(self, token_document: dict[str, object]) -> None: ...
+    def write_page(self, token_page: dict[str, object]) -> None: ...
@@ -8,12 +8,18 @@ Typical usage example:
 
     my_instance = TokenizerSpacy()
 """
-import json
+import threading
+from collections.abc import Callable
+from collections.abc import Iterator
+from typing import ClassVar
 
 import spacy
+import spacy.attrs
 import spacy.tokens
 
 import dcr_core.cls_nlp_core
+import dcr_core.cls_run_context
+import dcr_core.cls_token_json_writer
 
 
 # pylint: disable=too-many-branches
@@ -22,6 +28,8 @@ import dcr_core.cls_nlp_core
 class TokenizerSpacy:
     """Tokenize the document."""
 
+    TokenAttrGetter = Callable[[spacy.tokens.Token], bool | float | int | str | None]
+
     TokenToken = dict[str, bool | float | int | str]
     TokenTokens = list[TokenToken]
 
@@ -36,19 +44,31 @@ class TokenizerSpacy:
 
     TokenDocument = dict[str, int | TokenPages | str]
 
+    # The loaded spaCy pipelines are shared by all instances in the process.
+    _pipelines: ClassVar[dict[str, spacy.Language]] = {}
+    _pipelines_lock: ClassVar[threading.Lock] = threading.Lock()
+
     # ------------------------------------------------------------------
     # Initialise the instance.
     # ------------------------------------------------------------------
-    def __init__(self) -> None:
-        """Initialise the instance."""
+    def __init__(self, run_context: dcr_core.cls_run_context.RunContextProtocol | None = None) -> None:
+        """Initialise the instance.
+
+        Args:
+            run_context (RunContext, optional): The run context of the document.
+                Defaults to the global variables in dcr_core.core_glob.
+        """
         try:
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
         except AttributeError:
             dcr_core.core_glob.initialise_logger()
             dcr_core.core_glob.logger.debug(dcr_core.core_glob.LOGGER_START)
 
+        self._run_context = dcr_core.core_utils.get_run_context(run_context)
+
         dcr_core.core_utils.check_exists_object(
             is_setup=True,
+            run_context=self._run_context,
         )
 
         self._document_id: int = 0
@@ -58,13 +78,15 @@ class TokenizerSpacy:
         self._no_lines_header: int = 0
         self._no_lines_toc: int = 0
         self._pipeline_name = dcr_core.cls_nlp_core.NLPCore.LANGUAGE_SPACY_DEFAULT
-        self._nlp: spacy.Language = spacy.load(self._pipeline_name)
+        self._nlp: spacy.Language = TokenizerSpacy.load_pipeline(self._pipeline_name)
 
         self._column_no: int = 0
         self._column_span: int = 0
         self._coord_llx = 0.0
         self._coord_urx = 0.0
 
+        self._is_json_stream = False
+
         self._line_type = ""
 
         self._no_lines_in_doc = 0
@@ -83,19 +105,30 @@ class TokenizerSpacy:
         self._page_no = 0
         self._para_lines: list[str] = []
         self._para_no = 0
+        self._para_docs: Iterator[spacy.tokens.Doc] | None = None
         self._para_no_prev = 0
         self._para_text = ""
+        self._parse_result_line_line: dcr_core.cls_nlp_core.NLPCore.ParserLineLine = {}
+        self._parse_result_line_page: dcr_core.cls_nlp_core.NLPCore.ParserLinePage = {}
+
         self._processing_ok = False
 
         self._row_no: int = 0
 
+        self._sent_end = 0
         self._sent_no = 0
+        self._sent_start = 0
+        self._sent_start_char = 0
         self._sentence = ""
 
+        self._token_attr_extractors: list[tuple[str, TokenizerSpacy.TokenAttrGetter]] = []
+        self._token_ignore_mask = 0
         self._token_paras: TokenizerSpacy.TokenParas = []
         self._token_sents: TokenizerSpacy.TokenSents = []
         self._token_tokens: TokenizerSpacy.TokenTokens = []
 
+        self.json_writer = dcr_core.cls_token_json_writer.TokenJsonWriter(run_context=self._run_context)
+
         self.token_pages: TokenizerSpacy.TokenPages = []
 
         self._exist = True
@@ -127,6 +160,7 @@ class TokenizerSpacy:
         """Finish current ent."""
         dcr_core.core_utils.check_exists_object(
             is_text_parser=True,
+            run_context=self._run_context,
         )
 
         json_data = {
@@ -136,30 +170,24 @@ class TokenizerSpacy:
             dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LINES_HEADER: self._no_lines_header,
             dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LINES_IN_DOC: self._no_lines_in_doc,
             dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LINES_TOC: self._no_lines_toc,
-            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LISTS_BULLET_IN_DOC: dcr_core.core_glob.text_parser.parse_result_line_document[
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LISTS_BULLET_IN_DOC: self._run_context.text_parser.parse_result_line_document[
                 dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LISTS_BULLET_IN_DOC
             ],
-            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LISTS_NUMBER_IN_DOC: dcr_core.core_glob.text_parser.parse_result_line_document[
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LISTS_NUMBER_IN_DOC: self._run_context.text_parser.parse_result_line_document[
                 dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LISTS_NUMBER_IN_DOC
             ],
             dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_PAGES_IN_DOC: self._no_pages_in_doc,
             dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_PARAS_IN_DOC: self._no_paras_in_doc,
             dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_SENTS_IN_DOC: self._no_sents_in_doc,
-            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_TABLES_IN_DOC: dcr_core.core_glob.text_parser.parse_result_line_document[
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_TABLES_IN_DOC: self._run_context.text_parser.parse_result_line_document[
                 dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_TABLES_IN_DOC
             ],
             dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_TOKENS_IN_DOC: self._no_tokens_in_doc,
             dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGES: self.token_pages,
         }
 
-        if dcr_core.core_glob.setup.is_tokenize_2_jsonfile:
-            with open(self._file_name_next, "w", encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT) as file_handle:
-                json.dump(
-                    json_data,
-                    file_handle,
-                    indent=dcr_core.core_glob.setup.json_indent,
-                    sort_keys=dcr_core.core_glob.setup.is_json_sort_keys,
-                )
+        if self._run_context.setup.is_tokenize_2_jsonfile:
+            self.json_writer.write_document(json_data)
 
     # ------------------------------------------------------------------
     # Finish current page.
@@ -178,16 +206,20 @@ class TokenizerSpacy:
         """Finish current page."""
         self._no_pages_in_doc += 1
 
-        self.token_pages.append(
-            {
-                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGE_NO: self._page_no,
-                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LINES_IN_PAGE: self._no_lines_in_page,
-                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_PARAS_IN_PAGE: self._no_paras_in_page,
-                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_SENTS_IN_PAGE: self._no_sents_in_page,
-                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_TOKENS_IN_PAGE: self._no_tokens_in_page,
-                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PARAS: self._token_paras,
-            }
-        )
+        token_page: TokenizerSpacy.TokenPage = {
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGE_NO: self._page_no,
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_LINES_IN_PAGE: self._no_lines_in_page,
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_PARAS_IN_PAGE: self._no_paras_in_page,
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_SENTS_IN_PAGE: self._no_sents_in_page,
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_TOKENS_IN_PAGE: self._no_tokens_in_page,
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PARAS: self._token_paras,
+        }
+
+        # In the streaming mode the finished page is written immediately and not kept in memory.
+        if self._is_json_stream:
+            self.json_writer.write_page(token_page)
+        else:
+            self.token_pages.append(token_page)
 
     # ------------------------------------------------------------------
     # Finish current paragraph.
@@ -292,256 +324,422 @@ class TokenizerSpacy:
             )
 
     # ------------------------------------------------------------------
-    # Determine the requested token attributes.
+    # Determine the texts of all paragraphs of the document.
     # ------------------------------------------------------------------
-    @staticmethod
-    def _get_token_attributes(token: spacy.tokens.Token) -> TokenToken:  # type: ignore # noqa: C901
-        """Determine the requested token attributes.
+    def _get_para_texts(self) -> Iterator[str]:
+        """Determine the texts of all paragraphs of the document.
 
-        Args:
-            token (spacy.tokens.Token):
-                spaCy tokens.
+        The paragraphs are determined in the same order and with the same
+        rules as in the method _process_page.
 
-        Returns:
-            Token:
-                Requested token attributes.
+        Yields:
+            Iterator[str]: The text of the next paragraph.
         """
-        token_attr: dict[str, bool | float | int | str] = {}
-
-        if (
-            token.is_bracket  # pylint: disable=too-many-boolean-expressions
-            and dcr_core.core_glob.setup.is_spacy_ignore_bracket
-            or token.is_left_punct
-            and dcr_core.core_glob.setup.is_spacy_ignore_left_punct
-            or token.is_punct
-            and dcr_core.core_glob.setup.is_spacy_ignore_punct
-            or token.is_quote
-            and dcr_core.core_glob.setup.is_spacy_ignore_quote
-            or token.is_right_punct
-            and dcr_core.core_glob.setup.is_spacy_ignore_right_punct
-            or token.is_space
-            and dcr_core.core_glob.setup.is_spacy_ignore_space
-            or token.is_stop
-            and dcr_core.core_glob.setup.is_spacy_ignore_stop
-        ):
-            return token_attr
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_cluster:
-            if token.cluster != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_CLUSTER] = token.cluster
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_dep_:
-            if token.dep_ != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_DEP_] = token.dep_
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_doc:
-            if token.doc is not None:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_DOC] = token.doc.text
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_ent_iob_:
-            if token.ent_iob_ != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_ENT_IOB_] = token.ent_iob_
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_ent_kb_id_:
-            # not testable
-            if token.ent_kb_id_ != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_ENT_KB_ID_] = token.ent_kb_id_
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_ent_type_:
-            if token.ent_type_ != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_ENT_TYPE_] = token.ent_type_
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_head:
-            if token.head is not None:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_HEAD] = token.head.i
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_i:
-            token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_I] = token.i
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_idx:
-            if token.idx != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IDX] = token.idx
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_is_alpha:
-            if token.is_alpha:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_ALPHA] = token.is_alpha
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_is_ascii:
-            if token.is_ascii:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_ASCII] = token.is_ascii
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_is_bracket:
-            if token.is_bracket:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_BRACKET] = token.is_bracket
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_is_currency:
-            if token.is_currency:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_CURRENCY] = token.is_currency
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_is_digit:
-            if token.is_digit:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_DIGIT] = token.is_digit
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_is_left_punct:
-            if token.is_left_punct:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_LEFT_PUNCT] = token.is_left_punct
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_is_lower:
-            if token.is_lower:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_LOWER] = token.is_lower
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_is_oov:
-            if token.is_oov:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_OOV] = token.is_oov
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_is_punct:
-            if token.is_punct:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_PUNCT] = token.is_punct
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_is_quote:
-            if token.is_quote:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_QUOTE] = token.is_quote
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_is_right_punct:
-            if token.is_right_punct:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_RIGHT_PUNCT] = token.is_right_punct
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_is_sent_end:
-            if token.is_sent_end:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_SENT_END] = token.is_sent_end
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_is_sent_start:
-            if token.is_sent_start:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_SENT_START] = token.is_sent_start
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_is_space:
-            if token.is_space:
-                # not testable
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_SPACE] = token.is_space
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_is_stop:
-            if token.is_stop:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_STOP] = token.is_stop
+        for parse_result_line_page in self._run_context.text_parser.parse_result_line_document[
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGES
+        ]:
+            para_lines: list[str] = []
+            para_no_prev = 0
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_is_title:
-            if token.is_title:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_TITLE] = token.is_title
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_is_upper:
-            if token.is_upper:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_UPPER] = token.is_upper
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_lang_:
-            if token.lang_ != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LANG_] = token.lang_
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_left_edge:
-            if token.left_edge.text is not None:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LEFT_EDGE] = token.left_edge.i
-
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_lemma_:
-            if token.lemma_ != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LEMMA_] = token.lemma_
+            for parse_result_line_line in parse_result_line_page[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINES]:
+                if self._is_line_type_ignored(parse_result_line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINE_TYPE]):
+                    continue
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_lex:
-            if token.lex is not None:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LEX] = token.lex.text
+                para_no = parse_result_line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PARA_NO]
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_lex_id:
-            if token.lex_id != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LEX_ID] = token.lex_id
+                if para_no_prev == 0:
+                    para_lines = []
+                elif para_no != para_no_prev:
+                    yield " ".join(para_lines)
+                    para_lines = []
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_like_email:
-            if token.like_email:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LIKE_EMAIL] = token.like_email
+                para_lines.append(parse_result_line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TEXT])
+                para_no_prev = para_no
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_like_num:
-            if token.like_num:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LIKE_NUM] = token.like_num
+            if para_no_prev > 0:
+                yield " ".join(para_lines)
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_like_url:
-            if token.like_url:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LIKE_URL] = token.like_url
+    # ------------------------------------------------------------------
+    # Compile the token attribute extractor.
+    # ------------------------------------------------------------------
+    def _compile_token_attributes(self) -> None:
+        """Compile the token attribute extractor.
+
+        The configuration parameters are evaluated only once per document
+        instead of once per token: the ignore rules are reduced to a
+        single bit mask over the lexical flags of a token and the
+        requested token attributes to a list of (JSON name, getter)
+        pairs. A getter returns None if the attribute is to be omitted.
+        """
+        setup = self._run_context.setup
+
+        self._token_ignore_mask = 0
+
+        for is_ignore, flag_id in (
+            (setup.is_spacy_ignore_bracket, spacy.attrs.IS_BRACKET),
+            (setup.is_spacy_ignore_left_punct, spacy.attrs.IS_LEFT_PUNCT),
+            (setup.is_spacy_ignore_punct, spacy.attrs.IS_PUNCT),
+            (setup.is_spacy_ignore_quote, spacy.attrs.IS_QUOTE),
+            (setup.is_spacy_ignore_right_punct, spacy.attrs.IS_RIGHT_PUNCT),
+            (setup.is_spacy_ignore_space, spacy.attrs.IS_SPACE),
+            (setup.is_spacy_ignore_stop, spacy.attrs.IS_STOP),
+        ):
+            if is_ignore:
+                self._token_ignore_mask |= 1 << flag_id
+
+        token_attr_extractors: list[tuple[bool, str, TokenizerSpacy.TokenAttrGetter]] = [
+            (
+                setup.is_spacy_tkn_attr_cluster,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_CLUSTER,
+                lambda token: token.cluster,
+            ),
+            (
+                setup.is_spacy_tkn_attr_dep_,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_DEP_,
+                lambda token: token.dep_ or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_doc,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_DOC,
+                lambda token: self._sentence,
+            ),
+            (
+                setup.is_spacy_tkn_attr_ent_iob_,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_ENT_IOB_,
+                lambda token: token.ent_iob_ or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_ent_kb_id_,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_ENT_KB_ID_,
+                lambda token: token.ent_kb_id_ or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_ent_type_,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_ENT_TYPE_,
+                lambda token: token.ent_type_ or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_head,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_HEAD,
+                lambda token: token.head.i - self._sent_start,
+            ),
+            (
+                setup.is_spacy_tkn_attr_i,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_I,
+                lambda token: token.i - self._sent_start,
+            ),
+            (
+                setup.is_spacy_tkn_attr_idx,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IDX,
+                lambda token: token.idx - self._sent_start_char,
+            ),
+            (
+                setup.is_spacy_tkn_attr_is_alpha,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_ALPHA,
+                lambda token: token.is_alpha or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_is_ascii,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_ASCII,
+                lambda token: token.is_ascii or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_is_bracket,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_BRACKET,
+                lambda token: token.is_bracket or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_is_currency,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_CURRENCY,
+                lambda token: token.is_currency or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_is_digit,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_DIGIT,
+                lambda token: token.is_digit or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_is_left_punct,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_LEFT_PUNCT,
+                lambda token: token.is_left_punct or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_is_lower,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_LOWER,
+                lambda token: token.is_lower or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_is_oov,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_OOV,
+                lambda token: token.is_oov or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_is_punct,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_PUNCT,
+                lambda token: token.is_punct or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_is_quote,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_QUOTE,
+                lambda token: token.is_quote or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_is_right_punct,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_RIGHT_PUNCT,
+                lambda token: token.is_right_punct or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_is_sent_end,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_SENT_END,
+                lambda token: token.is_sent_end or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_is_sent_start,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_SENT_START,
+                lambda token: token.is_sent_start or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_is_space,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_SPACE,
+                lambda token: token.is_space or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_is_stop,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_STOP,
+                lambda token: token.is_stop or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_is_title,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_TITLE,
+                lambda token: token.is_title or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_is_upper,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_IS_UPPER,
+                lambda token: token.is_upper or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_lang_,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LANG_,
+                lambda token: token.lang_ or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_left_edge,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LEFT_EDGE,
+                lambda token: token.left_edge.i - self._sent_start,
+            ),
+            (
+                setup.is_spacy_tkn_attr_lemma_,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LEMMA_,
+                lambda token: token.lemma_ or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_lex,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LEX,
+                lambda token: token.lex.text,
+            ),
+            (
+                setup.is_spacy_tkn_attr_lex_id,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LEX_ID,
+                lambda token: token.lex_id,
+            ),
+            (
+                setup.is_spacy_tkn_attr_like_email,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LIKE_EMAIL,
+                lambda token: token.like_email or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_like_num,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LIKE_NUM,
+                lambda token: token.like_num or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_like_url,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LIKE_URL,
+                lambda token: token.like_url or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_lower_,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LOWER_,
+                lambda token: token.lower_ or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_morph,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_MORPH,
+                lambda token: str(token.morph),
+            ),
+            (
+                setup.is_spacy_tkn_attr_norm_,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_NORM_,
+                lambda token: token.norm_ or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_orth_,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_ORTH_,
+                lambda token: token.orth_ or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_pos_,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_POS_,
+                lambda token: token.pos_ or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_prefix_,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_PREFIX_,
+                lambda token: token.prefix_ or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_prob,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_PROB,
+                lambda token: token.prob,
+            ),
+            (
+                setup.is_spacy_tkn_attr_rank,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_RANK,
+                lambda token: token.rank,
+            ),
+            (
+                setup.is_spacy_tkn_attr_right_edge,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_RIGHT_EDGE,
+                lambda token: token.right_edge.i - self._sent_start,
+            ),
+            (
+                setup.is_spacy_tkn_attr_sent,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_SENT,
+                lambda token: token.sent.text,
+            ),
+            (
+                setup.is_spacy_tkn_attr_sentiment,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_SENTIMENT,
+                lambda token: token.sentiment,
+            ),
+            (
+                setup.is_spacy_tkn_attr_shape_,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_SHAPE_,
+                lambda token: token.shape_ or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_suffix_,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_SUFFIX_,
+                lambda token: token.suffix_ or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_tag_,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_TAG_,
+                lambda token: token.tag_ or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_tensor,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_TENSOR,
+                lambda token: self._get_token_tensor(token),
+            ),
+            (
+                setup.is_spacy_tkn_attr_text,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_TEXT,
+                lambda token: token.text or None,
+            ),
+            (
+                setup.is_spacy_tkn_attr_text_with_ws,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_TEXT_WITH_WS,
+                lambda token: self._get_token_text_with_ws(token),
+            ),
+            (
+                setup.is_spacy_tkn_attr_vocab,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_VOCAB,
+                lambda token: str(token.vocab),
+            ),
+            (
+                setup.is_spacy_tkn_attr_whitespace_,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_WHITESPACE_,
+                lambda token: self._get_token_whitespace_(token),
+            ),
+        ]
+
+        self._token_attr_extractors = [(json_name, getter) for (is_requested, json_name, getter) in token_attr_extractors if is_requested]
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_lower_:
-            if token.lower_ != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_LOWER_] = token.lower_
+    # ------------------------------------------------------------------
+    # Determine the requested token attributes.
+    # ------------------------------------------------------------------
+    def _get_token_attributes(self, token: spacy.tokens.Token) -> TokenToken:  # type: ignore
+        """Determine the requested token attributes.
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_morph:
-            if token.morph is not None:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_MORPH] = str(token.morph)
+        The token positions are relative to the start of the current
+        sentence, as if the sentence had been processed on its own.
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_norm_:
-            if token.norm_ != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_NORM_] = token.norm_
+        Args:
+            token (spacy.tokens.Token):
+                spaCy tokens.
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_orth_:
-            if token.orth_ != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_ORTH_] = token.orth_
+        Returns:
+            Token:
+                Requested token attributes.
+        """
+        token_attr: dict[str, bool | float | int | str] = {}
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_pos_:
-            if token.pos_ != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_POS_] = token.pos_
+        if token.lex.flags & self._token_ignore_mask:
+            return token_attr
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_prefix_:
-            if token.prefix_ != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_PREFIX_] = token.prefix_
+        for json_name, getter in self._token_attr_extractors:
+            if (value := getter(token)) is not None:
+                token_attr[json_name] = value
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_prob:
-            if token.prob != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_PROB] = token.prob
+        return token_attr
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_rank:
-            if token.rank != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_RANK] = token.rank
+    # ------------------------------------------------------------------
+    # Determine the token attribute tensor.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _get_token_tensor(token: spacy.tokens.Token) -> str | None:
+        """Determine the token attribute tensor.
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_right_edge:
-            if token.right_edge is not None:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_RIGHT_EDGE] = token.right_edge.i
+        Args:
+            token (spacy.tokens.Token): spaCy token.
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_sent:
-            if token.sent is not None:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_SENT] = token.sent.text
+        Returns:
+            str | None: The tensor of the token, if available.
+        """
+        try:
+            return str(token.tensor)
+        except IndexError:
+            return None
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_sentiment:
-            if token.sentiment != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_SENTIMENT] = token.sentiment
+    # ------------------------------------------------------------------
+    # Determine the token attribute text_with_ws.
+    # ------------------------------------------------------------------
+    def _get_token_text_with_ws(self, token: spacy.tokens.Token) -> str | None:
+        """Determine the token attribute text_with_ws.
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_shape_:
-            if token.shape_ != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_SHAPE_] = token.shape_
+        The trailing whitespace of a sentence is not part of the sentence.
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_suffix_:
-            if token.suffix_ != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_SUFFIX_] = token.suffix_
+        Args:
+            token (spacy.tokens.Token): spaCy token.
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_tag_:
-            if token.tag_ != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_TAG_] = token.tag_
+        Returns:
+            str | None: The text of the token including the trailing whitespace, if any.
+        """
+        if token.text_with_ws == "":
+            return None
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_tensor:
-            try:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_TENSOR] = str(token.tensor)
-            except IndexError:
-                pass
+        return token.text if token.i == self._sent_end - 1 else token.text_with_ws
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_text:
-            if token.text != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_TEXT] = token.text
+    # ------------------------------------------------------------------
+    # Determine the token attribute whitespace_.
+    # ------------------------------------------------------------------
+    def _get_token_whitespace_(self, token: spacy.tokens.Token) -> str | None:
+        """Determine the token attribute whitespace_.
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_text_with_ws:
-            if token.text_with_ws != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_TEXT_WITH_WS] = token.text_with_ws
+        The trailing whitespace of a sentence is not part of the sentence.
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_vocab:
-            if token.vocab is not None:
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_VOCAB] = str(token.vocab)
+        Args:
+            token (spacy.tokens.Token): spaCy token.
 
-        if dcr_core.core_glob.setup.is_spacy_tkn_attr_whitespace_:
-            if token.whitespace_ != "":
-                token_attr[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_WHITESPACE_] = token.whitespace_
+        Returns:
+            str | None: The trailing whitespace of the token, if any.
+        """
+        if token.whitespace_ == "" or token.i == self._sent_end - 1:
+            return None
 
-        return token_attr
+        return token.whitespace_
 
     # ------------------------------------------------------------------
     # Initialise a new document.
@@ -575,15 +773,14 @@ class TokenizerSpacy:
         """Initialize a new paragraph."""
         dcr_core.core_utils.check_exists_object(
             is_text_parser=True,
+            run_context=self._run_context,
         )
 
-        if dcr_core.cls_nlp_core.NLPCore.JSON_NAME_COLUMN_NO in dcr_core.core_glob.text_parser.parse_result_line_line:
-            self._column_no = dcr_core.core_glob.text_parser.parse_result_line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_COLUMN_NO]
-            self._row_no = dcr_core.core_glob.text_parser.parse_result_line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_ROW_NO]
-            if dcr_core.cls_nlp_core.NLPCore.JSON_NAME_COLUMN_SPAN in dcr_core.core_glob.text_parser.parse_result_line_line:
-                self._column_span = dcr_core.core_glob.text_parser.parse_result_line_line[
-                    dcr_core.cls_nlp_core.NLPCore.JSON_NAME_COLUMN_SPAN
-                ]
+        if dcr_core.cls_nlp_core.NLPCore.JSON_NAME_COLUMN_NO in self._parse_result_line_line:
+            self._column_no = self._parse_result_line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_COLUMN_NO]
+            self._row_no = self._parse_result_line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_ROW_NO]
+            if dcr_core.cls_nlp_core.NLPCore.JSON_NAME_COLUMN_SPAN in self._parse_result_line_line:
+                self._column_span = self._parse_result_line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_COLUMN_SPAN]
             else:
                 self._column_span = 0
         else:
@@ -591,8 +788,8 @@ class TokenizerSpacy:
             self._column_span = 0
             self._row_no = 0
 
-        self._coord_llx = dcr_core.core_glob.text_parser.parse_result_line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_COORD_LLX]
-        self._coord_urx = dcr_core.core_glob.text_parser.parse_result_line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_COORD_URX]
+        self._coord_llx = self._parse_result_line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_COORD_LLX]
+        self._coord_urx = self._parse_result_line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_COORD_URX]
 
         self._no_lines_in_para = 0
         self._no_tokens_in_para = 0
@@ -612,6 +809,35 @@ class TokenizerSpacy:
 
         self._token_tokens = []
 
+    # ------------------------------------------------------------------
+    # Check whether the lines of a line type are ignored.
+    # ------------------------------------------------------------------
+    def _is_line_type_ignored(self, line_type: str) -> bool:
+        """Check whether the lines of a line type are ignored.
+
+        Args:
+            line_type (str): The line type.
+
+        Returns:
+            bool: True if the lines of this line type are not tokenized.
+        """
+        return (
+            line_type == dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_FOOTER  # pylint: disable=too-many-boolean-expressions
+            and self._run_context.setup.is_spacy_ignore_line_type_footer
+            or line_type == dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_HEADER
+            and self._run_context.setup.is_spacy_ignore_line_type_header
+            or line_type == dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_HEADING
+            and self._run_context.setup.is_spacy_ignore_line_type_heading
+            or line_type == dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_LIST_BULLET
+            and self._run_context.setup.is_spacy_ignore_line_type_list_bullet
+            or line_type == dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_LIST_NUMBER
+            and self._run_context.setup.is_spacy_ignore_line_type_list_number
+            or line_type == dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_TABLE
+            and self._run_context.setup.is_spacy_ignore_line_type_table
+            or line_type == dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_TOC
+            and self._run_context.setup.is_spacy_ignore_line_type_toc
+        )
+
     # ------------------------------------------------------------------
     # Process a whole new page.
     # ------------------------------------------------------------------
@@ -619,6 +845,7 @@ class TokenizerSpacy:
         """Process a whole new page."""
         dcr_core.core_utils.check_exists_object(
             is_text_parser=True,
+            run_context=self._run_context,
         )
 
         self._para_no_prev = 0
@@ -635,30 +862,11 @@ class TokenizerSpacy:
         #    "rowNo": 99,
         #    "text": "..."
         # },
-        for dcr_core.core_glob.text_parser.parse_result_line_line in dcr_core.core_glob.text_parser.parse_result_line_page[
-            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINES
-        ]:
-            line_type = dcr_core.core_glob.text_parser.parse_result_line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINE_TYPE]
-
-            if (
-                line_type == dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_FOOTER  # pylint: disable=too-many-boolean-expressions
-                and dcr_core.core_glob.setup.is_spacy_ignore_line_type_footer
-                or line_type == dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_HEADER
-                and dcr_core.core_glob.setup.is_spacy_ignore_line_type_header
-                or line_type == dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_HEADING
-                and dcr_core.core_glob.setup.is_spacy_ignore_line_type_heading
-                or line_type == dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_LIST_BULLET
-                and dcr_core.core_glob.setup.is_spacy_ignore_line_type_list_bullet
-                or line_type == dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_LIST_NUMBER
-                and dcr_core.core_glob.setup.is_spacy_ignore_line_type_list_number
-                or line_type == dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_TABLE
-                and dcr_core.core_glob.setup.is_spacy_ignore_line_type_table
-                or line_type == dcr_core.cls_nlp_core.NLPCore.LINE_TYPE_TOC
-                and dcr_core.core_glob.setup.is_spacy_ignore_line_type_toc
-            ):
+        for self._parse_result_line_line in self._parse_result_line_page[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINES]:
+            if self._is_line_type_ignored(self._parse_result_line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINE_TYPE]):
                 continue
 
-            self._para_no = dcr_core.core_glob.text_parser.parse_result_line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PARA_NO]
+            self._para_no = self._parse_result_line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PARA_NO]
 
             if self._para_no_prev == 0:
                 self._init_para()
@@ -678,6 +886,7 @@ class TokenizerSpacy:
         """Process a whole new paragraph."""
         dcr_core.core_utils.check_exists_object(
             is_text_parser=True,
+            run_context=self._run_context,
         )
 
         self._no_lines_in_doc += 1
@@ -685,25 +894,36 @@ class TokenizerSpacy:
         self._no_lines_in_para += 1
 
         if not self._para_lines:
-            self._line_type = dcr_core.core_glob.text_parser.parse_result_line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINE_TYPE]
+            self._line_type = self._parse_result_line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINE_TYPE]
 
-        self._para_lines.append(dcr_core.core_glob.text_parser.parse_result_line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TEXT])
+        self._para_lines.append(self._parse_result_line_line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TEXT])
 
     # ------------------------------------------------------------------
     # Process all sentences of a paragraph.
     # ------------------------------------------------------------------
     def _process_sents(self) -> None:
-        """Process all sentences of a paragraph."""
+        """Process all sentences of a paragraph.
+
+        The spaCy pipeline runs only once per paragraph - the tokens of
+        each sentence are taken directly from the sentence spans. In the
+        nlp.pipe mode the paragraph has already been processed in a batch.
+        """
         self._sent_no = 0
 
-        paragraph = self._nlp(self._para_text)
+        if self._para_docs is None:
+            paragraph = self._nlp(self._para_text)
+        else:
+            paragraph = next(self._para_docs)
 
         for sent in paragraph.sents:
             self._sentence = sent.text
+            self._sent_end = sent.end
+            self._sent_start = sent.start
+            self._sent_start_char = sent.start_char
 
             self._init_sent()
 
-            self._process_tokens()
+            self._process_tokens(sent)
 
             self._finish_sent()
 
@@ -722,13 +942,15 @@ class TokenizerSpacy:
     #     "tknWhitespace_": "xxx"
     # }
     # ------------------------------------------------------------------
-    def _process_tokens(self) -> None:
-        """Process all tokens of a sentence."""
-        self._token_no = 0
+    def _process_tokens(self, sent: spacy.tokens.Span) -> None:
+        """Process all tokens of a sentence.
 
-        sentence = self._nlp(self._sentence)
+        Args:
+            sent (spacy.tokens.Span): The sentence span of the paragraph.
+        """
+        self._token_no = 0
 
-        for token in sentence:
+        for token in sent:
             if (token_token := self._get_token_attributes(token)) != {}:
                 self._no_tokens_in_doc += 1
                 self._no_tokens_in_page += 1
@@ -747,6 +969,40 @@ class TokenizerSpacy:
         """
         return self._exist
 
+    # ------------------------------------------------------------------
+    # Get the number of tokens of the last processed document.
+    # ------------------------------------------------------------------
+    def get_no_tokens_in_doc(self) -> int:
+        """Get the number of tokens of the last processed document.
+
+        Returns:
+            int: The number of tokens, the ignored tokens excluded.
+        """
+        return self._no_tokens_in_doc
+
+    # ------------------------------------------------------------------
+    # Load a spaCy pipeline.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def load_pipeline(pipeline_name: str) -> spacy.Language:
+        """Load a spaCy pipeline.
+
+        Each pipeline is loaded only once per process and then
+        shared by all instances of this class, so that a worker
+        process can load it in advance.
+
+        Args:
+            pipeline_name (str): SpaCy pipeline name.
+
+        Returns:
+            spacy.Language: The loaded spaCy pipeline.
+        """
+        with TokenizerSpacy._pipelines_lock:
+            if pipeline_name not in TokenizerSpacy._pipelines:
+                TokenizerSpacy._pipelines[pipeline_name] = spacy.load(pipeline_name)
+
+            return TokenizerSpacy._pipelines[pipeline_name]
+
     # ------------------------------------------------------------------
     # Process a whole new document.
     # ------------------------------------------------------------------
@@ -783,6 +1039,7 @@ class TokenizerSpacy:
         dcr_core.core_utils.check_exists_object(
             is_setup=True,
             is_text_parser=True,
+            run_context=self._run_context,
         )
 
         self._document_id = document_id
@@ -793,29 +1050,52 @@ class TokenizerSpacy:
         self._no_lines_toc = no_lines_toc
 
         if pipeline_name != self._pipeline_name:
-            self._nlp = spacy.load(pipeline_name)
+            self._nlp = TokenizerSpacy.load_pipeline(pipeline_name)
             self._pipeline_name = pipeline_name
 
         self._processing_ok = False
 
+        self._compile_token_attributes()
+
         self._init_document()
 
-        # {
-        #   "pageNo": 99,
-        #   "noParagraphsInPage": 99,
-        #   "noLinesInPage": 99,
-        #   "lines": [...]
-        # }
-        for dcr_core.core_glob.text_parser.parse_result_line_page in dcr_core.core_glob.text_parser.parse_result_line_document[
-            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGES
-        ]:
-            self._page_no = dcr_core.core_glob.text_parser.parse_result_line_page[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGE_NO]
+        self._is_json_stream = self._run_context.setup.is_tokenize_2_jsonfile and self._run_context.setup.is_tokenize_2_jsonfile_stream
+        if self._run_context.setup.is_tokenize_2_jsonfile:
+            self.json_writer.open_document(self._file_name_next)
 
-            self._init_page()
-            self._process_page()
-            self._finish_page()
+        # An unfinished output file is deleted if the processing fails.
+        try:
+            # In the nlp.pipe mode all paragraphs of the document are streamed in
+            # batches through the spaCy pipeline and consumed in _process_sents.
+            if self._run_context.setup.is_spacy_pipe:
+                self._para_docs = iter(
+                    self._nlp.pipe(
+                        self._get_para_texts(),
+                        batch_size=self._run_context.setup.spacy_pipe_batch_size,
+                        n_process=self._run_context.setup.spacy_pipe_n_process,
+                    )
+                )
 
-        self._finish_document()
+            # {
+            #   "pageNo": 99,
+            #   "noParagraphsInPage": 99,
+            #   "noLinesInPage": 99,
+            #   "lines": [...]
+            # }
+            for self._parse_result_line_page in self._run_context.text_parser.parse_result_line_document[
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGES
+            ]:
+                self._page_no = self._parse_result_line_page[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGE_NO]
+
+                self._init_page()
+                self._process_page()
+                self._finish_page()
+
+            self._finish_document()
+        finally:
+            self.json_writer.close_document()
+
+            self._para_docs = None
 
         self._processing_ok = True
 
@@ -3,9 +3,19 @@
 # Version 2020.05, that can be found in the LICENSE file.
 
 """Module stub file."""
+import threading
+from collections.abc import Callable
+from collections.abc import Iterator
+from typing import ClassVar
+
 import spacy.tokens
 
+import dcr_core.cls_nlp_core
+import dcr_core.cls_run_context
+import dcr_core.cls_token_json_writer
+
 class TokenizerSpacy:
+    TokenAttrGetter = Callable[[spacy.tokens.Token], bool | float | int | str | None]
     TokenToken = dict[str, bool | float | int | str]
     TokenTokens = list[TokenToken]
     TokenSent = dict[str, float | int | None | str | TokenTokens]
@@ -15,8 +25,10 @@ class TokenizerSpacy:
     TokenPage = dict[str, int | TokenParas]
     TokenPages = list[TokenPage]
     TokenDocument = dict[str, int | TokenPages | str]
+    _pipelines: ClassVar[dict[str, spacy.Language]]
+    _pipelines_lock: ClassVar[threading.Lock]
 
-    def __init__(self) -> None:
+    def __init__(self, run_context: dcr_core.cls_run_context.RunContextProtocol | None = ...) -> None:
         self._column_no: int = 0
         self._column_span: int = 0
         self._coord_llx: float = 0.0
@@ -25,6 +37,7 @@ class TokenizerSpacy:
         self._exist: bool = False
         self._file_name_next: str = ""
         self._file_name_orig: str = ""
+        self._is_json_stream: bool = False
         self._line_type: str = ""
         self._nlp: spacy.Language = None
         self._no_lines_footer: int = 0
@@ -43,34 +56,53 @@ class TokenizerSpacy:
         self._no_tokens_in_para: int = 0
         self._no_tokens_in_sent: int = 0
         self._page_no: int = 0
+        self._para_docs: Iterator[spacy.tokens.Doc] | None = None
         self._para_lines: list[str] = []
         self._para_no: int = 0
         self._para_no_prev: int = 0
         self._para_text: str = ""
+        self._parse_result_line_line: dcr_core.cls_nlp_core.NLPCore.ParserLineLine = {}
+        self._parse_result_line_page: dcr_core.cls_nlp_core.NLPCore.ParserLinePage = {}
         self._pipeline_name: str = ""
         self._processing_ok: bool = False
         self._row_no: int = 0
+        self._run_context: dcr_core.cls_run_context.RunContextProtocol
+        self._sent_end: int = 0
         self._sent_no: int = 0
+        self._sent_start: int = 0
+        self._sent_start_char: int = 0
         self._sentence: str = ""
+        self._token_attr_extractors: list[tuple[str, TokenizerSpacy.TokenAttrGetter]] = []
+        self._token_ignore_mask: int = 0
         self._token_paras: TokenizerSpacy.TokenParas = []
         self._token_sents: TokenizerSpacy.TokenSents = []
         self._token_tokens: TokenizerSpacy.TokenTokens = []
+        self.json_writer: dcr_core.cls_token_json_writer.TokenJsonWriter
         self.token_pages: TokenizerSpacy.TokenPages = []
+    def _compile_token_attributes(self) -> None: ...
     def _finish_document(self) -> None: ...
     def _finish_page(self) -> None: ...
     def _finish_para(self) -> None: ...
     def _finish_sent(self) -> None: ...
+    def _get_para_texts(self) -> Iterator[str]: ...
+    def _get_token_attributes(self, token: spacy.tokens.Token) -> TokenToken: ...
     @staticmethod
-    def _get_token_attributes(token: spacy.tokens.Token) -> TokenToken: ...
+    def _get_token_tensor(token: spacy.tokens.Token) -> str | None: ...
+    def _get_token_text_with_ws(self, token: spacy.tokens.Token) -> str | None: ...
+    def _get_token_whitespace_(self, token: spacy.tokens.Token) -> str | None: ...
     def _init_document(self) -> None: ...
     def _init_page(self) -> None: ...
     def _init_para(self) -> None: ...
     def _init_sent(self) -> None: ...
+    def _is_line_type_ignored(self, line_type: str) -> bool: ...
     def _process_page(self) -> None: ...
     def _process_para(self) -> None: ...
     def _process_sents(self) -> None: ...
-    def _process_tokens(self) -> None: ...
+    def _process_tokens(self, sent: spacy.tokens.Span) -> None: ...
     def exists(self) -> bool: ...
+    def get_no_tokens_in_doc(self) -> int: ...
+    @staticmethod
+    def load_pipeline(pipeline_name: str) -> spacy.Language: ...
     def process_document(
         self,
         document_id: int,
@@ -5,6 +5,7 @@
 """Global constants and variables."""
 import logging
 import logging.config
+import os
 
 import yaml
 
@@ -75,6 +76,7 @@ line_type_table: dcr_core.cls_line_type_table.LineTypeTable
 line_type_toc: dcr_core.cls_line_type_toc.LineTypeToc
 
 logger: logging.Logger
+logger_cfg_key: tuple[str, float] = ("", 0.0)
 
 setup: dcr_core.cls_setup.Setup
 
@@ -86,13 +88,36 @@ tokenizer_spacy: dcr_core.cls_tokenizer_spacy.TokenizerSpacy
 # -----------------------------------------------------------------------------
 # Initialising the logging functionality.
 # -----------------------------------------------------------------------------
-def initialise_logger(logger_name="dcr_core") -> None:
-    """Initialise the root logging functionality."""
+def initialise_logger(logger_name: str = "dcr_core", is_reload: bool = False) -> None:
+    """Initialise the root logging functionality.
+
+    The logging configuration file is only read again if it has been
+    modified since the last call, if another logger is requested or if
+    a reload is explicitly requested.
+
+    The logger level is taken from the logging configuration file, so
+    that debug messages are neither formatted nor emitted unless the
+    level DEBUG is configured there. Defaults to INFO.
+
+    Args:
+        logger_name (str, optional): The logger name. Defaults to "dcr_core".
+        is_reload (bool, optional): Read the logging configuration file
+            again unconditionally. Defaults to False.
+    """
+    logger_cfg_key = (logger_name, os.path.getmtime(dcr_core.core_glob.LOGGER_CFG_FILE))
+
+    if not is_reload and logger_cfg_key == dcr_core.core_glob.logger_cfg_key and hasattr(dcr_core.core_glob, "logger"):
+        return
+
     with open(dcr_core.core_glob.LOGGER_CFG_FILE, "r", encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT) as file_handle:
         log_config = yaml.safe_load(file_handle.read())
 
     logging.config.dictConfig(log_config)
     dcr_core.core_glob.logger = logging.getLogger(logger_name)
-    dcr_core.core_glob.logger.setLevel(logging.DEBUG)
+
+    if dcr_core.core_glob.logger.level == logging.NOTSET:
+        dcr_core.core_glob.logger.setLevel(logging.INFO)
+
+    dcr_core.core_glob.logger_cfg_key = logger_cfg_key
 
     dcr_core.core_utils.progress_msg_core("The logger is configured and ready")
@@ -42,8 +42,9 @@ line_type_list_number: dcr_core.cls_line_type_list_number.LineTypeListNumber
 line_type_table: dcr_core.cls_line_type_table.LineTypeTable
 line_type_toc: dcr_core.cls_line_type_toc.LineTypeToc
 logger: logging.Logger
+logger_cfg_key: tuple[str, float]
 setup: dcr_core.cls_setup.Setup
 text_parser: dcr_core.cls_text_parser.TextParser
 tokenizer_spacy: dcr_core.cls_tokenizer_spacy.TokenizerSpacy
 
-def initialise_logger(logger_name: str = ...) -> None: ...
+def initialise_logger(logger_name: str = ..., is_reload: bool = ...) -> None: ...
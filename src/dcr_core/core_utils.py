@@ -3,6 +3,8 @@
 # Version 2020.05, that can be found in the LICENSE file.
 
 """Miscellaneous helper functions."""
+from __future__ import annotations
+
 import datetime
 import os
 import pathlib
@@ -31,6 +33,7 @@ def check_exists_object(  # noqa: C901
     is_line_type_toc: bool = False,
     is_setup: bool = False,
     is_text_parser: bool = False,
+    run_context: dcr_core.cls_run_context.RunContextProtocol | None = None,
 ) -> None:
     """Check the existence of objects.
 
@@ -56,10 +59,15 @@ def check_exists_object(  # noqa: C901
         is_text_parser (bool, optional): Check an object
             of class TextParser.
             Defaults to False.
+        run_context (RunContext, optional): The run context
+            containing the objects to be checked.
+            Defaults to the global variables in dcr_core.core_glob.
     """
+    objects = get_run_context(run_context)
+
     if is_line_type_header_footer:
         try:
-            dcr_core.core_glob.line_type_header_footer.exists()  # type: ignore
+            objects.line_type_header_footer.exists()  # type: ignore
         except AttributeError:
             terminate_fatal(
                 "The required instance of the class 'LineTypeHeadersFooters' does not yet exist.",
@@ -67,7 +75,7 @@ def check_exists_object(  # noqa: C901
 
     if is_line_type_list_bullet:
         try:
-            dcr_core.core_glob.line_type_list_bullet.exists()  # type: ignore
+            objects.line_type_list_bullet.exists()  # type: ignore
         except AttributeError:
             terminate_fatal(
                 "The required instance of the class 'LineTypeListBullet' does not yet exist.",
@@ -75,7 +83,7 @@ def check_exists_object(  # noqa: C901
 
     if is_line_type_list_number:
         try:
-            dcr_core.core_glob.line_type_list_number.exists()  # type: ignore
+            objects.line_type_list_number.exists()  # type: ignore
         except AttributeError:
             terminate_fatal(
                 "The required instance of the class 'LineTypeListNumber' does not yet exist.",
@@ -83,7 +91,7 @@ def check_exists_object(  # noqa: C901
 
     if is_line_type_table:
         try:
-            dcr_core.core_glob.line_type_table.exists()  # type: ignore
+            objects.line_type_table.exists()  # type: ignore
         except AttributeError:
             terminate_fatal(
                 "The required instance of the class 'LineTypeTable' does not yet exist.",
@@ -91,7 +99,7 @@ def check_exists_object(  # noqa: C901
 
     if is_line_type_toc:
         try:
-            dcr_core.core_glob.line_type_toc.exists()  # type: ignore
+            objects.line_type_toc.exists()  # type: ignore
         except AttributeError:
             terminate_fatal(
                 "The required instance of the class 'LineTypeToc' does not yet exist.",
@@ -99,7 +107,7 @@ def check_exists_object(  # noqa: C901
 
     if is_setup:
         try:
-            dcr_core.core_glob.setup.exists()  # type: ignore
+            objects.setup.exists()  # type: ignore
         except AttributeError:
             terminate_fatal(
                 "The required instance of the class 'Setup' does not yet exist.",
@@ -107,7 +115,7 @@ def check_exists_object(  # noqa: C901
 
     if is_text_parser:
         try:
-            dcr_core.core_glob.text_parser.exists()
+            objects.text_parser.exists()
         except AttributeError:
             terminate_fatal(
                 "The required instance of the class 'TextParser' does not yet exist.",
@@ -191,6 +199,28 @@ def get_full_name_from_components(
     return get_os_independent_name(str(os.path.join(directory_name_int, file_name_int)))
 
 
+# ------------------------------------------------------------------
+# Determine the run context.
+# ------------------------------------------------------------------
+def get_run_context(run_context: dcr_core.cls_run_context.RunContextProtocol | None) -> dcr_core.cls_run_context.RunContextProtocol:
+    """Determine the run context.
+
+    Without an explicit run context the global variables in
+    dcr_core.core_glob are used - they provide the same objects
+    as a run context, but are shared by all runs in the process.
+
+    Args:
+        run_context (RunContextProtocol | None): The run context or None.
+
+    Returns:
+        RunContextProtocol: The run context to be used.
+    """
+    if run_context is not None:
+        return run_context
+
+    return dcr_core.core_glob
+
+
 # ------------------------------------------------------------------
 # Get the platform-independent name.
 # ------------------------------------------------------------------
@@ -236,27 +266,33 @@ def get_stem_name(file_name: pathlib.Path | str | None) -> str:
 # ------------------------------------------------------------------
 # Create a progress message.
 # ------------------------------------------------------------------
-def progress_msg(is_verbose: bool, msg: str) -> None:
+def progress_msg(is_verbose: bool, msg: str, *args: object) -> None:
     """Create a progress message.
 
+    Like with the logging functionality, the arguments are only merged
+    into the message if the message is actually reported, so that a
+    suppressed message does not cost any formatting.
+
     Args:
         is_verbose (bool): If true, processing results are reported.
-        msg (str): Progress message.
+        msg (str): Progress message, optionally with '%' placeholders.
+        *args (object): Arguments merged into the placeholders of the message.
     """
     if is_verbose:
-        progress_msg_core(msg)
+        progress_msg_core(msg, *args)
 
 
 # ------------------------------------------------------------------
 # Create a progress message.
 # ------------------------------------------------------------------
-def progress_msg_core(msg: str) -> None:
+def progress_msg_core(msg: str, *args: object) -> None:
     """Create a progress message.
 
     Args:
-        msg (str): Progress message.
+        msg (str): Progress message, optionally with '%' placeholders.
+        *args (object): Arguments merged into the placeholders of the message.
     """
-    final_msg = dcr_core.core_glob.LOGGER_PROGRESS_UPDATE + str(datetime.datetime.now()) + " : " + msg + "."
+    final_msg = dcr_core.core_glob.LOGGER_PROGRESS_UPDATE + str(datetime.datetime.now()) + " : " + (msg % args if args else msg) + "."
 
     print(final_msg)
 
@@ -5,6 +5,8 @@
 """Module stub file."""
 import pathlib
 
+import dcr_core.cls_run_context
+
 def check_exists_object(
     is_line_type_header_footer: bool = False,
     is_line_type_list_bullet: bool = False,
@@ -13,13 +15,15 @@ def check_exists_object(
     is_line_type_toc: bool = False,
     is_setup: bool = False,
     is_text_parser: bool = False,
+    run_context: dcr_core.cls_run_context.RunContextProtocol | None = ...,
 ) -> None: ...
 def get_components_from_full_name(
     full_name: str,
 ) -> tuple[str, str, str]: ...
 def get_full_name_from_components(directory_name: pathlib.Path | str, stem_name: str = "", file_extension: str = "") -> str: ...
 def get_os_independent_name(name: pathlib.Path | str | None) -> str: ...
+def get_run_context(run_context: dcr_core.cls_run_context.RunContextProtocol | None) -> dcr_core.cls_run_context.RunContextProtocol: ...
 def get_stem_name(file_name: pathlib.Path | str | None) -> str: ...
-def progress_msg(is_verbose: bool, msg: str) -> None: ...
-def progress_msg_core(msg: str) -> None: ...
+def progress_msg(is_verbose: bool, msg: str, *args: object) -> None: ...
+def progress_msg_core(msg: str, *args: object) -> None: ...
 def terminate_fatal(error_msg: str) -> None: ...
@@ -0,0 +1,89 @@
+"""Testing Class DocumentMetrics."""
+import json
+import os
+
+import dcr_core.cls_document_metrics
+import dcr_core.cls_nlp_core
+import dcr_core.core_glob
+import dcr_core.core_utils
+
+# -----------------------------------------------------------------------------
+# Constants & Globals.
+# -----------------------------------------------------------------------------
+# @pytest.mark.issue
+
+
+# -----------------------------------------------------------------------------
+# Test Cases DocumentMetrics - Coverage.
+# -----------------------------------------------------------------------------
+def test(tmp_path):
+    """Test Cases DocumentMetrics - Coverage."""
+    # -------------------------------------------------------------------------
+    instance = dcr_core.cls_document_metrics.DocumentMetrics(document_id=1, full_name_orig="test.pdf")
+
+    instance.exists()
+
+    full_name_in = dcr_core.core_utils.get_full_name_from_components(tmp_path, "test.pdf")
+    full_name_out = dcr_core.core_utils.get_full_name_from_components(tmp_path, "test.line_token.json")
+
+    with open(full_name_in, "wb") as file_handle:
+        file_handle.write(b"x" * 100)
+
+    with open(full_name_out, "wb") as file_handle:
+        file_handle.write(b"x" * 200)
+
+    # -------------------------------------------------------------------------
+    instance.start_stage(dcr_core.cls_document_metrics.DocumentMetrics.STAGE_PARSER, [full_name_in, "missing.xml"], bytes_in=10)
+    instance.end_stage(dcr_core.cls_document_metrics.DocumentMetrics.STAGE_PARSER, no_lines=3, no_pages=1, no_paras=2)
+
+    instance.start_stage(dcr_core.cls_document_metrics.DocumentMetrics.STAGE_TOKENIZER)
+    instance.end_stage(dcr_core.cls_document_metrics.DocumentMetrics.STAGE_TOKENIZER, [full_name_out], no_tokens=12)
+
+    # Not ended because of an error.
+    instance.start_stage(dcr_core.cls_document_metrics.DocumentMetrics.STAGE_CACHE)
+
+    instance.finish(dcr_core.cls_document_metrics.DocumentMetrics.STATUS_ERROR)
+
+    data = instance.to_dict()
+
+    assert data[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_DOC_ID] == 1, "document id"
+    assert data[dcr_core.cls_document_metrics.DocumentMetrics.JSON_NAME_STATUS] == "error", "status"
+    assert data[dcr_core.cls_document_metrics.DocumentMetrics.JSON_NAME_WALL_TIME] >= 0.0, "wall time"
+
+    stages = data[dcr_core.cls_document_metrics.DocumentMetrics.JSON_NAME_STAGES]
+
+    assert [stage[dcr_core.cls_document_metrics.DocumentMetrics.JSON_NAME_STAGE] for stage in stages] == [
+        "parser",
+        "tokenizer",
+        "cache",
+    ], "stages in processing order"
+    assert stages[0][dcr_core.cls_document_metrics.DocumentMetrics.JSON_NAME_BYTES_IN] == 110, "bytes in"
+    assert stages[0][dcr_core.cls_document_metrics.DocumentMetrics.JSON_NAME_NO_LINES] == 3, "lines"
+    assert stages[0][dcr_core.cls_document_metrics.DocumentMetrics.JSON_NAME_NO_PARAS] == 2, "paragraphs"
+    assert stages[1][dcr_core.cls_document_metrics.DocumentMetrics.JSON_NAME_BYTES_OUT] == 200, "bytes out"
+    assert stages[1][dcr_core.cls_document_metrics.DocumentMetrics.JSON_NAME_NO_TOKENS] == 12, "tokens"
+    assert stages[2][dcr_core.cls_document_metrics.DocumentMetrics.JSON_NAME_WALL_TIME] >= 0.0, "stage ended by finish"
+
+    # -------------------------------------------------------------------------
+    full_name_jsonl = dcr_core.core_utils.get_full_name_from_components(tmp_path, "metrics.jsonl")
+
+    instance.write_jsonl(full_name_jsonl)
+    instance.write_jsonl(full_name_jsonl)
+
+    with open(full_name_jsonl, "r", encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT) as file_handle:
+        lines = file_handle.readlines()
+
+    assert len(lines) == 2, "JSONL - appended"
+    assert json.loads(lines[1]) == data, "JSONL - content"
+
+    # -------------------------------------------------------------------------
+    full_name_prom = dcr_core.core_utils.get_full_name_from_components(tmp_path, "metrics.prom")
+
+    instance.write_prometheus(full_name_prom)
+
+    with open(full_name_prom, "r", encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT) as file_handle:
+        text = file_handle.read()
+
+    assert 'dcr_core_stage_tokens{stage="tokenizer"} 12\n' in text, "Prometheus - stage metric"
+    assert 'dcr_core_document_wall_seconds{status="error"} ' in text, "Prometheus - document metric"
+    assert [file_name for file_name in os.listdir(tmp_path) if file_name.endswith(".tmp")] == [], "temporary files"
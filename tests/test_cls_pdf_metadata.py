@@ -0,0 +1,55 @@
+"""Testing Class PdfMetadata."""
+
+import os
+import shutil
+
+import pytest
+
+import dcr_core.cls_pdf_metadata
+import dcr_core.core_utils
+
+# -----------------------------------------------------------------------------
+# Constants & Globals.
+# -----------------------------------------------------------------------------
+# @pytest.mark.issue
+
+FILE_NAME_PDF_IMAGE = "case_5_pdf_image_large_route_inbox_pdf2image_tesseract_pypdf2_pdflib.pdf"
+FILE_NAME_PDF_TEXT = "case_3_pdf_text_route_inbox_pdflib.pdf"
+
+
+# -----------------------------------------------------------------------------
+# Test Cases PdfMetadata - Coverage.
+# -----------------------------------------------------------------------------
+def test(tmp_path):
+    """Test Cases PdfMetadata - Coverage."""
+    # -------------------------------------------------------------------------
+    full_name = dcr_core.core_utils.get_full_name_from_components(tmp_path, FILE_NAME_PDF_TEXT)
+    shutil.copy(
+        dcr_core.core_utils.get_full_name_from_components(pytest.helpers.get_test_files_source_directory_name(), FILE_NAME_PDF_TEXT),
+        full_name,
+    )
+
+    instance = dcr_core.cls_pdf_metadata.PdfMetadata.get(full_name)
+
+    instance.exists()
+
+    assert instance.no_pages == 3, "no_pages"
+    assert instance.file_size == os.path.getsize(full_name), "file_size"
+    assert len(instance.get_content_hash()) == 64, "content_hash"
+
+    # -------------------------------------------------------------------------
+    assert instance.get_text_layer_map() == [True, None, None], "text_layer_map - early exit"
+    assert instance.get_text_layer_map(is_complete=True) == [True, True, True], "text_layer_map - complete"
+
+    # -------------------------------------------------------------------------
+    assert dcr_core.cls_pdf_metadata.PdfMetadata.get(full_name) is instance, "cached instance"
+
+    shutil.copy(
+        dcr_core.core_utils.get_full_name_from_components(pytest.helpers.get_test_files_source_directory_name(), FILE_NAME_PDF_IMAGE),
+        full_name,
+    )
+
+    instance = dcr_core.cls_pdf_metadata.PdfMetadata.get(full_name)
+
+    assert instance.no_pages == 2, "changed file - no_pages"
+    assert instance.get_text_layer_map() == [False, False], "changed file - text_layer_map"
@@ -0,0 +1,100 @@
+"""Testing Class ResultCache."""
+import os
+import time
+
+import dcr_core.cls_result_cache
+import dcr_core.core_glob
+import dcr_core.core_utils
+
+# -----------------------------------------------------------------------------
+# Constants & Globals.
+# -----------------------------------------------------------------------------
+# @pytest.mark.issue
+
+
+# -----------------------------------------------------------------------------
+# Test Cases ResultCache - Coverage.
+# -----------------------------------------------------------------------------
+def test(tmp_path):
+    """Test Cases ResultCache - Coverage."""
+    # -------------------------------------------------------------------------
+    instance = dcr_core.cls_result_cache.ResultCache(dcr_core.core_utils.get_full_name_from_components(tmp_path, "cache"))
+
+    instance.exists()
+
+    # -------------------------------------------------------------------------
+    full_name_in_1 = dcr_core.core_utils.get_full_name_from_components(tmp_path, "test_1.html")
+    full_name_in_2 = dcr_core.core_utils.get_full_name_from_components(tmp_path, "test_2.html")
+    full_name_out = dcr_core.core_utils.get_full_name_from_components(tmp_path, "test.pdf")
+
+    for full_name_in in (full_name_in_1, full_name_in_2):
+        with open(full_name_in, "w", encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT) as file_handle:
+            file_handle.write("<p>Test</p>")
+
+    key = dcr_core.cls_result_cache.ResultCache.get_key(full_name_in_1, "en")
+
+    assert len(key) == 64, "key length"
+    assert dcr_core.cls_result_cache.ResultCache.get_key(full_name_in_2, "en") == key, "identical content"
+    assert dcr_core.cls_result_cache.ResultCache.get_key(full_name_in_1, "de") != key, "different variant"
+
+    # -------------------------------------------------------------------------
+    assert not instance.get(key, full_name_out), "cache miss"
+    assert not os.path.exists(full_name_out), "cache miss - no output file"
+
+    with open(full_name_out, "wb") as file_handle:
+        file_handle.write(b"%PDF-1.7")
+
+    instance.put(key, full_name_out)
+
+    os.remove(full_name_out)
+
+    assert instance.get(key, full_name_out), "cache hit"
+
+    with open(full_name_out, "rb") as file_handle:
+        assert file_handle.read() == b"%PDF-1.7", "cache hit - content"
+
+    assert [file_name for file_name in os.listdir(tmp_path) if file_name.endswith(".tmp")] == [], "temporary files"
+
+
+# -----------------------------------------------------------------------------
+# Test Cases ResultCache - Eviction.
+# -----------------------------------------------------------------------------
+def test_evict(tmp_path):
+    """Test Cases ResultCache - Eviction."""
+    # -------------------------------------------------------------------------
+    instance = dcr_core.cls_result_cache.ResultCache(dcr_core.core_utils.get_full_name_from_components(tmp_path, "cache"))
+
+    full_name = dcr_core.core_utils.get_full_name_from_components(tmp_path, "test.line_token.json")
+
+    with open(full_name, "wb") as file_handle:
+        file_handle.write(b"x" * 1000 * 1000)
+
+    for key in ("a" * 64, "b" * 64, "c" * 64):
+        instance.put(key, full_name, ".line_token.json")
+        instance.put_json(key, ".manifest.json", {"files": [".line_token.json"]})
+
+    assert instance.get_json("a" * 64, ".manifest.json") == {"files": [".line_token.json"]}, "manifest"
+    assert instance.get_json("d" * 64, ".manifest.json") is None, "manifest - cache miss"
+
+    # -------------------------------------------------------------------------
+    time_old = time.time() - 10 * 86400
+
+    os.utime(instance._get_full_name_entry("a" * 64, ".line_token.json"), (time_old, time_old))
+    os.utime(instance._get_full_name_entry("a" * 64, ".manifest.json"), (time_old, time_old))
+    os.utime(instance._get_full_name_entry("b" * 64, ".line_token.json"), (time_old, time_old))
+
+    assert instance.evict(max_age=0, max_size=0) == 0, "no limits"
+    assert instance.evict(max_age=30, max_size=0) == 0, "age limit not reached"
+    assert instance.evict(max_age=5, max_size=0) == 1, "age limit"
+    assert not instance.contains("a" * 64, ".line_token.json"), "age limit - evicted"
+    assert not instance.contains("a" * 64, ".manifest.json"), "age limit - evicted with all files"
+    assert instance.contains("b" * 64, ".line_token.json"), "age limit - entry with a recently used file kept"
+
+    # -------------------------------------------------------------------------
+    assert instance.get("b" * 64, full_name, ".line_token.json"), "recently used"
+
+    assert instance.evict(max_age=0, max_size=1) == 1, "size limit"
+    assert not instance.contains("c" * 64, ".line_token.json"), "size limit - least recently used evicted"
+    assert not instance.contains("c" * 64, ".manifest.json"), "size limit - evicted with all files"
+    assert instance.contains("b" * 64, ".line_token.json"), "size limit - recently used kept"
+    assert instance.contains("b" * 64, ".manifest.json"), "size limit - recently used kept with all files"
@@ -0,0 +1,155 @@
+"""Testing Class TextParser."""
+import dcr_core.cls_nlp_core
+import dcr_core.cls_run_context
+import dcr_core.cls_text_parser
+
+# -----------------------------------------------------------------------------
+# Constants & Globals.
+# -----------------------------------------------------------------------------
+# @pytest.mark.issue
+
+RESOLUTION = 144.0
+
+
+# -----------------------------------------------------------------------------
+# Create the Tesseract OCR TSV data of a page.
+# -----------------------------------------------------------------------------
+def _get_tsv_data(lines: list[tuple[int, int, int, list[str]]]) -> dict[str, list[float | int | str]]:
+    tsv_data: dict[str, list[float | int | str]] = {
+        "block_num": [],
+        "conf": [],
+        "height": [],
+        "left": [],
+        "line_num": [],
+        "par_num": [],
+        "text": [],
+        "top": [],
+        "width": [],
+    }
+
+    for block_num, par_num, line_num, words in lines:
+        for word_no, word in enumerate(words):
+            tsv_data["block_num"].append(block_num)
+            tsv_data["conf"].append(90.0 if word.strip() else -1)
+            tsv_data["height"].append(20)
+            tsv_data["left"].append(144 + word_no * 144)
+            tsv_data["line_num"].append(line_num)
+            tsv_data["par_num"].append(par_num)
+            tsv_data["text"].append(word)
+            tsv_data["top"].append(100 * line_num)
+            tsv_data["width"].append(72)
+
+    return tsv_data
+
+
+# -----------------------------------------------------------------------------
+# Test Cases TextParser - Tesseract OCR TSV data.
+# -----------------------------------------------------------------------------
+def test_parse_tesseract_tsv():
+    """Test Cases TextParser - Tesseract OCR TSV data."""
+    # -------------------------------------------------------------------------
+    run_context = dcr_core.cls_run_context.RunContext()
+
+    run_context.setup.is_parsing_line = True
+    run_context.setup.is_parsing_page = False
+    run_context.setup.is_parsing_word = False
+
+    run_context.text_parser = dcr_core.cls_text_parser.TextParser(run_context=run_context)
+
+    instance = run_context.text_parser
+
+    instance.exists()
+
+    # -------------------------------------------------------------------------
+    instance.parse_tesseract_tsv(
+        directory_name="",
+        document_id=1,
+        environment_variant="test",
+        file_name_curr="scan_0.pdf",
+        file_name_next="",
+        file_name_orig="scan.pdf",
+        tesseract_pages=[
+            (
+                _get_tsv_data(
+                    [
+                        (1, 1, 1, ["First", "line", ""]),
+                        (1, 1, 2, ["Second", "line"]),
+                        (1, 2, 1, ["Third", "line"]),
+                    ]
+                ),
+                RESOLUTION,
+            ),
+            (_get_tsv_data([(1, 1, 1, [" "])]), RESOLUTION),
+        ],
+    )
+
+    line_pages = instance.parse_result_line_pages
+
+    assert len(line_pages) == 2, "no pages"
+
+    lines = line_pages[0][dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINES]
+
+    assert [line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TEXT] for line in lines] == [
+        "First line",
+        "Second line",
+        "Third line",
+    ], "line texts"
+    assert [line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PARA_NO] for line in lines] == [1, 1, 2], "paragraph numbers"
+    assert lines[0][dcr_core.cls_nlp_core.NLPCore.JSON_NAME_COORD_LLX] == 72.0, "coordinate llx"
+    assert lines[0][dcr_core.cls_nlp_core.NLPCore.JSON_NAME_COORD_URX] == 180.0, "coordinate urx"
+
+    assert line_pages[1][dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINES] == [], "empty page"
+
+
+# -----------------------------------------------------------------------------
+# Test Cases TextParser - Pandoc AST.
+# -----------------------------------------------------------------------------
+def test_parse_pandoc_json(tmp_path):
+    """Test Cases TextParser - Pandoc AST."""
+    # -------------------------------------------------------------------------
+    run_context = dcr_core.cls_run_context.RunContext()
+
+    run_context.setup.is_parsing_line = True
+    run_context.setup.is_parsing_page = False
+    run_context.setup.is_parsing_word = False
+
+    run_context.text_parser = dcr_core.cls_text_parser.TextParser(run_context=run_context)
+
+    instance = run_context.text_parser
+
+    # -------------------------------------------------------------------------
+    instance.parse_pandoc_json(
+        directory_name=str(tmp_path),
+        document_id=1,
+        environment_variant="test",
+        file_name_curr="test.html",
+        file_name_next="",
+        file_name_orig="test.html",
+        pandoc_ast={
+            "blocks": [
+                {"t": "Header", "c": [1, ["", [], []], [{"t": "Str", "c": "Title"}]]},
+                {"t": "Para", "c": [{"t": "Str", "c": "First"}, {"t": "Space"}, {"t": "Str", "c": "paragraph"}]},
+                {
+                    "t": "BulletList",
+                    "c": [
+                        [{"t": "Plain", "c": [{"t": "Str", "c": "one"}]}],
+                        [{"t": "Plain", "c": [{"t": "Str", "c": "two"}]}],
+                    ],
+                },
+            ]
+        },
+    )
+
+    line_pages = instance.parse_result_line_pages
+
+    assert len(line_pages) == 1, "no pages"
+
+    lines = line_pages[0][dcr_core.cls_nlp_core.NLPCore.JSON_NAME_LINES]
+
+    assert [line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TEXT] for line in lines] == [
+        "Title",
+        "First paragraph",
+        "• one",
+        "• two",
+    ], "line texts"
+    assert [line[dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PARA_NO] for line in lines] == [1, 2, 3, 4], "paragraph numbers"
@@ -0,0 +1,182 @@
+"""Testing Class TokenJsonWriter."""
+import json
+import os
+
+import pytest
+
+import dcr_core.cls_nlp_core
+import dcr_core.cls_setup
+import dcr_core.cls_token_json_writer
+
+# -----------------------------------------------------------------------------
+# Constants & Globals.
+# -----------------------------------------------------------------------------
+# @pytest.mark.issue
+
+TOKEN_PAGES = [
+    {
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGE_NO: page_no,
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PARAS: [
+            {
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PARA_NO: 1,
+                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_SENTS: [
+                    {
+                        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_SENT_NO: 1,
+                        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TEXT: "Ä text.",
+                        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKENS: [
+                            {
+                                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_I: 0,
+                                dcr_core.cls_nlp_core.NLPCore.JSON_NAME_TOKEN_TEXT: "Ä",
+                            },
+                        ],
+                    },
+                ],
+            },
+        ],
+    }
+    for page_no in (1, 2)
+]
+
+
+# -----------------------------------------------------------------------------
+# Write a document and load it back with the original JSON names.
+# -----------------------------------------------------------------------------
+def _write_and_load(full_name: str) -> dict:
+    instance = dcr_core.cls_token_json_writer.TokenJsonWriter()
+
+    instance.open_document(full_name)
+
+    for token_page in TOKEN_PAGES:
+        instance.write_page(token_page)
+
+    instance.write_document(
+        {
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_DOC_ID: 4711,
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_PAGES_IN_DOC: len(TOKEN_PAGES),
+            dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGES: TOKEN_PAGES,
+        }
+    )
+
+    with open(full_name, "r", encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT) as file_handle:
+        json_data = json.load(file_handle)
+
+    if dcr_core.core_glob.setup.is_tokenize_2_jsonfile_short_keys:
+        long_keys = {short_key: json_name for json_name, short_key in dcr_core.cls_token_json_writer.TokenJsonWriter.SHORT_KEYS.items()}
+
+        def _lengthen_keys(data):
+            if isinstance(data, dict):
+                return {long_keys.get(key, key): _lengthen_keys(value) for key, value in data.items()}
+            if isinstance(data, list):
+                return [_lengthen_keys(value) for value in data]
+            return data
+
+        json_data = _lengthen_keys(json_data)
+
+    return json_data
+
+
+# -----------------------------------------------------------------------------
+# Test Cases TokenJsonWriter - Coverage.
+# -----------------------------------------------------------------------------
+def test():
+    """Test Cases TokenJsonWriter - Coverage."""
+    # -------------------------------------------------------------------------
+    try:
+        del dcr_core.core_glob.setup
+    except (AttributeError, NameError):
+        pass
+
+    with pytest.raises(SystemExit) as expt:
+        dcr_core.cls_token_json_writer.TokenJsonWriter()
+
+    assert expt.type == SystemExit, "Instance of Setup is missing"
+    assert expt.value.code == 1, "Instance of Setup is missing"
+
+    dcr_core.core_glob.setup = dcr_core.cls_setup.Setup()
+
+    # -------------------------------------------------------------------------
+    instance = dcr_core.cls_token_json_writer.TokenJsonWriter()
+
+    instance.exists()
+
+    # -------------------------------------------------------------------------
+    assert len(set(dcr_core.cls_token_json_writer.TokenJsonWriter.SHORT_KEYS.values())) == len(
+        dcr_core.cls_token_json_writer.TokenJsonWriter.SHORT_KEYS
+    ), "short keys not unique"
+
+
+# -----------------------------------------------------------------------------
+# Test Cases TokenJsonWriter - output variants.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("is_compact", [False, True])
+@pytest.mark.parametrize("is_short_keys", [False, True])
+@pytest.mark.parametrize("is_stream", [False, True])
+@pytest.mark.parametrize("encoder", [dcr_core.cls_setup.Setup.JSON_ENCODER_JSON, dcr_core.cls_setup.Setup.JSON_ENCODER_ORJSON])
+def test_variants(encoder: str, is_compact: bool, is_short_keys: bool, is_stream: bool, tmp_path):
+    """Test Cases TokenJsonWriter - output variants."""
+    if encoder == dcr_core.cls_setup.Setup.JSON_ENCODER_ORJSON:
+        pytest.importorskip("orjson")
+
+    dcr_core.core_glob.setup = dcr_core.cls_setup.Setup()
+
+    dcr_core.core_glob.setup.is_tokenize_2_jsonfile_compact = is_compact
+    dcr_core.core_glob.setup.is_tokenize_2_jsonfile_short_keys = is_short_keys
+    dcr_core.core_glob.setup.is_tokenize_2_jsonfile_stream = is_stream
+    dcr_core.core_glob.setup.tokenize_2_jsonfile_encoder = encoder
+
+    full_name = os.path.join(tmp_path, "test.line_token.json")
+
+    json_data = _write_and_load(full_name)
+
+    assert json_data == {
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_DOC_ID: 4711,
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_NO_PAGES_IN_DOC: len(TOKEN_PAGES),
+        dcr_core.cls_nlp_core.NLPCore.JSON_NAME_PAGES: TOKEN_PAGES,
+    }, f"encoder={encoder} compact={is_compact} short_keys={is_short_keys} stream={is_stream}"
+
+    assert dcr_core.cls_token_json_writer.TokenJsonWriter().load_document(full_name) == json_data, "load the document with the JSON names"
+
+    if is_compact:
+        with open(full_name, "r", encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT) as file_handle:
+            assert "\n" not in file_handle.read(), "compact file contains line feeds"
+
+
+# -----------------------------------------------------------------------------
+# Test Cases TokenJsonWriter - unfinished document.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("is_stream", [False, True])
+def test_close_document(is_stream: bool, tmp_path):
+    """Test Cases TokenJsonWriter - unfinished document."""
+    dcr_core.core_glob.setup = dcr_core.cls_setup.Setup()
+
+    dcr_core.core_glob.setup.is_tokenize_2_jsonfile_stream = is_stream
+
+    full_name = os.path.join(tmp_path, "test.line_token.json")
+
+    json_data = _write_and_load(full_name)
+
+    # -------------------------------------------------------------------------
+    instance = dcr_core.cls_token_json_writer.TokenJsonWriter()
+
+    instance.open_document(full_name)
+
+    instance.write_page(TOKEN_PAGES[0])
+
+    instance.close_document()
+
+    assert os.listdir(tmp_path) == ["test.line_token.json"], "unfinished output file not deleted"
+
+    with open(full_name, "r", encoding=dcr_core.core_glob.FILE_ENCODING_DEFAULT) as file_handle:
+        assert json.load(file_handle) == json_data, "previous output file changed"
+
+    # -------------------------------------------------------------------------
+    instance.open_document(full_name)
+
+    for token_page in TOKEN_PAGES:
+        instance.write_page(token_page)
+
+    instance.write_document(json_data)
+
+    instance.close_document()
+
+    assert os.listdir(tmp_path) == ["test.line_token.json"], "finished output file deleted"
@@ -0,0 +1,57 @@
+# pylint: disable=unused-argument
+"""Testing Standard Cases."""
+import pytest
+
+import dcr_core.cls_process
+
+# -----------------------------------------------------------------------------
+# Constants & Globals.
+# -----------------------------------------------------------------------------
+# @pytest.mark.issue
+
+
+# -----------------------------------------------------------------------------
+# Test Cases 3 and 7 as a batch.
+# -----------------------------------------------------------------------------
+def test(fxtr_setup_empty_inbox):
+    """Test Cases 3 and 7 as a batch."""
+    # -------------------------------------------------------------------------
+    directory_name = dcr_core.core_glob.setup.directory_inbox
+
+    pytest.helpers.copy_files_4_pytest_2_dir(
+        source_files=[
+            ("case_3_pdf_text_route_inbox_pdflib", "pdf"),
+            ("case_7_cfg_wrong_extension", "cfg"),
+        ],
+        target_path=directory_name,
+    )
+
+    full_name_case_3 = dcr_core.core_utils.get_full_name_from_components(directory_name, "case_3_pdf_text_route_inbox_pdflib", "pdf")
+    full_name_case_7 = dcr_core.core_utils.get_full_name_from_components(directory_name, "case_7_cfg_wrong_extension", "cfg")
+
+    # -------------------------------------------------------------------------
+    results = dcr_core.cls_process.Process.documents(
+        [full_name_case_3, full_name_case_7],
+        max_workers=2,
+        is_delete_auxiliary_files=True,
+    )
+
+    assert len(results) == 2, "Number of batch results"
+
+    assert results[0] == (full_name_case_3, "ok", ""), f"Batch result - file={full_name_case_3}"
+
+    assert results[1][0] == full_name_case_7, f"Batch result - file={full_name_case_7}"
+    assert results[1][1] == "01.901", f"Unknown file extension - file={full_name_case_7}"
+
+    # -------------------------------------------------------------------------
+    pytest.helpers.verify_created_files(
+        directory_name,
+        [
+            "case_3_pdf_text_route_inbox_pdflib.line_list_number.json",
+            "case_3_pdf_text_route_inbox_pdflib.line_token.json",
+            "case_3_pdf_text_route_inbox_pdflib.page.json",
+            "case_3_pdf_text_route_inbox_pdflib.pdf",
+            "case_3_pdf_text_route_inbox_pdflib.word.json",
+            "case_7_cfg_wrong_extension.cfg",
+        ],
+    )
@@ -0,0 +1,98 @@
+# pylint: disable=unused-argument
+"""Testing Standard Cases."""
+import os
+import shutil
+
+import pytest
+
+import dcr_core.cls_process
+
+# -----------------------------------------------------------------------------
+# Constants & Globals.
+# -----------------------------------------------------------------------------
+# @pytest.mark.issue
+
+
+# -----------------------------------------------------------------------------
+# Test Cases Pandoc batch - identical content and errors per file.
+# -----------------------------------------------------------------------------
+def test(fxtr_setup_empty_inbox, monkeypatch):
+    """Test Cases Pandoc batch - identical content and errors per file."""
+    # -------------------------------------------------------------------------
+    directory_name = dcr_core.core_glob.setup.directory_inbox
+
+    pytest.helpers.copy_files_4_pytest(
+        [
+            (("case_2_docx_route_inbox_pandoc_pdflib", "docx"), (directory_name, ["case_2_docx_route_inbox_pandoc_pdflib"], "docx")),
+            (("case_2_docx_route_inbox_pandoc_pdflib", "docx"), (directory_name, ["case_2_docx_copy"], "docx")),
+            (("docx_heading", "docx"), (directory_name, ["docx_heading"], "docx")),
+            (("docx_table", "docx"), (directory_name, ["docx_table"], "docx")),
+        ]
+    )
+
+    full_names = [
+        (
+            dcr_core.core_utils.get_full_name_from_components(directory_name, stem_name, "docx"),
+            dcr_core.core_utils.get_full_name_from_components(directory_name, stem_name, "pdf"),
+        )
+        for stem_name in (
+            "case_2_docx_route_inbox_pandoc_pdflib",
+            "case_2_docx_copy",
+            "docx_heading",
+            "docx_missing",
+            "docx_table",
+        )
+    ]
+
+    converted = []
+
+    def _pandoc(full_name_in, full_name_out, language_pandoc, run_context=None):
+        converted.append(full_name_in)
+
+        if full_name_in == full_names[2][0]:
+            raise OSError("pandoc not found")
+
+        shutil.copyfile(full_name_in, full_name_out)
+
+        return dcr_core.core_glob.RETURN_OK
+
+    monkeypatch.setattr(dcr_core.cls_process.Process, "pandoc", _pandoc)
+
+    # -------------------------------------------------------------------------
+    results = dcr_core.cls_process.Process.pandoc_batch(full_names, "english", max_workers=2)
+
+    assert len(results) == len(full_names), "Number of batch results"
+
+    assert sorted(converted) == sorted([full_names[0][0], full_names[2][0], full_names[4][0]]), "Identical content converted once"
+
+    assert results[0] == (full_names[0][0], "ok", ""), f"Batch result - file={full_names[0][0]}"
+    assert results[1] == (full_names[1][0], "ok", ""), f"Copied result - file={full_names[1][0]}"
+    assert results[2][:2] == (full_names[2][0], "31.906"), f"Unexpected error - file={full_names[2][0]}"
+    assert results[3][:2] == (full_names[3][0], "31.902"), f"Missing file - file={full_names[3][0]}"
+    assert results[4] == (full_names[4][0], "ok", ""), f"Batch result - file={full_names[4][0]}"
+
+    # -------------------------------------------------------------------------
+    pytest.helpers.verify_content_of_directory(
+        directory_name,
+        [],
+        [
+            "case_2_docx_copy.docx",
+            "case_2_docx_copy.pdf",
+            "case_2_docx_route_inbox_pandoc_pdflib.docx",
+            "case_2_docx_route_inbox_pandoc_pdflib.pdf",
+            "docx_heading.docx",
+            "docx_table.docx",
+            "docx_table.pdf",
+        ],
+    )
+
+    # -------------------------------------------------------------------------
+    # The output file of identical content is a directory.
+    os.remove(full_names[0][1])
+    os.remove(full_names[1][1])
+    os.mkdir(full_names[1][1])
+
+    results = dcr_core.cls_process.Process.pandoc_batch(full_names[:2], "english")
+
+    assert results[0] == (full_names[0][0], "ok", ""), f"Batch result - file={full_names[0][0]}"
+    assert results[1][:2] == (full_names[1][0], "31.907"), f"Copy error - file={full_names[1][0]}"
@@ -0,0 +1,85 @@
+# pylint: disable=unused-argument
+"""Testing Standard Cases."""
+import os
+
+import pytest
+
+import dcr_core.cls_process
+
+# -----------------------------------------------------------------------------
+# Constants & Globals.
+# -----------------------------------------------------------------------------
+# @pytest.mark.issue
+
+
+# -----------------------------------------------------------------------------
+# Simulate an aborted processing stage.
+# -----------------------------------------------------------------------------
+def _raise_memory_error(self) -> None:
+    raise MemoryError("processing stage aborted")
+
+
+# -----------------------------------------------------------------------------
+# Test Case 3 - resumed and taken from the document cache.
+# -----------------------------------------------------------------------------
+def test(fxtr_setup_empty_inbox, monkeypatch, tmp_path):
+    """Test Case 3 - resumed and taken from the document cache."""
+    # -------------------------------------------------------------------------
+    directory_name = dcr_core.core_glob.setup.directory_inbox
+    stem_name = "case_3_pdf_text_route_inbox_pdflib"
+    file_extension = "pdf"
+
+    full_name = dcr_core.core_utils.get_full_name_from_components(directory_name, stem_name, file_extension)
+
+    result_files = [
+        stem_name + ".line_list_number.json",
+        stem_name + ".line_token.json",
+    ]
+
+    test_files = sorted(
+        result_files
+        + [
+            stem_name + ".page.json",
+            stem_name + ".pdf",
+            stem_name + ".word.json",
+        ]
+    )
+
+    setup_overrides = {"document_cache_directory": str(tmp_path)}
+
+    # -------------------------------------------------------------------------
+    pytest.helpers.copy_files_4_pytest_2_dir(
+        source_files=[
+            (stem_name, file_extension),
+        ],
+        target_path=directory_name,
+    )
+
+    # -------------------------------------------------------------------------
+    # The tokenizer is aborted after the checkpoint of the parser stage.
+    with monkeypatch.context() as context:
+        context.setattr(dcr_core.cls_process.Process, "_document_tokenizer", _raise_memory_error)
+
+        with pytest.raises(MemoryError):
+            dcr_core.cls_process.Process().document(
+                full_name, is_delete_auxiliary_files=True, is_resume=True, setup_overrides=setup_overrides
+            )
+
+    # The extra files of the skipped parser stage are stored in the cache too.
+    with monkeypatch.context() as context:
+        context.setattr(dcr_core.cls_process.Process, "_document_parser", _raise_memory_error)
+
+        dcr_core.cls_process.Process().document(full_name, is_delete_auxiliary_files=True, is_resume=True, setup_overrides=setup_overrides)
+
+    pytest.helpers.verify_created_files(directory_name, test_files)
+
+    # -------------------------------------------------------------------------
+    for file_name in result_files:
+        os.remove(dcr_core.core_utils.get_full_name_from_components(directory_name, file_name))
+
+    with monkeypatch.context() as context:
+        context.setattr(dcr_core.cls_process.Process, "_document_pdflib", _raise_memory_error)
+
+        dcr_core.cls_process.Process().document(full_name, is_delete_auxiliary_files=True, setup_overrides=setup_overrides)
+
+    pytest.helpers.verify_created_files(directory_name, test_files)